@@ -22,12 +22,15 @@ from rich.prompt import Prompt
 from datetime import datetime
 from typing import Optional
 from pathlib import Path
-from concurrent.futures import ThreadPoolExecutor, TimeoutError as FuturesTimeoutError
 
 from codur.graph.main_graph import create_agent_graph
+from codur.graph.runtime import run_graph
+from codur.graph.tool_selection import get_tool_selection_stats
 from codur.config import load_config, save_config
 from langchain_core.messages import HumanMessage
 from codur.utils.message_pipeline import message_shortening_pipeline
+from codur.utils.llm_cache import get_llm_cache_stats
+from codur.utils.llm_telemetry import LLMTelemetry, format_telemetry_summary, llm_telemetry_scope
 from codur.model_registry import (
     list_groq_models,
     list_openai_models,
@@ -44,22 +47,31 @@ app = typer.Typer(
 console = Console(stderr=False)
 
 
-def _invoke_graph(graph, payload: dict, timeout_s: int | None):
-    if not timeout_s:
-        return graph.invoke(payload)
-    executor = ThreadPoolExecutor(max_workers=1)
-    future = executor.submit(graph.invoke, payload)
-    timed_out = False
+class _TokenPrinter:
+    """Echo streamed LLM tokens, labelling each node's output once."""
+
+    def __init__(self) -> None:
+        self.node: str | None = None
+
+    def __call__(self, node: str, text: str) -> None:
+        if node != self.node:
+            console.print(f"\n[dim]{node}>[/dim] ", end="")
+            self.node = node
+        console.print(text, end="", style="dim", markup=False, highlight=False, soft_wrap=True)
+
+    def finish(self) -> None:
+        if self.node is not None:
+            console.print()
+            self.node = None
+
+
+def _invoke_graph(graph, payload: dict, timeout_s: int | None, stream_tokens: bool = False):
+    printer = _TokenPrinter() if stream_tokens else None
     try:
-        return future.result(timeout=timeout_s)
-    except FuturesTimeoutError as exc:
-        timed_out = True
-        future.cancel()
-        executor.shutdown(wait=False, cancel_futures=True)
-        raise TimeoutError(f"Codur run exceeded {timeout_s} seconds") from exc
+        return run_graph(graph, payload, timeout_s, on_token=printer)
     finally:
-        if not timed_out:
-            executor.shutdown(wait=True, cancel_futures=True)
+        if printer is not None:
+            printer.finish()
 
 
 def _run_prompt(
@@ -70,6 +82,7 @@ def _run_prompt(
     max_llm_calls: int | None,
     fail_early: bool,
     dump_messages: str | None = None,
+    llm_telemetry: Path | None = None,
 ) -> None:
     if not raw:
         console.print(Panel.fit(
@@ -87,13 +100,14 @@ def _run_prompt(
     graph = create_agent_graph(cfg)
 
     try:
-        result = _invoke_graph(graph, {
-            "messages": [HumanMessage(content=prompt)],
-            "verbose": verbose,
-            "config": cfg,
-            "llm_calls": 0,
-            "max_llm_calls": cfg.runtime.max_llm_calls,
-        }, cfg.runtime.max_runtime_s)
+        with llm_telemetry_scope(LLMTelemetry(llm_telemetry)) as telemetry:
+            result = _invoke_graph(graph, {
+                "messages": [HumanMessage(content=prompt)],
+                "verbose": verbose,
+                "config": cfg,
+                "llm_calls": 0,
+                "max_llm_calls": cfg.runtime.max_llm_calls,
+            }, cfg.runtime.max_runtime_s, stream_tokens=not raw and cfg.runtime.stream_tokens)
 
         if dump_messages:
             messages = result.get("messages", [])
@@ -102,6 +116,25 @@ def _run_prompt(
                     f.write("-" * 20 + f"{message.__class__.__name__}" + "-" * 20 + "\n\n")
                     f.write(f"{message.content}\n\n")
 
+        cache_stats = get_llm_cache_stats(cfg)
+        if cache_stats and verbose:
+            console.print(
+                f"[dim]LLM cache: {cache_stats['hits']} hits, {cache_stats['misses']} misses "
+                f"({cache_stats['hit_rate']:.0%} hit rate), {cache_stats['bypassed']} bypassed[/dim]"
+            )
+
+        selection_stats = get_tool_selection_stats()
+        if selection_stats["calls"] and verbose:
+            console.print(
+                f"[dim]Tool selection: {selection_stats['bound_tools']}/{selection_stats['total_tools']} "
+                f"schemas bound over {selection_stats['calls']} calls, "
+                f"~{selection_stats['saved_tokens']} tokens saved[/dim]"
+            )
+
+        if not raw:
+            for line in format_telemetry_summary(telemetry.summary()):
+                console.print(f"[dim]LLM {line}[/dim]")
+
         selected_agent = result.get("selected_agent")
         if raw:
             if selected_agent:
@@ -159,9 +192,14 @@ def main_callback(
         "--dump-messages",
         help="Dump all messages to a file",
     ),
+    llm_telemetry: Optional[Path] = typer.Option(
+        None,
+        "--llm-telemetry",
+        help="Append per-call LLM telemetry (tokens, latency, cost) to a JSONL file",
+    ),
 ):
     if command:
-        _run_prompt(command, config, verbose, raw, max_llm_calls, fail_early, dump_messages)
+        _run_prompt(command, config, verbose, raw, max_llm_calls, fail_early, dump_messages, llm_telemetry)
         raise typer.Exit()
     if ctx.invoked_subcommand is None:
         console.print(ctx.get_help())
@@ -203,6 +241,11 @@ def run(
         "--dump-messages",
         help="Dump all messages to a file",
     ),
+    llm_telemetry: Optional[Path] = typer.Option(
+        None,
+        "--llm-telemetry",
+        help="Append per-call LLM telemetry (tokens, latency, cost) to a JSONL file",
+    ),
 ):
     """
     Run a coding task through the agent orchestrator.
@@ -211,7 +254,7 @@ def run(
         codur run "Create a Python function to calculate fibonacci numbers"
         codur run "Refactor the authentication module" --verbose
     """
-    _run_prompt(prompt, config, verbose, raw, max_llm_calls, fail_early, dump_messages)
+    _run_prompt(prompt, config, verbose, raw, max_llm_calls, fail_early, dump_messages, llm_telemetry)
 
 
 @app.command()
@@ -440,7 +483,7 @@ def interactive(
                 "llm_calls": 0,
                 "max_llm_calls": cfg.runtime.max_llm_calls,
                 "verbose": verbose,
-            }, cfg.runtime.max_runtime_s)
+            }, cfg.runtime.max_runtime_s, stream_tokens=cfg.runtime.stream_tokens)
 
             selected_agent = result.get("selected_agent")
             if selected_agent:
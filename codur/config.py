@@ -50,6 +50,11 @@ class LLMProfile(BaseModel):
     model: str
     temperature: Optional[float] = None
     api_key_env: Optional[str] = None
+    # USD per million tokens; used to report the cost of a run.
+    input_cost_per_mtok: Optional[float] = None
+    output_cost_per_mtok: Optional[float] = None
+    # Token budget for the message history sent to this model (tool schemas excluded).
+    context_budget_tokens: Optional[int] = None
 
 
 class LLMProviderSettings(BaseModel):
@@ -59,6 +64,18 @@ class LLMProviderSettings(BaseModel):
     max_model_size_gb: Optional[float] = None
 
 
+class LLMCacheSettings(BaseModel):
+    """On-disk cache of LLM responses (opt-in)."""
+    enabled: bool = False
+    # Relative paths are resolved against the workspace root.
+    path: str = ".codur/llm_cache.sqlite"
+    ttl_s: int = 7 * 24 * 3600
+    max_entries: int = 5000
+    # Only cache calls whose temperature is at or below max_temperature.
+    deterministic_only: bool = True
+    max_temperature: float = 0.3
+
+
 class LLMSettings(BaseModel):
     """LLM provider settings"""
     default_profile: str
@@ -66,6 +83,7 @@ class LLMSettings(BaseModel):
     default_temperature: float = 0.7
     planning_temperature: float = 0.3  # Lower temperature for planning (more deterministic)
     generation_temperature: float = 0.5  # Normal temperature for code generation
+    cache: LLMCacheSettings = Field(default_factory=LLMCacheSettings)
     # Runtime API keys (loaded from environment)
     anthropic_api_key: Optional[str] = None
     openai_api_key: Optional[str] = None
@@ -78,8 +96,22 @@ class AsyncSettings(BaseModel):
     event_buffer_size: int = 200
     stream_events: bool = True
     user_input_poll_ms: int = 100
-    tool_timeout_s: int = 600
-    cancel_grace_s: int = 5
+    tool_timeout_s: float = 600
+    cancel_grace_s: float = 5
+
+
+class FixCandidateSettings(BaseModel):
+    """Speculative fix candidates for code-fix tasks"""
+    count: int = 1
+    temperatures: List[float] = Field(default_factory=lambda: [0.2, 0.5, 0.8])
+    profiles: List[str] = Field(default_factory=list)
+
+    @field_validator("count")
+    @classmethod
+    def _validate_positive_count(cls, value: int) -> int:
+        if value <= 0:
+            raise ValueError("Value must be positive")
+        return value
 
 
 class RuntimeSettings(BaseModel):
@@ -88,8 +120,14 @@ class RuntimeSettings(BaseModel):
     max_llm_calls: int | None = None
     max_runtime_s: int | None = None
     verbose: bool = False
+    stream_tokens: bool = True
     allow_outside_workspace: bool = False
     detect_tool_calls_from_text: bool = True
+    summary_threshold_tokens: int = 1500
+    coding_max_turns: int = 5
+    coding_max_tokens: int | None = None
+    restore_last_green: bool = True
+    fix_candidates: FixCandidateSettings = Field(default_factory=FixCandidateSettings)
     planner_fallback_profiles: List[str] = Field(default_factory=list)
     workspace_root: str | None = None
     async_: AsyncSettings = Field(default_factory=AsyncSettings, alias="async")
@@ -105,7 +143,14 @@ class RuntimeSettings(BaseModel):
             raise ValueError("Value must be positive")
         return value
 
-    @field_validator("max_llm_calls")
+    @field_validator("coding_max_turns")
+    @classmethod
+    def _validate_positive_turns(cls, value: int) -> int:
+        if value <= 0:
+            raise ValueError("Value must be positive")
+        return value
+
+    @field_validator("max_llm_calls", "coding_max_tokens")
     @classmethod
     def _validate_optional_positive_llm_calls(cls, value: int | None) -> int | None:
         if value is None:
@@ -145,6 +190,14 @@ class ModelAgentInstruction(BaseModel):
     instruction: str  # Instruction text to inject as system message
 
 
+class WarmRunnerSettings(BaseModel):
+    """Pre-forked Python runner for run_python_file and run_pytest"""
+    enabled: bool = False
+    preload: List[str] = Field(default_factory=lambda: ["pytest"])
+    preload_project: bool = True
+    idle_timeout_s: int = 900
+
+
 class ToolSettings(BaseModel):
     """Default tool settings."""
     default_max_bytes: int = 200_000
@@ -164,6 +217,15 @@ class ToolSettings(BaseModel):
     secret_globs: list[str] = Field(default_factory=list)
     include_hidden_files: bool = False
     respect_gitignore: bool = True
+    persist_workspace_index: bool = True
+    rope_idle_timeout_s: int = 900
+    rope_full_validate_after_s: int = 300
+    schema_cache_path: Optional[str] = None
+    selection_top_k: int = 30
+    output_blob_threshold_chars: int = 8000
+    checkpoints: bool = True
+    pytest_log_dir: str = ".codur/pytest-logs"
+    warm_runner: WarmRunnerSettings = Field(default_factory=WarmRunnerSettings)
 
     @field_validator("default_max_bytes", "default_max_results")
     @classmethod
@@ -0,0 +1,245 @@
+"""Run-scoped checkpoints of the files the agent edits, stored as git objects.
+
+Before a file-mutating tool call runs, `execute_tool_calls` records the
+current content of the paths it is about to modify. After the calls it
+snapshots every path modified so far into a checkpoint: a blob per file and a
+tree per checkpoint, written to the object database of the workspace's git
+repository (a private bare repository when the workspace is not in one). No
+ref, index entry or stash is created, so the user's repository is left alone.
+
+The latest checkpoint turns green when a test or script run passes with no
+edit after it. When verification fails, the routing loop puts the files back
+to the last green checkpoint (`restore_last_green`). The agent can also list
+checkpoints and restore one with the `checkpoint_list` / `checkpoint_restore`
+tools. A restore only reads blobs back from the object database.
+"""
+
+from __future__ import annotations
+
+import contextvars
+import tempfile
+import threading
+import time
+from contextlib import contextmanager
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Iterable, Iterator, Optional, TypedDict
+
+import pygit2
+
+from codur.graph.tool_result_cache import current_tool_result_cache
+from codur.utils.rope_pool import notify_rope_changed
+from codur.utils.workspace_index import notify_path_changed
+
+BASELINE_LABEL = "baseline (before the agent's first edit)"
+
+
+class CheckpointInfo(TypedDict):
+    """A checkpoint as reported by checkpoint_list."""
+    id: int
+    label: str
+    green: bool
+    paths: list[str]
+    created_at: float
+
+
+@dataclass
+class Checkpoint:
+    """Contents of the edited files at one point of the run.
+
+    `paths` are the files edited so far when the checkpoint was taken; those
+    missing from `tree` did not exist at that time. Files first edited later
+    are restored to the content they had before the run edited them.
+    """
+    id: int
+    label: str
+    tree: str
+    paths: tuple[str, ...]
+    created_at: float
+    green: bool = False
+
+    def to_info(self) -> CheckpointInfo:
+        return CheckpointInfo(
+            id=self.id,
+            label=self.label,
+            green=self.green,
+            paths=list(self.paths),
+            created_at=self.created_at,
+        )
+
+
+class CheckpointStore:
+    """Checkpoints of the files edited under one workspace root."""
+
+    def __init__(self, root: Optional[Path] = None) -> None:
+        self.root = (root or Path.cwd()).resolve()
+        self.checkpoints: list[Checkpoint] = []
+        # Blob of each edited file before its first edit (None: the file did not exist).
+        self._originals: dict[str, Optional[pygit2.Oid]] = {}
+        self._repo: Optional[pygit2.Repository] = None
+        self._lock = threading.RLock()
+
+    def _object_repo(self) -> pygit2.Repository:
+        if self._repo is None:
+            repo_path = pygit2.discover_repository(str(self.root))
+            if repo_path is not None:
+                self._repo = pygit2.Repository(repo_path)
+            else:
+                self._repo = pygit2.init_repository(tempfile.mkdtemp(prefix="codur-checkpoints-"), bare=True)
+        return self._repo
+
+    def _relative(self, path: str | Path) -> Optional[str]:
+        target = Path(path)
+        target = (target if target.is_absolute() else self.root / target).resolve()
+        try:
+            return target.relative_to(self.root).as_posix()
+        except ValueError:
+            return None
+
+    def _blob(self, relative: str) -> Optional[pygit2.Oid]:
+        target = self.root / relative
+        return self._object_repo().create_blob(target.read_bytes()) if target.is_file() else None
+
+    def _ensure_baseline(self) -> None:
+        if not self.checkpoints:
+            empty_tree = pygit2.Index().write_tree(self._object_repo())
+            self.checkpoints.append(Checkpoint(0, BASELINE_LABEL, str(empty_tree), (), time.time()))
+
+    def track(self, paths: Iterable[str]) -> None:
+        """Record the current content of paths about to be edited for the first time."""
+        with self._lock:
+            self._ensure_baseline()
+            for path in paths:
+                relative = self._relative(path)
+                if relative is not None and relative not in self._originals:
+                    self._originals[relative] = self._blob(relative)
+
+    def edited_paths(self) -> list[str]:
+        """Root-relative paths edited so far in the run."""
+        with self._lock:
+            return sorted(self._originals)
+
+    def checkpoint(self, label: str) -> Checkpoint:
+        """Snapshot every edited file (returns the latest checkpoint when nothing changed)."""
+        with self._lock:
+            self._ensure_baseline()
+            repo = self._object_repo()
+            index = pygit2.Index()
+            for relative in self._originals:
+                blob = self._blob(relative)
+                if blob is not None:
+                    index.add(pygit2.IndexEntry(relative, blob, pygit2.GIT_FILEMODE_BLOB))
+            tree = str(index.write_tree(repo))
+            paths = tuple(sorted(self._originals))
+            latest = self.checkpoints[-1]
+            if latest.tree == tree and latest.paths == paths:
+                return latest
+            checkpoint = Checkpoint(len(self.checkpoints), label, tree, paths, time.time())
+            self.checkpoints.append(checkpoint)
+            return checkpoint
+
+    def mark_green(self) -> Checkpoint:
+        """Mark the latest checkpoint as passing."""
+        with self._lock:
+            self._ensure_baseline()
+            self.checkpoints[-1].green = True
+            return self.checkpoints[-1]
+
+    def last_green(self) -> Optional[Checkpoint]:
+        with self._lock:
+            return next((item for item in reversed(self.checkpoints) if item.green), None)
+
+    def get(self, checkpoint_id: int) -> Checkpoint:
+        with self._lock:
+            if not 0 <= checkpoint_id < len(self.checkpoints):
+                raise ValueError(f"Unknown checkpoint: {checkpoint_id}")
+            return self.checkpoints[checkpoint_id]
+
+    def restore(self, checkpoint_id: int) -> list[str]:
+        """Put every edited file back to its content at the checkpoint; return the files changed."""
+        with self._lock:
+            checkpoint = self.get(checkpoint_id)
+            repo = self._object_repo()
+            tree = repo[checkpoint.tree]
+            changed: list[str] = []
+            for relative, original in self._originals.items():
+                if relative in checkpoint.paths:
+                    blob = tree[relative].id if relative in tree else None
+                else:
+                    blob = original
+                wanted = repo[blob].data if blob is not None else None
+                target = self.root / relative
+                current = target.read_bytes() if target.is_file() else None
+                if current == wanted:
+                    continue
+                if wanted is None:
+                    target.unlink()
+                else:
+                    target.parent.mkdir(parents=True, exist_ok=True)
+                    target.write_bytes(wanted)
+                changed.append(relative)
+            return changed
+
+
+def is_passing_check(tool_name: Optional[str], output: object) -> bool:
+    """True for a test or script run that succeeded."""
+    if not isinstance(output, dict):
+        return False
+    if tool_name == "run_pytest":
+        return output.get("success") is True
+    if tool_name == "run_python_file":
+        return output.get("return_code") == 0
+    return False
+
+
+def notify_restored(root: Path, paths: list[str]) -> None:
+    """Tell the workspace index, rope and the run's tool result cache that files were restored."""
+    for path in paths:
+        notify_path_changed(root / path)
+        notify_rope_changed(root / path)
+    cache = current_tool_result_cache()
+    if cache is not None and paths:
+        cache.invalidate_paths(paths)
+
+
+def restore_last_green(config: object | None) -> Optional[tuple[Checkpoint, list[str]]]:
+    """Restore the run's last green checkpoint (runtime.restore_last_green).
+
+    Returns the checkpoint and the files it changed, or None when nothing was restored.
+    """
+    if not getattr(getattr(config, "runtime", None), "restore_last_green", True):
+        return None
+    store = current_checkpoint_store()
+    checkpoint = store.last_green() if store is not None else None
+    if checkpoint is None:
+        return None
+    changed = store.restore(checkpoint.id)
+    if not changed:
+        return None
+    notify_restored(store.root, changed)
+    return checkpoint, changed
+
+
+def checkpoints_enabled(config: object | None) -> bool:
+    return bool(getattr(getattr(config, "tools", None), "checkpoints", True))
+
+
+_CURRENT_STORE: contextvars.ContextVar[Optional[CheckpointStore]] = contextvars.ContextVar(
+    "codur_checkpoint_store", default=None
+)
+
+
+def current_checkpoint_store() -> Optional[CheckpointStore]:
+    """Return the checkpoint store of the active run, or None outside a run."""
+    return _CURRENT_STORE.get()
+
+
+@contextmanager
+def checkpoint_scope(store: Optional[CheckpointStore] = None) -> Iterator[CheckpointStore]:
+    """Checkpoint files edited by tool calls made inside the block."""
+    store = store or CheckpointStore()
+    reset = _CURRENT_STORE.set(store)
+    try:
+        yield store
+    finally:
+        _CURRENT_STORE.reset(reset)
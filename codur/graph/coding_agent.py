@@ -1,5 +1,5 @@
 """Dedicated coding node for the codur-coding agent."""
-from langchain_core.messages import SystemMessage
+from langchain_core.messages import BaseMessage
 from rich.console import Console
 
 from codur.config import CodurConfig
@@ -11,14 +11,19 @@ from codur.graph.state_operations import (
     get_llm_calls,
     is_verbose,
     increment_iterations,
-    add_messages,
+    get_messages,
     get_next_step_suggestion,
     get_last_tool_output_from_messages,
 )
+from codur.graph.tool_executor import ToolExecutionResult
+from codur.graph.tool_loop import STOP_FINISHED, STOP_NO_TOOL_CALLS, ToolLoop, get_tool_loop_budget
+from codur.graph.tool_selection import record_tool_selection, select_tool_schemas
 from codur.tools.schema_generator import get_function_schemas
 from codur.tools.registry import list_tools_for_tasks
 from codur.utils.llm_calls import LLMCallLimitExceeded
 from codur.utils.llm_helpers import create_and_invoke_with_tool_support
+from codur.utils.llm_telemetry import llm_telemetry_scope
+from codur.utils.prompt_cache import build_system_messages
 from codur.constants import TaskType
 
 """
@@ -102,13 +107,16 @@ Your mission: Solve coding requests with correct, efficient, and robust implemen
 ## Important Notes
 
 - You MUST return valid tool calls - do NOT create fake tool names or prefixes
+- Only part of the tools above is offered per turn. If you need one that is not offered, call request_tools with its name
 - You can read multiple files in one call using read_files, write_files
+- Large tool outputs show only their head and a blob_handle; use read_tool_output to read further
+- Your edits are checkpointed: to undo bad edits, use checkpoint_list and checkpoint_restore instead of rewriting files
 - All tool arguments must match the schema exactly
 - After Writing Code (replace_function, write_file, replace_class, etc.):
     - For Python files: Use validate_python_syntax to verify syntax is correct
     - To test execution: Use run_python_file to run the modified code and see output
     - Validation and execution are faster and more efficient than reading the entire file back
-    - Only run pytest if there are tests
+    - Only run pytest if there are tests; run_pytest with affected_only=true runs just the tests that import the files you changed
     - Make fixes based on validation/execution results (if any)
 - If the output of the code was not as expected, include a "clarify" tool call that contains next steps for improvement
 - But if the code worked as expected, use the "done" tool to finish. Or use "build_verification_response" if you feel this should be the last step before done.
@@ -120,73 +128,51 @@ CODING_AGENT_SYSTEM_PROMPT = _get_system_prompt_with_tools()
 
 
 @prepend_summary
-def coding_node(state: AgentState, config: CodurConfig, summary: str, recursion_depth=0) -> ExecuteNodeResult:
+def coding_node(state: AgentState, config: CodurConfig, summary: str) -> ExecuteNodeResult:
     """Run the codur-coding agent with a structured coding prompt.
 
+    Each turn invokes the LLM and executes its tool calls; turns repeat until
+    the agent finishes or the loop's budget stops it (see codur.graph.tool_loop).
+
     Args:
         state: Current graph state with messages, iterations, etc.
         config: Runtime configuration
         summary: Summary of previous messages (injected by decorator)
-        recursion_depth: Current recursion depth for nested invocations
 
     Returns:
         ExecuteNodeResult with agent_outcome
     """
     agent_name = "coding"
-    iterations = get_iterations(state)
-    increment_iterations(state)
     verbose = is_verbose(state)
 
-    if verbose:
-        console.print(f"[bold blue]Running codur-coding node (iteration {iterations})...[/bold blue]")
-
-    tool_schemas = get_function_schemas()  # All 70+ tools
-
-    if recursion_depth == 0:
-        suggestion = get_next_step_suggestion(state)
-        if suggestion:
-            if verbose:
-                console.print(f"[dim]Incorporating next step suggestion into prompt:[/dim] {suggestion}")
-            summary += f"\n\nNext Step Suggestion: {suggestion}"
-        new_messages = [
-            SystemMessage(content=CODING_AGENT_SYSTEM_PROMPT + "\n\n" + summary),
-        ]
-    else:
-        new_messages = []
-
-    try:
-        new_messages, _, execution_result = create_and_invoke_with_tool_support(
-            config,
-            new_messages,
-            tool_schemas,
-            profile_name=config.llm.default_profile,
-            temperature=config.llm.generation_temperature,
-            invoked_by="coding.primary",
-            state=state,
-        )
-    except Exception as exc:
-        if isinstance(exc, LLMCallLimitExceeded):
-            raise
-        # Fallback on error
+    suggestion = get_next_step_suggestion(state)
+    if suggestion:
         if verbose:
-            console.log(f"[yellow]Primary invocation failed: {exc}[/yellow]")
+            console.print(f"[dim]Incorporating next step suggestion into prompt:[/dim] {suggestion}")
+        summary += f"\n\nNext Step Suggestion: {suggestion}"
+    # Stable prompt first so provider prompt caches can reuse it across turns
+    turn_messages = build_system_messages(CODING_AGENT_SYSTEM_PROMPT, summary)
+
+    # inject each turn's messages into state for the next turn
+    # unfortunately mutations to state do not persist across agent nodes
+    history = list(get_messages(state))
+    state["messages"] = history
+    new_messages = []
+
+    with llm_telemetry_scope() as telemetry:
+        loop = ToolLoop(get_tool_loop_budget(config), telemetry, invoked_by_prefix=f"{agent_name}.")
+        while True:
+            turn_messages, execution_result = _run_turn(state, config, turn_messages, verbose)
+            history.extend(turn_messages)
+            new_messages.extend(turn_messages)
+            if not loop.finish_turn(execution_result):
+                break
+            turn_messages = []
 
-        # Try fallback model
-        fallback_profile = config.agents.preferences.fallback_model
-        if fallback_profile:
-            new_messages, _, execution_result = create_and_invoke_with_tool_support(
-                config,
-                new_messages,
-                tool_schemas,
-                profile_name=fallback_profile,
-                temperature=config.llm.generation_temperature,
-                invoked_by="coding.fallback",
-                state=state,
-            )
-        else:
-            raise
+    if verbose:
+        console.print(f"[dim]Coding loop stopped after {loop.turns} turn(s): {loop.stop_reason}[/dim]")
 
-    if not execution_result.results:
+    if loop.stop_reason == STOP_NO_TOOL_CALLS:
         # No tools called - return response as-is
         return ExecuteNodeResult(
             agent_outcomes=[AgentOutcome(
@@ -202,7 +188,7 @@ def coding_node(state: AgentState, config: CodurConfig, summary: str, recursion_
     # Get Last tool to detect "done"
     last_tool_call = get_last_tool_output_from_messages(new_messages)
     last_tool_name = last_tool_call.tool if last_tool_call else None
-    if last_tool_name == "done":
+    if loop.stop_reason == STOP_FINISHED and last_tool_name == "done":
         return ExecuteNodeResult(
             agent_outcomes=[AgentOutcome(
                 agent=agent_name,
@@ -214,7 +200,7 @@ def coding_node(state: AgentState, config: CodurConfig, summary: str, recursion_
             messages=new_messages,
             selected_agent="codur-verification",
         )
-    elif last_tool_name == "build_verification_response":
+    elif loop.stop_reason == STOP_FINISHED and last_tool_name == "build_verification_response":
         console.log("[green]Building verification response as requested by agent...[/green]")
         return ExecuteNodeResult(
             agent_outcomes=[AgentOutcome(
@@ -227,27 +213,69 @@ def coding_node(state: AgentState, config: CodurConfig, summary: str, recursion_
             messages=new_messages,
         )
 
-
-    if recursion_depth <= 3:
-        # inject messages into state for next iteration
-        # unfortunately mutations to state do not persist across agent nodes
-        add_messages(state, new_messages)
-        nested_outcome = coding_node(
-            state=state,
-            config=config,
-            summary=summary,
-            recursion_depth=recursion_depth + 1
-        )
-        nested_outcome["messages"] = new_messages + nested_outcome["messages"]
-        return nested_outcome
-
     return ExecuteNodeResult(
         agent_outcomes=[AgentOutcome(
             agent=agent_name,
-            result="tool calls executed",
+            result=f"tool calls executed ({loop.stop_reason})",
             status="success",
             messages=new_messages,
         )],
         llm_calls=get_llm_calls(state),
         messages=new_messages,
     )
+
+
+def _run_turn(
+    state: AgentState,
+    config: CodurConfig,
+    turn_messages: list[BaseMessage],
+    verbose: bool,
+) -> tuple[list[BaseMessage], ToolExecutionResult]:
+    """Invoke the LLM once and execute its tool calls, returning the turn's messages."""
+    iterations = get_iterations(state)
+    increment_iterations(state)
+    if verbose:
+        console.print(f"[bold blue]Running codur-coding node (iteration {iterations})...[/bold blue]")
+
+    # Bind a task-aware subset of the 70+ tools (plus meta tools and tools used so far)
+    selection = select_tool_schemas(get_function_schemas(), state, config)
+    record_tool_selection(selection)
+    tool_schemas = selection.schemas
+    if verbose:
+        console.print(
+            f"[dim]Binding {len(tool_schemas)}/{selection.total_tools} tools "
+            f"(~{selection.saved_tokens} schema tokens saved)[/dim]"
+        )
+
+    try:
+        turn_messages, _, execution_result = create_and_invoke_with_tool_support(
+            config,
+            turn_messages,
+            tool_schemas,
+            profile_name=config.llm.default_profile,
+            temperature=config.llm.generation_temperature,
+            invoked_by="coding.primary",
+            state=state,
+        )
+    except Exception as exc:
+        if isinstance(exc, LLMCallLimitExceeded):
+            raise
+        # Fallback on error
+        if verbose:
+            console.log(f"[yellow]Primary invocation failed: {exc}[/yellow]")
+
+        # Try fallback model
+        fallback_profile = config.agents.preferences.fallback_model
+        if fallback_profile:
+            turn_messages, _, execution_result = create_and_invoke_with_tool_support(
+                config,
+                turn_messages,
+                tool_schemas,
+                profile_name=fallback_profile,
+                temperature=config.llm.generation_temperature,
+                invoked_by="coding.fallback",
+                state=state,
+            )
+        else:
+            raise
+    return turn_messages, execution_result
@@ -20,6 +20,7 @@ from codur.graph.state_operations import (
     get_latest_agent_outcome,
 )
 from codur.graph.tool_executor import execute_tool_calls
+from codur.utils.concurrency import OperationCancelled, get_concurrency_limiter
 from codur.utils.llm_calls import LLMCallLimitExceeded
 
 # Import agents to ensure they are registered
@@ -61,10 +62,12 @@ class AgentExecutor:
         task = last_message.content if hasattr(last_message, "content") else str(last_message)
 
         try:
-            if self.agent_name.startswith("llm:"):
-                messages_out, result = self._execute_llm_profile(task)
-            else:
-                messages_out, result = self._execute_agent(task)
+            # Delegated agents share the runtime.async.max_concurrent_agents budget with tool calls.
+            with get_concurrency_limiter(self.config).slot():
+                if self.agent_name.startswith("llm:"):
+                    messages_out, result = self._execute_llm_profile(task)
+                else:
+                    messages_out, result = self._execute_agent(task)
 
             assert isinstance(messages_out, list)
             if is_verbose(self.state):
@@ -82,7 +85,7 @@ class AgentExecutor:
             }
             return dct
         except Exception as exc:
-            if isinstance(exc, LLMCallLimitExceeded):
+            if isinstance(exc, (LLMCallLimitExceeded, OperationCancelled)):
                 raise
             console.print(f"[red]✗ Error executing {self.agent_name}: {str(exc)}[/red]")
             if is_verbose(self.state):
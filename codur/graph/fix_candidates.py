@@ -0,0 +1,306 @@
+"""Speculative fix candidates for code-fix tasks.
+
+With `runtime.fix_candidates.count` above 1, the coding step of a code-fix task
+runs that many coding attempts at once instead of one. Each candidate gets its
+own temperature/profile and its own copy of the workspace, and the verification
+agent checks it in that copy. The first candidate that passes has the files it
+modified copied into the real workspace; the others are cancelled and their
+copies deleted. When none passes, nothing is promoted and the graph goes back
+to planning with the candidates' verification feedback.
+"""
+
+from __future__ import annotations
+
+import contextvars
+import shutil
+import tempfile
+from concurrent.futures import Future, ThreadPoolExecutor, as_completed
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Optional
+
+from langchain_core.messages import AIMessage, BaseMessage, ToolMessage
+from rich.console import Console
+
+from codur.config import CodurConfig
+from codur.constants import TaskType
+from codur.graph.checkpoints import checkpoints_enabled, current_checkpoint_store
+from codur.graph.coding_agent import coding_node
+from codur.graph.message_summary import prepend_summary
+from codur.graph.node_types import AgentOutcome, ExecuteNodeResult
+from codur.graph.state import AgentState, AgentStateData
+from codur.graph.state_operations import (
+    get_llm_calls,
+    get_messages,
+    increment_iterations,
+    is_verbose,
+    parse_tool_message,
+)
+from codur.graph.tool_executor import get_mutated_paths
+from codur.graph.tool_result_cache import current_tool_result_cache, tool_result_scope
+from codur.graph.verification_agent import verification_agent_node
+from codur.utils.concurrency import CancellationToken, cancel_scope, current_cancel_token, raise_if_cancelled
+from codur.utils.ignore_utils import get_exclude_dirs
+from codur.utils.llm_calls import LLMCallLimitExceeded
+from codur.utils.path_utils import current_workspace_root, workspace_root_scope
+from codur.utils.rope_pool import get_rope_pool, notify_rope_changed
+from codur.utils.workspace_index import drop_workspace_index, notify_path_changed
+from codur.utils.workspace_symbols import drop_workspace_symbols
+
+AGENT_FIX_CANDIDATES = "fix-candidates"
+
+console = Console()
+
+
+@dataclass(frozen=True)
+class CandidateSpec:
+    """How one candidate differs from the others."""
+    index: int
+    profile: Optional[str]
+    temperature: Optional[float]
+
+    @property
+    def label(self) -> str:
+        return f"candidate {self.index} ({self.profile}, temperature={self.temperature})"
+
+
+@dataclass
+class CandidateResult:
+    """A finished candidate; `workspace` is its copy of the workspace until discarded."""
+    spec: CandidateSpec
+    workspace: Optional[Path] = None
+    messages: list[BaseMessage] = field(default_factory=list)
+    outcomes: list[AgentOutcome] = field(default_factory=list)
+    llm_calls: int = 0
+    passed: bool = False
+    error: Optional[BaseException] = None
+
+    @property
+    def feedback(self) -> str:
+        if self.error is not None:
+            return f"error: {self.error}"
+        verification = self.outcomes[-1] if self.outcomes else {}
+        return verification.get("next_step_suggestion") or verification.get("result") or "no result"
+
+
+def get_candidate_specs(config: CodurConfig) -> list[CandidateSpec]:
+    """Spread runtime.fix_candidates.temperatures/profiles over the candidates."""
+    settings = config.runtime.fix_candidates
+    temperatures = list(settings.temperatures) or [config.llm.generation_temperature]
+    profiles = list(settings.profiles) or [config.llm.default_profile]
+    return [
+        CandidateSpec(
+            index=idx,
+            profile=profiles[idx % len(profiles)],
+            temperature=temperatures[idx % len(temperatures)],
+        )
+        for idx in range(settings.count)
+    ]
+
+
+def use_fix_candidates(state: AgentState, config: CodurConfig) -> bool:
+    """True when the coding step of this task should fan out into candidates."""
+    classification = state.get("classification")
+    return (
+        config.runtime.fix_candidates.count > 1
+        and classification is not None
+        and classification.task_type == TaskType.CODE_FIX
+    )
+
+
+def copy_workspace(root: Path, config: CodurConfig) -> Path:
+    """Copy the workspace (minus tools.exclude_dirs) into a fresh temporary directory."""
+    workspace = Path(tempfile.mkdtemp(prefix="codur-candidate-"))
+    shutil.copytree(
+        root,
+        workspace,
+        ignore=shutil.ignore_patterns(*get_exclude_dirs(config)),
+        symlinks=True,
+        dirs_exist_ok=True,
+    )
+    return workspace
+
+
+def get_changed_paths(messages: list[BaseMessage], workspace: Path) -> list[str]:
+    """Workspace-relative paths the file-mutating tool calls in `messages` touched."""
+    changed: list[str] = []
+    for message in messages:
+        if not isinstance(message, ToolMessage):
+            continue
+        tool_output = parse_tool_message(message)
+        if tool_output is None:
+            continue
+        paths = get_mutated_paths(tool_output.tool, tool_output.args or {}, tool_output.output) or []
+        for path in paths:
+            target = (workspace / path).resolve()
+            try:
+                relative = target.relative_to(workspace.resolve()).as_posix()
+            except ValueError:
+                continue
+            if relative not in changed:
+                changed.append(relative)
+    return changed
+
+
+def promote_candidate(workspace: Path, root: Path, paths: list[str], config: CodurConfig) -> None:
+    """Copy (or delete) each changed path from the candidate's copy into the real workspace.
+
+    The run's checkpoint store tracks the promoted paths and checkpoints them, as
+    it would have for the same edits made directly in the workspace.
+    """
+    store = current_checkpoint_store()
+    if store is None or not checkpoints_enabled(config) or store.root != root.resolve():
+        store = None
+    if store is not None:
+        store.track(paths)
+    for relative in paths:
+        source = workspace / relative
+        target = root / relative
+        if source.is_file():
+            target.parent.mkdir(parents=True, exist_ok=True)
+            shutil.copy2(source, target)
+        elif target.is_file():
+            target.unlink()
+        notify_path_changed(target)
+        notify_rope_changed(target)
+    cache = current_tool_result_cache()
+    if cache is not None:
+        cache.invalidate_paths(paths)
+    if store is not None and paths:
+        store.checkpoint("after promoting " + ", ".join(paths))
+
+
+def remove_workspace(workspace: Path) -> None:
+    """Delete a candidate's copy and the per-root caches built for it."""
+    workspace = workspace.resolve()
+    drop_workspace_index(workspace)
+    drop_workspace_symbols(workspace)
+    get_rope_pool().close(workspace)
+    shutil.rmtree(workspace, ignore_errors=True)
+
+
+def _discard_workspace(future: Future) -> None:
+    if future.cancelled():
+        return
+    workspace = future.result().workspace
+    if workspace is not None:
+        remove_workspace(workspace)
+
+
+def _run_candidate(
+    spec: CandidateSpec,
+    state: AgentState,
+    config: CodurConfig,
+    summary: str,
+    root: Path,
+    token: CancellationToken,
+) -> CandidateResult:
+    """Run coding then verification for one candidate inside its own workspace copy."""
+    result = CandidateResult(spec=spec)
+    candidate_config = config.model_copy(update={
+        "llm": config.llm.model_copy(update={
+            "default_profile": spec.profile,
+            "generation_temperature": spec.temperature,
+        }),
+    })
+    candidate_state = AgentStateData(state)
+    candidate_state["messages"] = list(get_messages(state))
+    base_llm_calls = get_llm_calls(state)
+    try:
+        result.workspace = copy_workspace(root, config)
+        with cancel_scope(token), workspace_root_scope(result.workspace), tool_result_scope(result.workspace):
+            # coding_node leaves its messages in candidate_state for the verifier to see.
+            coding = coding_node(candidate_state, candidate_config, summary=summary)
+            # The verifier keeps the run's profile so every candidate is judged the same way.
+            verification = verification_agent_node(candidate_state, config, summary=summary)
+        result.messages = list(coding["messages"]) + list(verification["messages"])
+        result.outcomes = list(coding["agent_outcomes"]) + list(verification["agent_outcomes"])
+        result.passed = verification["agent_outcomes"][-1].get("status") == "success"
+    except Exception as exc:  # a failing candidate must not take the others down
+        result.error = exc
+    result.llm_calls = get_llm_calls(candidate_state) - base_llm_calls
+    return result
+
+
+@prepend_summary
+def fix_candidates_node(state: AgentState, config: CodurConfig, summary: str) -> ExecuteNodeResult:
+    """Run the coding step as parallel candidates and promote the first that passes verification.
+
+    Args:
+        state: Current graph state with messages, iterations, etc.
+        config: Runtime configuration
+        summary: Summary of previous messages (injected by decorator)
+
+    Returns:
+        ExecuteNodeResult with the winning candidate's messages and outcomes, or a
+        failed outcome carrying every candidate's feedback when none passed
+    """
+    verbose = is_verbose(state)
+    increment_iterations(state)
+    specs = get_candidate_specs(config)
+    root = current_workspace_root() or Path.cwd()
+    parent_token = current_cancel_token()
+    tokens = [CancellationToken(parent=parent_token) for _ in specs]
+
+    if verbose:
+        console.print(f"[bold blue]Running {len(specs)} fix candidates in parallel...[/bold blue]")
+
+    executor = ThreadPoolExecutor(max_workers=len(specs), thread_name_prefix="codur-fix-candidate")
+    futures = {
+        executor.submit(
+            contextvars.copy_context().run, _run_candidate, spec, state, config, summary, root, token
+        ): token
+        for spec, token in zip(specs, tokens)
+    }
+    finished: list[CandidateResult] = []
+    winner: Optional[CandidateResult] = None
+    winner_future: Optional[Future] = None
+    try:
+        for future in as_completed(futures):
+            result = future.result()
+            finished.append(result)
+            if verbose:
+                status = "passed" if result.passed else f"failed: {result.feedback}"
+                console.print(f"[dim]{result.spec.label} {status}[/dim]")
+            if result.passed:
+                winner, winner_future = result, future
+                break
+    finally:
+        for future, token in futures.items():
+            if future is not winner_future:
+                token.cancel("another fix candidate passed" if winner else "fix candidates stopped")
+                future.add_done_callback(_discard_workspace)
+        executor.shutdown(wait=False, cancel_futures=True)
+
+    llm_calls = get_llm_calls(state) + sum(result.llm_calls for result in finished)
+    if winner is not None:
+        changed = get_changed_paths(winner.messages, winner.workspace)
+        try:
+            promote_candidate(winner.workspace, root, changed, config)
+        finally:
+            remove_workspace(winner.workspace)
+        if verbose:
+            console.print(f"[green]✓ Promoted {winner.spec.label}: {', '.join(changed) or 'no file changes'}[/green]")
+        return ExecuteNodeResult(
+            agent_outcomes=winner.outcomes,
+            messages=winner.messages,
+            llm_calls=llm_calls,
+        )
+
+    raise_if_cancelled()
+    for result in finished:
+        if isinstance(result.error, LLMCallLimitExceeded):
+            raise result.error
+    feedback = "\n".join(f"- {result.spec.label}: {result.feedback}" for result in finished)
+    report = f"None of the {len(finished)} fix candidates passed verification:\n{feedback}"
+    return ExecuteNodeResult(
+        agent_outcomes=[AgentOutcome(
+            agent=AGENT_FIX_CANDIDATES,
+            status="failed",
+            result=report,
+            next_step_suggestion=feedback,
+            messages=[],
+        )],
+        messages=[AIMessage(content=report)],
+        llm_calls=llm_calls,
+    )
@@ -12,6 +12,7 @@ from codur.graph.execution import (
 from codur.graph.routing_node import routing_node
 from codur.graph.tools import tool_node
 from codur.graph.coding_agent import coding_node
+from codur.graph.fix_candidates import fix_candidates_node, use_fix_candidates
 from codur.graph.explaining import explaining_node
 # Routing logic inlined below (routing.py removed)
 from codur.graph.planning.core import PlanningOrchestrator
@@ -21,6 +22,7 @@ from codur.config import CodurConfig
 from codur.constants import ACTION_DELEGATE, ACTION_TOOL
 from codur.graph.verification_agent import verification_agent_node
 from codur.llm import create_llm, create_llm_profile
+from codur.tools.schema_generator import load_tool_schemas
 from codur.graph.state_operations import get_next_action, get_selected_agent
 
 # Route names for specialized agents
@@ -83,6 +85,13 @@ def should_continue(state: AgentState) -> str:
     return get_next_action(state) or "end"
 
 
+def coding_step(state: AgentState, config: CodurConfig):
+    """Run the coding agent, or parallel fix candidates when configured for this task."""
+    if use_fix_candidates(state, config):
+        return fix_candidates_node(state, config)
+    return coding_node(state, config)
+
+
 def create_agent_graph(config: CodurConfig):
     """
     Create the main agent orchestration graph.
@@ -95,6 +104,9 @@ def create_agent_graph(config: CodurConfig):
     5. Loop or finish
     """
 
+    # Reuse persisted tool schemas when tools.schema_cache_path is set
+    load_tool_schemas(config)
+
     # Initialize LLM with JSON mode enabled for structured planning output
     # JSON mode forces the LLM to return valid JSON, improving reliability
     if config.llm.default_profile:
@@ -114,7 +126,7 @@ def create_agent_graph(config: CodurConfig):
     workflow.add_node("llm_plan", lambda state: PlanningOrchestrator(config).llm_plan(state, llm))
     workflow.add_node("delegate", lambda state: delegate_node(state, config))
     workflow.add_node("tool", lambda state: tool_node(state, config))
-    workflow.add_node("coding", lambda state: coding_node(state, config))
+    workflow.add_node("coding", lambda state: coding_step(state, config))
     workflow.add_node("explaining", lambda state: explaining_node(state, config))
     workflow.add_node("execute", lambda state: execute_node(state, config))
     workflow.add_node("routing", lambda state: routing_node(state, llm, config))
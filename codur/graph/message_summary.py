@@ -1,11 +1,34 @@
-from langchain_core.messages import SystemMessage, BaseMessage
+"""Rolling summary of the conversation for agent nodes.
+
+Agent nodes (coding, verification) get the run's history as a rolling summary
+stored in AgentState plus the messages added since it was last folded:
+- new material below runtime.summary_threshold_tokens is passed verbatim and
+  costs no LLM call,
+- above it, the summarizer folds the new messages into the summary in the
+  background while the node's own LLM call and tools run; the next node entry
+  adopts the result,
+- material that grew far past the threshold is folded before the node runs.
+"""
+
+from __future__ import annotations
+
+import contextvars
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+from contextlib import contextmanager
+from dataclasses import dataclass
+from typing import Iterator, Optional
+
+from langchain_core.messages import AIMessage, BaseMessage, HumanMessage, SystemMessage, ToolMessage
 
 from codur.graph.state import AgentState
 from codur.graph.state_operations import get_config, get_messages, ToolOutput, \
     get_parsed_tool_calls_from_messages
 from codur.llm import create_llm_profile
 from codur.tools.registry import get_tool_summary_format
-from codur.utils.llm_calls import invoke_llm
+from codur.utils.llm_calls import count_llm_call, invoke_llm
+from codur.utils.prompt_cache import is_agent_prompt
+from codur.utils.text_helpers import estimate_tokens
 
 PROMPT = """
 You are an expert at summarizing conversation history for AI agents. Given the following conversation messages between a user and an AI agent, produce a concise summary that captures the key points, decisions, and actions taken. The summary should be clear and informative, allowing someone who hasn't seen the full conversation to understand what transpired.
@@ -20,14 +43,20 @@ Do not call any tools yourself!
 Tool result format:
 """
 
+DEFAULT_SUMMARY_THRESHOLD_TOKENS = 1500
+# Pending material this many times over the threshold is folded before the node runs.
+_BLOCKING_FACTOR = 4
 
-def get_messages_to_summarize(state: AgentState) -> list[BaseMessage]:
-    messages = get_messages(state)
-    last_system_idx = 0
-    for idx, message in enumerate(messages):
-        if isinstance(message, SystemMessage):
-            last_system_idx = idx
-    return messages[last_system_idx:]
+_ROLES = {HumanMessage: "User", AIMessage: "Assistant", ToolMessage: "Tool result", SystemMessage: "System"}
+
+
+def get_summary_threshold(config: object | None) -> int:
+    """Read runtime.summary_threshold_tokens."""
+    value = getattr(getattr(config, "runtime", None), "summary_threshold_tokens", DEFAULT_SUMMARY_THRESHOLD_TOKENS)
+    try:
+        return max(0, int(value))
+    except (TypeError, ValueError):
+        return DEFAULT_SUMMARY_THRESHOLD_TOKENS
 
 
 def get_tool_formats(messages: list[BaseMessage]) -> str:
@@ -41,43 +70,176 @@ def get_tool_formats(messages: list[BaseMessage]) -> str:
     return "\n".join(tool_formats)
 
 
-def create_summary(state: AgentState) -> str:
-    config = get_config(state)
+def get_pending_messages(state: AgentState) -> list[BaseMessage]:
+    """Messages not yet folded into the rolling summary.
 
+    Agent prompts (system prompt and context built by build_system_messages)
+    are skipped: the context already holds an earlier summary. Other system
+    messages start a new conversation window (the planner replays the history
+    after its own system prompt), so only messages from the last one are used.
+    """
+    messages = get_messages(state)
+    start = int(state.get("rolling_summary_upto", 0))
+    for idx in range(len(messages) - 1, start - 1, -1):
+        message = messages[idx]
+        if isinstance(message, SystemMessage) and not is_agent_prompt(message):
+            start = idx
+            break
+    return [message for message in messages[start:] if not is_agent_prompt(message)]
+
+
+def render_messages(messages: list[BaseMessage]) -> str:
+    lines = []
+    for message in messages:
+        role = next((name for cls, name in _ROLES.items() if isinstance(message, cls)), message.type)
+        content = message.content if isinstance(message.content, str) else str(message.content)
+        lines.append(f"{role}: {content}")
+    return "\n\n".join(lines)
+
+
+def fold_summary(
+    config,
+    summary: str,
+    messages: list[BaseMessage],
+    state: AgentState | None = None,
+) -> str:
+    """Return `summary` updated with `messages` (one summarizer LLM call)."""
     llm = create_llm_profile(
         config,
         config.llm.default_profile,
         json_mode=False,
         temperature=0.0,
     )
-
-    messages = get_messages_to_summarize(state)
-    tool_formats = get_tool_formats(messages)
-
-    system_message = SystemMessage(
-        content=PROMPT + "\n\n" + tool_formats
-    )
-
+    sections = []
+    if summary:
+        sections.append(f"Summary so far:\n{summary}")
+    sections.append(f"New messages:\n{render_messages(messages)}")
     response = invoke_llm(
         llm,
-        messages + [system_message],
+        [
+            SystemMessage(content=PROMPT + "\n\n" + get_tool_formats(messages)),
+            HumanMessage(content="\n\n".join(sections)),
+        ],
         invoked_by="summarizer",
         state=state,
         config=config,
     )
-
     return response.content
 
 
+def compose_context(summary: str, pending: list[BaseMessage]) -> str:
+    """Context handed to an agent node: the summary plus messages not folded into it."""
+    sections = []
+    if summary:
+        sections.append(f"Summary of the conversation so far:\n{summary}")
+    if pending:
+        sections.append(f"Recent messages:\n{render_messages(pending)}")
+    return "\n\n".join(sections)
+
+
+@dataclass
+class _Fold:
+    base_upto: int
+    upto: int
+    future: "Future[str]"
+
+
+class RollingSummarizer:
+    """Runs summary folds in the background for one graph run."""
+
+    def __init__(self) -> None:
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="codur-summary")
+        self._lock = threading.Lock()
+        self._fold: Optional[_Fold] = None
+
+    def submit(self, config, summary: str, messages: list[BaseMessage], base_upto: int, upto: int) -> None:
+        context = contextvars.copy_context()
+        future = self._executor.submit(context.run, fold_summary, config, summary, messages)
+        with self._lock:
+            self._fold = _Fold(base_upto, upto, future)
+
+    def take(self, base_upto: int) -> Optional[tuple[str, int]]:
+        """Wait for the fold started from `base_upto` and return (summary, upto), if any."""
+        with self._lock:
+            fold, self._fold = self._fold, None
+        if fold is None or fold.base_upto != base_upto:
+            return None
+        try:
+            return fold.future.result(), fold.upto
+        except Exception:
+            # The next entry folds the material again.
+            return None
+
+    def close(self) -> None:
+        """Drop queued folds and wait for a running one, so no LLM call outlives the run."""
+        self._executor.shutdown(wait=True, cancel_futures=True)
+
+
+_CURRENT_SUMMARIZER: contextvars.ContextVar[Optional[RollingSummarizer]] = contextvars.ContextVar(
+    "codur_rolling_summarizer", default=None
+)
+
+
+def current_rolling_summarizer() -> Optional[RollingSummarizer]:
+    return _CURRENT_SUMMARIZER.get()
+
+
+@contextmanager
+def rolling_summary_scope() -> Iterator[RollingSummarizer]:
+    """Allow background summary folds for agent nodes run inside the block."""
+    summarizer = RollingSummarizer()
+    reset = _CURRENT_SUMMARIZER.set(summarizer)
+    try:
+        yield summarizer
+    finally:
+        _CURRENT_SUMMARIZER.reset(reset)
+        summarizer.close()
+
+
+def update_rolling_summary(state: AgentState) -> tuple[str, dict]:
+    """Bring the rolling summary up to date for a node entry.
+
+    Returns:
+        (context for the node's prompt, state updates to return from the node)
+    """
+    config = get_config(state)
+    summary = state.get("rolling_summary", "")
+    upto = int(state.get("rolling_summary_upto", 0))
+    summarizer = current_rolling_summarizer()
+
+    if summarizer is not None:
+        folded = summarizer.take(upto)
+        if folded is not None:
+            summary, upto = folded
+            state["rolling_summary"], state["rolling_summary_upto"] = summary, upto
+
+    pending = get_pending_messages(state)
+    end = len(get_messages(state))
+    threshold = get_summary_threshold(config)
+    pending_tokens = estimate_tokens(render_messages(pending))
+    if pending and pending_tokens >= threshold:
+        if summarizer is None or pending_tokens >= threshold * _BLOCKING_FACTOR:
+            summary = fold_summary(config, summary, pending, state=state)
+            upto, pending = end, []
+        else:
+            # The fold runs without state, so its call is counted (and limited) here.
+            count_llm_call(state, config, "summarizer")
+            summarizer.submit(config, summary, pending, base_upto=upto, upto=end)
+
+    updates = {"rolling_summary": summary, "rolling_summary_upto": upto}
+    return compose_context(summary, pending), updates
+
+
 def prepend_summary(func):
     def inner(state: AgentState, *args, **kwargs):
         if "summary" in kwargs:
             return func(state, *args, **kwargs)
         else:
-            summary_result = create_summary(state)
+            summary_result, updates = update_rolling_summary(state)
             kwargs["summary"] = summary_result
             agent_result = func(state, *args, **kwargs)
             agent_result["agent_summaries"] = [summary_result]
+            agent_result.update(updates)
             return agent_result
 
     return inner
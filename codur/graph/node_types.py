@@ -46,6 +46,8 @@ class ExecuteNodeResult(TypedDict):
     messages: list[BaseMessage]
     llm_calls: NotRequired[int]
     selected_agent: NotRequired[str]
+    rolling_summary: NotRequired[str]
+    rolling_summary_upto: NotRequired[int]
 
 
 class ReviewNodeResult(TypedDict):
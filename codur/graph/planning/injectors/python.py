@@ -52,6 +52,9 @@ class PythonToolInjector:
             "python_dependency_graph",
             "python_ast_dependencies",
             "python_ast_dependencies_multifile",
+            "find_symbol",
+            "find_symbol_definitions",
+            "find_symbol_references",
         ]
 
     def get_example_tool_calls(self, example_path: str) -> List[Dict[str, Any]]:
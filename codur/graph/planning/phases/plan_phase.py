@@ -12,7 +12,7 @@ from codur.constants import TaskType
 from codur.graph.node_types import PlanNodeResult
 from codur.graph.state import AgentState
 from codur.tools.registry import list_tools_for_tasks, get_tool_by_name
-from codur.tools.schema_generator import function_to_json_schema
+from codur.tools.schema_generator import get_tool_schema
 from codur.tools.tool_annotations import ToolSideEffect
 from codur.graph.state_operations import (
     get_iterations,
@@ -137,7 +137,7 @@ def llm_plan(
 
     # Prepare tools
     tools = get_planning_tools(include_investigation=True)
-    tool_schemas = [function_to_json_schema(t) for t in tools]
+    tool_schemas = [get_tool_schema(t) for t in tools]
 
     # Build initial messages for this planning session
     system_msg = SystemMessage(content=planning_prompt)
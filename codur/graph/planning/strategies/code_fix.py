@@ -99,6 +99,7 @@ class CodeFixStrategy:
             tool_results_present=tool_results_present,
             messages=messages,
             iterations=iterations,
+            config=config,
             verbose=verbose,
             context_message="Reading {file_path} for context, routing decision in Phase 2",
             selected_agent="agent:codur-coding",
@@ -113,6 +114,7 @@ class CodeFixStrategy:
             "search_files",
             "grep_files",
             "ripgrep_search",
+            "find_symbol_definitions",
             "python_ast_dependencies_multifile",
             "lint_python_files",
             "lint_python_tree",
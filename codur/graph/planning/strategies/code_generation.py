@@ -93,6 +93,7 @@ class CodeGenerationStrategy:
             tool_results_present=tool_results_present,
             messages=messages,
             iterations=iterations,
+            config=config,
             verbose=verbose,
             context_message="Reading {file_path} for context, routing decision in Phase 2",
             selected_agent="agent:codur-coding",
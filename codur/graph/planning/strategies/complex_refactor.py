@@ -111,6 +111,8 @@ class ComplexRefactorStrategy:
             "list_files",
             "python_dependency_graph",
             "python_ast_dependencies_multifile",
+            "find_symbol_definitions",
+            "find_symbol_references",
             "code_quality",
             "lint_python_tree",
             "search_files",
@@ -1,29 +1,56 @@
 """Shared discovery logic for file-based strategies.
 
 Provides reusable functions for the common file discovery pattern:
-1. No files known -> list_files to discover
+1. No files known -> read files defining symbols named in the request, else list_files
 2. Tool results present -> select file from results
 3. Files known -> read_file for context
 """
 
+import re
+
 from rich.console import Console
 from langchain_core.messages import BaseMessage
 
+from codur.config import CodurConfig
 from codur.graph.node_types import PlanNodeResult
 from codur.graph.planning.types import ClassificationResult
 from codur.graph.planning.tool_analysis import (
     tool_results_include_read_file,
     select_file_from_tool_results,
 )
+from codur.graph.state_operations import get_last_human_message_content_from_messages
+from codur.utils.workspace_symbols import get_workspace_symbols, has_workspace_symbols
 
 console = Console()
 
+# Identifiers the user marked as code: `name`, `pkg.Name` or name()
+_CODE_IDENTIFIER_PATTERN = re.compile(r"`([A-Za-z_][\w.]*)(?:\(\))?`|\b([A-Za-z_]\w*)\(\)")
+_MAX_SYMBOL_FILES = 3
+
+
+def find_files_for_mentioned_symbols(messages: list[BaseMessage], config: CodurConfig | None = None) -> list[str]:
+    """Return files defining code identifiers mentioned in the latest request.
+
+    Only an index that is already built (in memory or persisted) is used, so
+    planning never waits for a full parse of the workspace.
+    """
+    text = get_last_human_message_content_from_messages(messages) or ""
+    names = {backticked or called for backticked, called in _CODE_IDENTIFIER_PATTERN.findall(text)}
+    if not names or not has_workspace_symbols(None, config):
+        return []
+    try:
+        files = get_workspace_symbols(None, config).files_defining(sorted(names))
+    except OSError:
+        return []
+    return files if len(files) <= _MAX_SYMBOL_FILES else []
+
 
 def discover_files_if_needed(
     classification: ClassificationResult,
     tool_results_present: bool,
     messages: list[BaseMessage],
     iterations: int,
+    config: CodurConfig | None = None,
     verbose: bool = False,
     discovery_message: str = "No file hint detected - listing files",
     selection_message: str = "Selected file from tool results: {candidate}",
@@ -35,7 +62,8 @@ def discover_files_if_needed(
     This implements the three-step discovery logic used by CodeFix,
     CodeGeneration, and Explanation strategies:
 
-    1. If no tool results and no files -> call list_files
+    1. If no tool results and no files -> read files defining mentioned symbols,
+       or call list_files when none are found
     2. If tool results present but no files -> select and read a file
     3. If files are known -> read the first file for context
 
@@ -44,6 +72,7 @@ def discover_files_if_needed(
         tool_results_present: Whether tool results exist in messages
         messages: The conversation messages
         iterations: Current iteration count
+        config: Runtime configuration, passed to the symbol index
         verbose: Whether to print verbose messages
         discovery_message: Message to print when listing files
         selection_message: Message to print when selecting file (use {candidate})
@@ -55,8 +84,25 @@ def discover_files_if_needed(
     """
     task_type = classification.task_type.value
 
-    # 1. No file hint -> list files
+    # 1. No file hint -> read files defining mentioned symbols, else list files
     if not tool_results_present and not classification.detected_files:
+        symbol_files = find_files_for_mentioned_symbols(messages, config)
+        if symbol_files:
+            if verbose:
+                console.print(f"[dim]Located mentioned symbols in: {', '.join(symbol_files)}[/dim]")
+            result: PlanNodeResult = {
+                "next_action": "tool",
+                "tool_calls": [{"tool": "read_file", "args": {"path": path}} for path in symbol_files],
+                "iterations": iterations + 1,
+                "llm_debug": {
+                    "phase1_resolved": True,
+                    "task_type": task_type,
+                    "file_discovery": "symbol_index",
+                },
+            }
+            if selected_agent:
+                result["selected_agent"] = selected_agent
+            return result
         if verbose:
             console.print(f"[dim]{discovery_message}[/dim]")
         result: PlanNodeResult = {
@@ -104,6 +104,7 @@ class ExplanationStrategy:
             tool_results_present=tool_results_present,
             messages=messages,
             iterations=iterations,
+            config=config,
             verbose=verbose,
         )
 
@@ -117,6 +118,8 @@ class ExplanationStrategy:
             "python_ast_graph",
             "python_dependency_graph",
             "python_ast_dependencies_multifile",
+            "find_symbol_definitions",
+            "find_symbol_references",
             "search_files",
             "grep_files",
             "ripgrep_search",
@@ -3,11 +3,12 @@ import json
 from traceback import format_exc
 
 from langchain_core.language_models.chat_models import BaseChatModel
-from langchain_core.messages import BaseMessage
+from langchain_core.messages import AIMessage, BaseMessage
 from rich.console import Console
 
 from codur.graph.state import AgentState
 from codur.config import CodurConfig
+from codur.graph.checkpoints import restore_last_green
 from codur.graph.node_types import ReviewNodeResult
 # Node names for routing
 NODE_END = "end"
@@ -22,6 +23,7 @@ from codur.graph.state_operations import (
     get_selected_agent,
 )
 from codur.graph.verification_agent import verification_agent_node
+from codur.graph.fix_candidates import AGENT_FIX_CANDIDATES
 
 console = Console()
 
@@ -53,6 +55,27 @@ def handle_verification_tool_output(messages: list[BaseMessage]) -> ReviewNodeRe
                 )
 
 
+def _restore_after_failed_verification(
+    result: ReviewNodeResult,
+    config: CodurConfig,
+    verbose: bool,
+) -> ReviewNodeResult:
+    """Roll edited files back to the last green checkpoint when verification failed."""
+    if result.get("next_action") == NODE_END:
+        return result
+    restored = restore_last_green(config)
+    if restored is None:
+        return result
+    checkpoint, changed = restored
+    note = (
+        f"Verification failed: restored {', '.join(changed)} to checkpoint {checkpoint.id} "
+        f"({checkpoint.label}), the last state whose tests/scripts passed."
+    )
+    if verbose:
+        console.print(f"[yellow]↺ {note}[/yellow]")
+    return ReviewNodeResult(**{**result, "messages": [AIMessage(content=note)]})
+
+
 def routing_node(state: AgentState, llm: BaseChatModel, config: CodurConfig) -> ReviewNodeResult:
     """Routing node: Review execution results and route to next node.
 
@@ -92,6 +115,14 @@ def routing_node(state: AgentState, llm: BaseChatModel, config: CodurConfig) ->
             "next_action": NODE_END,
         }
 
+    if outcome.get("agent") == AGENT_FIX_CANDIDATES and outcome.get("status") != "success":
+        # Every candidate was already verified in its own workspace; plan the next attempt.
+        if verbose:
+            console.print("[yellow]⚠ No fix candidate passed - back to planning[/yellow]")
+        return ReviewNodeResult(
+            next_action=NODE_LLM_PLAN,
+        )
+
     last_tool_call = get_last_tool_output(state)
     last_tool_name = last_tool_call.tool if last_tool_call else None
     if last_tool_name == "done":
@@ -122,9 +153,9 @@ def routing_node(state: AgentState, llm: BaseChatModel, config: CodurConfig) ->
         else:
             if verbose:
                 console.print(f"[yellow]⚠ Verification failed - continuing to fix[/yellow]")
-            return ReviewNodeResult(
+            return _restore_after_failed_verification(ReviewNodeResult(
                 next_action=NODE_VERIFICATION,
-            )
+            ), config, verbose)
 
 
     # If only tools ran (no agent did actual work), route to selected agent or back to planning
@@ -158,14 +189,14 @@ def routing_node(state: AgentState, llm: BaseChatModel, config: CodurConfig) ->
     messages = get_messages(state)
     result = handle_verification_tool_output(messages)
     if result:
-        return result
+        return _restore_after_failed_verification(result, config, verbose)
 
     # Try verification if it's a fix task and we haven't exceeded iterations
     if is_coding_agent_session(state) and iterations < max_iterations - 1:
         verification_outcome = verification_agent_node(state, config)
         result = handle_verification_tool_output(verification_outcome["messages"])
         if result:
-            return result
+            return _restore_after_failed_verification(result, config, verbose)
 
     # Accept result if:
     # - Not a fix task
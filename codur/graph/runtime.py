@@ -0,0 +1,182 @@
+"""
+Asyncio execution of the agent graph with LLM token streaming.
+
+Nodes stay synchronous; LangGraph runs them off the event loop. Tokens are
+taken from LangGraph's "messages" stream mode, which switches chat models
+invoked inside nodes to their streaming implementation.
+"""
+
+from __future__ import annotations
+
+import asyncio
+from typing import Any, Callable, Optional
+
+from langchain_core.messages import AIMessageChunk
+
+from codur.graph.checkpoints import checkpoint_scope
+from codur.graph.message_summary import rolling_summary_scope
+from codur.graph.tool_output_store import tool_output_scope
+from codur.graph.tool_result_cache import tool_result_scope
+from codur.utils.concurrency import AsyncLimits, cancel_scope, get_async_limits
+from codur.utils.llm_telemetry import llm_telemetry_scope
+
+# Nodes whose LLM output is prose worth showing as it is generated.
+# Planning and classification nodes produce JSON, so their tokens are not shown.
+STREAMED_NODES = frozenset({"coding", "explaining", "execute"})
+
+TokenCallback = Callable[[str, str], None]
+UpdateCallback = Callable[[dict], Any]
+
+
+def chunk_text(message: AIMessageChunk) -> str:
+    """Return the text carried by a streamed message chunk."""
+    content = message.content
+    if isinstance(content, str):
+        return content
+    parts = []
+    for block in content or []:
+        if isinstance(block, str):
+            parts.append(block)
+        elif isinstance(block, dict) and block.get("type") == "text":
+            parts.append(str(block.get("text", "")))
+    return "".join(parts)
+
+
+_STREAM_DONE = object()
+
+
+async def astream_graph(
+    graph,
+    payload: dict,
+    on_token: Optional[TokenCallback] = None,
+    on_update: Optional[UpdateCallback] = None,
+    limits: Optional[AsyncLimits] = None,
+) -> dict:
+    """Run the graph with astream and return the final state.
+
+    on_token(node, text) receives LLM tokens from STREAMED_NODES.
+    on_update(event) receives each node update ({node: output}); it may be a coroutine.
+    Events pass through a buffer of runtime.async.event_buffer_size entries; when a
+    slow consumer lets it fill up, the graph waits (backpressure) instead of queueing
+    without bound. With runtime.async.stream_events disabled no callbacks are made.
+    """
+    limits = limits or get_async_limits(payload.get("config"))
+    if not limits.stream_events:
+        on_token = on_update = None
+    stream_mode = ["values"]
+    if on_update is not None:
+        stream_mode.append("updates")
+    if on_token is not None:
+        stream_mode.append("messages")
+
+    buffer: asyncio.Queue = asyncio.Queue(maxsize=limits.event_buffer_size)
+    final_state: dict = dict(payload)
+
+    async def _produce() -> None:
+        nonlocal final_state
+        try:
+            async for mode, chunk in graph.astream(payload, stream_mode=stream_mode):
+                if mode == "values":
+                    final_state = chunk
+                else:
+                    await buffer.put((mode, chunk))
+        finally:
+            await buffer.put((_STREAM_DONE, None))
+
+    producer = asyncio.ensure_future(_produce())
+    try:
+        while True:
+            mode, chunk = await buffer.get()
+            if mode is _STREAM_DONE:
+                break
+            if mode == "updates":
+                result = on_update(chunk)
+                if asyncio.iscoroutine(result):
+                    await result
+            elif mode == "messages":
+                message, metadata = chunk
+                node = (metadata or {}).get("langgraph_node", "")
+                if node in STREAMED_NODES and isinstance(message, AIMessageChunk):
+                    text = chunk_text(message)
+                    if text:
+                        on_token(node, text)
+        await producer
+    finally:
+        if not producer.done():
+            producer.cancel()
+            try:
+                await producer
+            except (asyncio.CancelledError, Exception):
+                pass
+    return final_state
+
+
+async def ainvoke_graph(
+    graph,
+    payload: dict,
+    timeout_s: int | None = None,
+    on_token: Optional[TokenCallback] = None,
+    on_update: Optional[UpdateCallback] = None,
+) -> dict:
+    """Run the graph asynchronously, enforcing timeout_s when set.
+
+    The run executes under a cancellation token. On timeout (or when the caller
+    cancels) the token is cancelled so tool calls still running in node threads
+    stop at their next checkpoint. Tool calls share a run-scoped result cache
+    and keep large outputs in a run-scoped store, edited files are checkpointed,
+    agent nodes fold the rolling summary in the background, and the LLM call
+    records of the run are returned under "llm_telemetry".
+    """
+    limits = get_async_limits(payload.get("config"))
+    with (
+        cancel_scope() as token,
+        tool_result_scope(),
+        tool_output_scope(),
+        checkpoint_scope(),
+        rolling_summary_scope(),
+        llm_telemetry_scope() as telemetry,
+    ):
+        run = astream_graph(graph, payload, on_token=on_token, on_update=on_update, limits=limits)
+        try:
+            if not timeout_s:
+                final_state = await run
+            else:
+                final_state = await asyncio.wait_for(run, timeout=timeout_s)
+            final_state["llm_telemetry"] = telemetry.as_dicts()
+            return final_state
+        except asyncio.TimeoutError as exc:
+            token.cancel(f"run exceeded {timeout_s} seconds")
+            raise TimeoutError(f"Codur run exceeded {timeout_s} seconds") from exc
+        except asyncio.CancelledError:
+            token.cancel("run cancelled")
+            raise
+
+
+def run_graph(
+    graph,
+    payload: dict,
+    timeout_s: int | None = None,
+    on_token: Optional[TokenCallback] = None,
+    on_update: Optional[UpdateCallback] = None,
+) -> dict:
+    """Blocking entry point: run the graph on a fresh event loop.
+
+    Unlike asyncio.run, shutting the loop down waits at most cancel_grace_s for
+    node threads that are still finishing after a timeout.
+    """
+    grace_s = get_async_limits(payload.get("config")).cancel_grace_s
+    loop = asyncio.new_event_loop()
+    try:
+        asyncio.set_event_loop(loop)
+        return loop.run_until_complete(
+            ainvoke_graph(graph, payload, timeout_s, on_token=on_token, on_update=on_update)
+        )
+    finally:
+        try:
+            loop.run_until_complete(loop.shutdown_asyncgens())
+            loop.run_until_complete(asyncio.wait_for(loop.shutdown_default_executor(), timeout=grace_s))
+        except asyncio.TimeoutError:
+            pass
+        finally:
+            asyncio.set_event_loop(None)
+            loop.close()
@@ -31,6 +31,9 @@ class AgentState(TypedDict):
         error_hashes: Hashes of errors seen for deduplication
         local_repair_attempted: Whether a local repair was attempted
         agent_summaries: Summaries of agent actions
+        rolling_summary: Summary of the conversation folded so far
+        rolling_summary_upto: Number of messages the rolling summary covers
+        llm_telemetry: Per-call LLM records of the run (set when the run ends)
     """
     messages: Annotated[Sequence[BaseMessage], operator.add]
     next_action: str
@@ -47,6 +50,9 @@ class AgentState(TypedDict):
     local_repair_attempted: bool
     agent_summaries: list[str]
     classification: ClassificationResult | None
+    rolling_summary: str
+    rolling_summary_upto: int
+    llm_telemetry: list[dict]
 
 
 class AgentStateData(dict):
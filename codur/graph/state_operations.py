@@ -5,6 +5,7 @@ from typing import TYPE_CHECKING, Optional, Any
 from langchain_core.messages import BaseMessage, HumanMessage, ToolMessage, AIMessage, SystemMessage
 
 from codur.constants import TaskType
+from codur.graph.tool_output_store import resolve_output
 
 if TYPE_CHECKING:
     # Avoid circular imports for type checking
@@ -72,7 +73,8 @@ def parse_tool_message(message: ToolMessage) -> Optional[ToolOutput]:
         data = json.loads(message.content)
         return ToolOutput(
             tool=data.get("tool", ""),
-            output=data.get("output", ""),
+            # Large outputs are kept out of the message; read them back from the run's store.
+            output=resolve_output(data.get("output", "")),
             args=data.get("args", {}),
         )
     except (json.JSONDecodeError, TypeError):
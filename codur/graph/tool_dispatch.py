@@ -0,0 +1,432 @@
+"""Precompiled tool dispatch table.
+
+The table is built once per process from the `codur.tools` registry: each
+entry holds the tool function, an invoker chosen from its contexts/guards and
+an argument validator compiled from its JSON schema. Per-call data (workspace
+root, state, config, last user message) is passed at invocation time through
+`ToolCallContext` instead of being baked into closures.
+"""
+
+from __future__ import annotations
+
+import inspect
+import re
+from collections.abc import Mapping
+from dataclasses import dataclass
+from functools import lru_cache
+from pathlib import Path
+from typing import Any, Callable, Iterator, Optional
+
+from codur.config import CodurConfig
+from codur.graph.state import AgentState
+from codur.tools.schema_generator import function_to_json_schema
+from codur.tools.tool_annotations import (
+    ToolContext,
+    ToolGuard,
+    get_tool_contexts,
+    get_tool_guards,
+)
+from codur.utils.path_utils import resolve_path
+
+
+@dataclass(frozen=True)
+class ToolCallContext:
+    """Per-call data handed to tools that declare the matching ToolContext."""
+    root: Path
+    allow_outside_root: bool
+    state: AgentState
+    config: CodurConfig
+    last_human_msg: Optional[str] = None
+
+
+class ToolArgumentError(ValueError):
+    """Raised when tool call arguments do not match the tool's schema."""
+
+
+def _format_syntax_validation_result(result: dict) -> str:
+    """Format the result of validate_python_syntax for tool output."""
+    if result.get("valid"):
+        return "✓ Python syntax is valid"
+    else:
+        return f"✗ Syntax error:\n{result.get('error', 'Unknown error')}"
+
+
+_TEST_OVERWRITE_VERBS = {
+    "overwrite",
+    "replace",
+    "rewrite",
+    "regenerate",
+    "recreate",
+    "reset",
+}
+_TEST_WRITE_VERBS = {
+    "write",
+    "add",
+    "update",
+    "create",
+    "implement",
+    "generate",
+}
+
+
+def _is_test_path(path: Path) -> bool:
+    name = path.name.lower()
+    if name.startswith("test_") and name.endswith(".py"):
+        return True
+    if name.endswith("_test.py"):
+        return True
+    parts = {part.lower() for part in path.parts}
+    return "tests" in parts or "test" in parts
+
+
+def _allows_test_overwrite(last_human_msg: Optional[str], path: Path) -> bool:
+    if not last_human_msg:
+        return False
+    msg_lower = last_human_msg.lower()
+    filename = path.name.lower()
+    has_test_reference = (
+        (filename and filename in msg_lower)
+        or "test file" in msg_lower
+        or "unit test" in msg_lower
+        or re.search(r"\btests?\b", msg_lower) is not None
+    )
+    if any(verb in msg_lower for verb in _TEST_OVERWRITE_VERBS):
+        return has_test_reference
+    if any(verb in msg_lower for verb in _TEST_WRITE_VERBS):
+        return has_test_reference or ("unit test" in msg_lower or "tests" in msg_lower)
+    return False
+
+
+def _guard_test_file_overwrite(
+    path: Optional[str],
+    root: Path,
+    allow_outside_root: bool,
+    last_human_msg: Optional[str],
+) -> None:
+    if not path:
+        return
+    target = resolve_path(path, root, allow_outside_root=allow_outside_root)
+    if not target.exists():
+        return
+    if not _is_test_path(target):
+        return
+    if _allows_test_overwrite(last_human_msg, target):
+        return
+    raise ValueError(
+        f"Refusing to overwrite existing test file '{path}' without explicit request "
+        "to replace/overwrite it."
+    )
+
+
+# --- Argument validation -----------------------------------------------------
+
+_PY_TYPES: dict[str, tuple[type, ...]] = {
+    "integer": (int,),
+    "number": (int, float),
+    "boolean": (bool,),
+    "array": (list, tuple),
+    "object": (dict,),
+}
+
+
+def _coerce(value: Any, json_type: str) -> Any:
+    """Convert the string forms LLMs commonly emit for scalars; return value unchanged otherwise."""
+    if not isinstance(value, str):
+        return value
+    text = value.strip()
+    if json_type == "integer" and re.fullmatch(r"[+-]?\d+", text):
+        return int(text)
+    if json_type == "number":
+        try:
+            return float(text)
+        except ValueError:
+            return value
+    if json_type == "boolean" and text.lower() in ("true", "false"):
+        return text.lower() == "true"
+    return value
+
+
+def _matches(value: Any, json_type: str) -> bool:
+    if json_type == "string" or json_type not in _PY_TYPES:
+        # "string" is also the schema generator's fallback for Any and unions,
+        # so it is not enforced.
+        return True
+    if isinstance(value, bool) and json_type in ("integer", "number"):
+        return False
+    return isinstance(value, _PY_TYPES[json_type])
+
+
+@dataclass(frozen=True)
+class _ParamCheck:
+    types: tuple[str, ...]
+    nullable: bool
+    enum: Optional[frozenset]
+    item_enum: Optional[frozenset]
+
+    def check(self, name: str, value: Any) -> Any:
+        """Return the (possibly coerced) value, or raise ToolArgumentError."""
+        if value is None:
+            return value
+        for json_type in self.types:
+            candidate = _coerce(value, json_type)
+            if _matches(candidate, json_type):
+                value = candidate
+                break
+        else:
+            raise ToolArgumentError(
+                f"argument '{name}' must be {' or '.join(self.types)}, got {type(value).__name__}"
+            )
+        if self.enum is not None and isinstance(value, str) and value not in self.enum:
+            raise ToolArgumentError(f"argument '{name}' must be one of {sorted(self.enum)}, got {value!r}")
+        if self.item_enum is not None and isinstance(value, (list, tuple)):
+            invalid = [item for item in value if isinstance(item, str) and item not in self.item_enum]
+            if invalid:
+                raise ToolArgumentError(f"argument '{name}' has invalid values {invalid}; expected {sorted(self.item_enum)}")
+        return value
+
+
+@dataclass(frozen=True)
+class ArgValidator:
+    """Checks tool arguments against the tool's JSON schema."""
+    params: Mapping[str, _ParamCheck]
+    required: frozenset[str]
+    accepts_extra: bool = False
+
+    def validate(self, args: dict) -> None:
+        """Validate args in place (coercing scalar strings); raise ToolArgumentError on problems."""
+        problems = []
+        if not self.accepts_extra:
+            unknown = sorted(key for key in args if key not in self.params)
+            if unknown:
+                expected = ", ".join(self.params) or "none"
+                problems.append(
+                    f"unknown argument{'s' if len(unknown) > 1 else ''} {', '.join(map(repr, unknown))} "
+                    f"(expected: {expected})"
+                )
+        missing = sorted(key for key in self.required if args.get(key) is None)
+        if missing:
+            problems.append(f"missing required argument{'s' if len(missing) > 1 else ''} {', '.join(map(repr, missing))}")
+        for key, value in args.items():
+            check = self.params.get(key)
+            if check is None:
+                continue
+            try:
+                args[key] = check.check(key, value)
+            except ToolArgumentError as exc:
+                problems.append(str(exc))
+        if problems:
+            raise ToolArgumentError("; ".join(problems))
+
+
+def compile_arg_validator(
+    schema: dict,
+    *,
+    accepts_extra: bool = False,
+    optional: frozenset[str] = frozenset(),
+) -> ArgValidator:
+    """Compile a validator from a function schema as produced by function_to_json_schema."""
+    parameters = schema.get("parameters") or {}
+    params = {}
+    for name, prop in (parameters.get("properties") or {}).items():
+        raw_type = prop.get("type", "string")
+        types = [raw_type] if isinstance(raw_type, str) else list(raw_type)
+        items = prop.get("items") if isinstance(prop.get("items"), dict) else {}
+        params[name] = _ParamCheck(
+            types=tuple(json_type for json_type in types if json_type != "null") or ("string",),
+            nullable="null" in types,
+            enum=frozenset(prop["enum"]) if "enum" in prop else None,
+            item_enum=frozenset(items["enum"]) if "enum" in items else None,
+        )
+    required = frozenset(parameters.get("required") or ()) - optional
+    return ArgValidator(params=params, required=required, accepts_extra=accepts_extra)
+
+
+# --- Invokers -------------------------------------------------------------------
+
+Invoker = Callable[[Callable, dict, ToolCallContext], Any]
+
+
+def _invoke_with_config(func: Callable, args: dict, context: ToolCallContext) -> Any:
+    return func(config=context.config, state=context.state, **args)
+
+
+def _invoke_with_filesystem(func: Callable, args: dict, context: ToolCallContext) -> Any:
+    return func(
+        root=context.root,
+        allow_outside_root=context.allow_outside_root,
+        state=context.state,
+        **args
+    )
+
+
+def _invoke_with_search(func: Callable, args: dict, context: ToolCallContext) -> Any:
+    return func(root=context.root, state=context.state, **args)
+
+
+def _invoke_with_state(func: Callable, args: dict, context: ToolCallContext) -> Any:
+    return func(state=context.state, **args)
+
+
+def _invoke_agent_call(func: Callable, args: dict, context: ToolCallContext) -> Any:
+    args = dict(args)
+    # execute_tool_calls attaches the most recent read_file output as file context.
+    file_contents = args.pop("file_contents", None)
+    if file_contents:
+        args["challenge"] = f"{args.get('challenge', '')}\n\nFile contents:\n{file_contents}"
+    return func(config=context.config, state=context.state, **args)
+
+
+def _invoke_retry_in_agent(func: Callable, args: dict, context: ToolCallContext) -> Any:
+    return func(
+        task=args.get("task") or (context.last_human_msg or ""),
+        agent=args.get("agent", ""),
+        state=context.state,
+        config=context.config,
+        reason=args.get("reason"),
+    )
+
+
+def _invoke_validate_python_syntax(func: Callable, args: dict, context: ToolCallContext) -> Any:
+    return _format_syntax_validation_result(func(args.get("code", "")))
+
+
+_SPECIAL_INVOKERS: dict[str, Invoker] = {
+    "agent_call": _invoke_agent_call,
+    "retry_in_agent": _invoke_retry_in_agent,
+    "validate_python_syntax": _invoke_validate_python_syntax,
+}
+# Arguments the executor fills in when the model leaves them out.
+_OPTIONAL_ARGS: dict[str, frozenset[str]] = {"retry_in_agent": frozenset({"task"})}
+# Arguments the executor adds that are not part of the tool's schema.
+_INJECTED_ARGS: dict[str, frozenset[str]] = {"agent_call": frozenset({"file_contents"})}
+
+
+def _default_invoker(contexts: frozenset[ToolContext]) -> Invoker:
+    if ToolContext.CONFIG in contexts:
+        return _invoke_with_config
+    if ToolContext.FILESYSTEM in contexts:
+        return _invoke_with_filesystem
+    if ToolContext.SEARCH in contexts:
+        return _invoke_with_search
+    return _invoke_with_state
+
+
+def _accepts_var_kwargs(func: Callable) -> bool:
+    while hasattr(func, "__wrapped__"):
+        func = func.__wrapped__
+    try:
+        parameters = inspect.signature(func).parameters.values()
+    except (TypeError, ValueError):
+        return True
+    return any(param.kind is inspect.Parameter.VAR_KEYWORD for param in parameters)
+
+
+@dataclass(frozen=True)
+class ToolEntry:
+    """A tool function with its precomputed invoker and argument validator."""
+    name: str
+    func: Callable
+    invoker: Invoker
+    guards: frozenset[ToolGuard]
+    validator: Optional[ArgValidator]
+
+    def validate(self, args: dict) -> None:
+        if self.validator is None:
+            return
+        injected = _INJECTED_ARGS.get(self.name)
+        if injected and injected & args.keys():
+            self.validator.validate({key: value for key, value in args.items() if key not in injected})
+            return
+        self.validator.validate(args)
+
+    def __call__(self, args: dict, context: ToolCallContext) -> Any:
+        if ToolGuard.TEST_OVERWRITE in self.guards:
+            _guard_test_file_overwrite(
+                args.get("path"),
+                context.root,
+                context.allow_outside_root,
+                context.last_human_msg,
+            )
+        return self.invoker(self.func, args, context)
+
+
+def _build_entry(name: str, func: Callable) -> ToolEntry:
+    contexts = frozenset(get_tool_contexts(func))
+    try:
+        validator = compile_arg_validator(
+            function_to_json_schema(func),
+            accepts_extra=_accepts_var_kwargs(func),
+            optional=_OPTIONAL_ARGS.get(name, frozenset()),
+        )
+    except Exception:
+        validator = None
+    return ToolEntry(
+        name=name,
+        func=func,
+        invoker=_SPECIAL_INVOKERS.get(name) or _default_invoker(contexts),
+        guards=frozenset(get_tool_guards(func)),
+        validator=validator,
+    )
+
+
+class ToolDispatcher(Mapping):
+    """Read-only mapping of tool name to ToolEntry."""
+
+    def __init__(self, entries: dict[str, ToolEntry]) -> None:
+        self._entries = entries
+
+    def __getitem__(self, name: str) -> ToolEntry:
+        return self._entries[name]
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._entries)
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def validate(self, name: str, args: dict) -> Optional[str]:
+        """Return an error message if args are invalid for a known tool, else None."""
+        entry = self._entries.get(name)
+        if entry is None:
+            return None
+        try:
+            entry.validate(args)
+        except ToolArgumentError as exc:
+            return f"Invalid arguments for {name}: {exc}"
+        return None
+
+    def bind(self, context: ToolCallContext) -> "BoundTools":
+        return BoundTools(self, context)
+
+
+class BoundTools(Mapping):
+    """Tool name -> callable(args) view of a dispatcher for one call context."""
+
+    def __init__(self, dispatcher: ToolDispatcher, context: ToolCallContext) -> None:
+        self._dispatcher = dispatcher
+        self._context = context
+
+    def __getitem__(self, name: str) -> Callable[[dict], Any]:
+        entry = self._dispatcher[name]
+        context = self._context
+        return lambda args: entry(args, context)
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._dispatcher)
+
+    def __len__(self) -> int:
+        return len(self._dispatcher)
+
+
+@lru_cache(maxsize=1)
+def get_tool_dispatcher() -> ToolDispatcher:
+    """Return the process-wide dispatcher built from the codur.tools registry."""
+    from codur.tools import __all__ as tool_names
+    import codur.tools as tools_module
+
+    entries = {}
+    for tool_name in tool_names:
+        tool_func = getattr(tools_module, tool_name, None)
+        if callable(tool_func):
+            entries[tool_name] = _build_entry(tool_name, tool_func)
+    return ToolDispatcher(entries)
@@ -2,11 +2,15 @@
 
 from __future__ import annotations
 
+import contextvars
 import json
-from dataclasses import dataclass
+import threading
+import time
+from collections import deque
+from dataclasses import dataclass, field
+from functools import lru_cache, partial
 from pathlib import Path
 from typing import Optional, Any, Callable, List
-import re
 
 from langchain_core.messages import HumanMessage, BaseMessage, ToolMessage
 from rich.console import Console
@@ -14,87 +18,39 @@ from rich.console import Console
 from codur.config import CodurConfig
 from codur.graph.state import AgentState, AgentStateData
 from codur.graph.state_operations import get_messages, is_verbose, get_tool_calls
-from codur.utils.path_utils import resolve_path
-from codur.tools.tool_annotations import ToolContext, ToolGuard, get_tool_contexts, get_tool_guards
+from codur.graph.tool_dispatch import BoundTools, ToolCallContext, get_tool_dispatcher
+from codur.graph.checkpoints import CheckpointStore, checkpoints_enabled, current_checkpoint_store, is_passing_check
+from codur.graph.tool_output_store import (
+    DEFAULT_BLOB_HEAD_CHARS,
+    ToolOutputStore,
+    current_tool_output_store,
+    get_blob_threshold,
+    output_text,
+)
+from codur.graph.tool_result_cache import ToolResultCache, current_tool_result_cache
+from codur.utils.concurrency import (
+    AsyncLimits,
+    CancellationToken,
+    ConcurrencyLimiter,
+    cancel_scope,
+    current_cancel_token,
+    get_async_limits,
+    get_concurrency_limiter,
+    raise_if_cancelled,
+)
+from codur.utils.path_utils import current_workspace_root
+from codur.utils.rope_pool import notify_rope_changed
+from codur.utils.workspace_index import notify_path_changed
+from codur.tools.tool_annotations import (
+    ToolContext,
+    ToolSideEffect,
+    get_tool_contexts,
+    get_tool_side_effects,
+)
 
 console = Console()
 
 
-def _format_syntax_validation_result(result: dict) -> str:
-    """Format the result of validate_python_syntax for tool output."""
-    if result.get("valid"):
-        return "✓ Python syntax is valid"
-    else:
-        return f"✗ Syntax error:\n{result.get('error', 'Unknown error')}"
-
-
-_TEST_OVERWRITE_VERBS = {
-    "overwrite",
-    "replace",
-    "rewrite",
-    "regenerate",
-    "recreate",
-    "reset",
-}
-_TEST_WRITE_VERBS = {
-    "write",
-    "add",
-    "update",
-    "create",
-    "implement",
-    "generate",
-}
-
-
-def _is_test_path(path: Path) -> bool:
-    name = path.name.lower()
-    if name.startswith("test_") and name.endswith(".py"):
-        return True
-    if name.endswith("_test.py"):
-        return True
-    parts = {part.lower() for part in path.parts}
-    return "tests" in parts or "test" in parts
-
-
-def _allows_test_overwrite(last_human_msg: Optional[str], path: Path) -> bool:
-    if not last_human_msg:
-        return False
-    msg_lower = last_human_msg.lower()
-    filename = path.name.lower()
-    has_test_reference = (
-        (filename and filename in msg_lower)
-        or "test file" in msg_lower
-        or "unit test" in msg_lower
-        or re.search(r"\btests?\b", msg_lower) is not None
-    )
-    if any(verb in msg_lower for verb in _TEST_OVERWRITE_VERBS):
-        return has_test_reference
-    if any(verb in msg_lower for verb in _TEST_WRITE_VERBS):
-        return has_test_reference or ("unit test" in msg_lower or "tests" in msg_lower)
-    return False
-
-
-def _guard_test_file_overwrite(
-    path: Optional[str],
-    root: Path,
-    allow_outside_root: bool,
-    last_human_msg: Optional[str],
-) -> None:
-    if not path:
-        return
-    target = resolve_path(path, root, allow_outside_root=allow_outside_root)
-    if not target.exists():
-        return
-    if not _is_test_path(target):
-        return
-    if _allows_test_overwrite(last_human_msg, target):
-        return
-    raise ValueError(
-        f"Refusing to overwrite existing test file '{path}' without explicit request "
-        "to replace/overwrite it."
-    )
-
-
 @dataclass
 class ToolExecutionResult:
     results: list[dict]
@@ -104,6 +60,267 @@ class ToolExecutionResult:
     error_details: Optional[str] = None
 
 
+@dataclass
+class _ScheduledCall:
+    """A tool call queued for execution, with its position in the original batch."""
+    order: tuple[int, ...]
+    call: dict
+    output: Any = None
+    error: Optional[str] = None
+    cached: bool = False
+    args: dict = field(init=False)
+    # Set by the worker thread; copied into output/error unless the call timed out.
+    outcome: tuple[Any, Optional[str]] = (None, None)
+    token: CancellationToken = field(default_factory=CancellationToken)
+    started_at: float = 0.0
+    started: threading.Event = field(default_factory=threading.Event)
+    done: threading.Event = field(default_factory=threading.Event)
+    # Set when the wait gave up; the thread may still be running the tool.
+    timed_out: bool = False
+    # Run on the call's thread when it finishes after timing out.
+    on_finish: list[Callable[[], None]] = field(default_factory=list)
+    lock: threading.Lock = field(default_factory=threading.Lock)
+
+    def __post_init__(self) -> None:
+        args = self.call.get("args", {})
+        self.args = args if isinstance(args, dict) else {}
+
+    @property
+    def tool_name(self) -> Optional[str]:
+        return self.call.get("tool")
+
+
+# Side effects that force a tool call to run on its own, in request order.
+_ORDERED_SIDE_EFFECTS = frozenset({
+    ToolSideEffect.FILE_MUTATION,
+    ToolSideEffect.CODE_EXECUTION,
+    ToolSideEffect.STATE_CHANGE,
+})
+
+
+@lru_cache(maxsize=None)
+def _is_concurrent_safe(tool_name: Optional[str]) -> bool:
+    """Return True if a tool is read-only and may overlap with its neighbours.
+
+    Tools that mutate files, execute code, change external state or need the
+    full agent context (ToolContext.CONFIG, e.g. agent delegation) act as
+    ordering barriers. Unknown tools are treated as barriers as well.
+    """
+    if not tool_name:
+        return False
+    import codur.tools as tools_module
+
+    tool_func = getattr(tools_module, tool_name, None)
+    if not callable(tool_func):
+        return False
+    if ToolContext.CONFIG in get_tool_contexts(tool_func):
+        return False
+    return not any(effect in _ORDERED_SIDE_EFFECTS for effect in get_tool_side_effects(tool_func))
+
+
+@lru_cache(maxsize=None)
+def _is_cacheable(tool_name: Optional[str]) -> bool:
+    """Return True if repeated calls with the same args may reuse a result within a run."""
+    if not _is_concurrent_safe(tool_name):
+        return False
+    import codur.tools as tools_module
+
+    return not get_tool_side_effects(getattr(tools_module, tool_name))
+
+
+def _execute_scheduled(scheduled: _ScheduledCall, tool_map: dict, limiter: ConcurrencyLimiter) -> None:
+    try:
+        with cancel_scope(scheduled.token), limiter.slot():
+            scheduled.started_at = time.monotonic()
+            scheduled.started.set()
+            scheduled.outcome = (tool_map[scheduled.tool_name](scheduled.args), None)
+    except Exception as exc:
+        scheduled.outcome = (None, f"{scheduled.tool_name} failed: {exc}")
+    finally:
+        scheduled.started.set()
+        with scheduled.lock:
+            scheduled.done.set()
+            callbacks = list(scheduled.on_finish)
+        for callback in callbacks:
+            callback()
+
+
+def _run_when_finished(scheduled: _ScheduledCall, callback: Callable[[], None]) -> None:
+    """Run callback once the call's thread has finished (right away if it already has)."""
+    with scheduled.lock:
+        if not scheduled.done.is_set():
+            scheduled.on_finish.append(callback)
+            return
+    callback()
+
+
+def _start_scheduled(scheduled: _ScheduledCall, tool_map: dict, limiter: ConcurrencyLimiter) -> None:
+    """Run a call on a daemon thread so a hung tool can be abandoned after its timeout."""
+    scheduled.token = CancellationToken(parent=current_cancel_token())
+    context = contextvars.copy_context()
+    threading.Thread(
+        target=context.run,
+        args=(_execute_scheduled, scheduled, tool_map, limiter),
+        name=f"codur-tool-{scheduled.tool_name}",
+        daemon=True,
+    ).start()
+
+
+def _await_scheduled(scheduled: _ScheduledCall, limits: AsyncLimits) -> None:
+    """Wait for a call, enforcing tool_timeout_s and then cancel_grace_s."""
+    timeout = limits.tool_timeout_s
+    if timeout <= 0:
+        scheduled.done.wait()
+    else:
+        # Abandoned calls keep their limiter slot, so the wait for one is bounded too.
+        if not scheduled.started.wait(timeout):
+            scheduled.timed_out = True
+            scheduled.token.cancel(f"no free slot after {timeout:g}s")
+            scheduled.done.wait(limits.cancel_grace_s)
+            scheduled.error = f"{scheduled.tool_name} timed out after {timeout:g}s waiting for a free slot"
+            return
+        remaining = scheduled.started_at + timeout - time.monotonic()
+        if not scheduled.done.wait(max(0.0, remaining)):
+            scheduled.timed_out = True
+            scheduled.token.cancel(f"timed out after {timeout:g}s")
+            stopped = scheduled.done.wait(limits.cancel_grace_s)
+            scheduled.error = f"{scheduled.tool_name} timed out after {timeout:g}s"
+            if not stopped:
+                scheduled.error += f" (still running after {limits.cancel_grace_s:g}s grace period, abandoned)"
+            return
+    scheduled.output, scheduled.error = scheduled.outcome
+
+
+def _run_batch(
+    batch: list[_ScheduledCall],
+    tool_map: dict,
+    limits: AsyncLimits,
+    limiter: ConcurrencyLimiter,
+) -> None:
+    """Execute a batch of calls in order, keeping up to max_concurrent_agents in flight."""
+    pending = deque(batch)
+    running: deque[_ScheduledCall] = deque()
+    while pending or running:
+        while pending and len(running) < limits.max_concurrent:
+            scheduled = pending.popleft()
+            _start_scheduled(scheduled, tool_map, limiter)
+            running.append(scheduled)
+        _await_scheduled(running.popleft(), limits)
+
+
+_MUTATION_PATH_KEYS = ("path", "source", "destination", "destination_dir")
+
+
+def get_mutated_paths(tool_name: Optional[str], args: dict, output: Any = None) -> Optional[list[str]]:
+    """Return the paths a file-mutating tool call touched, or None if the tool does not mutate files."""
+    if not tool_name:
+        return None
+    import codur.tools as tools_module
+
+    tool_func = getattr(tools_module, tool_name, None)
+    if not callable(tool_func) or ToolSideEffect.FILE_MUTATION not in get_tool_side_effects(tool_func):
+        return None
+    paths = [args[key] for key in _MUTATION_PATH_KEYS if isinstance(args.get(key), str)]
+    for item in args.get("files") or []:
+        if isinstance(item, dict) and isinstance(item.get("path"), str):
+            paths.append(item["path"])
+    # Refactoring tools (rope) also report the other files they rewrote.
+    if isinstance(output, dict) and isinstance(output.get("changed_files"), list):
+        paths.extend(path for path in output["changed_files"] if isinstance(path, str))
+    return paths
+
+
+def _notify_file_mutation(tool_name: Optional[str], args: dict, root: Path, output: Any = None) -> Optional[list[str]]:
+    """Let the workspace index and pooled rope projects know which paths a file-mutating tool touched.
+
+    Returns the touched paths, or None if the tool does not mutate files.
+    """
+    paths = get_mutated_paths(tool_name, args, output)
+    if paths is None:
+        return None
+    for path in paths:
+        notify_path_changed(root / path)
+        notify_rope_changed(root / path)
+    return paths
+
+
+def _invalidate_after_timeout(
+    scheduled: _ScheduledCall,
+    root: Path,
+    cache: Optional[ToolResultCache],
+    checkpoints: Optional[CheckpointStore],
+) -> None:
+    """Treat a timed-out ordered call as having changed everything it could reach.
+
+    Its output is unknown and its thread may still be writing, so this runs once
+    when the wait gives up and again when the thread finishes.
+    """
+    for path in get_mutated_paths(scheduled.tool_name, scheduled.args) or []:
+        notify_path_changed(root / path)
+        notify_rope_changed(root / path)
+    if cache is not None:
+        cache.clear()
+    if checkpoints is not None and get_mutated_paths(scheduled.tool_name, scheduled.args) is not None:
+        checkpoints.checkpoint(f"after {scheduled.tool_name} (timed out)")
+
+
+def _checkpoint_store(root: Path, config: CodurConfig) -> Optional[CheckpointStore]:
+    """The run's checkpoint store, when it covers the workspace these calls run in."""
+    store = current_checkpoint_store()
+    if store is None or not checkpoints_enabled(config) or store.root != root.resolve():
+        return None
+    return store
+
+
+def _checkpoint_results(store: CheckpointStore, results: list[dict]) -> None:
+    """Snapshot the files these calls edited; a passing check after the last edit makes it green."""
+    edited: list[str] = []
+    green = False
+    for res in results:
+        if get_mutated_paths(res["tool"], res["args"], res["output"]) is not None:
+            edited.append(res["tool"])
+            green = False
+        elif is_passing_check(res["tool"], res["output"]):
+            green = True
+    if edited:
+        store.checkpoint("after " + ", ".join(dict.fromkeys(edited)))
+    if green:
+        store.mark_green()
+
+
+# Paging tool for stored outputs; its own pages are never stored again.
+_UNSTORED_TOOLS = frozenset({"read_tool_output"})
+
+
+def _compact_result(res: dict, store: Optional[ToolOutputStore], threshold: int) -> dict:
+    """Replace a large output with a stub pointing into the run's tool output store."""
+    if store is None or threshold <= 0 or res.get("tool") in _UNSTORED_TOOLS:
+        return res
+    output = res.get("output")
+    if len(output_text(output)) <= threshold:
+        return res
+    return {**res, "output": store.stub(output, head_chars=min(DEFAULT_BLOB_HEAD_CHARS, threshold))}
+
+
+def _update_result_cache(
+    cache: Optional[ToolResultCache],
+    scheduled: _ScheduledCall,
+    mutated_paths: Optional[list[str]],
+) -> None:
+    """Store read-only results; invalidate entries a workspace-changing call may have affected."""
+    if cache is None:
+        return
+    tool_name = scheduled.tool_name
+    if _is_cacheable(tool_name):
+        if scheduled.error is None:
+            cache.put(tool_name, scheduled.args, scheduled.output)
+    elif mutated_paths:
+        cache.invalidate_paths(mutated_paths)
+    elif mutated_paths is not None or not _is_concurrent_safe(tool_name):
+        # Code execution, git state changes, delegation or unknown targets: start over.
+        cache.clear()
+
+
 def _inject_missing_required_params(tool_calls: list[dict], state: AgentState) -> None:
     """Inject missing required parameters when they can be inferred from context.
 
@@ -156,7 +373,7 @@ def execute_tool_calls(
         console.log(f"[cyan]Executing {len(tool_calls)} tool call(s)...[/cyan]")
 
     """Execute tool calls using a shared tool map."""
-    root = Path.cwd()
+    root = current_workspace_root() or Path.cwd()
     allow_outside_root = config.runtime.allow_outside_workspace
     tool_state = state if hasattr(state, "get_config") else AgentStateData(state)
 
@@ -175,33 +392,77 @@ def execute_tool_calls(
 
     last_human_msg = _last_human_message(get_messages(state) or [])
     tool_map = _build_tool_map(root, allow_outside_root, tool_state, last_human_msg, config)
+    dispatcher = get_tool_dispatcher()
     verbose = is_verbose(state)
-
-    i = 0
-    while i < len(tool_calls):
-        call = tool_calls[i]
-        tool_name = call.get("tool")
-        args = call.get("args", {})
-        if not isinstance(args, dict):
-            args = {}
-        _normalize_tool_args(args)
-        if verbose:
-            console.log(f"Executing tool call: {_format_tool_call_for_log(tool_name, args)}")
-
-        # For agent_call, inject file_contents from the most recent read_file result
-        if tool_name == "agent_call" and last_read_file_output is not None:
-            args["file_contents"] = last_read_file_output
-
-        if tool_name not in tool_map:
-            msg = f"Unknown tool: {tool_name}"
-            errors.append(msg)
+    limits = get_async_limits(config)
+    limiter = get_concurrency_limiter(config)
+    result_cache = current_tool_result_cache()
+    checkpoints = _checkpoint_store(root, config)
+
+    outcomes: list[_ScheduledCall] = []
+    queue = deque(_ScheduledCall(order=(idx,), call=call) for idx, call in enumerate(tool_calls))
+    while queue:
+        # Stop scheduling once the run has been cancelled (e.g. max_runtime_s elapsed).
+        raise_if_cancelled()
+        # Collect a batch: either a single ordered call, or a run of consecutive
+        # read-only calls that may overlap on the thread pool.
+        batch = [queue.popleft()]
+        if _is_concurrent_safe(batch[0].tool_name):
+            while queue and _is_concurrent_safe(queue[0].tool_name):
+                batch.append(queue.popleft())
+
+        runnable: list[_ScheduledCall] = []
+        for scheduled in batch:
+            tool_name = scheduled.tool_name
+            args = scheduled.args
+            _normalize_tool_args(args)
             if verbose:
-                console.log(f"[red]{msg}[/red]")
-            i += 1
-            continue
-        try:
-            output = tool_map[tool_name](args)
-            results.append({"tool": tool_name, "output": output, "args": dict(args)})
+                console.log(f"Executing tool call: {_format_tool_call_for_log(tool_name, args)}")
+
+            # For agent_call, inject file_contents from the most recent read_file result
+            if tool_name == "agent_call" and last_read_file_output is not None:
+                args["file_contents"] = last_read_file_output
+
+            if tool_name not in tool_map:
+                scheduled.error = f"Unknown tool: {tool_name}"
+                if verbose:
+                    console.log(f"[red]{scheduled.error}[/red]")
+                outcomes.append(scheduled)
+                continue
+            scheduled.error = dispatcher.validate(tool_name, args)
+            if scheduled.error is not None:
+                if verbose:
+                    console.log(f"[red]{scheduled.error}[/red]")
+                outcomes.append(scheduled)
+                continue
+            if result_cache is not None and _is_cacheable(tool_name):
+                scheduled.cached, cached_output = result_cache.get(tool_name, args)
+                if scheduled.cached:
+                    scheduled.output = cached_output
+            runnable.append(scheduled)
+
+        if checkpoints is not None:
+            for item in runnable:
+                checkpoints.track(get_mutated_paths(item.tool_name, item.args) or [])
+        _run_batch([item for item in runnable if not item.cached], tool_map, limits, limiter)
+
+        # Post-process in call order so follow-up calls stay deterministic.
+        follow_ups: list[_ScheduledCall] = []
+        for scheduled in runnable:
+            outcomes.append(scheduled)
+            tool_name = scheduled.tool_name
+            if scheduled.timed_out and not _is_concurrent_safe(tool_name):
+                invalidate = partial(_invalidate_after_timeout, scheduled, root, result_cache, checkpoints)
+                invalidate()
+                _run_when_finished(scheduled, invalidate)
+            elif not scheduled.cached:
+                mutated_paths = _notify_file_mutation(tool_name, scheduled.args, root, scheduled.output)
+                _update_result_cache(result_cache, scheduled, mutated_paths)
+            if scheduled.error is not None:
+                if verbose:
+                    console.log(f"[red]{scheduled.error}[/red]")
+                continue
+            output = scheduled.output
             if tool_name == "read_file":
                 last_read_file_output = output
             if tool_name == "list_files" and not has_multifile_call:
@@ -209,27 +470,34 @@ def execute_tool_calls(
                 if isinstance(output, list):
                     py_files = [item for item in output if isinstance(item, str) and item.endswith(".py")]
                 if 0 < len(py_files) <= 5:
-                    tool_calls.insert(
-                        i + 1,
-                        {"tool": "python_ast_dependencies_multifile", "args": {"paths": py_files}},
-                    )
+                    follow_ups.append(_ScheduledCall(
+                        order=scheduled.order + (1,),
+                        call={"tool": "python_ast_dependencies_multifile", "args": {"paths": py_files}},
+                    ))
                     has_multifile_call = True
 
             if verbose and isinstance(output, dict) and "error" in output:
                 console.log(f"[red]{tool_name} error:\n{output}[/red]")
+        queue.extendleft(reversed(follow_ups))
 
-        except Exception as exc:
-            msg = f"{tool_name} failed: {exc}"
-            errors.append(msg)
-            if verbose:
-                console.log(f"[red]{msg}[/red]")
-        i += 1
-
+    for scheduled in sorted(outcomes, key=lambda item: item.order):
+        if scheduled.error is not None:
+            errors.append(scheduled.error)
+        else:
+            result = {"tool": scheduled.tool_name, "output": scheduled.output, "args": dict(scheduled.args)}
+            if scheduled.cached:
+                result["cached"] = True
+            results.append(result)
+    if checkpoints is not None:
+        _checkpoint_results(checkpoints, results)
+
+    output_store = current_tool_output_store()
+    blob_threshold = get_blob_threshold(config)
     tool_call_messages = []
     for res in results:
         tool_call_id = res.get("id")
         tool_name = res.get("tool")
-        tool_result_json = json.dumps(res)
+        tool_result_json = json.dumps(_compact_result(res, output_store, blob_threshold))
         if not tool_call_id:
             tool_call_id = hash(tool_result_json)
         tool_call_messages.append(ToolMessage(content=tool_result_json, tool_call_id=tool_call_id, tool_name=tool_name))
@@ -246,15 +514,7 @@ def execute_tool_calls(
 
 def get_tool_names(state: AgentState, config: CodurConfig) -> set[str]:
     """Return the set of supported tool names."""
-    root = Path.cwd()
-    allow_outside_root = config.runtime.allow_outside_workspace
-    tool_state = state if hasattr(state, "get_config") else AgentStateData(state)
-    last_human_msg = _last_human_message(get_messages(state) or [])
-    tool_map = _build_tool_map(root, allow_outside_root, tool_state, last_human_msg, config)
-    return set(tool_map.keys())
-
-
-_OUTPUT_FORMATTERS = {"validate_python_syntax": _format_syntax_validation_result}
+    return set(get_tool_dispatcher())
 
 
 def _build_tool_map(
@@ -263,78 +523,23 @@ def _build_tool_map(
     tool_state: AgentState,
     last_human_msg: Optional[str],
     config: CodurConfig,
-) -> dict:
-    """Build tool map dynamically from tool registry."""
-    from codur.tools import __all__ as tool_names
-    import codur.tools as tools_module
-
-    tool_map = {}
-
-    for tool_name in tool_names:
-        # Get the tool function
-        tool_func = getattr(tools_module, tool_name, None)
-        if not callable(tool_func):
-            continue
-
-        contexts = set(get_tool_contexts(tool_func))
-        guards = set(get_tool_guards(tool_func))
-
-        # Handle special cases
-        if tool_name in _OUTPUT_FORMATTERS:
-            # Format output for specific tools
-            formatter = _OUTPUT_FORMATTERS[tool_name]
-            tool_map[tool_name] = lambda args, tf=tool_func, fmt=formatter: fmt(tf(args.get("code", "")))
-
-        else:
-            def _invoke_with_context(
-                args: dict,
-                tf=tool_func,
-                tool_name=tool_name,
-                contexts=contexts,
-            ):
-                if ToolContext.CONFIG in contexts:
-                    if tool_name == "agent_call":
-                        return tf(config=config, state=tool_state, **args)
-                    if tool_name == "retry_in_agent":
-                        return tf(
-                            task=args.get("task") or (last_human_msg or ""),
-                            agent=args.get("agent", ""),
-                            state=tool_state,
-                            config=config,
-                            reason=args.get("reason"),
-                        )
-                    return tf(config=config, state=tool_state, **args)
-                if ToolContext.FILESYSTEM in contexts:
-                    return tf(
-                        root=root,
-                        allow_outside_root=allow_outside_root,
-                        state=tool_state,
-                        **args
-                    )
-                if ToolContext.SEARCH in contexts:
-                    return tf(root=root, state=tool_state, **args)
-                return tf(state=tool_state, **args)
-
-            if ToolGuard.TEST_OVERWRITE in guards:
-                def _guarded(args: dict, invoke=_invoke_with_context) -> str:
-                    _guard_test_file_overwrite(
-                        args.get("path"),
-                        root,
-                        allow_outside_root,
-                        last_human_msg,
-                    )
-                    return invoke(args)
-                tool_map[tool_name] = _guarded
-            else:
-                tool_map[tool_name] = _invoke_with_context
-
-    return tool_map
+) -> BoundTools:
+    """Bind the shared tool dispatcher to this call's context."""
+    context = ToolCallContext(
+        root=root,
+        allow_outside_root=allow_outside_root,
+        state=tool_state,
+        config=config,
+        last_human_msg=last_human_msg,
+    )
+    return get_tool_dispatcher().bind(context)
 
 
 def _format_summary(results: list[dict], errors: list[str], mode: str) -> str:
     summary_lines = []
     for item in results:
-        summary_lines.append(_format_tool_result(item, mode))
+        line = _format_tool_result(item, mode)
+        summary_lines.append(f"{line} (cached)" if item.get("cached") else line)
     for error in errors:
         summary_lines.append(f"error: {error}")
     return "\n".join(summary_lines) if summary_lines else "No tool calls executed."
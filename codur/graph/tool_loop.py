@@ -0,0 +1,121 @@
+"""Turn and token budgets for an agent's tool-calling loop.
+
+An agent node calls the LLM, executes the returned tool calls and goes again
+until one of these happens:
+- the model calls a finishing tool (`done`, `build_verification_response`),
+- a turn makes no tool calls,
+- a turn repeats the exact tool calls of an earlier turn with no file
+  modified in between (the model is stuck),
+- `runtime.coding_max_turns` turns have run, or the LLM calls of the loop have
+  used `runtime.coding_max_tokens` tokens (prompt + completion, as recorded
+  by the LLM telemetry).
+"""
+
+from __future__ import annotations
+
+import json
+from dataclasses import dataclass, field
+from typing import Optional
+
+from codur.graph.tool_executor import ToolExecutionResult, get_mutated_paths
+from codur.utils.llm_telemetry import LLMTelemetry
+
+DEFAULT_MAX_TURNS = 5
+
+STOP_FINISHED = "finished"
+STOP_NO_TOOL_CALLS = "no tool calls"
+STOP_REPEATED_CALLS = "repeated identical tool calls"
+STOP_TURN_BUDGET = "turn budget exhausted"
+STOP_TOKEN_BUDGET = "token budget exhausted"
+
+FINISHING_TOOLS = frozenset({"done", "build_verification_response"})
+
+
+@dataclass(frozen=True)
+class ToolLoopBudget:
+    """Limits of one tool loop; max_tokens None means unlimited."""
+    max_turns: int = DEFAULT_MAX_TURNS
+    max_tokens: Optional[int] = None
+
+
+def get_tool_loop_budget(config: object | None) -> ToolLoopBudget:
+    """Read runtime.coding_max_turns and runtime.coding_max_tokens."""
+    runtime = getattr(config, "runtime", None)
+    max_turns = getattr(runtime, "coding_max_turns", DEFAULT_MAX_TURNS)
+    max_tokens = getattr(runtime, "coding_max_tokens", None)
+    try:
+        max_turns = max(1, int(max_turns))
+    except (TypeError, ValueError):
+        max_turns = DEFAULT_MAX_TURNS
+    try:
+        max_tokens = int(max_tokens) if max_tokens else None
+    except (TypeError, ValueError):
+        max_tokens = None
+    return ToolLoopBudget(max_turns=max_turns, max_tokens=max_tokens)
+
+
+def _call_signature(result: dict) -> str:
+    return json.dumps([result.get("tool"), result.get("args") or {}], sort_keys=True, default=str)
+
+
+@dataclass
+class ToolLoop:
+    """Decides after each turn whether the loop goes on.
+
+    `telemetry` is the LLM telemetry the loop's calls are recorded in; only
+    records added after the loop started and whose invoked_by starts with
+    `invoked_by_prefix` count towards the token budget.
+    """
+    budget: ToolLoopBudget
+    telemetry: Optional[LLMTelemetry] = None
+    invoked_by_prefix: str = ""
+    turns: int = 0
+    stop_reason: Optional[str] = None
+    _first_record: int = 0
+    _seen: set[str] = field(default_factory=set)
+
+    def __post_init__(self) -> None:
+        if self.telemetry is not None:
+            self._first_record = len(self.telemetry.records)
+
+    @property
+    def tokens_used(self) -> int:
+        if self.telemetry is None:
+            return 0
+        return sum(
+            record.prompt_tokens + record.completion_tokens
+            for record in self.telemetry.records[self._first_record:]
+            if record.invoked_by.startswith(self.invoked_by_prefix) and not record.cached
+        )
+
+    def finish_turn(self, execution_result: ToolExecutionResult) -> bool:
+        """Record a completed turn; return True when the loop should run another one."""
+        self.turns += 1
+        results = execution_result.results
+        if not results:
+            self.stop_reason = STOP_NO_TOOL_CALLS
+        elif results[-1].get("tool") in FINISHING_TOOLS:
+            self.stop_reason = STOP_FINISHED
+        elif self._repeats(results):
+            self.stop_reason = STOP_REPEATED_CALLS
+        elif self.turns >= self.budget.max_turns:
+            self.stop_reason = STOP_TURN_BUDGET
+        elif self.budget.max_tokens is not None and self.tokens_used >= self.budget.max_tokens:
+            self.stop_reason = STOP_TOKEN_BUDGET
+        return self.stop_reason is None
+
+    def _repeats(self, results: list[dict]) -> bool:
+        """True when this turn's calls match an earlier turn since the last file change."""
+        signature = "\n".join(_call_signature(result) for result in results)
+        if signature in self._seen:
+            return True
+        mutated = (
+            get_mutated_paths(result.get("tool"), result.get("args") or {}, result.get("output")) is not None
+            for result in results
+        )
+        if any(mutated):
+            # Re-running the same checks after an edit is progress, not a loop.
+            self._seen.clear()
+        else:
+            self._seen.add(signature)
+        return False
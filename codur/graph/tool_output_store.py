@@ -0,0 +1,126 @@
+"""Run-scoped, content-addressed store for large tool outputs.
+
+A full `read_file` body or pytest log serialized into a ToolMessage stays in
+the message history and is re-sent with every later LLM call. When a run scope
+is active (see `tool_output_scope`, opened by the graph runtime),
+`execute_tool_calls` stores outputs above `tools.output_blob_threshold_chars`
+here and the ToolMessage carries a stub instead: the head of the output, its
+size and a handle the model pages through with `read_tool_output`.
+
+`parse_tool_message` resolves stubs back to the full output for nodes that
+read tool results from the history.
+"""
+
+from __future__ import annotations
+
+import contextvars
+import hashlib
+import json
+import threading
+from contextlib import contextmanager
+from typing import Any, Iterator, Optional, TypedDict
+
+DEFAULT_BLOB_THRESHOLD_CHARS = 8000
+DEFAULT_BLOB_HEAD_CHARS = 2000
+# Key identifying a stub in a ToolMessage output.
+BLOB_HANDLE_KEY = "blob_handle"
+
+
+class ToolOutputStub(TypedDict):
+    """What the ToolMessage carries in place of a stored output."""
+    blob_handle: str
+    total_chars: int
+    head: str
+    hint: str
+
+
+def output_text(output: Any) -> str:
+    """Text form of a tool output, as it would appear in the ToolMessage."""
+    return output if isinstance(output, str) else json.dumps(output, default=str)
+
+
+class ToolOutputStore:
+    """Large tool outputs keyed by a hash of their text."""
+
+    def __init__(self) -> None:
+        self._texts: dict[str, str] = {}
+        self._outputs: dict[str, Any] = {}
+        self._lock = threading.Lock()
+
+    def put(self, output: Any) -> str:
+        """Store an output and return its handle (identical outputs share one entry)."""
+        text = output_text(output)
+        handle = "blob-" + hashlib.blake2b(text.encode("utf-8"), digest_size=8).hexdigest()
+        with self._lock:
+            self._texts[handle] = text
+            self._outputs[handle] = output
+        return handle
+
+    def get(self, handle: str) -> Optional[Any]:
+        with self._lock:
+            return self._outputs.get(handle)
+
+    def text(self, handle: str) -> Optional[str]:
+        with self._lock:
+            return self._texts.get(handle)
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._texts)
+
+    def stub(self, output: Any, head_chars: int = DEFAULT_BLOB_HEAD_CHARS) -> ToolOutputStub:
+        """Store `output` and return the stub that replaces it in the ToolMessage."""
+        handle = self.put(output)
+        text = self._texts[handle]
+        return ToolOutputStub(
+            blob_handle=handle,
+            total_chars=len(text),
+            head=text[:head_chars],
+            hint=(
+                f"Output truncated after {min(head_chars, len(text))} of {len(text)} chars. "
+                f'Call read_tool_output(handle="{handle}", offset={head_chars}) for more.'
+            ),
+        )
+
+
+def is_output_stub(output: Any) -> bool:
+    return isinstance(output, dict) and isinstance(output.get(BLOB_HANDLE_KEY), str)
+
+
+def resolve_output(output: Any) -> Any:
+    """Return the stored output behind a stub (the stub itself when unavailable)."""
+    store = current_tool_output_store()
+    if store is None or not is_output_stub(output):
+        return output
+    stored = store.get(output[BLOB_HANDLE_KEY])
+    return output if stored is None else stored
+
+
+def get_blob_threshold(config: object | None) -> int:
+    """Read tools.output_blob_threshold_chars; 0 or less disables the store."""
+    value = getattr(getattr(config, "tools", None), "output_blob_threshold_chars", DEFAULT_BLOB_THRESHOLD_CHARS)
+    try:
+        return int(value)
+    except (TypeError, ValueError):
+        return DEFAULT_BLOB_THRESHOLD_CHARS
+
+
+_CURRENT_STORE: contextvars.ContextVar[Optional[ToolOutputStore]] = contextvars.ContextVar(
+    "codur_tool_output_store", default=None
+)
+
+
+def current_tool_output_store() -> Optional[ToolOutputStore]:
+    """Return the store of the active run, or None outside a run."""
+    return _CURRENT_STORE.get()
+
+
+@contextmanager
+def tool_output_scope(store: Optional[ToolOutputStore] = None) -> Iterator[ToolOutputStore]:
+    """Keep large tool outputs out of messages for tool calls made inside the block."""
+    store = store or ToolOutputStore()
+    reset = _CURRENT_STORE.set(store)
+    try:
+        yield store
+    finally:
+        _CURRENT_STORE.reset(reset)
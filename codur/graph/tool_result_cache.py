@@ -0,0 +1,148 @@
+"""Run-scoped cache of read-only tool results.
+
+Within one graph run the planner and coding loops re-issue identical
+`read_file`, `list_files`, `git_status`, ... calls. `execute_tool_calls`
+serves repeats from this cache when a run scope is active (see
+`tool_result_scope`, opened by the graph runtime).
+
+An entry records the paths the call depends on (path-like args, or the
+workspace root when there are none) and the (mtime, size) of those that are
+files. It is dropped when a FILE_MUTATION tool touches an overlapping path,
+when a file it read changed on disk, or when a tool that can change the
+workspace in unknown ways (code execution, git state changes, agent
+delegation) runs.
+"""
+
+from __future__ import annotations
+
+import contextvars
+import json
+import os
+import threading
+from contextlib import contextmanager
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Iterable, Iterator, Optional
+
+# Args whose values name files or directories a tool reads.
+_PATH_ARG_KEYS = ("path", "file_path", "source", "cwd")
+_PATH_LIST_ARG_KEYS = ("paths",)
+
+
+@dataclass
+class _Entry:
+    output: Any
+    deps: tuple[Path, ...]
+    stamps: tuple[Optional[tuple[int, int]], ...]
+
+
+def _stamp(path: Path) -> Optional[tuple[int, int]]:
+    """(mtime_ns, size) for files; None for directories and missing paths."""
+    try:
+        stat = os.stat(path)
+    except OSError:
+        return None
+    if not os.path.isfile(path):
+        return None
+    return stat.st_mtime_ns, stat.st_size
+
+
+def _overlaps(a: Path, b: Path) -> bool:
+    return a == b or a in b.parents or b in a.parents
+
+
+class ToolResultCache:
+    """Cache of read-only tool outputs, invalidated by overlapping mutations."""
+
+    def __init__(self, root: Optional[Path] = None) -> None:
+        self.root = (root or Path.cwd()).resolve()
+        self.hits = 0
+        self.misses = 0
+        self._entries: dict[str, _Entry] = {}
+        self._lock = threading.Lock()
+
+    def get(self, tool_name: str, args: dict) -> tuple[bool, Any]:
+        """Return (found, output) for a call."""
+        key = self._key(tool_name, args)
+        with self._lock:
+            entry = self._entries.get(key) if key else None
+            if entry is not None and tuple(_stamp(dep) for dep in entry.deps) != entry.stamps:
+                del self._entries[key]
+                entry = None
+            if entry is None:
+                self.misses += 1
+                return False, None
+            self.hits += 1
+            return True, entry.output
+
+    def put(self, tool_name: str, args: dict, output: Any) -> None:
+        key = self._key(tool_name, args)
+        if key is None:
+            return
+        deps = self._dependencies(args)
+        with self._lock:
+            self._entries[key] = _Entry(output, deps, tuple(_stamp(dep) for dep in deps))
+
+    def invalidate_paths(self, paths: Iterable[str | Path]) -> None:
+        """Drop entries depending on any path overlapping one of `paths`."""
+        changed = [self._resolve(path) for path in paths]
+        if not changed:
+            return
+        with self._lock:
+            stale = [
+                key for key, entry in self._entries.items()
+                if any(_overlaps(dep, path) for dep in entry.deps for path in changed)
+            ]
+            for key in stale:
+                del self._entries[key]
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def _key(self, tool_name: str, args: dict) -> Optional[str]:
+        try:
+            return tool_name + ":" + json.dumps(args, sort_keys=True, separators=(",", ":"))
+        except (TypeError, ValueError):
+            return None
+
+    def _dependencies(self, args: dict) -> tuple[Path, ...]:
+        base = self._resolve(args["root"]) if isinstance(args.get("root"), str) else self.root
+        raw: list[str] = [args[key] for key in _PATH_ARG_KEYS if isinstance(args.get(key), str)]
+        for key in _PATH_LIST_ARG_KEYS:
+            values = args.get(key)
+            if isinstance(values, list):
+                raw.extend(value for value in values if isinstance(value, str))
+        if not raw:
+            return (base,)
+        return tuple(self._resolve(value, base) for value in raw)
+
+    def _resolve(self, path: str | Path, base: Optional[Path] = None) -> Path:
+        candidate = Path(path).expanduser()
+        if not candidate.is_absolute():
+            candidate = (base or self.root) / candidate
+        return Path(os.path.normpath(candidate))
+
+
+_CURRENT_CACHE: contextvars.ContextVar[Optional[ToolResultCache]] = contextvars.ContextVar(
+    "codur_tool_result_cache", default=None
+)
+
+
+def current_tool_result_cache() -> Optional[ToolResultCache]:
+    """Return the cache of the active run, or None outside a run scope."""
+    return _CURRENT_CACHE.get()
+
+
+@contextmanager
+def tool_result_scope(root: Optional[Path] = None) -> Iterator[ToolResultCache]:
+    """Give tool calls made inside the block a shared result cache."""
+    cache = ToolResultCache(root)
+    reset = _CURRENT_CACHE.set(cache)
+    try:
+        yield cache
+    finally:
+        _CURRENT_CACHE.reset(reset)
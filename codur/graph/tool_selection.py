@@ -0,0 +1,203 @@
+"""Task-aware selection of the tool schemas bound to an LLM call.
+
+Binding every tool costs thousands of input tokens per turn. The coding node
+binds the META_TOOL tools, every tool already used or requested (via
+`request_tools`) in the run, and the top-k remaining tools ranked by:
+- the classified task type and the other classification candidates,
+- language-specific tools for the file types in play (the planning injectors
+  know which tools fit Python, Markdown, ...).
+"""
+
+from __future__ import annotations
+
+import json
+import threading
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Iterable, Optional, TypedDict
+
+from langchain_core.messages import BaseMessage
+
+from codur.constants import TaskType
+from codur.graph.planning.injectors import get_all_injectors, get_injector_for_file
+from codur.graph.state import AgentState
+from codur.graph.state_operations import get_parsed_tool_calls_from_messages
+from codur.tools.registry import list_tools_for_tasks
+from codur.tools.tool_annotations import ToolSideEffect
+from codur.utils.text_helpers import estimate_tokens
+
+DEFAULT_TOP_K = 30
+
+# Editing and validating code is part of every coding turn, whatever the task type.
+_EDITING_SCENARIOS = frozenset({TaskType.CODE_FIX, TaskType.CODE_GENERATION})
+# Git writes and network access are rarely needed; they stay reachable via request_tools.
+_RARE_SIDE_EFFECTS = frozenset({ToolSideEffect.STATE_CHANGE, ToolSideEffect.NETWORK})
+_PATH_ARG_KEYS = ("path", "file_path", "source", "destination")
+
+
+@dataclass(frozen=True)
+class ToolSelection:
+    """Schemas to bind for one call, with the estimated savings over binding all tools."""
+    schemas: list[dict]
+    total_tools: int
+    bound_tokens: int
+    full_tokens: int
+
+    @property
+    def names(self) -> list[str]:
+        return [schema["name"] for schema in self.schemas]
+
+    @property
+    def saved_tokens(self) -> int:
+        return self.full_tokens - self.bound_tokens
+
+
+def get_tool_selection_top_k(config: object | None) -> int:
+    """Read tools.selection_top_k; 0 or less binds all tools."""
+    value = getattr(getattr(config, "tools", None), "selection_top_k", DEFAULT_TOP_K)
+    try:
+        return int(value)
+    except (TypeError, ValueError):
+        return DEFAULT_TOP_K
+
+
+def _schema_tokens(schemas: Iterable[dict]) -> int:
+    return sum(estimate_tokens(json.dumps(schema, separators=(",", ":"))) for schema in schemas)
+
+
+@lru_cache(maxsize=1)
+def _tool_metadata() -> dict[str, tuple[frozenset, frozenset]]:
+    """Tool name -> (scenarios, side effects)."""
+    return {
+        item["name"]: (frozenset(item.get("scenarios", [])), frozenset(item.get("side_effects", [])))
+        for item in list_tools_for_tasks(include_unannotated=True)
+    }
+
+
+def _tools_in_play(messages: list[BaseMessage]) -> tuple[set[str], set[str]]:
+    """Return (tools used or requested so far, file paths they touched)."""
+    used: set[str] = set()
+    paths: set[str] = set()
+    for call in get_parsed_tool_calls_from_messages(messages):
+        used.add(call.tool)
+        if call.tool == "request_tools" and isinstance(call.output, dict):
+            used.update(name for name in call.output.get("granted", []) if isinstance(name, str))
+        args = call.args if isinstance(call.args, dict) else {}
+        paths.update(args[key] for key in _PATH_ARG_KEYS if isinstance(args.get(key), str))
+        paths.update(path for path in args.get("paths") or [] if isinstance(path, str))
+    return used, paths
+
+
+def _score(
+    name: str,
+    scenarios: frozenset,
+    side_effects: frozenset,
+    classification,
+    language_tools: set[str],
+    other_language_tools: set[str],
+) -> float:
+    score = 0.25 * len(scenarios)
+    if classification is not None:
+        if classification.task_type in scenarios:
+            score += 2.0 + classification.confidence
+        for candidate in classification.candidates:
+            if candidate.task_type != classification.task_type and candidate.task_type in scenarios:
+                score += candidate.confidence
+    if TaskType.CODE_VALIDATION in scenarios:
+        score += 1.0
+    if _EDITING_SCENARIOS <= scenarios:
+        score += 0.75
+    if side_effects & _RARE_SIDE_EFFECTS:
+        score -= 1.0
+    if name in language_tools:
+        score += 1.0
+    elif name in other_language_tools:
+        score -= 2.0
+    return score
+
+
+def select_tool_schemas(
+    schemas: list[dict],
+    state: AgentState,
+    config: object | None,
+    messages: Optional[list[BaseMessage]] = None,
+) -> ToolSelection:
+    """Pick the schemas to bind for the next call from `schemas`.
+
+    Args:
+        schemas: Candidate schemas (e.g. get_function_schemas())
+        state: Graph state; its classification and tool messages drive the ranking
+        config: Codur configuration (tools.selection_top_k)
+        messages: Messages of the current turn not yet in state
+
+    Returns:
+        ToolSelection with the chosen schemas in the order of `schemas`
+    """
+    full_tokens = _schema_tokens(schemas)
+    top_k = get_tool_selection_top_k(config)
+    if top_k <= 0 or len(schemas) <= top_k:
+        return ToolSelection(list(schemas), len(schemas), full_tokens, full_tokens)
+
+    classification = state.get("classification")
+    used, paths = _tools_in_play(list(state.get("messages", [])) + list(messages or []))
+    if classification is not None:
+        paths.update(classification.detected_files)
+    language_tools: set[str] = set()
+    for path in paths:
+        injector = get_injector_for_file(path)
+        if injector is not None:
+            language_tools.update(injector.get_planning_tools())
+    # Language-specific tools for file types that are not in play rank last.
+    other_language_tools = {
+        tool for injector in get_all_injectors() for tool in injector.get_planning_tools()
+    } - language_tools
+
+    metadata = _tool_metadata()
+    forced = []
+    ranked = []
+    for schema in schemas:
+        name = schema["name"]
+        scenarios, side_effects = metadata.get(name, (frozenset(), frozenset()))
+        if TaskType.META_TOOL in scenarios or name in used:
+            forced.append(schema)
+            continue
+        score = _score(name, scenarios, side_effects, classification, language_tools, other_language_tools)
+        ranked.append((-score, name, schema))
+    ranked.sort(key=lambda item: (item[0], item[1]))
+    chosen = {schema["name"] for schema in forced} | {name for _, name, _ in ranked[:top_k]}
+    # Keep the candidate order: the bound tools lead the provider's cached prompt
+    # prefix, so the same set of tools must always serialize identically.
+    selected = [schema for schema in schemas if schema["name"] in chosen]
+    return ToolSelection(selected, len(schemas), _schema_tokens(selected), full_tokens)
+
+
+class ToolSelectionStats(TypedDict):
+    """Aggregated tool selection counters."""
+    calls: int
+    bound_tools: int
+    total_tools: int
+    saved_tokens: int
+
+
+_STATS = {"calls": 0, "bound_tools": 0, "total_tools": 0, "saved_tokens": 0}
+_STATS_LOCK = threading.Lock()
+
+
+def record_tool_selection(selection: ToolSelection) -> None:
+    """Add a selection to the process-wide stats reported at the end of a run."""
+    with _STATS_LOCK:
+        _STATS["calls"] += 1
+        _STATS["bound_tools"] += len(selection.schemas)
+        _STATS["total_tools"] += selection.total_tools
+        _STATS["saved_tokens"] += selection.saved_tokens
+
+
+def get_tool_selection_stats() -> ToolSelectionStats:
+    with _STATS_LOCK:
+        return ToolSelectionStats(**_STATS)
+
+
+def reset_tool_selection_stats() -> None:
+    with _STATS_LOCK:
+        for key in _STATS:
+            _STATS[key] = 0
@@ -1,7 +1,7 @@
 """Dedicated verification node for the codur-verification agent."""
 import json
 
-from langchain_core.messages import HumanMessage, SystemMessage, ToolMessage
+from langchain_core.messages import HumanMessage, ToolMessage
 from rich.console import Console
 
 from codur.config import CodurConfig
@@ -19,6 +19,7 @@ from codur.tools.meta_tools import VerificationResult
 from codur.tools.schema_generator import get_function_schemas
 from codur.tools.tool_annotations import ToolSideEffect
 from codur.utils.llm_helpers import create_and_invoke_with_tool_support
+from codur.utils.prompt_cache import build_system_messages
 
 
 """
@@ -238,9 +239,7 @@ def verification_agent_node(
     )
 
     if recursion_depth == 0:
-        new_messages = [
-            SystemMessage(content=VERIFICATION_AGENT_SYSTEM_PROMPT + "\n\n" + summary),
-        ]
+        new_messages = build_system_messages(VERIFICATION_AGENT_SYSTEM_PROMPT, summary)
     else:
         new_messages = []
 
@@ -4,7 +4,11 @@ LLM factory for the Codur orchestrator.
 
 from __future__ import annotations
 
+import hashlib
+import json
 import os
+import threading
+from collections import OrderedDict
 
 from langchain_core.language_models.chat_models import BaseChatModel
 
@@ -18,6 +22,13 @@ import codur.providers.groq  # noqa: F401
 import codur.providers.openai  # noqa: F401
 
 
+# Clients are memoized per (profile, temperature, json_mode, tool schemas) so
+# provider HTTP connection pools and bound-tool wrappers are reused across calls.
+MAX_CACHED_CLIENTS = 64
+_CLIENTS: "OrderedDict[str, BaseChatModel]" = OrderedDict()
+_CLIENTS_LOCK = threading.Lock()
+
+
 # Task-specific temperature defaults
 # These provide reasonable defaults for different task types
 TASK_TEMPERATURES = {
@@ -138,6 +149,13 @@ def create_llm_profile(
             f"Available providers: {available}"
         )
 
+    key = _client_key(config, profile_name, provider_class, temperature, api_key, json_mode, tool_schemas)
+    with _CLIENTS_LOCK:
+        llm = _CLIENTS.get(key)
+        if llm is not None:
+            _CLIENTS.move_to_end(key)
+            return llm
+
     # Create base LLM (with json_mode if requested and no tools)
     # Try to pass json_mode if provider supports it
     try:
@@ -155,9 +173,48 @@ def create_llm_profile(
             )
         llm = provider_class.bind_tools_to_llm(llm, tool_schemas)
 
+    with _CLIENTS_LOCK:
+        _CLIENTS[key] = llm
+        while len(_CLIENTS) > MAX_CACHED_CLIENTS:
+            _CLIENTS.popitem(last=False)
     return llm
 
 
+def _client_key(
+    config: CodurConfig,
+    profile_name: str,
+    provider_class: type,
+    temperature: float | None,
+    api_key: str | None,
+    json_mode: bool,
+    tool_schemas: list[dict] | None,
+) -> str:
+    """Fingerprint everything a provider reads to build a client.
+
+    The profile and provider settings are part of the key, so editing the config
+    yields a fresh client without an explicit invalidation.
+    """
+    provider_settings = config.providers.get(config.llm.profiles[profile_name].provider.lower())
+    payload = {
+        "profile": profile_name,
+        "profile_settings": config.llm.profiles[profile_name].model_dump(),
+        "provider": f"{provider_class.__module__}.{provider_class.__qualname__}",
+        "provider_settings": provider_settings.model_dump() if provider_settings is not None else None,
+        "api_key": hashlib.sha256(api_key.encode("utf-8")).hexdigest() if api_key else None,
+        "temperature": temperature,
+        "json_mode": json_mode,
+        "tools": tool_schemas or None,
+    }
+    text = json.dumps(payload, sort_keys=True, default=str)
+    return hashlib.blake2b(text.encode("utf-8"), digest_size=16).hexdigest()
+
+
+def clear_llm_clients() -> None:
+    """Drop all memoized LLM clients (e.g. after reloading configuration)."""
+    with _CLIENTS_LOCK:
+        _CLIENTS.clear()
+
+
 def create_llm_with_tools(
     config: CodurConfig,
     profile_name: str,
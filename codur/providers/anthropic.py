@@ -71,6 +71,11 @@ class AnthropicProvider(BaseLLMProvider):
         """Anthropic Claude supports native tool calling."""
         return True
 
+    @staticmethod
+    def supports_prompt_cache_control() -> bool:
+        """Anthropic caches prompt prefixes at cache_control breakpoints."""
+        return True
+
     @staticmethod
     def bind_tools_to_llm(llm: BaseChatModel, tool_schemas: list[dict]) -> BaseChatModel:
         """Bind tools for Anthropic Claude."""
@@ -73,6 +73,15 @@ class BaseLLMProvider(ABC):
         """
         pass
 
+    @staticmethod
+    def supports_prompt_cache_control() -> bool:
+        """Return True if the provider caches prompt prefixes at explicit breakpoints.
+
+        Such providers get `cache_control` blocks (see codur.utils.prompt_cache).
+        Providers that cache prefixes automatically (OpenAI) need no breakpoints.
+        """
+        return False
+
     @staticmethod
     def bind_tools_to_llm(llm: BaseChatModel, tool_schemas: list[dict]) -> BaseChatModel:
         """Bind tools to LLM instance.
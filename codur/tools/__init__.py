@@ -61,6 +61,8 @@ from codur.tools.git import (
     git_stage_files,
     git_stage_all,
     git_commit,
+    checkpoint_list,
+    checkpoint_restore,
 )
 from codur.tools.webrequests import (
     fetch_webpage,
@@ -82,6 +84,11 @@ from codur.tools.python_ast import (
     python_ast_outline,
     python_ast_dependencies,
     python_ast_dependencies_multifile,
+    find_symbol,
+)
+from codur.tools.symbol_search import (
+    find_symbol_definitions,
+    find_symbol_references,
 )
 from codur.tools.project_analysis import (
     python_dependency_graph,
@@ -96,6 +103,8 @@ from codur.tools.meta_tools import (
     build_verification_response,
     clarify,
     done,
+    read_tool_output,
+    request_tools,
     task_complete,
 )
 from codur.tools.ast_utils import (
@@ -182,6 +191,8 @@ __all__ = [
     "git_stage_files",
     "git_stage_all",
     "git_commit",
+    "checkpoint_list",
+    "checkpoint_restore",
     "fetch_webpage",
     "location_lookup",
     "duckduckgo_search",
@@ -193,6 +204,9 @@ __all__ = [
     "python_ast_outline",
     "python_ast_dependencies",
     "python_ast_dependencies_multifile",
+    "find_symbol",
+    "find_symbol_definitions",
+    "find_symbol_references",
     "python_dependency_graph",
     "code_quality",
     "validate_python_syntax",
@@ -225,5 +239,7 @@ __all__ = [
     "get_primary_entry_point",
     "clarify",
     "done",
+    "read_tool_output",
+    "request_tools",
     "task_complete",
 ]
@@ -0,0 +1,230 @@
+"""Test impact analysis for run_pytest(affected_only=True).
+
+The files modified in the run (the checkpoint store's edited paths, or an
+explicit list) are mapped to the test modules that import them, directly or
+through other project modules, using the static import graph of the project.
+Only those test modules are run. Each test module's pass/fail result is cached
+for the process, keyed on the content of the test module, of every project
+module it imports transitively and of the conftest.py files above it, so a
+test module whose dependency closure did not change is not run again.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import threading
+from collections import deque
+from pathlib import Path
+
+from codur.graph.checkpoints import current_checkpoint_store
+from codur.graph.state import AgentState
+from codur.graph.state_operations import get_config
+from codur.tools.project_analysis import python_import_graph
+from codur.tools.validation import RunPytestResult, run_pytest
+from codur.utils.path_utils import resolve_path, resolve_root
+
+# pytest exit codes: 0 all passed, 1 some failed, 5 nothing collected (not a pass, as in run_pytest).
+# Anything else (interrupted, internal/usage error, timeout) says nothing about the tests.
+_CONCLUSIVE_EXIT_CODES = (0, 1, 5)
+
+_RESULT_CACHE: dict[str, bool] = {}
+_RESULT_CACHE_LOCK = threading.Lock()
+
+
+class RunAffectedTestsResult(RunPytestResult, total=False):
+    """Result from run_pytest(affected_only=True): the pytest run (if any) plus the selection."""
+    modified: list[str]
+    selected: list[str]
+    cached: dict[str, bool]
+    ran: list[str]
+    failed: list[str]
+
+
+def is_test_file(path: Path) -> bool:
+    """True for files pytest collects by default (test_*.py / *_test.py)."""
+    return path.suffix == ".py" and (path.name.startswith("test_") or path.stem.endswith("_test"))
+
+
+def clear_test_result_cache() -> None:
+    with _RESULT_CACHE_LOCK:
+        _RESULT_CACHE.clear()
+
+
+def _relative(path: Path, root: Path) -> str:
+    try:
+        return path.relative_to(root).as_posix()
+    except ValueError:
+        return path.as_posix()
+
+
+def _closure(start: str, edges: dict[str, set[str]]) -> set[str]:
+    seen = {start}
+    pending = deque([start])
+    while pending:
+        for name in edges.get(pending.popleft(), ()):
+            if name not in seen:
+                seen.add(name)
+                pending.append(name)
+    return seen
+
+
+def select_affected_tests(
+    root: Path,
+    modified: list[Path],
+    module_map: dict[str, Path],
+    imports: dict[str, set[str]],
+) -> list[Path]:
+    """Test files that import a modified file (transitively), are modified, or sit under a modified conftest.py."""
+    module_by_path = {path.resolve(): name for name, path in module_map.items()}
+    importers: dict[str, set[str]] = {}
+    for source, targets in imports.items():
+        for target in targets:
+            importers.setdefault(target, set()).add(source)
+
+    selected: set[Path] = set()
+    for path in modified:
+        if path.name == "conftest.py":
+            selected.update(
+                file_path for file_path in module_map.values()
+                if is_test_file(file_path) and path.parent in file_path.resolve().parents
+            )
+        name = module_by_path.get(path)
+        if name is None:
+            if is_test_file(path) and path.is_file():
+                selected.add(path)
+            continue
+        selected.update(
+            module_map[affected] for affected in _closure(name, importers) if is_test_file(module_map[affected])
+        )
+    return sorted({path.resolve() for path in selected})
+
+
+def _file_digest(path: Path) -> str:
+    try:
+        return hashlib.sha256(path.read_bytes()).hexdigest()
+    except OSError:
+        return "missing"
+
+
+def _cache_key(
+    root: Path,
+    test_path: Path,
+    module_map: dict[str, Path],
+    imports: dict[str, set[str]],
+    pytest_args: list[str],
+) -> str:
+    """Hash of the test file, its project import closure, the conftest files above it and the pytest args."""
+    module_by_path = {path.resolve(): name for name, path in module_map.items()}
+    dependencies = {test_path}
+    name = module_by_path.get(test_path)
+    if name is not None:
+        dependencies.update(module_map[dep].resolve() for dep in _closure(name, imports))
+    for parent in test_path.parents:
+        dependencies.add(parent / "conftest.py")
+        if parent == root:
+            break
+
+    digest = hashlib.sha256()
+    digest.update(str(root).encode())
+    digest.update(_relative(test_path, root).encode())
+    digest.update("\0".join(pytest_args).encode())
+    for dependency in sorted(dependencies):
+        if dependency.name == "conftest.py" and not dependency.is_file():
+            continue
+        digest.update(f"\0{_relative(dependency, root)}={_file_digest(dependency)}".encode())
+    return digest.hexdigest()
+
+
+def _failed_test_files(result: RunPytestResult, tests: list[str]) -> set[str]:
+    """Test files with a failing test in the report (pytest's FAILED/ERROR lines without one)."""
+    if "failures" in result:
+        node_paths = [failure["test_id"].split("::")[0] for failure in result["failures"]]
+    else:
+        node_paths = [
+            line.split()[1].split("::")[0]
+            for line in (result.get("stdout") or "").splitlines()
+            if line.startswith(("FAILED ", "ERROR "))
+        ]
+    failed: set[str] = set()
+    for node_path in node_paths:
+        for test in tests:
+            if test == node_path or test.endswith("/" + node_path) or node_path.endswith("/" + test):
+                failed.add(test)
+    return failed
+
+
+def run_affected_tests(
+    paths: list[str] | None = None,
+    keyword: str | None = None,
+    markers: str | None = None,
+    extra_args: list[str] | None = None,
+    root: str | Path | None = None,
+    cwd: str | None = None,
+    env: dict | None = None,
+    timeout: int | None = None,
+    allow_outside_root: bool = False,
+    state: AgentState | None = None,
+) -> RunAffectedTestsResult:
+    """Run the test modules affected by `paths` (defaults to the files edited during this run).
+
+    Backs run_pytest(affected_only=True). `success` is True only when every
+    selected test module passed, from this run or from the result cache.
+    """
+    root_path = resolve_root(root)
+    if paths:
+        modified = [resolve_path(raw, root_path, allow_outside_root=allow_outside_root) for raw in paths]
+    else:
+        store = current_checkpoint_store()
+        edited = store.edited_paths() if store is not None and store.root == root_path else []
+        modified = [(root_path / relative).resolve() for relative in edited]
+    modified_rel = [_relative(path, root_path) for path in modified]
+
+    module_map, imports = python_import_graph(root_path, get_config(state))
+    selected = select_affected_tests(root_path, modified, module_map, imports)
+    selected_rel = [_relative(path, root_path) for path in selected]
+    if not selected:
+        return {
+            "success": False,
+            "error": "No test module depends on the modified files; run run_pytest without affected_only to run every test.",
+            "modified": modified_rel,
+            "selected": [],
+        }
+
+    pytest_args = [f"-k={keyword or ''}", f"-m={markers or ''}", f"cwd={cwd or ''}", f"env={sorted((env or {}).items())}", *(extra_args or [])]
+    keys = {
+        relative: _cache_key(root_path, path, module_map, imports, pytest_args)
+        for relative, path in zip(selected_rel, selected)
+    }
+    with _RESULT_CACHE_LOCK:
+        cached = {relative: _RESULT_CACHE[key] for relative, key in keys.items() if key in _RESULT_CACHE}
+    to_run = [relative for relative in selected_rel if relative not in cached]
+
+    outcomes = dict(cached)
+    result: RunAffectedTestsResult = {}
+    if to_run:
+        result = run_pytest(
+            paths=to_run, keyword=keyword, markers=markers, extra_args=extra_args, root=str(root_path),
+            cwd=cwd, env=env, timeout=timeout, allow_outside_root=allow_outside_root, state=state,
+        )
+        exit_code = result.get("exit_code")
+        failed = _failed_test_files(result, to_run)
+        if exit_code == 1 and (not failed or result.get("omitted_failures")):
+            # Failures we cannot attribute to a file (none named, or the report was
+            # cut at MAX_FAILURES): fail them all, cache nothing.
+            exit_code = None
+        for relative in to_run:
+            passed = exit_code == 0 or (exit_code == 1 and relative not in failed)
+            outcomes[relative] = passed
+            if exit_code in _CONCLUSIVE_EXIT_CODES:
+                with _RESULT_CACHE_LOCK:
+                    _RESULT_CACHE[keys[relative]] = passed
+
+    return {
+        **result,
+        "success": all(outcomes.values()),
+        "modified": modified_rel,
+        "selected": selected_rel,
+        "cached": cached,
+        "ran": to_run,
+        "failed": sorted(relative for relative, passed in outcomes.items() if not passed),
+    }
@@ -1,11 +1,25 @@
 """AST-based utilities for finding line ranges of functions/classes."""
 
-import ast
 from typing import Optional
 
 from codur.constants import TaskType
 from codur.graph.state import AgentState
 from codur.tools.tool_annotations import tool_scenarios
+from codur.utils.symbol_index import SymbolInfo, SymbolTable, get_symbol_table
+
+
+def _symbol_table(file_content: str) -> Optional[SymbolTable]:
+    try:
+        return get_symbol_table(file_content)
+    except SyntaxError:
+        return None
+
+
+def _span(symbol: Optional[SymbolInfo]) -> Optional[tuple[int, int]]:
+    # Spans start at the def/class line (decorators excluded), 1-based like our line tools
+    if symbol is None:
+        return None
+    return (symbol.start_line, symbol.end_line)
 
 
 @tool_scenarios(TaskType.CODE_FIX, TaskType.CODE_GENERATION, TaskType.REFACTOR)
@@ -24,20 +38,8 @@ def find_function_lines(
     Returns:
         (start_line, end_line) as 1-based line numbers, or None if not found
     """
-    try:
-        tree = ast.parse(file_content)
-    except SyntaxError:
-        return None
-
-    for node in ast.walk(tree):
-        if isinstance(node, ast.FunctionDef) and node.name == function_name:
-            # AST uses 1-based line numbers, which matches our tools
-            start_line = node.lineno
-            # end_lineno available in Python 3.8+
-            end_line = node.end_lineno if hasattr(node, 'end_lineno') else node.lineno
-            return (start_line, end_line)
-
-    return None
+    table = _symbol_table(file_content)
+    return _span(table.find_function(function_name)) if table is not None else None
 
 
 @tool_scenarios(TaskType.CODE_FIX, TaskType.REFACTOR)
@@ -56,18 +58,8 @@ def find_class_lines(
     Returns:
         (start_line, end_line) as 1-based line numbers, or None if not found
     """
-    try:
-        tree = ast.parse(file_content)
-    except SyntaxError:
-        return None
-
-    for node in ast.walk(tree):
-        if isinstance(node, ast.ClassDef) and node.name == class_name:
-            start_line = node.lineno
-            end_line = node.end_lineno if hasattr(node, 'end_lineno') else node.lineno
-            return (start_line, end_line)
-
-    return None
+    table = _symbol_table(file_content)
+    return _span(table.find_class(class_name)) if table is not None else None
 
 
 @tool_scenarios(TaskType.CODE_FIX, TaskType.REFACTOR)
@@ -88,17 +80,5 @@ def find_method_lines(
     Returns:
         (start_line, end_line) as 1-based line numbers, or None if not found
     """
-    try:
-        tree = ast.parse(file_content)
-    except SyntaxError:
-        return None
-
-    for node in ast.walk(tree):
-        if isinstance(node, ast.ClassDef) and node.name == class_name:
-            for item in node.body:
-                if isinstance(item, ast.FunctionDef) and item.name == method_name:
-                    start_line = item.lineno
-                    end_line = item.end_lineno if hasattr(item, 'end_lineno') else item.lineno
-                    return (start_line, end_line)
-
-    return None
+    table = _symbol_table(file_content)
+    return _span(table.find_method(class_name, method_name)) if table is not None else None
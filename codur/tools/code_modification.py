@@ -23,6 +23,8 @@ from codur.tools.tool_annotations import (
     tool_side_effects,
 )
 from codur.tools.validation import validate_python_syntax
+from codur.utils.ast_cache import parse_source
+from codur.utils.symbol_index import record_span_replacement
 
 
 def _validate_with_dedent(code: str) -> tuple[bool, Optional[str]]:
@@ -155,6 +157,7 @@ def replace_function(
             allow_outside_root=allow_outside_root,
             state=state
         )
+        record_span_replacement(content, start_line, end_line, new_code)
         
         message = f"Successfully replaced function '{function_name}' in {path}"
         return _build_result(
@@ -245,6 +248,7 @@ def replace_class(
             allow_outside_root=allow_outside_root,
             state=state
         )
+        record_span_replacement(content, start_line, end_line, new_code)
         
         message = f"Successfully replaced class '{class_name}' in {path}"
         return _build_result(
@@ -337,6 +341,7 @@ def replace_method(
             allow_outside_root=allow_outside_root,
             state=state
         )
+        record_span_replacement(content, start_line, end_line, new_code)
         
         message = f"Successfully replaced method '{class_name}.{method_name}' in {path}"
         return _build_result(
@@ -433,7 +438,7 @@ def replace_file_content(
 def _extract_function_name(new_code: str) -> Optional[str]:
     """Return the first top-level function name from parsed code."""
     try:
-        tree = ast.parse(new_code)
+        tree = parse_source(new_code)
     except SyntaxError:
         return None
     for node in tree.body:
@@ -22,6 +22,7 @@ from codur.utils.ignore_utils import (
     should_respect_gitignore,
 )
 from codur.utils.validation import validate_file_access
+from codur.utils.workspace_index import get_workspace_index, iter_workspace_files
 from codur.tools.tool_annotations import (
     ToolContext,
     ToolGuard,
@@ -136,26 +137,7 @@ def _filter_dirnames(
 
 def _iter_files(root: Path, config: object | None = None) -> Iterable[Path]:
     """Yield files under root honoring ignore and hidden rules."""
-    exclude_dirs = get_exclude_dirs(config)
-    include_hidden = should_include_hidden(config)
-    gitignore_spec = load_gitignore(root) if should_respect_gitignore(config) else None
-    for dirpath, dirnames, filenames in os.walk(root):
-        _filter_dirnames(
-            dirpath=dirpath,
-            dirnames=dirnames,
-            root=root,
-            include_hidden=include_hidden,
-            exclude_dirs=exclude_dirs,
-            gitignore_spec=gitignore_spec,
-        )
-        rel_dir = Path(dirpath).relative_to(root)
-        for filename in filenames:
-            if not include_hidden and filename.startswith("."):
-                continue
-            rel_path = rel_dir / filename
-            if gitignore_spec and is_gitignored(rel_path, root, gitignore_spec, is_dir=False):
-                continue
-            yield Path(dirpath) / filename
+    return iter_workspace_files(root, config)
 
 
 @summary_format(READFILE_SUMMARY_FORMAT)
@@ -401,24 +383,11 @@ def list_dirs(
     """List directories under a root, honoring ignore settings."""
     root_path = resolve_root(root)
     config = get_config(state)
-    exclude_dirs = get_exclude_dirs(config)
-    include_hidden = should_include_hidden(config)
-    gitignore_spec = load_gitignore(root_path) if should_respect_gitignore(config) else None
     results: list[str] = []
-    for dirpath, dirnames, _ in os.walk(root_path):
-        _filter_dirnames(
-            dirpath=dirpath,
-            dirnames=dirnames,
-            root=root_path,
-            include_hidden=include_hidden,
-            exclude_dirs=exclude_dirs,
-            gitignore_spec=gitignore_spec,
-        )
-        for dirname in dirnames:
-            dir_path = Path(dirpath) / dirname
-            results.append(str(dir_path.relative_to(root_path)))
-            if len(results) >= max_results:
-                return results
+    for rel_dir in get_workspace_index(root_path, config).iter_dirs():
+        results.append(str(Path(rel_dir)))
+        if len(results) >= max_results:
+            break
     return results
 
 
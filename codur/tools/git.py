@@ -10,6 +10,7 @@ import pygit2
 
 from codur.config import CodurConfig
 from codur.constants import DEFAULT_MAX_BYTES, DEFAULT_MAX_RESULTS, TaskType
+from codur.graph.checkpoints import CheckpointInfo, CheckpointStore, current_checkpoint_store, notify_restored
 from codur.graph.state import AgentState
 from codur.tools.tool_annotations import (
     ToolContext,
@@ -18,7 +19,7 @@ from codur.tools.tool_annotations import (
     tool_scenarios,
     tool_side_effects,
 )
-from codur.utils.path_utils import resolve_root, resolve_path
+from codur.utils.path_utils import current_workspace_root, resolve_root, resolve_path
 from codur.utils.text_helpers import truncate_chars
 from codur.utils.validation import require_tool_permission
 
@@ -377,3 +378,48 @@ def git_commit(
         "repo_root": str(repo_root),
         "ref": ref_name,
     }
+
+
+def _require_checkpoints() -> CheckpointStore:
+    store = current_checkpoint_store()
+    if store is None:
+        raise ValueError("Checkpoints are only available during an agent run")
+    # Same guard as the tool executor: a fix candidate's workspace copy is not the run's workspace.
+    root = (current_workspace_root() or Path.cwd()).resolve()
+    if store.root != root:
+        raise ValueError(f"Checkpoints cover {store.root}, not the current workspace {root}")
+    return store
+
+
+@tool_scenarios(TaskType.CODE_FIX, TaskType.REFACTOR)
+def checkpoint_list(
+    state: AgentState | None = None,
+) -> list[CheckpointInfo]:
+    """
+    List the checkpoints of files edited during this run (oldest first).
+
+    A checkpoint is taken after every batch of edits; it is green when a test or
+    script run passed after it. Checkpoint 0 is the state before the first edit.
+    """
+    return [checkpoint.to_info() for checkpoint in _require_checkpoints().checkpoints]
+
+
+@tool_side_effects(ToolSideEffect.FILE_MUTATION)
+@tool_scenarios(TaskType.CODE_FIX, TaskType.REFACTOR)
+def checkpoint_restore(
+    checkpoint_id: int,
+    state: AgentState | None = None,
+) -> dict:
+    """
+    Put the files edited during this run back to their content at a checkpoint.
+
+    Cheaper and safer than undoing bad edits by hand: use checkpoint_list to
+    find the last green checkpoint, then restore it.
+    """
+    store = _require_checkpoints()
+    changed = store.restore(checkpoint_id)
+    notify_restored(store.root, changed)
+    return {
+        "checkpoint": checkpoint_id,
+        "changed_files": changed,
+    }
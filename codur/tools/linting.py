@@ -4,51 +4,21 @@ Python linting helpers for Codur.
 
 from __future__ import annotations
 
-import ast
-import os
 from pathlib import Path
 from typing import Iterable
 
 from codur.constants import TaskType
 from codur.graph.state_operations import get_config
-from codur.utils.ignore_utils import (
-    get_exclude_dirs,
-    is_gitignored,
-    load_gitignore,
-    should_include_hidden,
-    should_respect_gitignore,
-)
 from codur.graph.state import AgentState
 from codur.tools.tool_annotations import ToolContext, tool_contexts, tool_scenarios
+from codur.utils.ast_cache import parse_source
 from codur.utils.path_utils import resolve_root, resolve_path
+from codur.utils.workspace_index import iter_workspace_files
 
 
 def _iter_python_files(root: Path, config: object | None = None) -> Iterable[Path]:
     """Yield Python files under root honoring ignore settings."""
-    exclude_dirs = get_exclude_dirs(config)
-    include_hidden = should_include_hidden(config)
-    gitignore_spec = load_gitignore(root) if should_respect_gitignore(config) else None
-    for dirpath, dirnames, filenames in os.walk(root):
-        rel_dir = Path(dirpath).relative_to(root)
-        filtered_dirs: list[str] = []
-        for dirname in dirnames:
-            if dirname in exclude_dirs:
-                continue
-            if not include_hidden and dirname.startswith("."):
-                continue
-            rel_path = rel_dir / dirname
-            if gitignore_spec and is_gitignored(rel_path, root, gitignore_spec, is_dir=True):
-                continue
-            filtered_dirs.append(dirname)
-        dirnames[:] = filtered_dirs
-        for filename in filenames:
-            if not include_hidden and filename.startswith("."):
-                continue
-            rel_path = rel_dir / filename
-            if gitignore_spec and is_gitignored(rel_path, root, gitignore_spec, is_dir=False):
-                continue
-            if filename.endswith(".py"):
-                yield Path(dirpath) / filename
+    return iter_workspace_files(root, config, suffixes=(".py",))
 
 
 def _lint_file(path: Path) -> list[dict]:
@@ -56,7 +26,7 @@ def _lint_file(path: Path) -> list[dict]:
     try:
         with open(path, "r", encoding="utf-8", errors="replace") as handle:
             source = handle.read()
-        ast.parse(source, filename=str(path))
+        parse_source(source, filename=str(path))
     except SyntaxError as exc:
         return [{
             "file": str(path),
@@ -13,14 +13,18 @@ from codur.config import CodurConfig
 from codur.constants import TaskType
 from codur.graph.state import AgentState
 from codur.tools.tool_annotations import ToolSideEffect, tool_scenarios, tool_side_effects
+from codur.utils.concurrency import await_cancellable
 
 
 def _run(coro):
-    """Run a coroutine, erroring if already inside an event loop."""
+    """Run a coroutine, erroring if already inside an event loop.
+
+    The coroutine is cancelled if the calling tool call times out or the run is cancelled.
+    """
     try:
         asyncio.get_running_loop()
     except RuntimeError:
-        return asyncio.run(coro)
+        return asyncio.run(await_cancellable(coro))
     raise RuntimeError("Cannot run MCP tools from within a running event loop")
 
 
@@ -1,4 +1,5 @@
 """Meta-tools for agent control and clarification."""
+import difflib
 from typing import TypedDict, NotRequired
 
 from codur.constants import TaskType
@@ -116,4 +117,92 @@ def task_complete(
         Task completion confirmation
     """
     # Return value is not used - we intercept this tool call in the planning loop
-    return {"status": "task complete", "response": response}
\ No newline at end of file
+    return {"status": "task complete", "response": response}
+
+class ToolRequestResult(TypedDict):
+    """Outcome of a request for additional tools."""
+    granted: list[str]
+    unknown: list[str]
+    suggestions: dict[str, list[str]]
+
+
+@tool_scenarios(TaskType.META_TOOL)
+def request_tools(
+    tools: list[str],
+    reason: str | None = None,
+    state: AgentState | None = None,
+) -> ToolRequestResult:
+    """Request tools that are not in the current tool list.
+
+    Only a subset of tools is offered per call. Use this when you need a tool
+    that is mentioned in the instructions but not available to you; granted
+    tools are offered from the next turn on.
+
+    Args:
+        tools: Names of the tools you need
+        reason: Why the tools are needed (optional)
+        state: Agent state (ignored)
+
+    Returns:
+        ToolRequestResult with granted names and suggestions for unknown names
+    """
+    from codur.tools.registry import _iter_tool_functions
+
+    available = sorted(_iter_tool_functions())
+    granted = [name for name in tools if name in available]
+    unknown = [name for name in tools if name not in available]
+    return ToolRequestResult(
+        granted=granted,
+        unknown=unknown,
+        suggestions={name: difflib.get_close_matches(name, available, n=3) for name in unknown},
+    )
+
+
+class ToolOutputPage(TypedDict):
+    """A slice of a stored tool output."""
+    handle: str
+    offset: int
+    content: str
+    total_chars: int
+    next_offset: int | None
+
+
+MAX_TOOL_OUTPUT_PAGE_CHARS = 20_000
+
+
+@tool_scenarios(TaskType.META_TOOL)
+def read_tool_output(
+    handle: str,
+    offset: int = 0,
+    limit: int = 4000,
+    state: AgentState | None = None,
+) -> ToolOutputPage | dict[str, str]:
+    """Read part of a large tool output that was replaced by a handle.
+
+    Outputs too large for the conversation show only their head, plus a
+    blob_handle. Page through the rest with this tool.
+
+    Args:
+        handle: The blob_handle from the truncated tool result
+        offset: Character offset to start reading at
+        limit: Number of characters to read (at most 20000)
+        state: Agent state (ignored)
+
+    Returns:
+        ToolOutputPage with the requested slice and the offset of the next one
+    """
+    from codur.graph.tool_output_store import current_tool_output_store
+
+    store = current_tool_output_store()
+    text = store.text(handle) if store is not None else None
+    if text is None:
+        return {"error": f"Unknown tool output handle: {handle}"}
+    offset = max(0, offset)
+    end = offset + max(1, min(limit, MAX_TOOL_OUTPUT_PAGE_CHARS))
+    return ToolOutputPage(
+        handle=handle,
+        offset=offset,
+        content=text[offset:end],
+        total_chars=len(text),
+        next_offset=end if end < len(text) else None,
+    )
@@ -5,7 +5,6 @@ Project analysis tools for Codur.
 from __future__ import annotations
 
 import ast
-import os
 import sys
 from contextlib import contextmanager
 from collections import Counter
@@ -16,15 +15,11 @@ from codur.constants import DEFAULT_MAX_RESULTS, TaskType
 from codur.graph.state import AgentState
 from codur.graph.state_operations import get_config
 from codur.tools.tool_annotations import ToolContext, tool_contexts, tool_scenarios
-from codur.utils.ignore_utils import (
-    get_exclude_dirs,
-    is_gitignored,
-    load_gitignore,
-    should_include_hidden,
-    should_respect_gitignore,
-)
+from codur.utils.ast_cache import parse_source
+from codur.utils.ignore_utils import get_exclude_dirs
 from codur.utils.path_utils import resolve_path, resolve_root
 from codur.utils.validation import validate_file_access
+from codur.utils.workspace_index import get_workspace_index
 
 DEFAULT_MAX_NODES = 2000
 DEFAULT_MAX_EDGES = 4000
@@ -36,42 +31,16 @@ def _iter_python_files(
     config: object | None = None,
 ) -> list[Path]:
     """Collect Python files under root honoring ignore rules."""
+    index = get_workspace_index(root, config)
+    norm_excludes = [ex.strip("/") for ex in exclude_folders or [] if ex.strip("/")]
     files: list[Path] = []
-    default_excludes = get_exclude_dirs(config)
-    include_hidden = should_include_hidden(config)
-    gitignore_spec = load_gitignore(root) if should_respect_gitignore(config) else None
-    
-    # Pre-process exclude folders for platform compatibility
-    norm_excludes = []
-    if exclude_folders:
-        norm_excludes = [ex.replace("/", os.sep) for ex in exclude_folders]
-
-    for dirpath, dirnames, filenames in os.walk(root):
-        rel_dir = Path(dirpath).relative_to(root)
-        filtered_dirs: list[str] = []
-        for dirname in dirnames:
-            if dirname in default_excludes:
-                continue
-            if not include_hidden and dirname.startswith("."):
-                continue
-            rel_path = rel_dir / dirname
-            if gitignore_spec and is_gitignored(rel_path, root, gitignore_spec, is_dir=True):
-                continue
-            if norm_excludes:
-                s_rel = str(rel_path)
-                if any(s_rel == ex or s_rel.startswith(ex + os.sep) for ex in norm_excludes):
-                    continue
-            filtered_dirs.append(dirname)
-        dirnames[:] = filtered_dirs
-
-        for filename in filenames:
-            if not include_hidden and filename.startswith("."):
-                continue
-            rel_path = rel_dir / filename
-            if gitignore_spec and is_gitignored(rel_path, root, gitignore_spec, is_dir=False):
-                continue
-            if filename.endswith(".py"):
-                files.append(Path(dirpath) / filename)
+    for entry in index.iter_files(suffixes=(".py",)):
+        rel_dir = entry.path.rpartition("/")[0]
+        if norm_excludes and any(
+            rel_dir == ex or rel_dir.startswith(ex + "/") for ex in norm_excludes
+        ):
+            continue
+        files.append(index.root / entry.path)
     return files
 
 
@@ -130,56 +99,15 @@ def _is_excluded_module(name: str, excludes: list[str] | None) -> bool:
     return False
 
 
-@tool_contexts(ToolContext.FILESYSTEM)
-@tool_scenarios(TaskType.EXPLANATION, TaskType.CODE_FIX, TaskType.REFACTOR)
-def python_dependency_graph(
-    root: str | Path | None = None,
-    paths: list[str] | None = None,
+def _collect_import_edges(
+    module_map: dict[str, Path],
+    root_path: Path,
+    config: object | None,
     include_external: bool = False,
-    include_styling: bool = False,
     exclude_modules: list[str] | None = None,
-    exclude_folders: list[str] | None = None,
-    max_nodes: int = DEFAULT_MAX_NODES,
-    max_edges: int = DEFAULT_MAX_EDGES,
     allow_outside_root: bool = False,
-    state: AgentState | None = None,
-) -> dict:
-    """
-    Build a Python module dependency graph and return DOT output.
-
-    Args:
-        root: Root directory to analyze (defaults to current working directory)
-        paths: Specific paths to analyze (files or directories). If None, analyzes entire root
-        include_external: Include external (non-project) module dependencies
-        include_styling: Add visual styling to DOT output (shapes, colors, etc)
-        exclude_modules: Module names or prefixes to exclude from the graph
-        exclude_folders: Folder names to exclude from scanning
-        max_nodes: Maximum number of nodes to include (0 for unlimited)
-        max_edges: Maximum number of edges to include (0 for unlimited)
-        allow_outside_root: Allow analyzing paths outside the root directory
-        state: Agent state for configuration (internal)
-    """
-    root_path = resolve_root(root)
-    config = get_config(state)
-    file_paths: list[Path] = []
-
-    if paths:
-        for raw in paths:
-            target = resolve_path(raw, root_path, allow_outside_root=allow_outside_root)
-            if target.is_dir():
-                file_paths.extend(_iter_python_files(target, exclude_folders=exclude_folders, config=config))
-            elif target.is_file() and target.suffix == ".py":
-                file_paths.append(target)
-    else:
-        file_paths = _iter_python_files(root_path, exclude_folders=exclude_folders, config=config)
-
-    module_map: dict[str, Path] = {}
-    for file_path in sorted(set(file_paths)):
-        module_name = _module_name_for_path(file_path, root_path)
-        if exclude_modules and _is_excluded_module(module_name, exclude_modules):
-            continue
-        module_map[module_name] = file_path
-
+) -> tuple[set[tuple[str, str]], set[str], list[dict]]:
+    """Parse each module and return (import edges, external modules, parse errors)."""
     internal_modules = set(module_map.keys())
     external_modules: set[str] = set()
     edges: set[tuple[str, str]] = set()
@@ -195,7 +123,7 @@ def python_dependency_graph(
                 allow_outside_root=allow_outside_root,
             )
             source = file_path.read_text(encoding="utf-8", errors="replace")
-            tree = ast.parse(source, filename=str(file_path))
+            tree = parse_source(source, filename=str(file_path))
         except SyntaxError as exc:
             parse_errors.append({
                 "file": str(file_path),
@@ -249,6 +177,82 @@ def python_dependency_graph(
                         if external_name and not (exclude_modules and _is_excluded_module(external_name, exclude_modules)):
                             external_modules.add(external_name)
                             edges.add((module_name, external_name))
+    return edges, external_modules, parse_errors
+
+
+def python_import_graph(root: Path, config: object | None = None) -> tuple[dict[str, Path], dict[str, set[str]]]:
+    """Map each project module under root to its file and to the project modules it imports."""
+    root_path = root.resolve()
+    module_map = {
+        _module_name_for_path(file_path, root_path): file_path
+        for file_path in sorted(set(_iter_python_files(root_path, config=config)))
+    }
+    edges, _, _ = _collect_import_edges(module_map, root_path, config)
+    imports: dict[str, set[str]] = {name: set() for name in module_map}
+    for source, target in edges:
+        imports[source].add(target)
+    return module_map, imports
+
+
+@tool_contexts(ToolContext.FILESYSTEM)
+@tool_scenarios(TaskType.EXPLANATION, TaskType.CODE_FIX, TaskType.REFACTOR)
+def python_dependency_graph(
+    root: str | Path | None = None,
+    paths: list[str] | None = None,
+    include_external: bool = False,
+    include_styling: bool = False,
+    exclude_modules: list[str] | None = None,
+    exclude_folders: list[str] | None = None,
+    max_nodes: int = DEFAULT_MAX_NODES,
+    max_edges: int = DEFAULT_MAX_EDGES,
+    allow_outside_root: bool = False,
+    state: AgentState | None = None,
+) -> dict:
+    """
+    Build a Python module dependency graph and return DOT output.
+
+    Args:
+        root: Root directory to analyze (defaults to current working directory)
+        paths: Specific paths to analyze (files or directories). If None, analyzes entire root
+        include_external: Include external (non-project) module dependencies
+        include_styling: Add visual styling to DOT output (shapes, colors, etc)
+        exclude_modules: Module names or prefixes to exclude from the graph
+        exclude_folders: Folder names to exclude from scanning
+        max_nodes: Maximum number of nodes to include (0 for unlimited)
+        max_edges: Maximum number of edges to include (0 for unlimited)
+        allow_outside_root: Allow analyzing paths outside the root directory
+        state: Agent state for configuration (internal)
+    """
+    root_path = resolve_root(root)
+    config = get_config(state)
+    file_paths: list[Path] = []
+
+    if paths:
+        for raw in paths:
+            target = resolve_path(raw, root_path, allow_outside_root=allow_outside_root)
+            if target.is_dir():
+                file_paths.extend(_iter_python_files(target, exclude_folders=exclude_folders, config=config))
+            elif target.is_file() and target.suffix == ".py":
+                file_paths.append(target)
+    else:
+        file_paths = _iter_python_files(root_path, exclude_folders=exclude_folders, config=config)
+
+    module_map: dict[str, Path] = {}
+    for file_path in sorted(set(file_paths)):
+        module_name = _module_name_for_path(file_path, root_path)
+        if exclude_modules and _is_excluded_module(module_name, exclude_modules):
+            continue
+        module_map[module_name] = file_path
+
+    internal_modules = set(module_map.keys())
+    edges, external_modules, parse_errors = _collect_import_edges(
+        module_map,
+        root_path,
+        config,
+        include_external=include_external,
+        exclude_modules=exclude_modules,
+        allow_outside_root=allow_outside_root,
+    )
 
     nodes = sorted(internal_modules | external_modules) if include_external else sorted(internal_modules)
     truncated_nodes = False
@@ -489,7 +493,7 @@ def deep_python_dependency_graph(
                 allow_outside_root=allow_outside_root,
             )
             source = file_path.read_text(encoding="utf-8", errors="replace")
-            tree = ast.parse(source, filename=str(file_path))
+            tree = parse_source(source, filename=str(file_path))
         except (SyntaxError, OSError) as exc:
             msg = getattr(exc, "msg", str(exc))
             lineno = getattr(exc, "lineno", 0)
@@ -5,7 +5,6 @@ Project discovery tools for identifying executable entry points and project stru
 from __future__ import annotations
 
 import re
-import os
 from pathlib import Path
 from typing import Iterable, TypedDict
 
@@ -14,13 +13,7 @@ from codur.graph.state import AgentState
 from codur.graph.state_operations import get_config
 from codur.tools.tool_annotations import tool_scenarios
 from codur.utils.path_utils import resolve_root
-from codur.utils.ignore_utils import (
-    get_exclude_dirs,
-    is_gitignored,
-    load_gitignore,
-    should_include_hidden,
-    should_respect_gitignore,
-)
+from codur.utils.workspace_index import iter_workspace_files
 
 class EntryPointInfo(TypedDict):
     """Metadata about a discovered entry point."""
@@ -44,53 +37,9 @@ class PrimaryEntryPointResult(TypedDict):
     message: str
 
 
-def _filter_dirnames(
-    *,
-    dirpath: str,
-    dirnames: list[str],
-    root: Path,
-    include_hidden: bool,
-    exclude_dirs: set[str],
-    gitignore_spec: object | None,
-) -> None:
-    """Filter os.walk dirnames in-place based on config rules."""
-    rel_dir = Path(dirpath).relative_to(root)
-    filtered: list[str] = []
-    for dirname in dirnames:
-        if dirname in exclude_dirs:
-            continue
-        if not include_hidden and dirname.startswith("."):
-            continue
-        rel_path = rel_dir / dirname
-        if gitignore_spec and is_gitignored(rel_path, root, gitignore_spec, is_dir=True):
-            continue
-        filtered.append(dirname)
-    dirnames[:] = filtered
-
-
 def _iter_python_files(root: Path, config: object | None = None) -> Iterable[Path]:
     """Recursively iterate over Python files in a directory."""
-    exclude_dirs = get_exclude_dirs(config)
-    include_hidden = should_include_hidden(config)
-    gitignore_spec = load_gitignore(root) if should_respect_gitignore(config) else None
-    for dirpath, dirnames, filenames in os.walk(root):
-        _filter_dirnames(
-            dirpath=dirpath,
-            dirnames=dirnames,
-            root=root,
-            include_hidden=include_hidden,
-            exclude_dirs=exclude_dirs,
-            gitignore_spec=gitignore_spec,
-        )
-        rel_dir = Path(dirpath).relative_to(root)
-        for filename in filenames:
-            if not include_hidden and filename.startswith("."):
-                continue
-            rel_path = rel_dir / filename
-            if gitignore_spec and is_gitignored(rel_path, root, gitignore_spec, is_dir=False):
-                continue
-            if filename.endswith((".py", ".pyi")):
-                yield Path(dirpath) / filename
+    return iter_workspace_files(root, config, suffixes=(".py", ".pyi"))
 
 
 def _has_main_block(file_path: Path) -> bool:
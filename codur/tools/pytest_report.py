@@ -0,0 +1,232 @@
+"""Compact pytest results for run_pytest.
+
+run_pytest asks pytest for a junit XML report and returns the counts plus one
+entry per failing test (test id, exception type, message and a traceback cut
+down to the project's own frames) instead of the raw console output. The full
+stdout/stderr is written to a log file under `tools.pytest_log_dir` and the
+result references it, so the complete output stays one read_file away.
+"""
+
+from __future__ import annotations
+
+import re
+import time
+import uuid
+import xml.etree.ElementTree as ET
+from pathlib import Path
+from typing import Optional, TypedDict
+
+from codur.utils.text_helpers import truncate_chars
+
+DEFAULT_PYTEST_LOG_DIR = ".codur/pytest-logs"
+# Older logs in the directory are deleted past this many.
+PYTEST_LOG_KEEP = 20
+MAX_FAILURES = 20
+MAX_MESSAGE_CHARS = 500
+MAX_TRACEBACK_CHARS = 1500
+# Lines kept from the end of each project frame of a traceback.
+FRAME_TAIL_LINES = 8
+
+# pytest separates traceback entries with a "_ _ _ ..." line.
+_FRAME_SEPARATOR = re.compile(r"^(?:_ )+_?\s*$")
+# Last line of a traceback entry: "path:line: in func" or "path:line: ExceptionType".
+_LOCATION_LINE = re.compile(r"^(?P<path>\S.*?):(?P<line>\d+): ?(?P<what>.*)$")
+
+
+class PytestSummary(TypedDict):
+    """Test counts of a pytest run."""
+    tests: int
+    passed: int
+    failed: int
+    errors: int
+    skipped: int
+    duration_s: float
+
+
+class PytestFailure(TypedDict):
+    """One failing or erroring test."""
+    test_id: str
+    kind: str
+    exception_type: Optional[str]
+    message: str
+    traceback: str
+
+
+class PytestReport(TypedDict):
+    summary: PytestSummary
+    failures: list[PytestFailure]
+    omitted_failures: int
+
+
+def junit_args(report_path: Path) -> list[str]:
+    """pytest arguments that write the report read by read_junit_report."""
+    # xunit1 keeps the file/line attributes needed to rebuild test ids.
+    return [f"--junitxml={report_path}", "-o", "junit_family=xunit1"]
+
+
+def _test_id(case: ET.Element) -> str:
+    name = case.get("name", "")
+    classname = case.get("classname", "")
+    file = case.get("file")
+    if not file:
+        return f"{classname}::{name}" if classname else name
+    module = file[:-3].replace("/", ".") if file.endswith(".py") else file
+    parts = [file]
+    if classname.startswith(module + "."):
+        parts.extend(classname[len(module) + 1:].split("."))
+    parts.append(name)
+    return "::".join(parts)
+
+
+def _is_project_frame(path: str, root: Path) -> bool:
+    if "site-packages" in path or "dist-packages" in path:
+        return False
+    candidate = Path(path)
+    if not candidate.is_absolute():
+        return True
+    try:
+        candidate.resolve().relative_to(root)
+        return True
+    except ValueError:
+        return False
+
+
+def _traceback_entries(text: str) -> list[list[str]]:
+    """Split a pytest traceback into entries, each holding one location line.
+
+    Long entries end with "path:line: ExceptionType" (or "path:line:"); short
+    entries start with "path:line: in func" and are followed by their source line.
+    """
+    entries: list[list[str]] = []
+    current: list[str] = []
+    for line in text.splitlines():
+        if not line.strip():
+            continue
+        if _FRAME_SEPARATOR.match(line):
+            if current:
+                entries.append(current)
+            current = []
+            continue
+        location = _LOCATION_LINE.match(line)
+        if location is not None and location.group("what").startswith("in "):
+            if current:
+                entries.append(current)
+            current = [line]
+        elif location is not None:
+            current.append(line)
+            entries.append(current)
+            current = []
+        else:
+            current.append(line)
+    if current:
+        entries.append(current)
+    return entries
+
+
+def trim_traceback(text: str, root: Path) -> str:
+    """Keep the tail of each traceback entry located in the project; drop library frames."""
+    entries = _traceback_entries(text)
+    kept: list[str] = []
+    skipped = False
+    for entry in entries:
+        location = next((match for match in map(_LOCATION_LINE.match, entry) if match), None)
+        if location is not None and not _is_project_frame(location.group("path"), root):
+            skipped = True
+            continue
+        if skipped and kept:
+            kept.append("... (library frames omitted)")
+        skipped = False
+        kept.extend(entry[-FRAME_TAIL_LINES:])
+    if skipped or not kept:
+        # The innermost entry shows what raised, even in library code.
+        if kept:
+            kept.append("... (library frames omitted)")
+        innermost = entries[-1] if entries else []
+        raised_at = max((idx for idx, line in enumerate(innermost) if line.startswith(">")), default=None)
+        kept.extend(innermost[raised_at:] if raised_at is not None else innermost[-FRAME_TAIL_LINES:])
+    return truncate_chars("\n".join(kept), MAX_TRACEBACK_CHARS)
+
+
+def _exception_type(text: str, message: str) -> Optional[str]:
+    lines = [line for line in text.splitlines() if line.strip()]
+    location = _LOCATION_LINE.match(lines[-1]) if lines else None
+    what = location.group("what").strip() if location is not None else ""
+    if what and not what.startswith("in "):
+        return what
+    prefix = re.match(r"^([\w.]+(?:Error|Exception|Exit|Interrupt|Warning)):", message)
+    return prefix.group(1) if prefix else None
+
+
+def read_junit_report(report_path: Path, root: Path) -> Optional[PytestReport]:
+    """Parse a junit XML report written by pytest; None when it is missing or unreadable."""
+    try:
+        tree = ET.parse(report_path)
+    except (OSError, ET.ParseError):
+        return None
+    suites = [tree.getroot()] if tree.getroot().tag == "testsuite" else tree.getroot().findall("testsuite")
+    totals = {"tests": 0, "failures": 0, "errors": 0, "skipped": 0}
+    duration = 0.0
+    failures: list[PytestFailure] = []
+    for suite in suites:
+        for key in totals:
+            totals[key] += int(suite.get(key, 0) or 0)
+        duration += float(suite.get("time", 0) or 0)
+        for case in suite.iter("testcase"):
+            for kind in ("failure", "error"):
+                element = case.find(kind)
+                if element is None:
+                    continue
+                text = element.text or ""
+                message = element.get("message", "")
+                failures.append(PytestFailure(
+                    test_id=_test_id(case),
+                    kind=kind,
+                    exception_type=_exception_type(text, message),
+                    message=truncate_chars(message, MAX_MESSAGE_CHARS),
+                    traceback=trim_traceback(text, root),
+                ))
+    return PytestReport(
+        summary=PytestSummary(
+            tests=totals["tests"],
+            passed=max(0, totals["tests"] - totals["failures"] - totals["errors"] - totals["skipped"]),
+            failed=totals["failures"],
+            errors=totals["errors"],
+            skipped=totals["skipped"],
+            duration_s=round(duration, 3),
+        ),
+        failures=failures[:MAX_FAILURES],
+        omitted_failures=max(0, len(failures) - MAX_FAILURES),
+    )
+
+
+def get_pytest_log_dir(root: Path, config: object | None) -> Path:
+    """tools.pytest_log_dir, relative to the workspace root."""
+    log_dir = Path(getattr(getattr(config, "tools", None), "pytest_log_dir", None) or DEFAULT_PYTEST_LOG_DIR)
+    return log_dir if log_dir.is_absolute() else root / log_dir
+
+
+def write_pytest_log(
+    root: Path,
+    config: object | None,
+    command: str,
+    exit_code: Optional[int],
+    stdout: str,
+    stderr: str,
+) -> Optional[str]:
+    """Write the full output of a pytest run to the log directory; return its path."""
+    log_dir = get_pytest_log_dir(root, config)
+    log_path = log_dir / f"pytest-{time.strftime('%Y%m%d-%H%M%S')}-{uuid.uuid4().hex[:8]}.log"
+    try:
+        log_dir.mkdir(parents=True, exist_ok=True)
+        log_path.write_text(
+            f"$ {command}\nexit code: {exit_code}\n\n--- stdout ---\n{stdout}\n--- stderr ---\n{stderr}\n",
+            encoding="utf-8",
+        )
+        for old in sorted(log_dir.glob("pytest-*.log"))[:-PYTEST_LOG_KEEP]:
+            old.unlink(missing_ok=True)
+    except OSError:
+        return None
+    try:
+        return log_path.relative_to(root).as_posix()
+    except ValueError:
+        return str(log_path)
@@ -8,7 +8,9 @@ from codur.constants import DEFAULT_MAX_RESULTS, TaskType
 from codur.graph.state import AgentState
 from codur.graph.state_operations import get_config
 from codur.tools.tool_annotations import ToolContext, tool_contexts, tool_scenarios, summary_format
+from codur.utils.ast_cache import parse_source
 from codur.utils.path_utils import resolve_path, resolve_root
+from codur.utils.symbol_index import get_symbol_table
 from codur.utils.validation import validate_file_access
 DEFAULT_AST_MAX_NODES = 2000
 
@@ -32,6 +34,10 @@ AST_DEPENDENCIES_MULTIFILE_SUMMARY_FORMAT = """dependencies by file:
 <output>
 """
 
+FIND_SYMBOL_SUMMARY_FORMAT = """symbols matching <name> in <file_name>
+count: <count>
+<output>"""
+
 def _node_label(node: ast.AST) -> str:
     """Return a short label for display in the AST graph."""
     if isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef, ast.ClassDef)):
@@ -85,7 +91,7 @@ def python_ast_graph(
     )
     with open(target, "r", encoding="utf-8", errors="replace") as handle:
         source = handle.read()
-    tree = ast.parse(source, filename=str(target))
+    tree = parse_source(source, filename=str(target))
     nodes: list[dict] = []
     edges: list[dict] = []
     stack: list[tuple[ast.AST, int | None]] = [(tree, None)]
@@ -174,7 +180,7 @@ def python_ast_outline(
     )
     with open(target, "r", encoding="utf-8", errors="replace") as handle:
         source = handle.read()
-    tree = ast.parse(source, filename=str(target))
+    tree = parse_source(source, filename=str(target))
     results: list[dict] = []
     stack: list[tuple[ast.AST, str]] = [(tree, "")]
     truncated = False
@@ -241,7 +247,7 @@ def python_ast_dependencies(
     )
     with open(target, "r", encoding="utf-8", errors="replace") as handle:
         source = handle.read()
-    tree = ast.parse(source, filename=str(target))
+    tree = parse_source(source, filename=str(target))
     dependencies = set()
     class DependencyVisitor(ast.NodeVisitor):
         def __init__(self):
@@ -331,6 +337,54 @@ def python_ast_dependencies_multifile(
         )
     return results
 
+@summary_format(FIND_SYMBOL_SUMMARY_FORMAT)
+@tool_contexts(ToolContext.FILESYSTEM)
+@tool_scenarios(TaskType.EXPLANATION, TaskType.CODE_FIX, TaskType.REFACTOR, TaskType.CODE_ANALYSIS)
+def find_symbol(
+    path: str,
+    name: str,
+    kind: str | None = None,
+    root: str | Path | None = None,
+    allow_outside_root: bool = False,
+    state: AgentState | None = None,
+) -> dict:
+    """
+    Locate functions, methods or classes in a Python file by name or qualified name.
+    kind filters to "function", "method" or "class". Each match reports its line span,
+    decorators and whether it is async.
+    """
+    if kind is not None and kind not in ("function", "method", "class"):
+        raise ValueError("kind must be one of: function, method, class")
+    target = resolve_path(path, root, allow_outside_root=allow_outside_root)
+    validate_file_access(
+        target,
+        resolve_root(root),
+        get_config(state),
+        operation="read",
+        allow_outside_root=allow_outside_root,
+    )
+    with open(target, "r", encoding="utf-8", errors="replace") as handle:
+        source = handle.read()
+    matches = get_symbol_table(source).find(name, kind=kind)
+    return {
+        "file": str(target),
+        "name": name,
+        "count": len(matches),
+        "symbols": [
+            {
+                "qualname": symbol.qualname,
+                "kind": symbol.kind,
+                "start_line": symbol.start_line,
+                "end_line": symbol.end_line,
+                "decorator_start_line": symbol.decorator_start_line,
+                "decorators": list(symbol.decorators),
+                "is_async": symbol.is_async,
+                "parent": symbol.parent,
+            }
+            for symbol in matches
+        ],
+    }
+
 if __name__ == "__main__":
     import pprint
     outline = python_ast_outline(
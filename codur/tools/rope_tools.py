@@ -3,8 +3,9 @@
 from __future__ import annotations
 
 import re
+from contextlib import contextmanager
 from pathlib import Path
-from typing import Optional
+from typing import Iterator, Optional
 
 from rope.base.project import Project
 from rope.contrib import findit
@@ -23,6 +24,7 @@ from codur.tools.tool_annotations import (
     tool_side_effects,
 )
 from codur.utils.path_utils import resolve_root, resolve_path
+from codur.utils.rope_pool import get_rope_full_validate_after, get_rope_idle_timeout, get_rope_pool
 from codur.utils.validation import (
     require_directory_exists,
     require_file_exists,
@@ -48,10 +50,9 @@ def rope_find_usages(
 ) -> dict:
     """Find usages of the symbol at a location using rope."""
     config = get_config(state)
-    project, resource, project_root, target, content = _open_project_resource(
+    with _open_project_resource(
         path, root, allow_outside_root, config=config
-    )
-    try:
+    ) as (project, resource, project_root, target, content):
         resolved_offset = _offset_from_position(content, line=line, column=column, offset=offset)
         resources = _resources_from_paths(project, project_root, resource_paths)
         locations = findit.find_occurrences(
@@ -80,8 +81,6 @@ def rope_find_usages(
             "unsure": unsure,
             "in_hierarchy": in_hierarchy,
         }
-    finally:
-        project.close()
 
 
 @tool_contexts(ToolContext.FILESYSTEM)
@@ -97,10 +96,9 @@ def rope_find_definition(
 ) -> dict:
     """Find the definition location for the symbol at a position."""
     config = get_config(state)
-    project, resource, project_root, target, content = _open_project_resource(
+    with _open_project_resource(
         path, root, allow_outside_root, config=config
-    )
-    try:
+    ) as (project, resource, project_root, target, content):
         resolved_offset = _offset_from_position(content, line=line, column=column, offset=offset)
         location = findit.find_definition(project, content, resolved_offset, resource=resource)
         if not location:
@@ -125,8 +123,6 @@ def rope_find_definition(
             "definition": definition,
             "found": True,
         }
-    finally:
-        project.close()
 
 
 @tool_side_effects(ToolSideEffect.FILE_MUTATION)
@@ -152,10 +148,9 @@ def rope_rename_symbol(
     if not new_name:
         raise ValueError("new_name is required")
     config = get_config(state)
-    project, resource, project_root, target, content = _open_project_resource(
+    with _open_project_resource(
         path, root, allow_outside_root, config=config
-    )
-    try:
+    ) as (project, resource, project_root, target, content):
         resolved_offset = _offset_from_position(
             content,
             line=line,
@@ -184,8 +179,6 @@ def rope_rename_symbol(
             "changed_files": changed,
             "description": changes.get_description(),
         }
-    finally:
-        project.close()
 
 
 @tool_side_effects(ToolSideEffect.FILE_MUTATION)
@@ -202,10 +195,9 @@ def rope_move_module(
     if not destination_dir:
         raise ValueError("destination_dir is required")
     config = get_config(state)
-    project, resource, project_root, target, _content = _open_project_resource(
+    with _open_project_resource(
         path, root, allow_outside_root, config=config
-    )
-    try:
+    ) as (project, resource, project_root, target, _content):
         destination = resolve_path(destination_dir, project_root, allow_outside_root=False)
         destination.mkdir(parents=True, exist_ok=True)
         if not destination.is_dir():
@@ -224,8 +216,6 @@ def rope_move_module(
             "changed_files": changed,
             "description": changes.get_description(),
         }
-    finally:
-        project.close()
 
 
 @tool_side_effects(ToolSideEffect.FILE_MUTATION)
@@ -251,10 +241,9 @@ def rope_extract_method(
     if not extracted_name:
         raise ValueError("extracted_name is required")
     config = get_config(state)
-    project, resource, project_root, target, content = _open_project_resource(
+    with _open_project_resource(
         path, root, allow_outside_root, config=config
-    )
-    try:
+    ) as (project, resource, project_root, target, content):
         start = _offset_from_position(
             content,
             line=start_line,
@@ -292,17 +281,16 @@ def rope_extract_method(
             "changed_files": changed,
             "description": changes.get_description(),
         }
-    finally:
-        project.close()
 
 
+@contextmanager
 def _open_project_resource(
     path: str,
     root: str | Path | None,
     allow_outside_root: bool,
     config: object | None = None,
-) -> tuple[Project, object, Path, Path, str]:
-    """Open a rope Project and resource for a file path."""
+) -> Iterator[tuple[Project, object, Path, Path, str]]:
+    """Borrow the pooled rope Project and a resource for a file path."""
     root_path = resolve_root(root)
     require_directory_exists(root_path, message=f"Project root does not exist: {root_path}")
     target = resolve_path(path, root_path, allow_outside_root=allow_outside_root)
@@ -315,15 +303,17 @@ def _open_project_resource(
         allow_outside_root=allow_outside_root,
     )
     project_root = _select_project_root(root_path, target, allow_outside_root)
-    project = Project(str(project_root), ropefolder=None)
     try:
         relative = target.relative_to(project_root)
     except ValueError as exc:
-        project.close()
         raise ValueError(f"Path is outside project root: {target}") from exc
-    resource = project.get_file(str(relative))
-    content = target.read_text(encoding="utf-8", errors="replace")
-    return project, resource, project_root, target, content
+    with get_rope_pool().acquire(
+        project_root, get_rope_idle_timeout(config), get_rope_full_validate_after(config)
+    ) as project:
+        resource = project.get_file(str(relative))
+        project.validate(resource)
+        content = target.read_text(encoding="utf-8", errors="replace")
+        yield project, resource, project_root, target, content
 
 
 def _select_project_root(root_path: Path, target: Path, allow_outside_root: bool) -> Path:
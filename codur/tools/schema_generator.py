@@ -1,8 +1,14 @@
 """JSON Schema generation from Python function signatures for API tool calling."""
 
+import hashlib
 import inspect
+import json
+import os
+import threading
 from enum import Enum
+from pathlib import Path
 from typing import Any, Annotated, get_args, get_origin, get_type_hints
+from codur.tools import registry
 from codur.tools.registry import list_tools_for_tasks, get_tool_by_name
 from codur.constants import TaskType
 from codur.tools.tool_annotations import ToolSideEffect
@@ -279,6 +285,104 @@ def function_to_json_schema(func_or_tool) -> dict:
     }
 
 
+SCHEMA_CACHE_VERSION = 1
+_TOOLS_DIR = Path(__file__).resolve().parent
+
+# Memoized schemas of all registry tools (name -> schema) and filtered slices of them.
+_SCHEMAS: dict[str, dict] | None = None
+_SLICES: dict[tuple, tuple[dict, ...]] = {}
+_SCHEMAS_LOCK = threading.Lock()
+
+
+def tools_source_hash() -> str:
+    """Hash of the codur.tools sources; persisted schemas are only reused when it matches."""
+    digest = hashlib.blake2b(digest_size=16)
+    for path in sorted(_TOOLS_DIR.rglob("*.py")):
+        digest.update(path.relative_to(_TOOLS_DIR).as_posix().encode("utf-8"))
+        digest.update(path.read_bytes())
+    return digest.hexdigest()
+
+
+def _build_all_schemas() -> dict[str, dict]:
+    return {name: function_to_json_schema(func) for name, func in registry._iter_tool_functions().items()}
+
+
+def _all_schemas() -> dict[str, dict]:
+    global _SCHEMAS
+    with _SCHEMAS_LOCK:
+        if _SCHEMAS is None:
+            _SCHEMAS = _build_all_schemas()
+        return _SCHEMAS
+
+
+def load_tool_schemas(config: object | None) -> bool:
+    """Populate the schema memo from tools.schema_cache_path when configured.
+
+    Rebuilds and rewrites the file when it is missing, unreadable or was written
+    for other tool sources. Returns True if schemas were loaded from the file.
+    """
+    global _SCHEMAS
+    cache_path = getattr(getattr(config, "tools", None), "schema_cache_path", None)
+    if not cache_path:
+        return False
+    path = Path(cache_path).expanduser()
+    if not path.is_absolute():
+        from codur.utils.path_utils import resolve_root
+        path = resolve_root(None) / path
+    source_hash = tools_source_hash()
+    try:
+        data = json.loads(path.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        data = None
+    if (
+        isinstance(data, dict)
+        and data.get("version") == SCHEMA_CACHE_VERSION
+        and data.get("source_hash") == source_hash
+        and isinstance(data.get("schemas"), dict)
+    ):
+        with _SCHEMAS_LOCK:
+            _SCHEMAS = data["schemas"]
+            _SLICES.clear()
+        return True
+
+    schemas = _all_schemas()
+    payload = {"version": SCHEMA_CACHE_VERSION, "source_hash": source_hash, "schemas": schemas}
+    tmp_path = path.with_suffix(f".{os.getpid()}.tmp")
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path.write_text(json.dumps(payload, separators=(",", ":")), encoding="utf-8")
+        os.replace(tmp_path, path)
+    except OSError:
+        tmp_path.unlink(missing_ok=True)
+    return False
+
+
+def clear_tool_schemas() -> None:
+    """Forget memoized schemas and slices (e.g. after tools were registered or changed)."""
+    global _SCHEMAS
+    with _SCHEMAS_LOCK:
+        _SCHEMAS = None
+        _SLICES.clear()
+
+
+def get_tool_schema(func) -> dict:
+    """Return the schema for a tool function, memoized for registry tools."""
+    name = getattr(func, "__name__", None)
+    if name is not None and get_tool_by_name(name) is func:
+        schema = _all_schemas().get(name)
+        if schema is not None:
+            return schema
+    return function_to_json_schema(func)
+
+
+def _as_key(values) -> frozenset | None:
+    if values is None:
+        return None
+    if isinstance(values, Enum):
+        return frozenset({values})
+    return frozenset(values)
+
+
 def get_function_schemas(
     task_types: list[TaskType] | TaskType | None = None,
     *,
@@ -295,7 +399,10 @@ def get_function_schemas(
         include_unannotated: Include tools without TaskType annotations.
 
     Returns:
-        List of JSON schemas compatible with LangChain's bind_tools()
+        List of JSON schemas compatible with LangChain's bind_tools().
+        Schemas are generated once per process and each filter combination is
+        computed once, so the same call returns the same schema objects; treat
+        them as read-only.
 
     Examples:
         # Get all tools
@@ -316,6 +423,18 @@ def get_function_schemas(
             include_unannotated=True
         )
     """
+    key = (
+        _as_key(task_types),
+        _as_key(exclude_task_types),
+        _as_key(exclude_side_effects),
+        include_unannotated,
+        registry._rg_available(),
+    )
+    with _SCHEMAS_LOCK:
+        cached = _SLICES.get(key)
+    if cached is not None:
+        return list(cached)
+
     # Use list_tools_for_tasks for filtering
     tools = list_tools_for_tasks(
         task_types=task_types,
@@ -323,21 +442,19 @@ def get_function_schemas(
         exclude_side_effects=exclude_side_effects,
         include_unannotated=include_unannotated,
     )
+    all_schemas = _all_schemas()
     schemas = []
 
     for tool in tools:
         if not isinstance(tool, dict) or "name" not in tool:
             continue
 
-        tool_name = tool["name"]
-
-        # Get the actual function from registry
-        func = get_tool_by_name(tool_name)
-        if func is None:
+        # Look up the memoized schema for the registry tool
+        schema = all_schemas.get(tool["name"])
+        if schema is None:
             continue
-
-        # Generate schema
-        schema = function_to_json_schema(func)
         schemas.append(schema)
 
+    with _SCHEMAS_LOCK:
+        _SLICES[key] = tuple(schemas)
     return schemas
@@ -0,0 +1,89 @@
+"""
+Workspace-wide Python symbol search tools backed by a persistent index.
+"""
+
+from __future__ import annotations
+
+from pathlib import Path
+from typing import TypedDict
+
+from codur.constants import DEFAULT_MAX_RESULTS, TaskType
+from codur.graph.state import AgentState
+from codur.graph.state_operations import get_config
+from codur.tools.tool_annotations import ToolContext, summary_format, tool_contexts, tool_scenarios
+from codur.utils.workspace_symbols import SymbolDefinition, SymbolReference, get_workspace_symbols
+
+_SYMBOL_KINDS = ("function", "method", "class")
+
+
+class SymbolDefinitionsResult(TypedDict):
+    """Result payload for find_symbol_definitions."""
+    name: str
+    count: int
+    truncated: bool
+    definitions: list[SymbolDefinition]
+
+
+class SymbolReferencesResult(TypedDict):
+    """Result payload for find_symbol_references."""
+    name: str
+    count: int
+    files: int
+    truncated: bool
+    references: list[SymbolReference]
+
+
+@summary_format("definitions of <name>\ncount: <count>\n<output>")
+@tool_contexts(ToolContext.SEARCH)
+@tool_scenarios(TaskType.EXPLANATION, TaskType.CODE_FIX, TaskType.REFACTOR, TaskType.CODE_ANALYSIS)
+def find_symbol_definitions(
+    name: str,
+    kind: str | None = None,
+    root: str | Path | None = None,
+    max_results: int = DEFAULT_MAX_RESULTS,
+    state: AgentState | None = None,
+) -> SymbolDefinitionsResult:
+    """
+    Find where a Python function, method or class is defined across the workspace.
+    name may be bare ("load"), qualified ("Service.load") or dotted ("pkg.mod.Service").
+    kind optionally filters to "function", "method" or "class".
+    """
+    if kind is not None and kind not in _SYMBOL_KINDS:
+        raise ValueError("kind must be one of: function, method, class")
+    index = get_workspace_symbols(root, get_config(state))
+    definitions = index.find_definitions(name, kind=kind, max_results=max_results + 1)
+    truncated = len(definitions) > max_results
+    definitions = definitions[:max_results]
+    return {
+        "name": name,
+        "count": len(definitions),
+        "truncated": truncated,
+        "definitions": definitions,
+    }
+
+
+@summary_format("references to <name>\ncount: <count>\n<output>")
+@tool_contexts(ToolContext.SEARCH)
+@tool_scenarios(TaskType.EXPLANATION, TaskType.CODE_FIX, TaskType.REFACTOR, TaskType.CODE_ANALYSIS)
+def find_symbol_references(
+    name: str,
+    root: str | Path | None = None,
+    max_results: int = DEFAULT_MAX_RESULTS,
+    state: AgentState | None = None,
+) -> SymbolReferencesResult:
+    """
+    Find lines across the workspace's Python files that reference a name
+    (identifiers, attribute access and imports). Name-based: cheaper but less
+    precise than rope_find_usages.
+    """
+    index = get_workspace_symbols(root, get_config(state))
+    references = index.find_references(name, max_results=max_results + 1)
+    truncated = len(references) > max_results
+    references = references[:max_results]
+    return {
+        "name": name,
+        "count": len(references),
+        "files": len({item["path"] for item in references}),
+        "truncated": truncated,
+        "references": references,
+    }
@@ -1,8 +1,9 @@
 """Python syntax validation utilities and code execution verification."""
 
-import ast
 import os
+import shutil
 import subprocess
+import tempfile
 from pathlib import Path
 from typing import Optional, TypedDict
 
@@ -10,6 +11,13 @@ from rich.console import Console
 
 from codur.config import CodurConfig
 from codur.graph.state_operations import is_verbose, get_config
+from codur.tools.pytest_report import (
+    PytestFailure,
+    PytestSummary,
+    junit_args,
+    read_junit_report,
+    write_pytest_log,
+)
 
 
 console = Console()
@@ -35,6 +43,10 @@ class RunPytestResult(TypedDict, total=False):
     command: str
     cwd: str
     paths: list[str]
+    summary: PytestSummary
+    failures: list[PytestFailure]
+    omitted_failures: int
+    log_path: str
     stdout: str
     stderr: str
     error: str
@@ -50,10 +62,13 @@ from codur.tools.tool_annotations import (
     tool_scenarios,
     tool_side_effects,
 )
+from codur.utils.ast_cache import parse_source
+from codur.utils.concurrency import communicate_cancellable
 from codur.utils.config_helpers import get_cli_timeout
 from codur.utils.path_utils import resolve_path, resolve_root
 from codur.utils.text_helpers import truncate_chars
 from codur.utils.validation import require_directory_exists
+from codur.utils.warm_runner import WARM_PYTEST, WARM_SCRIPT, run_warm
 
 
 VALIDATE_PYTHON_SYNTAX_SUMMARY_FORMAT = """python syntax valid: <valid>
@@ -78,8 +93,15 @@ RUN_PYTHON_FILE_SUMMARY_FORMAT = f"python run: <path> with return_code: <return_
 
 RUN_PYTEST_SUMMARY_FORMAT = f"""pytest run: <command>
 success: <success>
+counts: <summary>
+failures (test id, exception type, message, key traceback lines):
+<failures>
+full log: <log_path>
 {STD_OUT_STDERR_ERR}"""
 
+# stderr kept in a result that has a parsed report; the full text is in the log.
+REPORT_STDERR_CHARS = 2000
+
 
 @summary_format(VALIDATE_PYTHON_SYNTAX_SUMMARY_FORMAT)
 @tool_scenarios(
@@ -100,7 +122,7 @@ def validate_python_syntax(code: str) -> ValidateSyntaxResult:
         {"valid": False, "error": error_message} if invalid
     """
     try:
-        ast.parse(code)
+        parse_source(code)
         return {"valid": True}
     except SyntaxError as e:
         error_msg = f"Syntax error at line {e.lineno}: {e.msg}"
@@ -172,21 +194,30 @@ def run_python_file(
         if env:
             process_env.update(env)
 
-        process = subprocess.Popen(
-            ["python", str(file_path)],
-            stdout=subprocess.PIPE,
-            stderr=subprocess.PIPE,
-            text=True,
-            cwd=str(exec_cwd),
-            env=process_env
-        )
-
         try:
-            stdout, stderr = process.communicate(timeout=execution_timeout)
-            return_code = process.returncode
+            warm = run_warm(
+                config or get_config(state), WARM_SCRIPT, [str(file_path)],
+                root_dir, exec_cwd, process_env, execution_timeout,
+            )
+            if warm is not None:
+                stdout, stderr, return_code = warm.stdout, warm.stderr, warm.returncode
+            else:
+                process = subprocess.Popen(
+                    ["python", str(file_path)],
+                    stdout=subprocess.PIPE,
+                    stderr=subprocess.PIPE,
+                    text=True,
+                    cwd=str(exec_cwd),
+                    env=process_env
+                )
+                try:
+                    stdout, stderr = communicate_cancellable(process, timeout=execution_timeout)
+                except subprocess.TimeoutExpired:
+                    process.kill()
+                    process.wait()
+                    raise
+                return_code = process.returncode
         except subprocess.TimeoutExpired:
-            process.kill()
-            process.wait()
             return {
                 "error": f"Error: Execution timed out after {execution_timeout} seconds"
             }
@@ -226,16 +257,36 @@ def run_pytest(
     cwd: str | None = None,
     env: dict | None = None,
     timeout: int | None = None,
+    affected_only: bool = False,
     allow_outside_root: bool = False,
     state: AgentState | None = None,
 ) -> RunPytestResult:
-    """Run pytest and return the results."""
+    """
+    Run pytest and return the results.
+
+    Returns the test counts and, for each failing test, its id, exception type,
+    message and the traceback lines from project code. The full pytest output is
+    saved to the file at `log_path`; read it when the summary is not enough.
+
+    With affected_only, run only the test modules that import the files modified
+    during this run (directly or through other modules); `path`/`paths` then name
+    the modified files instead. Results of test modules whose code and imports did
+    not change since they last passed or failed are reused.
+    """
     if path and paths:
         raise ValueError("Specify either 'path' or 'paths', not both.")
 
     if path:
         paths = [path]
 
+    if affected_only:
+        # Imported here: affected_tests runs the selected tests through run_pytest.
+        from codur.tools.affected_tests import run_affected_tests
+        return run_affected_tests(
+            paths=paths, keyword=keyword, markers=markers, extra_args=extra_args, root=root,
+            cwd=cwd, env=env, timeout=timeout, allow_outside_root=allow_outside_root, state=state,
+        )
+
     root_path = resolve_root(root)
     exec_cwd = (
         resolve_path(cwd, root_path, allow_outside_root=allow_outside_root)
@@ -273,45 +324,74 @@ def run_pytest(
         else DEFAULT_MAX_BYTES
     )
 
-    try:
-        process = subprocess.Popen(
-            cmd,
-            stdout=subprocess.PIPE,
-            stderr=subprocess.PIPE,
-            text=True,
-            cwd=str(exec_cwd),
-            env=process_env,
-        )
-    except FileNotFoundError:
-        return {
-            "success": False,
-            "exit_code": 127,
-            "error": "pytest not found on PATH",
-            "command": " ".join(cmd),
-            "cwd": str(exec_cwd),
-        }
+    command = " ".join(cmd)
+    report_dir: Optional[Path] = None
+    if not any(arg.startswith(("--junitxml", "--junit-xml")) for arg in cmd):
+        report_dir = Path(tempfile.mkdtemp(prefix="codur-pytest-"))
+        cmd = [*cmd, *junit_args(report_dir / "report.xml")]
 
     try:
-        stdout, stderr = process.communicate(timeout=effective_timeout)
+        warm = run_warm(config, WARM_PYTEST, cmd[1:], root_path, exec_cwd, process_env, effective_timeout)
+        if warm is not None:
+            stdout, stderr, return_code = warm.stdout, warm.stderr, warm.returncode
+        else:
+            try:
+                process = subprocess.Popen(
+                    cmd,
+                    stdout=subprocess.PIPE,
+                    stderr=subprocess.PIPE,
+                    text=True,
+                    cwd=str(exec_cwd),
+                    env=process_env,
+                )
+            except FileNotFoundError:
+                return {
+                    "success": False,
+                    "exit_code": 127,
+                    "error": "pytest not found on PATH",
+                    "command": command,
+                    "cwd": str(exec_cwd),
+                }
+            try:
+                stdout, stderr = communicate_cancellable(process, timeout=effective_timeout)
+            except subprocess.TimeoutExpired:
+                process.kill()
+                process.wait()
+                raise
+            return_code = process.returncode
+        report = read_junit_report(report_dir / "report.xml", root_path) if report_dir is not None else None
     except subprocess.TimeoutExpired:
-        process.kill()
-        process.wait()
         return {
             "success": False,
             "exit_code": None,
             "error": f"Execution timed out after {effective_timeout} seconds",
-            "command": " ".join(cmd),
+            "command": command,
             "cwd": str(exec_cwd),
         }
-
-    stdout = truncate_chars(stdout or "", max_output_chars).strip()
-    stderr = truncate_chars(stderr or "", max_output_chars).strip()
-    return {
-        "success": process.returncode == 0,
-        "exit_code": process.returncode,
-        "command": " ".join(cmd),
+    finally:
+        if report_dir is not None:
+            shutil.rmtree(report_dir, ignore_errors=True)
+
+    stdout, stderr = stdout or "", stderr or ""
+    result: RunPytestResult = {
+        "success": return_code == 0,
+        "exit_code": return_code,
+        "command": command,
         "cwd": str(exec_cwd),
         "paths": resolved_paths,
-        "stdout": stdout,
-        "stderr": stderr,
     }
+    log_path = write_pytest_log(root_path, config, command, return_code, stdout, stderr)
+    if log_path is not None:
+        result["log_path"] = log_path
+    if report is not None:
+        result["summary"] = report["summary"]
+        result["failures"] = report["failures"]
+        if report["omitted_failures"]:
+            result["omitted_failures"] = report["omitted_failures"]
+        if stderr.strip():
+            result["stderr"] = truncate_chars(stderr, REPORT_STDERR_CHARS).strip()
+        return result
+    # No report (usage error, crash, custom --junitxml): fall back to the console output.
+    result["stdout"] = truncate_chars(stdout, max_output_chars).strip()
+    result["stderr"] = truncate_chars(stderr, max_output_chars).strip()
+    return result
@@ -9,12 +9,9 @@ Provides a split-pane interface where users can:
 
 import asyncio
 import warnings
-import threading
 import os
 import re
-from pathlib import Path
 from datetime import datetime
-from pathspec import PathSpec
 warnings.filterwarnings(
     "ignore",
     message="Core Pydantic V1 functionality isn't compatible with Python 3.14 or greater.",
@@ -28,22 +25,17 @@ from textual.widgets import Header, TextArea, Static, RichLog
 from textual import events
 from textual.binding import Binding
 from textual.theme import Theme
+from rich.markup import escape
 from rich.panel import Panel
 from typing import Optional
 
-from codur.utils.ignore_utils import (
-    get_exclude_dirs,
-    is_gitignored,
-    is_hidden_path,
-    load_gitignore,
-    should_include_hidden,
-    should_respect_gitignore,
-)
+from codur.utils.workspace_index import get_workspace_index
 from codur.tui_components import AgentStatus, FileSearchScreen
 from codur.tui_style import TUI_CSS
 
 from codur.config import load_config, CodurConfig
 from codur.graph.main_graph import create_agent_graph
+from codur.graph.runtime import ainvoke_graph
 from codur.graph.state_operations import get_latest_agent_outcome
 from langchain_core.messages import HumanMessage
 
@@ -118,6 +110,7 @@ class CodurTUI(App):
         self.log_history: list[dict] = []
         self.debug_history: list[dict] = []
         self.user_queue: asyncio.Queue = asyncio.Queue()
+        self._token_buffer = ""
         self._file_index: list[str] = []
         self._file_search_active = False
         self._last_input_value = ""
@@ -203,58 +196,10 @@ class CodurTUI(App):
     async def _build_file_index(self) -> None:
         self._file_index = await asyncio.to_thread(self._scan_files)
 
-    def _load_gitignore(self, root: str) -> PathSpec | None:
-        """Load and parse .gitignore patterns from the repository root."""
-        if not should_respect_gitignore(self.config):
-            return None
-        return load_gitignore(Path(root))
-
-    def _is_ignored(self, path: str, root: str, spec: PathSpec | None, is_dir: bool = False) -> bool:
-        """Check if a path is ignored by gitignore patterns or hardcoded excludes."""
-        exclude_dirs = get_exclude_dirs(self.config)
-        if is_dir and os.path.basename(path) in exclude_dirs:
-            return True
-
-        if not should_include_hidden(self.config) and is_hidden_path(Path(path)):
-            return True
-
-        if spec:
-            return is_gitignored(Path(path), Path(root), spec, is_dir=is_dir)
-
-        return False
-
     def _scan_files(self) -> list[str]:
-        root = os.getcwd()
-        results: list[str] = []
-
-        # Load .gitignore patterns
-        gitignore_spec = self._load_gitignore(root)
-
-        for dirpath, dirnames, filenames in os.walk(root):
-            # Filter directories to exclude both hardcoded and gitignored ones
-            dirnames[:] = [
-                d for d in dirnames
-                if not self._is_ignored(
-                    os.path.relpath(os.path.join(dirpath, d), root),
-                    root,
-                    gitignore_spec,
-                    is_dir=True
-                )
-            ]
-
-            # Add directories
-            for dirname in dirnames:
-                full_path = os.path.join(dirpath, dirname)
-                rel_path = os.path.relpath(full_path, root)
-                results.append(rel_path + "/")  # Append / to indicate directory
-
-            # Add files (excluding ignored ones)
-            for filename in filenames:
-                full_path = os.path.join(dirpath, filename)
-                rel_path = os.path.relpath(full_path, root)
-                if not self._is_ignored(rel_path, root, gitignore_spec, is_dir=False):
-                    results.append(rel_path)
-
+        index = get_workspace_index(os.getcwd(), self.config)
+        results = [rel_dir + "/" for rel_dir in index.iter_dirs()]  # Append / to indicate directory
+        results.extend(entry.path for entry in index.iter_files())
         return results
 
     def _annotate_file_mentions(self, task: str) -> str:
@@ -537,8 +482,8 @@ class CodurTUI(App):
 
     async def _run_quick_response(self, task: str) -> None:
         self.update_agent_status("Orchestrator", "Responding", 0)
-        result = await asyncio.to_thread(
-            self.graph.invoke,
+        result = await ainvoke_graph(
+            self.graph,
             {"messages": [HumanMessage(content=task)], "config": self.config},
         )
         self.log_message("\n[bold green]Response:[/bold green]")
@@ -560,37 +505,37 @@ class CodurTUI(App):
         if planner_details:
             self.log_debug(f"  planner_llm: {planner_details}", "yellow")
 
-        event_queue: asyncio.Queue = asyncio.Queue()
-        loop = asyncio.get_running_loop()
-
-        thread = threading.Thread(
-            target=self._stream_worker,
-            args=(initial_state, event_queue, loop),
-            daemon=True,
-        )
-        thread.start()
-
         step_num = 0
-        while True:
-            event = await event_queue.get()
-            if event is None:
-                break
 
+        async def on_update(event: dict) -> None:
+            nonlocal step_num
+            self._flush_tokens()
             if self.paused:
+                # Not consuming the stream holds the graph at the next node boundary.
                 self.log_message("[yellow]Waiting for resume...[/yellow]")
                 while self.paused:
                     await asyncio.sleep(0.1)
 
             step_num += 1
             self._handle_stream_event(event, step_num)
-            await asyncio.sleep(0.05)
 
-    def _stream_worker(self, initial_state: dict, event_queue: asyncio.Queue, loop: asyncio.AbstractEventLoop) -> None:
+        on_token = self._log_token if self.config.runtime.stream_tokens else None
         try:
-            for event in self.graph.stream(initial_state):
-                loop.call_soon_threadsafe(event_queue.put_nowait, event)
+            await ainvoke_graph(self.graph, initial_state, on_token=on_token, on_update=on_update)
         finally:
-            loop.call_soon_threadsafe(event_queue.put_nowait, None)
+            self._flush_tokens()
+
+    def _log_token(self, node: str, text: str) -> None:
+        """Show streamed LLM output line by line as it arrives."""
+        self._token_buffer += text
+        while "\n" in self._token_buffer:
+            line, self._token_buffer = self._token_buffer.split("\n", 1)
+            self.log_message(escape(line), "dim")
+
+    def _flush_tokens(self) -> None:
+        if self._token_buffer:
+            self.log_message(escape(self._token_buffer), "dim")
+            self._token_buffer = ""
 
     def _handle_stream_event(self, event: dict, step_num: int) -> None:
         self.log_debug(f"\n[bold yellow]📊 Step {step_num} Event:[/bold yellow]", "")
@@ -0,0 +1,165 @@
+"""Content-addressed cache for parsed Python ASTs.
+
+Several tools parse the same module repeatedly during a single run (outline,
+dependencies, linting, line lookups, syntax validation). This cache keys parsed
+trees on a hash of the source text so each content version is parsed once.
+
+Cached trees are shared between callers and must be treated as read-only.
+"""
+
+from __future__ import annotations
+
+import ast
+import hashlib
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass
+from pathlib import Path
+from typing import TypedDict
+
+DEFAULT_MAX_ENTRIES = 512
+DEFAULT_MAX_BYTES = 32 * 1024 * 1024  # measured in source bytes
+
+
+class ParseCacheStats(TypedDict):
+    """Counters describing parse cache effectiveness."""
+    hits: int
+    misses: int
+    evictions: int
+    entries: int
+    bytes: int
+
+
+@dataclass(frozen=True)
+class _SyntaxErrorInfo:
+    error_type: type[SyntaxError]
+    msg: str
+    lineno: int | None
+    offset: int | None
+    text: str | None
+    end_lineno: int | None
+    end_offset: int | None
+
+    def to_exception(self, filename: str) -> SyntaxError:
+        return self.error_type(
+            self.msg,
+            (filename, self.lineno, self.offset, self.text, self.end_lineno, self.end_offset),
+        )
+
+
+def _source_digest(source: str) -> str:
+    return hashlib.blake2b(source.encode("utf-8", "surrogatepass"), digest_size=20).hexdigest()
+
+
+class ASTParseCache:
+    """LRU cache of `ast.parse` results bounded by entry count and source size.
+
+    Syntax errors are cached as well and re-raised with the caller's filename.
+    """
+
+    def __init__(self, max_entries: int = DEFAULT_MAX_ENTRIES, max_bytes: int = DEFAULT_MAX_BYTES) -> None:
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self._entries: OrderedDict[str, tuple[ast.Module | _SyntaxErrorInfo, int]] = OrderedDict()
+        self._bytes = 0
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+        self._lock = threading.Lock()
+
+    def parse(self, source: str, filename: str = "<unknown>") -> ast.Module:
+        """Return the parsed module for source, raising SyntaxError like ast.parse."""
+        key = _source_digest(source)
+        with self._lock:
+            cached = self._entries.get(key)
+            if cached is not None:
+                self._entries.move_to_end(key)
+                self._hits += 1
+            else:
+                self._misses += 1
+        if cached is None:
+            try:
+                result: ast.Module | _SyntaxErrorInfo = ast.parse(source, filename=filename)
+            except SyntaxError as exc:
+                result = _SyntaxErrorInfo(
+                    type(exc),
+                    exc.msg,
+                    exc.lineno,
+                    exc.offset,
+                    exc.text,
+                    getattr(exc, "end_lineno", None),
+                    getattr(exc, "end_offset", None),
+                )
+            self._store(key, result, len(source))
+        else:
+            result = cached[0]
+        if isinstance(result, _SyntaxErrorInfo):
+            raise result.to_exception(filename)
+        return result
+
+    def parse_file(self, path: str | Path) -> ast.Module:
+        """Read a file (UTF-8, replacing undecodable bytes) and parse it through the cache."""
+        with open(path, "r", encoding="utf-8", errors="replace") as handle:
+            source = handle.read()
+        return self.parse(source, filename=str(path))
+
+    def stats(self) -> ParseCacheStats:
+        with self._lock:
+            return {
+                "hits": self._hits,
+                "misses": self._misses,
+                "evictions": self._evictions,
+                "entries": len(self._entries),
+                "bytes": self._bytes,
+            }
+
+    def clear(self) -> None:
+        """Drop all cached trees and reset counters."""
+        with self._lock:
+            self._entries.clear()
+            self._bytes = 0
+            self._hits = 0
+            self._misses = 0
+            self._evictions = 0
+
+    def _store(self, key: str, result: ast.Module | _SyntaxErrorInfo, size: int) -> None:
+        if size > self.max_bytes:
+            return
+        with self._lock:
+            previous = self._entries.pop(key, None)
+            if previous is not None:
+                self._bytes -= previous[1]
+            self._entries[key] = (result, size)
+            self._bytes += size
+            while self._entries and (
+                len(self._entries) > self.max_entries or self._bytes > self.max_bytes
+            ):
+                _, (_, evicted_size) = self._entries.popitem(last=False)
+                self._bytes -= evicted_size
+                self._evictions += 1
+
+
+_PARSE_CACHE = ASTParseCache()
+
+
+def get_parse_cache() -> ASTParseCache:
+    """Return the process-wide parse cache."""
+    return _PARSE_CACHE
+
+
+def parse_source(source: str, filename: str = "<unknown>") -> ast.Module:
+    """Parse source through the process-wide cache (drop-in for ast.parse)."""
+    return _PARSE_CACHE.parse(source, filename=filename)
+
+
+def parse_file(path: str | Path) -> ast.Module:
+    """Read and parse a file through the process-wide cache."""
+    return _PARSE_CACHE.parse_file(path)
+
+
+def get_parse_cache_stats() -> ParseCacheStats:
+    return _PARSE_CACHE.stats()
+
+
+def clear_parse_cache() -> None:
+    _PARSE_CACHE.clear()
@@ -0,0 +1,203 @@
+"""Concurrency limits and cooperative cancellation for agent and tool work.
+
+Implements runtime.async settings:
+- `ConcurrencyLimiter` bounds how many delegated agents/tool calls run at once
+  across the process (several TUI tasks may run graphs concurrently). Slots are
+  re-entrant through a context variable, so work started while holding a slot
+  (an agent's own tool calls) does not wait on the limiter again.
+- `CancellationToken` is a cooperative stop flag carried in a context variable.
+  Long-running tools poll it (see `communicate_cancellable`) and stop early
+  once a timeout or run cancellation fires.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import contextvars
+import subprocess
+import threading
+import time
+from contextlib import contextmanager
+from dataclasses import dataclass
+from typing import Iterator, Optional
+
+_POLL_INTERVAL_S = 0.2
+
+
+class OperationCancelled(RuntimeError):
+    """Raised by cooperative checkpoints once the current scope is cancelled."""
+
+
+@dataclass(frozen=True)
+class AsyncLimits:
+    """Resolved runtime.async settings."""
+    max_concurrent: int = 3
+    event_buffer_size: int = 200
+    stream_events: bool = True
+    tool_timeout_s: float = 600.0
+    cancel_grace_s: float = 5.0
+
+
+def get_async_limits(config: object | None) -> AsyncLimits:
+    """Read runtime.async from config, falling back to defaults for missing values."""
+    defaults = AsyncLimits()
+    settings = getattr(getattr(config, "runtime", None), "async_", None)
+    if settings is None:
+        return defaults
+
+    def _number(name: str, default: float, minimum: float) -> float:
+        try:
+            return max(minimum, float(getattr(settings, name, default)))
+        except (TypeError, ValueError):
+            return default
+
+    return AsyncLimits(
+        max_concurrent=int(_number("max_concurrent_agents", defaults.max_concurrent, 1)),
+        event_buffer_size=int(_number("event_buffer_size", defaults.event_buffer_size, 1)),
+        stream_events=bool(getattr(settings, "stream_events", defaults.stream_events)),
+        tool_timeout_s=_number("tool_timeout_s", defaults.tool_timeout_s, 0),
+        cancel_grace_s=_number("cancel_grace_s", defaults.cancel_grace_s, 0),
+    )
+
+
+class CancellationToken:
+    """A cancel flag that is also set when its parent is cancelled."""
+
+    def __init__(self, parent: Optional["CancellationToken"] = None) -> None:
+        self.parent = parent
+        self._event = threading.Event()
+        self.reason: Optional[str] = None
+
+    def cancel(self, reason: str = "cancelled") -> None:
+        if not self._event.is_set():
+            self.reason = reason
+            self._event.set()
+
+    @property
+    def cancelled(self) -> bool:
+        return self._event.is_set() or (self.parent is not None and self.parent.cancelled)
+
+    def raise_if_cancelled(self) -> None:
+        if self.cancelled:
+            raise OperationCancelled(self._reason())
+
+    def _reason(self) -> str:
+        if self._event.is_set():
+            return self.reason or "cancelled"
+        return self.parent._reason() if self.parent is not None else "cancelled"
+
+
+_CURRENT_TOKEN: contextvars.ContextVar[Optional[CancellationToken]] = contextvars.ContextVar(
+    "codur_cancellation_token", default=None
+)
+
+
+def current_cancel_token() -> Optional[CancellationToken]:
+    """Return the cancellation token for the running operation, if any."""
+    return _CURRENT_TOKEN.get()
+
+
+def raise_if_cancelled() -> None:
+    """Cooperative checkpoint: raise OperationCancelled if the current scope was cancelled."""
+    token = _CURRENT_TOKEN.get()
+    if token is not None:
+        token.raise_if_cancelled()
+
+
+@contextmanager
+def cancel_scope(token: Optional[CancellationToken] = None) -> Iterator[CancellationToken]:
+    """Run a block under a token chained to the enclosing scope's token."""
+    token = token or CancellationToken(parent=_CURRENT_TOKEN.get())
+    reset = _CURRENT_TOKEN.set(token)
+    try:
+        yield token
+    finally:
+        _CURRENT_TOKEN.reset(reset)
+
+
+def communicate_cancellable(
+    process: subprocess.Popen,
+    timeout: Optional[float] = None,
+) -> tuple[str, str]:
+    """Popen.communicate that also kills the process when the current scope is cancelled.
+
+    Raises subprocess.TimeoutExpired after `timeout` (the caller kills the process,
+    as with communicate) and OperationCancelled after killing a cancelled process.
+    """
+    token = _CURRENT_TOKEN.get()
+    if token is None:
+        return process.communicate(timeout=timeout)
+    deadline = None if timeout is None else time.monotonic() + timeout
+    while True:
+        wait = _POLL_INTERVAL_S
+        if deadline is not None:
+            wait = min(wait, max(0.0, deadline - time.monotonic()))
+        try:
+            return process.communicate(timeout=wait)
+        except subprocess.TimeoutExpired:
+            if token.cancelled:
+                process.kill()
+                process.communicate()
+                token.raise_if_cancelled()
+            if deadline is not None and time.monotonic() >= deadline:
+                raise
+
+
+_HOLDING_SLOT: contextvars.ContextVar[bool] = contextvars.ContextVar("codur_holding_slot", default=False)
+
+
+class ConcurrencyLimiter:
+    """Process-wide cap on concurrently running agents and tool calls."""
+
+    def __init__(self, limit: int) -> None:
+        self.limit = limit
+        self._semaphore = threading.BoundedSemaphore(limit)
+
+    @contextmanager
+    def slot(self) -> Iterator[None]:
+        """Hold one slot for the duration of the block (free if one is already held)."""
+        if _HOLDING_SLOT.get():
+            yield
+            return
+        token = _CURRENT_TOKEN.get()
+        while not self._semaphore.acquire(timeout=_POLL_INTERVAL_S if token else None):
+            token.raise_if_cancelled()
+        reset = _HOLDING_SLOT.set(True)
+        try:
+            yield
+        finally:
+            _HOLDING_SLOT.reset(reset)
+            self._semaphore.release()
+
+
+_LIMITERS: dict[int, ConcurrencyLimiter] = {}
+_LIMITERS_LOCK = threading.Lock()
+
+
+def get_concurrency_limiter(config: object | None) -> ConcurrencyLimiter:
+    """Return the shared limiter for the configured max_concurrent_agents."""
+    limit = get_async_limits(config).max_concurrent
+    with _LIMITERS_LOCK:
+        limiter = _LIMITERS.get(limit)
+        if limiter is None:
+            limiter = ConcurrencyLimiter(limit)
+            _LIMITERS[limit] = limiter
+        return limiter
+
+
+async def await_cancellable(awaitable):
+    """Await a coroutine, cancelling it once the current scope's token is cancelled."""
+    token = _CURRENT_TOKEN.get()
+    task = asyncio.ensure_future(awaitable)
+    if token is None:
+        return await task
+    while not task.done():
+        await asyncio.wait({task}, timeout=_POLL_INTERVAL_S)
+        if token.cancelled and not task.done():
+            task.cancel()
+            try:
+                await task
+            except asyncio.CancelledError:
+                pass
+            token.raise_if_cancelled()
+    return task.result()
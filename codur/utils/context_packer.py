@@ -0,0 +1,202 @@
+"""Token-budgeted packing of the message history sent to an LLM.
+
+`pack_context` takes the same window as `message_shortening_pipeline` (the
+last block of system messages and everything after it) and then:
+1. collapses superseded tool outputs to short stubs: earlier reads of a file
+   that was read again or modified later, and earlier results of an identical
+   call (same tool and arguments),
+2. fits the profile's token budget by dropping the oldest exchanges (an
+   assistant message together with its tool results, so tool-call/result
+   pairs stay intact), then truncating the largest remaining tool outputs.
+The system block and the latest exchange are always kept.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+from dataclasses import dataclass
+from typing import Any, Optional
+
+from langchain_core.messages import BaseMessage, SystemMessage, ToolMessage
+
+from codur.graph.tool_executor import get_mutated_paths
+from codur.utils.message_pipeline import message_shortening_pipeline
+from codur.utils.text_helpers import CHARS_PER_TOKEN, estimate_tokens, truncate_chars
+
+DEFAULT_CONTEXT_BUDGET_TOKENS = 32000
+# Per-message overhead of the chat format (role, separators).
+_MESSAGE_OVERHEAD_TOKENS = 4
+# Outputs shorter than this are not worth replacing with a stub.
+_STUB_MIN_CHARS = 200
+# Truncated tool outputs keep at least this many characters.
+_MIN_TRUNCATED_CHARS = 500
+# Room for the "... (N more chars)" marker truncate_chars appends.
+_TRUNCATION_MARKER_CHARS = 32
+
+
+@dataclass(frozen=True)
+class PackedContext:
+    """Messages to send, with what packing did to fit them."""
+    messages: list[BaseMessage]
+    tokens: int
+    original_tokens: int
+    stubbed: int
+    dropped: int
+    truncated: int
+
+    @property
+    def saved_tokens(self) -> int:
+        return self.original_tokens - self.tokens
+
+
+def get_context_budget(config: object | None, profile_name: Optional[str]) -> int:
+    """Read the profile's context_budget_tokens (DEFAULT_CONTEXT_BUDGET_TOKENS when unset)."""
+    profiles = getattr(getattr(config, "llm", None), "profiles", None) or {}
+    profile = profiles.get(profile_name) if profile_name else None
+    budget = getattr(profile, "context_budget_tokens", None)
+    return int(budget) if budget else DEFAULT_CONTEXT_BUDGET_TOKENS
+
+
+def message_tokens(message: BaseMessage) -> int:
+    content = message.content if isinstance(message.content, str) else json.dumps(message.content, default=str)
+    tokens = estimate_tokens(content) + _MESSAGE_OVERHEAD_TOKENS
+    tool_calls = getattr(message, "tool_calls", None)
+    if tool_calls:
+        tokens += estimate_tokens(json.dumps(tool_calls, default=str))
+    return tokens
+
+
+def _parse(message: BaseMessage) -> Optional[dict]:
+    if not isinstance(message, ToolMessage) or not isinstance(message.content, str):
+        return None
+    try:
+        data = json.loads(message.content)
+    except json.JSONDecodeError:
+        return None
+    if not isinstance(data, dict) or not isinstance(data.get("tool"), str):
+        return None
+    return data
+
+
+def _with_output(message: ToolMessage, data: dict, output: Any) -> ToolMessage:
+    return message.model_copy(update={"content": json.dumps({**data, "output": output})})
+
+
+def _is_large(output: Any) -> bool:
+    text = output if isinstance(output, str) else json.dumps(output, default=str)
+    return len(text) >= _STUB_MIN_CHARS
+
+
+def _norm(path: str) -> str:
+    return os.path.normpath(path)
+
+
+def _collapse_superseded(messages: list[BaseMessage]) -> tuple[list[BaseMessage], int]:
+    """Replace outputs that later messages make obsolete with stubs (walks newest first)."""
+    packed = list(messages)
+    read_later: set[str] = set()
+    mutated_later: dict[str, str] = {}
+    calls_later: set[str] = set()
+    stubbed = 0
+
+    def file_stub(path: str) -> Optional[str]:
+        if path in read_later:
+            return f"[superseded: {path} is read again later]"
+        if path in mutated_later:
+            return f"[stale: {path} was modified later by {mutated_later[path]}]"
+        return None
+
+    for idx in range(len(packed) - 1, -1, -1):
+        data = _parse(packed[idx])
+        if data is None:
+            continue
+        tool = data["tool"]
+        args = data.get("args") if isinstance(data.get("args"), dict) else {}
+        output = data.get("output")
+        call_key = json.dumps([tool, args], sort_keys=True, default=str)
+        new_output = output
+
+        if call_key in calls_later and _is_large(output):
+            new_output = f"[superseded: {tool} is called again later with the same arguments]"
+        elif tool == "read_file" and isinstance(args.get("path"), str):
+            stub = file_stub(_norm(args["path"]))
+            if stub and _is_large(output):
+                new_output = stub
+            read_later.add(_norm(args["path"]))
+        elif tool == "read_files" and isinstance(output, dict):
+            new_output = {}
+            for path, content in output.items():
+                stub = file_stub(_norm(path))
+                new_output[path] = stub if stub and _is_large(content) else content
+                read_later.add(_norm(path))
+        calls_later.add(call_key)
+        for path in get_mutated_paths(tool, args, output) or []:
+            mutated_later.setdefault(_norm(path), tool)
+
+        if new_output != output:
+            packed[idx] = _with_output(packed[idx], data, new_output)
+            stubbed += 1
+    return packed, stubbed
+
+
+def _exchanges(messages: list[BaseMessage]) -> list[list[int]]:
+    """Group message indexes so that tool results stay with the message that requested them."""
+    groups: list[list[int]] = []
+    for idx, message in enumerate(messages):
+        if isinstance(message, ToolMessage) and groups:
+            groups[-1].append(idx)
+        else:
+            groups.append([idx])
+    return groups
+
+
+def pack_context(messages: list[BaseMessage], budget_tokens: int = DEFAULT_CONTEXT_BUDGET_TOKENS) -> PackedContext:
+    """Pack the message history into `budget_tokens` (see module docstring).
+
+    Raises:
+        ValueError: If messages contain no SystemMessage
+    """
+    window = message_shortening_pipeline(messages)
+    original_tokens = sum(message_tokens(message) for message in window)
+    packed, stubbed = _collapse_superseded(window)
+    tokens = [message_tokens(message) for message in packed]
+
+    head = 0
+    while head < len(packed) and isinstance(packed[head], SystemMessage):
+        head += 1
+    groups = [[head + idx for idx in group] for group in _exchanges(packed[head:])]
+
+    dropped = 0
+    while sum(tokens) > budget_tokens and len(groups) > 1:
+        for idx in groups.pop(0):
+            tokens[idx] = 0
+            dropped += 1
+    kept = list(range(head)) + [idx for group in groups for idx in group]
+
+    truncated = 0
+    overflow = sum(tokens) - budget_tokens
+    largest_first = sorted((idx for idx in kept if _parse(packed[idx]) is not None), key=lambda idx: -tokens[idx])
+    for idx in largest_first:
+        if overflow <= 0:
+            break
+        data = _parse(packed[idx])
+        output = data.get("output")
+        text = output if isinstance(output, str) else json.dumps(output, default=str)
+        max_chars = max(_MIN_TRUNCATED_CHARS, len(text) - overflow * CHARS_PER_TOKEN - _TRUNCATION_MARKER_CHARS)
+        if max_chars >= len(text):
+            continue
+        packed[idx] = _with_output(packed[idx], data, truncate_chars(text, max_chars))
+        new_tokens = message_tokens(packed[idx])
+        overflow -= tokens[idx] - new_tokens
+        tokens[idx] = new_tokens
+        truncated += 1
+
+    return PackedContext(
+        messages=[packed[idx] for idx in kept],
+        tokens=sum(tokens[idx] for idx in kept),
+        original_tokens=original_tokens,
+        stubbed=stubbed,
+        dropped=dropped,
+        truncated=truncated,
+    )
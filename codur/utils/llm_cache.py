@@ -0,0 +1,233 @@
+"""Opt-in on-disk cache of LLM responses.
+
+Reruns of the same task send identical planning and classification prompts;
+with `llm.cache.enabled` those responses are served from a SQLite file instead
+of the provider. Entries are keyed on the model identity, temperature, a hash of
+the bound tools/binding kwargs and a hash of the normalized messages. Entries
+expire after `ttl_s` and the least recently used ones are dropped beyond
+`max_entries`. In deterministic-only mode (the default) calls above
+`max_temperature` bypass the cache.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import Any, Optional, TypedDict
+
+from langchain_core.messages import BaseMessage, messages_from_dict, messages_to_dict
+
+from codur.utils.path_utils import resolve_root
+
+CACHE_SCHEMA_VERSION = 1
+
+
+class LLMCacheStats(TypedDict):
+    """Counters for the LLM response cache."""
+    hits: int
+    misses: int
+    bypassed: int
+    writes: int
+    evictions: int
+    hit_rate: float
+
+
+def _digest(payload: Any) -> str:
+    text = json.dumps(payload, sort_keys=True, default=str, separators=(",", ":"))
+    return hashlib.blake2b(text.encode("utf-8"), digest_size=16).hexdigest()
+
+
+def _unwrap(llm: Any) -> tuple[Any, dict]:
+    """Return the underlying chat model and the kwargs of any bindings around it."""
+    kwargs: dict = {}
+    while hasattr(llm, "bound") and isinstance(getattr(llm, "kwargs", None), dict):
+        kwargs = {**llm.kwargs, **kwargs}
+        llm = llm.bound
+    return llm, kwargs
+
+
+def llm_model_name(llm: Any) -> str:
+    """Return the model name of a chat model or binding ("" when unknown)."""
+    base, _ = _unwrap(llm)
+    return getattr(base, "model_name", None) or getattr(base, "model", None) or ""
+
+
+def llm_identity(llm: Any) -> tuple[str, Optional[float], str]:
+    """Return (model identity, temperature, binding hash) for a chat model or binding."""
+    base, kwargs = _unwrap(llm)
+    model = llm_model_name(base)
+    temperature = getattr(base, "temperature", None)
+    binding = {
+        "kwargs": kwargs,
+        "model_kwargs": getattr(base, "model_kwargs", None) or {},
+        "format": getattr(base, "format", None),
+    }
+    return f"{type(base).__name__}:{model}", temperature, _digest(binding)
+
+
+def _normalize_messages(messages: list[BaseMessage]) -> list[dict]:
+    normalized = []
+    for message in messages:
+        item = {"type": message.type, "content": message.content}
+        tool_calls = getattr(message, "tool_calls", None)
+        if tool_calls:
+            item["tool_calls"] = [{"name": call.get("name"), "args": call.get("args")} for call in tool_calls]
+        name = getattr(message, "name", None)
+        if name:
+            item["name"] = name
+        normalized.append(item)
+    return normalized
+
+
+class LLMResponseCache:
+    """SQLite-backed response cache with TTL and LRU size eviction."""
+
+    def __init__(
+        self,
+        path: Path,
+        *,
+        ttl_s: float,
+        max_entries: int,
+        deterministic_only: bool = True,
+        max_temperature: float = 0.3,
+    ) -> None:
+        self.path = path
+        self.ttl_s = ttl_s
+        self.max_entries = max_entries
+        self.deterministic_only = deterministic_only
+        self.max_temperature = max_temperature
+        self.hits = 0
+        self.misses = 0
+        self.bypassed = 0
+        self.writes = 0
+        self.evictions = 0
+        self._lock = threading.Lock()
+        self._conn: Optional[sqlite3.Connection] = None
+
+    def key_for(self, llm: Any, messages: list[BaseMessage]) -> Optional[str]:
+        """Return the cache key for a call, or None when the call must bypass the cache."""
+        model, temperature, binding_hash = llm_identity(llm)
+        if self.deterministic_only and (temperature is None or temperature > self.max_temperature):
+            with self._lock:
+                self.bypassed += 1
+            return None
+        return _digest({
+            "version": CACHE_SCHEMA_VERSION,
+            "model": model,
+            "temperature": temperature,
+            "binding": binding_hash,
+            "messages": _digest(_normalize_messages(messages)),
+        })
+
+    def get(self, key: str) -> Optional[BaseMessage]:
+        now = time.time()
+        with self._lock:
+            row = self._execute(
+                "SELECT created, payload FROM responses WHERE key = ?", (key,)
+            ).fetchone()
+            if row is None or now - row[0] > self.ttl_s:
+                self.misses += 1
+                return None
+            self._execute("UPDATE responses SET last_used = ? WHERE key = ?", (now, key))
+            self._conn.commit()
+            self.hits += 1
+        return messages_from_dict([json.loads(row[1])])[0]
+
+    def put(self, key: str, message: BaseMessage) -> None:
+        payload = json.dumps(messages_to_dict([message])[0], default=str)
+        now = time.time()
+        with self._lock:
+            self._execute(
+                "INSERT OR REPLACE INTO responses (key, created, last_used, payload) VALUES (?, ?, ?, ?)",
+                (key, now, now, payload),
+            )
+            self.writes += 1
+            self.evictions += self._evict(now)
+            self._conn.commit()
+
+    def stats(self) -> LLMCacheStats:
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "bypassed": self.bypassed,
+                "writes": self.writes,
+                "evictions": self.evictions,
+                "hit_rate": self.hits / lookups if lookups else 0.0,
+            }
+
+    def close(self) -> None:
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
+
+    def _evict(self, now: float) -> int:
+        removed = self._execute("DELETE FROM responses WHERE created < ?", (now - self.ttl_s,)).rowcount
+        removed += self._execute(
+            "DELETE FROM responses WHERE key IN ("
+            "SELECT key FROM responses ORDER BY last_used DESC LIMIT -1 OFFSET ?)",
+            (self.max_entries,),
+        ).rowcount
+        return max(0, removed)
+
+    def _execute(self, sql: str, params: tuple = ()) -> sqlite3.Cursor:
+        if self._conn is None:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            self._conn = sqlite3.connect(str(self.path), timeout=5, check_same_thread=False)
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS responses ("
+                "key TEXT PRIMARY KEY, created REAL NOT NULL, last_used REAL NOT NULL, payload TEXT NOT NULL)"
+            )
+        return self._conn.execute(sql, params)
+
+
+_CACHES: dict[str, LLMResponseCache] = {}
+_CACHES_LOCK = threading.Lock()
+
+
+def get_llm_cache(config: object | None) -> Optional[LLMResponseCache]:
+    """Return the shared response cache when llm.cache.enabled is set, else None."""
+    settings = getattr(getattr(config, "llm", None), "cache", None)
+    if settings is None or getattr(settings, "enabled", False) is not True:
+        return None
+    path = Path(getattr(settings, "path", ".codur/llm_cache.sqlite")).expanduser()
+    if not path.is_absolute():
+        path = resolve_root(None) / path
+    with _CACHES_LOCK:
+        cache = _CACHES.get(str(path))
+        if cache is None:
+            cache = LLMResponseCache(
+                path,
+                ttl_s=float(settings.ttl_s),
+                max_entries=int(settings.max_entries),
+                deterministic_only=bool(settings.deterministic_only),
+                max_temperature=float(settings.max_temperature),
+            )
+            _CACHES[str(path)] = cache
+        else:
+            # Settings may change between runs sharing the process; the file stays the same.
+            cache.ttl_s = float(settings.ttl_s)
+            cache.max_entries = int(settings.max_entries)
+            cache.deterministic_only = bool(settings.deterministic_only)
+            cache.max_temperature = float(settings.max_temperature)
+        return cache
+
+
+def get_llm_cache_stats(config: object | None) -> Optional[LLMCacheStats]:
+    """Return hit/miss counters for the configured cache, or None when disabled."""
+    cache = get_llm_cache(config)
+    return cache.stats() if cache is not None else None
+
+
+def clear_llm_caches() -> None:
+    """Close and forget all open caches (files are left on disk)."""
+    with _CACHES_LOCK:
+        for cache in _CACHES.values():
+            cache.close()
+        _CACHES.clear()
@@ -4,11 +4,29 @@ LLM invocation accounting and limits.
 
 from __future__ import annotations
 
+import sqlite3
+import time
+
 from langchain_core.language_models.chat_models import BaseChatModel
 from langchain_core.messages import BaseMessage, SystemMessage, ToolMessage
+from langchain_core.runnables import Runnable
 
 from codur.config import CodurConfig
 from codur.graph.state import AgentState
+from codur.providers.base import ProviderRegistry
+from codur.utils.llm_cache import LLMResponseCache, get_llm_cache, llm_model_name
+from codur.utils.llm_telemetry import (
+    FirstTokenTimer,
+    LLMCallRecord,
+    LLMTelemetry,
+    count_tokens,
+    current_llm_telemetry,
+    estimate_cost,
+    prompt_cache_read_tokens,
+    resolve_profile,
+    with_callback,
+)
+from codur.utils.prompt_cache import add_cache_breakpoints
 from rich.console import Console
 
 console = Console()
@@ -102,7 +120,7 @@ def invoke_llm(
     state: AgentState | None = None,
     config: CodurConfig | None = None,
 ) -> BaseMessage:
-    _increment_llm_calls(state, config, invoked_by)
+    count_llm_call(state, config, invoked_by)
 
     # Get matching instructions and inject as system messages
     instructions = _get_matching_instructions(config, invoked_by)
@@ -119,14 +137,119 @@ def invoke_llm(
     # tools that aren't in the currently bound tool set
     prompt_messages = _sanitize_tool_messages(llm, prompt_messages)
 
-    return llm.invoke(prompt_messages)
+    cache = get_llm_cache(config)
+    cache_key = _cache_key(cache, llm, prompt_messages)
+    if cache_key is not None:
+        try:
+            cached = cache.get(cache_key)
+        except sqlite3.Error as exc:
+            console.log(f"[yellow]LLM cache read failed: {exc}[/yellow]")
+            cached = cache_key = None
+        if cached is not None:
+            console.log(f"LLM cache hit (invoked_by={invoked_by})")
+            telemetry = current_llm_telemetry()
+            if telemetry is not None:
+                _record_call(telemetry, llm, prompt_messages, cached, invoked_by, config,
+                             time.time(), 0.0, None, cached=True)
+            return cached
+
+    if _uses_cache_control(llm, config):
+        prompt_messages = add_cache_breakpoints(prompt_messages)
+    response = _invoke_recorded(llm, prompt_messages, invoked_by, config)
+    if cache_key is not None and isinstance(response, BaseMessage):
+        try:
+            cache.put(cache_key, response)
+        except sqlite3.Error as exc:
+            console.log(f"[yellow]LLM cache write failed: {exc}[/yellow]")
+    return response
+
+
+def _uses_cache_control(llm: BaseChatModel, config: CodurConfig | None) -> bool:
+    """Whether the LLM's provider takes explicit prompt cache breakpoints."""
+    _, profile = resolve_profile(config, str(llm_model_name(llm)))
+    provider_class = ProviderRegistry.get(profile.provider) if profile is not None else None
+    return provider_class is not None and provider_class.supports_prompt_cache_control()
+
+
+def _invoke_recorded(
+    llm: BaseChatModel,
+    prompt_messages: list[BaseMessage],
+    invoked_by: str,
+    config: CodurConfig | None,
+) -> BaseMessage:
+    """Invoke the LLM, adding a record to the run's telemetry when one is active."""
+    telemetry = current_llm_telemetry()
+    if telemetry is None:
+        return llm.invoke(prompt_messages)
+
+    timer = FirstTokenTimer()
+    started_at = time.time()
+    start = time.monotonic()
+    try:
+        if isinstance(llm, Runnable):
+            response = llm.invoke(prompt_messages, config=with_callback(timer))
+        else:
+            response = llm.invoke(prompt_messages)
+    except Exception as exc:
+        _record_call(telemetry, llm, prompt_messages, None, invoked_by, config,
+                     started_at, time.monotonic() - start, None, error=f"{type(exc).__name__}: {exc}")
+        raise
+    ttft = timer.first_token_at - start if timer.first_token_at is not None else None
+    _record_call(telemetry, llm, prompt_messages, response, invoked_by, config,
+                 started_at, time.monotonic() - start, ttft)
+    return response
+
+
+def _record_call(
+    telemetry: LLMTelemetry,
+    llm: BaseChatModel,
+    prompt_messages: list[BaseMessage],
+    response: BaseMessage | None,
+    invoked_by: str,
+    config: CodurConfig | None,
+    started_at: float,
+    latency_s: float,
+    ttft_s: float | None,
+    cached: bool = False,
+    error: str | None = None,
+) -> None:
+    model = str(llm_model_name(llm))
+    profile_name, profile = resolve_profile(config, model)
+    prompt_tokens, completion_tokens, estimated = count_tokens(prompt_messages, response)
+    telemetry.add(LLMCallRecord(
+        invoked_by=invoked_by,
+        model=model,
+        profile=profile_name,
+        started_at=started_at,
+        latency_s=latency_s,
+        ttft_s=ttft_s,
+        prompt_tokens=prompt_tokens,
+        completion_tokens=completion_tokens,
+        tokens_estimated=estimated,
+        prompt_cache_read_tokens=0 if cached else prompt_cache_read_tokens(response),
+        # Cache hits cost nothing.
+        cost_usd=None if cached else estimate_cost(profile, prompt_tokens, completion_tokens),
+        cached=cached,
+        error=error,
+    ))
+
+
+def _cache_key(cache: LLMResponseCache | None, llm: BaseChatModel, messages: list[BaseMessage]) -> str | None:
+    if cache is None:
+        return None
+    try:
+        return cache.key_for(llm, messages)
+    except (TypeError, ValueError):
+        # Unserializable message content: skip caching for this call.
+        return None
 
 
-def _increment_llm_calls(
+def count_llm_call(
     state: AgentState | None,
     config: CodurConfig | None,
     invoked_by: str,
 ) -> None:
+    """Count one LLM call in state; raise LLMCallLimitExceeded past max_llm_calls."""
     if state is None:
         return
     limit = _resolve_limit(state, config)
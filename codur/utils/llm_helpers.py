@@ -14,7 +14,7 @@ from codur.graph.state_operations import is_verbose, get_messages
 from codur.graph.tool_executor import execute_tool_calls, ToolExecutionResult
 from codur.llm import create_llm, create_llm_profile
 from codur.utils.llm_calls import invoke_llm
-from codur.utils.message_pipeline import message_shortening_pipeline
+from codur.utils.context_packer import get_context_budget, pack_context
 from codur.utils.tool_response_handler import deserialize_tool_calls, extract_tool_calls_from_json_text
 
 if TYPE_CHECKING:
@@ -141,7 +141,7 @@ def create_and_invoke_with_tool_support(
             tool_schemas,
             temperature=temperature,
         )
-        messages_for_llm = message_shortening_pipeline(get_messages(state) + new_messages)
+        messages_for_llm = _pack_messages(config, resolved_profile, get_messages(state) + new_messages, verbose)
 
         try:
             response = invoke_llm(
@@ -181,7 +181,7 @@ def create_and_invoke_with_tool_support(
 
         # Prepend system message
         new_messages = [SystemMessage(content=system_message_content)] + list(new_messages)
-        messages_for_llm = message_shortening_pipeline(get_messages(state) + new_messages)
+        messages_for_llm = _pack_messages(config, resolved_profile, get_messages(state) + new_messages, verbose)
 
         # Create LLM with json_mode
         llm = _create_llm(
@@ -205,6 +205,22 @@ def create_and_invoke_with_tool_support(
     return new_messages, tool_calls, execution_result
 
 
+def _pack_messages(
+    config: CodurConfig,
+    profile_name: str,
+    messages: list[BaseMessage],
+    verbose: bool,
+) -> list[BaseMessage]:
+    """Fit the history into the profile's context budget."""
+    packed = pack_context(messages, get_context_budget(config, profile_name))
+    if verbose and packed.saved_tokens > 0:
+        console.log(
+            f"[dim]Context packed to ~{packed.tokens} tokens (~{packed.saved_tokens} saved: "
+            f"{packed.stubbed} stubbed, {packed.dropped} dropped, {packed.truncated} truncated)[/dim]"
+        )
+    return packed.messages
+
+
 def _build_tool_descriptions_for_prompt(tool_schemas: list[dict]) -> str:
     """Build tool descriptions for prompt injection (JSON fallback)."""
     lines = []
@@ -0,0 +1,244 @@
+"""Per-call LLM telemetry for a graph run.
+
+`invoke_llm` records one `LLMCallRecord` per call into the telemetry of the
+current run (a context variable set by the graph runtime): prompt/completion
+tokens (provider usage metadata, else estimated), wall latency, time to first
+streamed token, prompt tokens served from the provider's prompt cache, cost
+when the profile declares prices, the attempt number and whether the response
+came from the LLM cache. Records can be appended to a
+JSONL file as they are made and are summarized per `invoked_by`.
+"""
+
+from __future__ import annotations
+
+import contextvars
+import json
+import threading
+import time
+from contextlib import contextmanager
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import Any, Iterator, Optional, TypedDict
+
+from langchain_core.callbacks import BaseCallbackHandler
+from langchain_core.messages import BaseMessage
+from langchain_core.runnables import RunnableConfig, ensure_config
+
+from codur.utils.text_helpers import estimate_tokens
+
+
+@dataclass
+class LLMCallRecord:
+    """One LLM invocation."""
+    invoked_by: str
+    model: str
+    profile: Optional[str]
+    started_at: float
+    latency_s: float
+    ttft_s: Optional[float]
+    prompt_tokens: int
+    completion_tokens: int
+    tokens_estimated: bool
+    cost_usd: Optional[float]
+    prompt_cache_read_tokens: int = 0
+    attempt: int = 1
+    cached: bool = False
+    error: Optional[str] = None
+
+    def to_dict(self) -> dict:
+        return asdict(self)
+
+
+class LLMCallSummary(TypedDict):
+    """Aggregate of the records sharing an invoked_by value."""
+    calls: int
+    errors: int
+    cached: int
+    prompt_tokens: int
+    completion_tokens: int
+    prompt_cache_read_tokens: int
+    prompt_cache_hit_rate: float
+    latency_s: float
+    mean_ttft_s: Optional[float]
+    cost_usd: Optional[float]
+
+
+class LLMTelemetry:
+    """Thread-safe collector of LLMCallRecords, optionally mirrored to a JSONL file."""
+
+    def __init__(self, jsonl_path: Optional[Path] = None) -> None:
+        self.jsonl_path = jsonl_path
+        self.records: list[LLMCallRecord] = []
+        self._lock = threading.Lock()
+
+    def add(self, record: LLMCallRecord) -> LLMCallRecord:
+        with self._lock:
+            previous = next((item for item in reversed(self.records) if item.invoked_by == record.invoked_by), None)
+            if previous is not None and previous.error is not None:
+                record.attempt = previous.attempt + 1
+            self.records.append(record)
+            if self.jsonl_path is not None:
+                self.jsonl_path.parent.mkdir(parents=True, exist_ok=True)
+                with self.jsonl_path.open("a", encoding="utf-8") as handle:
+                    handle.write(json.dumps(record.to_dict()) + "\n")
+        return record
+
+    def as_dicts(self) -> list[dict]:
+        with self._lock:
+            return [record.to_dict() for record in self.records]
+
+    def summary(self) -> dict[str, LLMCallSummary]:
+        """Return per-invoked_by totals, ordered by total latency (largest first)."""
+        with self._lock:
+            records = list(self.records)
+        grouped: dict[str, list[LLMCallRecord]] = {}
+        for record in records:
+            grouped.setdefault(record.invoked_by, []).append(record)
+        summary = {}
+        for invoked_by, items in grouped.items():
+            ttfts = [item.ttft_s for item in items if item.ttft_s is not None]
+            costs = [item.cost_usd for item in items if item.cost_usd is not None]
+            prompt_tokens = sum(item.prompt_tokens for item in items)
+            cache_read = sum(item.prompt_cache_read_tokens for item in items)
+            summary[invoked_by] = LLMCallSummary(
+                calls=len(items),
+                errors=sum(1 for item in items if item.error is not None),
+                cached=sum(1 for item in items if item.cached),
+                prompt_tokens=prompt_tokens,
+                completion_tokens=sum(item.completion_tokens for item in items),
+                prompt_cache_read_tokens=cache_read,
+                prompt_cache_hit_rate=cache_read / prompt_tokens if prompt_tokens else 0.0,
+                latency_s=sum(item.latency_s for item in items),
+                mean_ttft_s=sum(ttfts) / len(ttfts) if ttfts else None,
+                cost_usd=sum(costs) if costs else None,
+            )
+        return dict(sorted(summary.items(), key=lambda item: item[1]["latency_s"], reverse=True))
+
+
+_CURRENT_TELEMETRY: contextvars.ContextVar[Optional[LLMTelemetry]] = contextvars.ContextVar(
+    "codur_llm_telemetry", default=None
+)
+
+
+def current_llm_telemetry() -> Optional[LLMTelemetry]:
+    """Return the telemetry of the active run, or None outside a run."""
+    return _CURRENT_TELEMETRY.get()
+
+
+@contextmanager
+def llm_telemetry_scope(telemetry: Optional[LLMTelemetry] = None) -> Iterator[LLMTelemetry]:
+    """Record LLM calls made inside the block (reuses the enclosing telemetry by default)."""
+    telemetry = telemetry or _CURRENT_TELEMETRY.get() or LLMTelemetry()
+    reset = _CURRENT_TELEMETRY.set(telemetry)
+    try:
+        yield telemetry
+    finally:
+        _CURRENT_TELEMETRY.reset(reset)
+
+
+class FirstTokenTimer(BaseCallbackHandler):
+    """Callback that notes when the first streamed token arrives."""
+
+    def __init__(self) -> None:
+        self.first_token_at: Optional[float] = None
+
+    def on_llm_new_token(self, token: str, **kwargs: Any) -> None:
+        if self.first_token_at is None:
+            self.first_token_at = time.monotonic()
+
+
+def with_callback(handler: BaseCallbackHandler) -> RunnableConfig:
+    """Return the inherited runnable config with `handler` added to its callbacks.
+
+    Keeps the callbacks of an enclosing LangGraph run, so token streaming to the
+    graph's "messages" stream still works.
+    """
+    config = ensure_config()
+    callbacks = config.get("callbacks")
+    if callbacks is None:
+        callbacks = [handler]
+    elif isinstance(callbacks, list):
+        callbacks = callbacks + [handler]
+    else:
+        callbacks = callbacks.copy()
+        callbacks.add_handler(handler, inherit=False)
+    return {**config, "callbacks": callbacks}
+
+
+def _message_text(message: BaseMessage) -> str:
+    content = message.content
+    text = content if isinstance(content, str) else json.dumps(content, default=str)
+    tool_calls = getattr(message, "tool_calls", None)
+    if tool_calls:
+        text += json.dumps(tool_calls, default=str)
+    return text
+
+
+def count_tokens(prompt_messages: list[BaseMessage], response: Any) -> tuple[int, int, bool]:
+    """Return (prompt tokens, completion tokens, estimated) for a call."""
+    usage = getattr(response, "usage_metadata", None)
+    if isinstance(usage, dict) and usage.get("input_tokens") is not None:
+        return int(usage.get("input_tokens") or 0), int(usage.get("output_tokens") or 0), False
+    prompt = sum(estimate_tokens(_message_text(message)) for message in prompt_messages)
+    completion = estimate_tokens(_message_text(response)) if isinstance(response, BaseMessage) else 0
+    return prompt, completion, True
+
+
+def prompt_cache_read_tokens(response: Any) -> int:
+    """Prompt tokens the provider served from its prompt cache (0 when not reported)."""
+    usage = getattr(response, "usage_metadata", None)
+    details = usage.get("input_token_details") if isinstance(usage, dict) else None
+    return int((details or {}).get("cache_read") or 0)
+
+
+def resolve_profile(config: object | None, model: str) -> tuple[Optional[str], Optional[Any]]:
+    """Find the configured profile (name, settings) whose model matches `model`."""
+    profiles = getattr(getattr(config, "llm", None), "profiles", None) or {}
+    default = getattr(getattr(config, "llm", None), "default_profile", None)
+    matches = [(name, profile) for name, profile in profiles.items() if getattr(profile, "model", None) == model]
+    for name, profile in matches:
+        if name == default:
+            return name, profile
+    return matches[0] if matches else (None, None)
+
+
+def estimate_cost(profile: Optional[Any], prompt_tokens: int, completion_tokens: int) -> Optional[float]:
+    """Cost in USD from the profile's per-million-token prices, or None when unpriced."""
+    input_price = getattr(profile, "input_cost_per_mtok", None)
+    output_price = getattr(profile, "output_cost_per_mtok", None)
+    if input_price is None and output_price is None:
+        return None
+    return (prompt_tokens * (input_price or 0.0) + completion_tokens * (output_price or 0.0)) / 1_000_000
+
+
+def format_telemetry_summary(summary: dict[str, LLMCallSummary]) -> list[str]:
+    """Render one line per invoked_by plus a total line."""
+    lines = []
+    for invoked_by, item in summary.items():
+        parts = [
+            f"{invoked_by}: {item['calls']} call{'s' if item['calls'] != 1 else ''}",
+            f"{item['prompt_tokens']}+{item['completion_tokens']} tokens",
+            f"{item['latency_s']:.1f}s",
+        ]
+        if item["prompt_cache_read_tokens"]:
+            parts.append(f"{item['prompt_cache_hit_rate']:.0%} prompt cache")
+        if item["mean_ttft_s"] is not None:
+            parts.append(f"ttft {item['mean_ttft_s']:.2f}s")
+        if item["cost_usd"] is not None:
+            parts.append(f"${item['cost_usd']:.4f}")
+        if item["cached"]:
+            parts.append(f"{item['cached']} cached")
+        if item["errors"]:
+            parts.append(f"{item['errors']} failed")
+        lines.append(", ".join(parts))
+    if summary:
+        costs = [item["cost_usd"] for item in summary.values() if item["cost_usd"] is not None]
+        total = (
+            f"total: {sum(item['calls'] for item in summary.values())} calls, "
+            f"{sum(item['prompt_tokens'] + item['completion_tokens'] for item in summary.values())} tokens, "
+            f"{sum(item['latency_s'] for item in summary.values()):.1f}s"
+        )
+        if costs:
+            total += f", ${sum(costs):.4f}"
+        lines.append(total)
+    return lines
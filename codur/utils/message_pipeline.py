@@ -6,7 +6,11 @@ from langchain_core.messages import BaseMessage, SystemMessage
 
 
 def message_shortening_pipeline(messages: list[BaseMessage]) -> list[BaseMessage]:
-    """Shorten message history by keeping only the last SystemMessage and subsequent messages."""
+    """Shorten message history by keeping only the last block of SystemMessages and subsequent messages.
+
+    Agent nodes send their system prompt and per-turn context as consecutive
+    SystemMessages (see codur.utils.prompt_cache); the whole block is kept.
+    """
 
     # Find the last SystemMessage index
     last_system_idx = None
@@ -17,4 +21,6 @@ def message_shortening_pipeline(messages: list[BaseMessage]) -> list[BaseMessage
     if last_system_idx is None:
         raise ValueError("No SystemMessage found in messages")
 
-    return messages[last_system_idx:]
\ No newline at end of file
+    while last_system_idx > 0 and isinstance(messages[last_system_idx - 1], SystemMessage):
+        last_system_idx -= 1
+    return messages[last_system_idx:]
@@ -4,11 +4,17 @@ Path resolution helpers for workspace-aware tools.
 
 from __future__ import annotations
 
+import contextvars
+from contextlib import contextmanager
 from pathlib import Path
+from typing import Iterator
 
 from codur.utils.validation import validate_within_workspace
 
 _DEFAULT_ROOT: Path | None = None
+_WORKSPACE_ROOT: contextvars.ContextVar[Path | None] = contextvars.ContextVar(
+    "codur_workspace_root", default=None
+)
 
 
 def set_default_root(root: str | Path | None) -> None:
@@ -20,9 +26,28 @@ def set_default_root(root: str | Path | None) -> None:
         _DEFAULT_ROOT = (Path(root)).resolve()
 
 
+def current_workspace_root() -> Path | None:
+    """Return the workspace root set by an enclosing workspace_root_scope, if any."""
+    return _WORKSPACE_ROOT.get()
+
+
+@contextmanager
+def workspace_root_scope(root: str | Path) -> Iterator[Path]:
+    """Run tool calls made inside the block (in this context only) against `root`."""
+    resolved = Path(root).resolve()
+    reset = _WORKSPACE_ROOT.set(resolved)
+    try:
+        yield resolved
+    finally:
+        _WORKSPACE_ROOT.reset(reset)
+
+
 def resolve_root(root: str | Path | None) -> Path:
     if root:
         return Path(root).resolve()
+    scoped = _WORKSPACE_ROOT.get()
+    if scoped is not None:
+        return scoped
     if _DEFAULT_ROOT is not None:
         return _DEFAULT_ROOT
     return Path.cwd().resolve()
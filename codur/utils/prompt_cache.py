@@ -0,0 +1,66 @@
+"""Prompt assembly that keeps provider prompt caches warm.
+
+Providers cache the longest byte-identical prompt prefix (OpenAI automatically,
+Anthropic at explicit `cache_control` breakpoints). Agent nodes therefore send
+their fixed system prompt as its own message, marked as the end of the stable
+prefix, and the per-turn context (summary, next-step suggestion) in a second
+system message after it:
+
+    [model instructions] [stable system prompt] | [context] [history / tool results]
+
+`add_cache_breakpoints` turns that marker (and the last message, so the
+growing history is cached between tool-loop turns) into Anthropic breakpoints.
+"""
+
+from __future__ import annotations
+
+from langchain_core.messages import BaseMessage, SystemMessage
+
+# additional_kwargs keys marking the last message of the stable prefix and the
+# per-turn context message that follows it.
+CACHE_PREFIX_KEY = "codur_cache_prefix"
+CONTEXT_KEY = "codur_context"
+CACHE_CONTROL = {"type": "ephemeral"}
+
+
+def build_system_messages(system_prompt: str, context: str = "") -> list[SystemMessage]:
+    """Return the stable system prompt followed by the volatile context (if any)."""
+    messages = [SystemMessage(content=system_prompt, additional_kwargs={CACHE_PREFIX_KEY: True})]
+    if context.strip():
+        messages.append(SystemMessage(content=context, additional_kwargs={CONTEXT_KEY: True}))
+    return messages
+
+
+def is_cache_prefix_end(message: BaseMessage) -> bool:
+    return bool(message.additional_kwargs.get(CACHE_PREFIX_KEY))
+
+
+def is_agent_prompt(message: BaseMessage) -> bool:
+    """True for messages built by build_system_messages (prompt or context)."""
+    return is_cache_prefix_end(message) or bool(message.additional_kwargs.get(CONTEXT_KEY))
+
+
+def _with_cache_control(message: BaseMessage) -> BaseMessage:
+    content = message.content
+    if isinstance(content, str):
+        if not content:
+            return message
+        blocks = [{"type": "text", "text": content}]
+    else:
+        blocks = [dict(block) if isinstance(block, dict) else {"type": "text", "text": str(block)} for block in content]
+        if not blocks:
+            return message
+    blocks[-1]["cache_control"] = CACHE_CONTROL
+    return message.model_copy(update={"content": blocks})
+
+
+def add_cache_breakpoints(messages: list[BaseMessage]) -> list[BaseMessage]:
+    """Mark the end of the stable prefix and the last message with cache_control blocks."""
+    if not messages:
+        return []
+    marked = list(messages)
+    # Anthropic allows four breakpoints per request; two are enough here.
+    prefix_end = next((idx for idx, message in enumerate(marked) if is_cache_prefix_end(message)), None)
+    for idx in {prefix_end, len(marked) - 1} - {None}:
+        marked[idx] = _with_cache_control(marked[idx])
+    return marked
@@ -0,0 +1,177 @@
+"""Process-wide pool of long-lived rope projects.
+
+Opening a rope `Project` per tool call throws away rope's object database and
+analysis caches. The pool keeps one project per root, serializes access to it
+(rope projects are not thread-safe), and evicts projects that sit idle.
+
+Rope only notices on-disk changes when a resource is validated. Codur's write
+tools report touched paths through `notify_rope_changed`, and those resources
+are validated before the project is handed out again. Projects unused for
+`tools.rope_full_validate_after_s` are fully revalidated to pick up edits made
+outside Codur.
+"""
+
+from __future__ import annotations
+
+import atexit
+import threading
+import time
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Iterator
+
+from rope.base.project import Project
+
+DEFAULT_IDLE_TIMEOUT_S = 900
+# Beyond this gap between uses, assume files may have changed outside Codur.
+DEFAULT_FULL_VALIDATE_AFTER_S = 300
+
+
+def get_rope_idle_timeout(config: object | None) -> float:
+    """Read tools.rope_idle_timeout_s from config; 0 disables pooling."""
+    tools = getattr(config, "tools", None) if config is not None else None
+    try:
+        return max(0.0, float(getattr(tools, "rope_idle_timeout_s", DEFAULT_IDLE_TIMEOUT_S)))
+    except (TypeError, ValueError):
+        return float(DEFAULT_IDLE_TIMEOUT_S)
+
+
+def get_rope_full_validate_after(config: object | None) -> float:
+    """Read tools.rope_full_validate_after_s from config; 0 revalidates the whole project on every use."""
+    tools = getattr(config, "tools", None) if config is not None else None
+    try:
+        return max(0.0, float(getattr(tools, "rope_full_validate_after_s", DEFAULT_FULL_VALIDATE_AFTER_S)))
+    except (TypeError, ValueError):
+        return float(DEFAULT_FULL_VALIDATE_AFTER_S)
+
+
+@dataclass
+class _PooledProject:
+    project: Project
+    root: Path
+    last_used: float
+    lock: threading.RLock = field(default_factory=threading.RLock)
+    dirty: set[Path] = field(default_factory=set)
+    in_use: int = 0
+
+
+class RopeProjectPool:
+    """Keep rope projects open across tool calls, keyed by project root."""
+
+    def __init__(self) -> None:
+        self._entries: dict[Path, _PooledProject] = {}
+        self._lock = threading.Lock()
+        self.opened = 0
+        self.reused = 0
+        self.full_validations = 0
+
+    @contextmanager
+    def acquire(
+        self,
+        root: Path,
+        idle_timeout_s: float = DEFAULT_IDLE_TIMEOUT_S,
+        full_validate_after_s: float = DEFAULT_FULL_VALIDATE_AFTER_S,
+    ) -> Iterator[Project]:
+        """Yield the pooled project for root with exclusive access."""
+        now = time.monotonic()
+        self.evict_idle(idle_timeout_s, now=now)
+        with self._lock:
+            entry = self._entries.get(root)
+            if entry is None:
+                entry = _PooledProject(Project(str(root), ropefolder=None), root, now)
+                self._entries[root] = entry
+                self.opened += 1
+            else:
+                self.reused += 1
+            entry.in_use += 1
+        try:
+            with entry.lock:
+                self._validate(entry, now, full_validate_after_s)
+                try:
+                    yield entry.project
+                finally:
+                    entry.last_used = time.monotonic()
+        finally:
+            with self._lock:
+                entry.in_use -= 1
+            if idle_timeout_s <= 0:
+                self.close(root)
+
+    def notify_changed(self, path: Path) -> None:
+        """Record that a file or directory changed so rope revalidates it."""
+        with self._lock:
+            entries = list(self._entries.values())
+        for entry in entries:
+            if entry.root == path or entry.root in path.parents:
+                with self._lock:
+                    entry.dirty.add(path)
+
+    def evict_idle(self, idle_timeout_s: float, *, now: float | None = None) -> int:
+        """Close projects idle past the timeout or whose root is gone; return how many."""
+        now = time.monotonic() if now is None else now
+        with self._lock:
+            stale = [
+                root for root, entry in self._entries.items()
+                if entry.in_use == 0
+                and (now - entry.last_used > idle_timeout_s or not root.is_dir())
+            ]
+            evicted = [self._entries.pop(root) for root in stale]
+        for entry in evicted:
+            _close_project(entry.project)
+        return len(evicted)
+
+    def close(self, root: Path) -> None:
+        with self._lock:
+            entry = self._entries.get(root)
+            if entry is None or entry.in_use:
+                return
+            del self._entries[root]
+        _close_project(entry.project)
+
+    def close_all(self) -> None:
+        with self._lock:
+            entries = list(self._entries.values())
+            self._entries.clear()
+        for entry in entries:
+            _close_project(entry.project)
+
+    def _validate(self, entry: _PooledProject, now: float, full_validate_after_s: float) -> None:
+        with self._lock:
+            dirty = entry.dirty
+            entry.dirty = set()
+        project = entry.project
+        if now - entry.last_used > full_validate_after_s:
+            self.full_validations += 1
+            project.validate(project.root)
+            return
+        for path in sorted(dirty):
+            # New or deleted files only show up when their folder is validated.
+            target = path if path.is_file() else path.parent
+            try:
+                relative = target.relative_to(entry.root).as_posix()
+                resource = project.get_resource(relative) if relative != "." else project.root
+            except Exception:
+                resource = project.root
+            project.validate(resource)
+
+
+def _close_project(project: Project) -> None:
+    try:
+        project.close()
+    except Exception:
+        pass
+
+
+_POOL = RopeProjectPool()
+atexit.register(_POOL.close_all)
+
+
+def get_rope_pool() -> RopeProjectPool:
+    """Return the process-wide rope project pool."""
+    return _POOL
+
+
+def notify_rope_changed(path: str | Path) -> None:
+    """Tell pooled rope projects that a path was modified, created or deleted."""
+    _POOL.notify_changed(Path(path).resolve())
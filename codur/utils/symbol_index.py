@@ -0,0 +1,269 @@
+"""Per-file symbol tables for fast function/class/method lookups.
+
+A symbol table maps qualified names (``Outer.method``, ``func.inner``) to line
+spans and metadata. Tables are built once per content version (keyed by a hash
+of the source) and, after a span replacement such as ``replace_function``, are
+patched by re-indexing only the replaced code instead of re-walking the file.
+"""
+
+from __future__ import annotations
+
+import ast
+import hashlib
+import textwrap
+import threading
+from collections import OrderedDict, deque
+from dataclasses import dataclass, replace
+from typing import Iterable, Literal, Optional
+
+from codur.utils.ast_cache import parse_source
+
+SymbolKind = Literal["function", "method", "class"]
+
+_DEF_NODES = (ast.FunctionDef, ast.AsyncFunctionDef, ast.ClassDef)
+_MAX_TABLES = 256
+
+
+@dataclass(frozen=True)
+class SymbolInfo:
+    """Location and metadata for a function, method or class definition."""
+    qualname: str
+    name: str
+    kind: SymbolKind
+    start_line: int  # line of the def/class keyword (1-based)
+    end_line: int
+    decorator_start_line: int  # first decorator line, or start_line when undecorated
+    col_offset: int
+    decorators: tuple[str, ...]
+    is_async: bool
+    parent: str | None  # qualname of the enclosing class/function
+
+    def shifted(self, delta: int) -> "SymbolInfo":
+        return replace(
+            self,
+            start_line=self.start_line + delta,
+            end_line=self.end_line + delta,
+            decorator_start_line=self.decorator_start_line + delta,
+        )
+
+
+def _safe_unparse(node: ast.AST) -> str:
+    try:
+        return ast.unparse(node)
+    except Exception:
+        return node.__class__.__name__
+
+
+def _collect_symbols(
+    tree: ast.AST,
+    *,
+    line_offset: int = 0,
+    prefix: str | None = None,
+    in_class: bool = False,
+) -> list[SymbolInfo]:
+    """Collect definitions breadth-first, like ast.walk.
+
+    `prefix` and `in_class` describe where a code fragment sits when indexing a
+    replacement span rather than a whole module.
+    """
+    symbols: list[SymbolInfo] = []
+    queue: deque[tuple[ast.AST, str | None, bool]] = deque([(tree, prefix, False)])
+    while queue:
+        node, parent_qual, in_class_body = queue.popleft()
+        next_parent = parent_qual
+        if isinstance(node, _DEF_NODES):
+            qualname = f"{parent_qual}.{node.name}" if parent_qual else node.name
+            if isinstance(node, ast.ClassDef):
+                kind: SymbolKind = "class"
+            else:
+                kind = "method" if in_class_body else "function"
+            start = node.lineno + line_offset
+            decorator_start = min(
+                [dec.lineno + line_offset for dec in node.decorator_list] + [start]
+            )
+            symbols.append(SymbolInfo(
+                qualname=qualname,
+                name=node.name,
+                kind=kind,
+                start_line=start,
+                end_line=(node.end_lineno or node.lineno) + line_offset,
+                decorator_start_line=decorator_start,
+                col_offset=node.col_offset,
+                decorators=tuple(_safe_unparse(dec) for dec in node.decorator_list),
+                is_async=isinstance(node, ast.AsyncFunctionDef),
+                parent=parent_qual,
+            ))
+            next_parent = qualname
+        is_class = isinstance(node, ast.ClassDef) or (node is tree and in_class)
+        body_ids = {id(item) for item in node.body} if is_class else set()
+        for child in ast.iter_child_nodes(node):
+            queue.append((child, next_parent, id(child) in body_ids))
+    return symbols
+
+
+class SymbolTable:
+    """Immutable lookup structure over the symbols of one source version.
+
+    Symbols are ordered by nesting depth, then position, so bare-name lookups
+    prefer the outermost, earliest definition.
+    """
+
+    def __init__(self, symbols: Iterable[SymbolInfo]) -> None:
+        self.symbols: tuple[SymbolInfo, ...] = tuple(
+            sorted(symbols, key=lambda s: (s.qualname.count("."), s.start_line))
+        )
+        self._by_qualname: dict[str, SymbolInfo] = {}
+        self._by_name: dict[tuple[str, str], SymbolInfo] = {}
+        self._methods: dict[tuple[str, str], SymbolInfo] = {}
+        for symbol in self.symbols:
+            self._by_qualname.setdefault(symbol.qualname, symbol)
+            group = "class" if symbol.kind == "class" else "function"
+            self._by_name.setdefault((group, symbol.name), symbol)
+            if symbol.kind == "method" and symbol.parent:
+                class_name = symbol.parent.rsplit(".", 1)[-1]
+                self._methods.setdefault((class_name, symbol.name), symbol)
+
+    @classmethod
+    def from_source(cls, source: str) -> "SymbolTable":
+        """Build a table from source; raises SyntaxError for unparsable code."""
+        return cls(_collect_symbols(parse_source(source)))
+
+    def get(self, qualname: str) -> Optional[SymbolInfo]:
+        return self._by_qualname.get(qualname)
+
+    def _is_class(self, qualname: str | None) -> bool:
+        parent = self.get(qualname) if qualname else None
+        return parent is not None and parent.kind == "class"
+
+    def find_function(self, name: str) -> Optional[SymbolInfo]:
+        """First function or method (sync or async) with this bare name."""
+        return self._by_name.get(("function", name))
+
+    def find_class(self, name: str) -> Optional[SymbolInfo]:
+        return self._by_name.get(("class", name))
+
+    def find_method(self, class_name: str, method_name: str) -> Optional[SymbolInfo]:
+        return self._methods.get((class_name, method_name))
+
+    def find(self, name: str, kind: SymbolKind | None = None) -> list[SymbolInfo]:
+        """Return symbols whose qualified name or bare name matches `name`."""
+        matches = [
+            symbol for symbol in self.symbols
+            if (symbol.qualname == name or symbol.name == name or symbol.qualname.endswith(f".{name}"))
+            and (kind is None or symbol.kind == kind)
+        ]
+        return sorted(matches, key=lambda symbol: (symbol.qualname != name, symbol.start_line))
+
+    def with_replaced_span(self, start_line: int, end_line: int, new_code: str) -> Optional["SymbolTable"]:
+        """Return the table after lines [start_line, end_line] are replaced by new_code.
+
+        Only the replacement code is parsed. Returns None when the edit does not
+        replace exactly one indexed definition in place, in which case callers
+        should rebuild from the new source.
+        """
+        old = next(
+            (s for s in self.symbols if s.start_line == start_line and s.end_line == end_line),
+            None,
+        )
+        if old is None or not new_code.endswith("\n"):
+            return None
+        first_line = next((line for line in new_code.splitlines() if line.strip()), "")
+        if len(first_line) - len(first_line.lstrip()) != old.col_offset:
+            return None
+        try:
+            tree = parse_source(textwrap.dedent(new_code))
+        except SyntaxError:
+            return None
+        if not tree.body or not isinstance(tree.body[0], _DEF_NODES):
+            return None
+        first = tree.body[0]
+        if first.decorator_list or first.lineno != 1:
+            return None
+
+        new_line_count = len(new_code.splitlines())
+        delta = new_line_count - (end_line - start_line + 1)
+        # A definition ends at its last statement, not at trailing blank or comment lines.
+        code_end_line = start_line - 1 + tree.body[-1].end_lineno
+        fresh = _collect_symbols(
+            tree,
+            line_offset=start_line - 1,
+            prefix=old.parent,
+            in_class=old.kind == "method" or self._is_class(old.parent),
+        )
+        fresh = [replace(s, col_offset=s.col_offset + old.col_offset) for s in fresh]
+        # Decorators above the replaced span still apply to the first new definition.
+        fresh[0] = replace(
+            fresh[0],
+            decorators=old.decorators,
+            decorator_start_line=old.decorator_start_line,
+        )
+
+        symbols: list[SymbolInfo] = list(fresh)
+        for symbol in self.symbols:
+            if symbol.start_line >= start_line and symbol.end_line <= end_line:
+                continue
+            if symbol.end_line < start_line:
+                symbols.append(symbol)
+            elif symbol.start_line > end_line:
+                symbols.append(symbol.shifted(delta))
+            elif symbol.end_line == end_line:  # encloses the replaced span, which ended it
+                symbols.append(replace(symbol, end_line=code_end_line))
+            else:  # encloses the replaced span
+                symbols.append(replace(symbol, end_line=symbol.end_line + delta))
+        return SymbolTable(symbols)
+
+
+def _digest(source: str) -> str:
+    return hashlib.blake2b(source.encode("utf-8", "surrogatepass"), digest_size=20).hexdigest()
+
+
+_TABLES: OrderedDict[str, SymbolTable] = OrderedDict()
+_TABLES_LOCK = threading.Lock()
+
+
+def _remember(key: str, table: SymbolTable) -> None:
+    with _TABLES_LOCK:
+        _TABLES[key] = table
+        _TABLES.move_to_end(key)
+        while len(_TABLES) > _MAX_TABLES:
+            _TABLES.popitem(last=False)
+
+
+def get_symbol_table(source: str) -> SymbolTable:
+    """Return the symbol table for source, building it on first use.
+
+    Raises SyntaxError when the source cannot be parsed.
+    """
+    key = _digest(source)
+    with _TABLES_LOCK:
+        table = _TABLES.get(key)
+        if table is not None:
+            _TABLES.move_to_end(key)
+            return table
+    table = SymbolTable.from_source(source)
+    _remember(key, table)
+    return table
+
+
+def record_span_replacement(old_source: str, start_line: int, end_line: int, new_code: str) -> str:
+    """Register the table for old_source with a span replaced; return the new source.
+
+    The new source is computed the same way `replace_lines` rewrites a file, so
+    the next lookup on the edited file is served without re-walking it.
+    """
+    lines = old_source.splitlines(keepends=True)
+    end_idx = min(end_line, len(lines))
+    lines[start_line - 1:end_idx] = new_code.splitlines(keepends=True) if new_code else []
+    new_source = "".join(lines)
+    with _TABLES_LOCK:
+        old_table = _TABLES.get(_digest(old_source))
+    if old_table is not None and end_idx == end_line:
+        table = old_table.with_replaced_span(start_line, end_line, new_code)
+        if table is not None:
+            _remember(_digest(new_source), table)
+    return new_source
+
+
+def clear_symbol_tables() -> None:
+    with _TABLES_LOCK:
+        _TABLES.clear()
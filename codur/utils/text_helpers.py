@@ -2,6 +2,9 @@
 
 from __future__ import annotations
 
+# Rough average for English text and code across common tokenizers.
+CHARS_PER_TOKEN = 4
+
 
 def truncate_lines(text: str, max_lines: int = 50) -> str:
     """Truncate text to maximum number of lines.
@@ -69,3 +72,17 @@ def smart_truncate(text: str, target_length: int = 1000) -> str:
 
     # No good boundary found, just truncate and add ellipsis
     return truncated + "..."
+
+
+def estimate_tokens(text: str) -> int:
+    """Estimate the number of LLM tokens in text (about CHARS_PER_TOKEN characters per token).
+
+    Args:
+        text: Text to measure
+
+    Returns:
+        int: Estimated token count
+    """
+    if not text:
+        return 0
+    return -(-len(text) // CHARS_PER_TOKEN)
@@ -0,0 +1,337 @@
+"""Warm, pre-forked Python runner for run_python_file and run_pytest.
+
+A cold run pays interpreter startup, site imports and the project's own heavy
+imports on every call. With `tools.warm_runner.enabled`, a fork server per
+workspace root (see `warm_runner_server.py`) imports the configured modules
+(pytest, the project's top-level packages) once and forks a child per run, so a
+run starts with those modules already loaded.
+
+The server is restarted when the source of any module it preloaded changes.
+`run_warm` returns None whenever the warm path cannot be used (disabled, no
+fork on this platform, server busy or failed to start, PYTHON* variables that
+differ from the server's) and the caller runs a cold subprocess instead.
+"""
+
+from __future__ import annotations
+
+import atexit
+import json
+import os
+import select
+import shutil
+import signal
+import subprocess
+import tempfile
+import threading
+import time
+from pathlib import Path
+from typing import Optional
+
+from codur.utils.concurrency import current_cancel_token
+from codur.utils.ignore_utils import get_exclude_dirs
+
+WARM_SCRIPT = "script"
+WARM_PYTEST = "pytest"
+
+DEFAULT_PRELOAD = ("pytest",)
+DEFAULT_IDLE_TIMEOUT_S = 900
+STARTUP_TIMEOUT_S = 60.0
+_POLL_INTERVAL_S = 0.2
+
+_SERVER_SOURCE = (Path(__file__).parent / "warm_runner_server.py").read_text(encoding="utf-8")
+
+
+class WarmRunnerUnavailable(RuntimeError):
+    """The fork server cannot take this run; run it cold."""
+
+
+def _warm_settings(config: object | None) -> object | None:
+    return getattr(getattr(config, "tools", None), "warm_runner", None)
+
+
+def warm_runner_enabled(config: object | None) -> bool:
+    return hasattr(os, "fork") and bool(getattr(_warm_settings(config), "enabled", False))
+
+
+def project_packages(root: Path, config: object | None = None) -> list[str]:
+    """Top-level packages of the project at root (test packages excluded)."""
+    excluded = get_exclude_dirs(config)
+    packages = []
+    for entry in sorted(root.iterdir()) if root.is_dir() else []:
+        if (
+            entry.name.isidentifier()
+            and entry.name not in excluded
+            and entry.name not in ("test", "tests")
+            and (entry / "__init__.py").is_file()
+        ):
+            packages.append(entry.name)
+    return packages
+
+
+def get_preload_modules(root: Path, config: object | None) -> tuple[str, ...]:
+    """tools.warm_runner.preload plus, with preload_project, the project's packages."""
+    settings = _warm_settings(config)
+    modules = list(getattr(settings, "preload", DEFAULT_PRELOAD))
+    if getattr(settings, "preload_project", True):
+        modules.extend(name for name in project_packages(root, config) if name not in modules)
+    return tuple(modules)
+
+
+def _python_env(env: dict[str, str]) -> dict[str, str]:
+    return {key: value for key, value in env.items() if key.startswith("PYTHON")}
+
+
+class ForkServer:
+    """One fork server process; runs one child at a time."""
+
+    def __init__(self, root: Path, python: str, preload: tuple[str, ...]) -> None:
+        self.root = root
+        self.preload = preload
+        self.lock = threading.Lock()
+        self.last_used = time.monotonic()
+        self._buffer = b""
+        self._python_env = _python_env(dict(os.environ))
+        self._process = subprocess.Popen(
+            [python, "-c", _SERVER_SOURCE, *preload],
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.DEVNULL,
+            cwd=str(root),
+        )
+        try:
+            ready = self._read_message(STARTUP_TIMEOUT_S)
+        except (OSError, EOFError, ValueError):
+            ready = None
+        if not ready or not ready.get("ready"):
+            self.close()
+            raise WarmRunnerUnavailable(f"fork server for {root} did not start")
+        self.loaded: list[str] = ready["loaded"]
+        self._files: dict[str, int] = ready["files"]
+
+    @property
+    def alive(self) -> bool:
+        return self._process.poll() is None
+
+    def stale(self) -> bool:
+        """True when a preloaded module's source changed since the server started."""
+        for path, mtime_ns in self._files.items():
+            try:
+                if os.stat(path).st_mtime_ns != mtime_ns:
+                    return True
+            except OSError:
+                return True
+        return False
+
+    def accepts(self, kind: str, env: dict[str, str]) -> bool:
+        if kind == WARM_PYTEST and "pytest" not in self.loaded:
+            return False
+        return _python_env(env) == self._python_env
+
+    def _read_message(self, timeout: Optional[float]) -> Optional[dict]:
+        """Next reply line, or None when none arrived within timeout (None: wait forever)."""
+        deadline = None if timeout is None else time.monotonic() + timeout
+        fd = self._process.stdout.fileno()
+        while b"\n" not in self._buffer:
+            wait = None if deadline is None else max(0.0, deadline - time.monotonic())
+            ready, _, _ = select.select([fd], [], [], wait)
+            if not ready:
+                return None
+            chunk = os.read(fd, 65536)
+            if not chunk:
+                raise EOFError("fork server exited")
+            self._buffer += chunk
+        line, _, self._buffer = self._buffer.partition(b"\n")
+        return json.loads(line)
+
+    def run(
+        self,
+        kind: str,
+        args: list[str],
+        cwd: Path,
+        env: dict[str, str],
+        timeout: Optional[float],
+    ) -> subprocess.CompletedProcess:
+        """Run in a forked child; raises TimeoutExpired / OperationCancelled after killing it."""
+        with tempfile.TemporaryDirectory(prefix="codur-warm-") as tmp:
+            stdout_path, stderr_path = Path(tmp) / "stdout", Path(tmp) / "stderr"
+            request = {
+                "kind": kind,
+                "args": args,
+                "cwd": str(cwd),
+                "env": env,
+                "stdout": str(stdout_path),
+                "stderr": str(stderr_path),
+            }
+            try:
+                self._process.stdin.write(json.dumps(request).encode() + b"\n")
+                self._process.stdin.flush()
+                started = self._read_message(STARTUP_TIMEOUT_S)
+            except OSError as exc:
+                raise WarmRunnerUnavailable(str(exc)) from exc
+            if started is None:
+                raise WarmRunnerUnavailable("fork server did not start the run")
+            pid = started["pid"]
+
+            token = current_cancel_token()
+            deadline = None if timeout is None else time.monotonic() + timeout
+            while True:
+                wait = _POLL_INTERVAL_S
+                if deadline is not None:
+                    wait = min(wait, max(0.0, deadline - time.monotonic()))
+                finished = self._read_message(wait)
+                if finished is not None:
+                    break
+                if token is not None and token.cancelled:
+                    self._kill(pid)
+                    token.raise_if_cancelled()
+                if deadline is not None and time.monotonic() >= deadline:
+                    self._kill(pid)
+                    raise subprocess.TimeoutExpired(args, timeout)
+            return subprocess.CompletedProcess(
+                args,
+                finished["returncode"],
+                stdout_path.read_text(errors="replace"),
+                stderr_path.read_text(errors="replace"),
+            )
+
+    def _kill(self, pid: int) -> None:
+        try:
+            os.kill(pid, signal.SIGKILL)
+        except ProcessLookupError:
+            pass
+        # Consume the child's exit reply so the next run reads its own replies.
+        self._read_message(None)
+
+    def close(self) -> None:
+        if self.alive:
+            self._process.kill()
+        self._process.wait()
+        for stream in (self._process.stdin, self._process.stdout):
+            stream.close()
+
+
+class WarmRunnerPool:
+    """Process-wide fork servers, keyed by root, interpreter and preload list."""
+
+    def __init__(self) -> None:
+        self._servers: dict[tuple[Path, str, tuple[str, ...]], ForkServer] = {}
+        self._lock = threading.Lock()
+        self.started = 0
+        self.reused = 0
+        self.invalidated = 0
+        self.cold_fallbacks = 0
+
+    def _server(self, root: Path, python: str, preload: tuple[str, ...]) -> ForkServer:
+        key = (root, python, preload)
+        with self._lock:
+            server = self._servers.get(key)
+            if server is not None and server.lock.locked():
+                raise WarmRunnerUnavailable("fork server is busy")
+            if server is not None and (not server.alive or server.stale()):
+                self.invalidated += 1
+                del self._servers[key]
+                server.close()
+                server = None
+            if server is None:
+                server = ForkServer(root, python, preload)
+                self._servers[key] = server
+                self.started += 1
+            else:
+                self.reused += 1
+            return server
+
+    def run(
+        self,
+        kind: str,
+        args: list[str],
+        root: Path,
+        cwd: Path,
+        env: dict[str, str],
+        timeout: Optional[float],
+        preload: tuple[str, ...],
+        python: str,
+    ) -> Optional[subprocess.CompletedProcess]:
+        """Run warm, or return None when the caller should run a cold subprocess."""
+        try:
+            server = self._server(root, python, preload)
+        except WarmRunnerUnavailable:
+            self.cold_fallbacks += 1
+            return None
+        if not server.accepts(kind, env) or not server.lock.acquire(blocking=False):
+            self.cold_fallbacks += 1
+            return None
+        try:
+            return server.run(kind, args, cwd, env, timeout)
+        except WarmRunnerUnavailable:
+            self.close(server)
+            self.cold_fallbacks += 1
+            return None
+        except (EOFError, OSError) as exc:
+            # The run had started: running it again cold could repeat its side effects.
+            self.close(server)
+            raise RuntimeError(f"warm runner exited during the run: {exc}") from exc
+        finally:
+            server.last_used = time.monotonic()
+            server.lock.release()
+
+    def evict_idle(self, idle_timeout_s: float) -> int:
+        now = time.monotonic()
+        with self._lock:
+            stale = [
+                key for key, server in self._servers.items()
+                if not server.lock.locked() and now - server.last_used > idle_timeout_s
+            ]
+            evicted = [self._servers.pop(key) for key in stale]
+        for server in evicted:
+            server.close()
+        return len(evicted)
+
+    def close(self, server: ForkServer) -> None:
+        with self._lock:
+            for key, candidate in list(self._servers.items()):
+                if candidate is server:
+                    del self._servers[key]
+        server.close()
+
+    def close_all(self) -> None:
+        with self._lock:
+            servers = list(self._servers.values())
+            self._servers.clear()
+        for server in servers:
+            server.close()
+
+
+_POOL = WarmRunnerPool()
+atexit.register(_POOL.close_all)
+
+
+def get_warm_runner_pool() -> WarmRunnerPool:
+    """Return the process-wide warm runner pool."""
+    return _POOL
+
+
+def run_warm(
+    config: object | None,
+    kind: str,
+    args: list[str],
+    root: Path,
+    cwd: Path,
+    env: dict[str, str],
+    timeout: Optional[float],
+) -> Optional[subprocess.CompletedProcess]:
+    """Run a script (args: [path, ...]) or pytest (args: pytest arguments) in the warm runner.
+
+    Returns None when the warm runner is disabled or cannot take the run; the
+    caller then runs its usual cold subprocess. Raises subprocess.TimeoutExpired
+    after killing a run that exceeded timeout.
+    """
+    if not warm_runner_enabled(config):
+        return None
+    python = shutil.which("python")
+    if python is None:
+        return None
+    settings = _warm_settings(config)
+    _POOL.evict_idle(float(getattr(settings, "idle_timeout_s", DEFAULT_IDLE_TIMEOUT_S)))
+    root = root.resolve()
+    env = {key: str(value) for key, value in env.items()}
+    return _POOL.run(kind, args, root, cwd, env, timeout, get_preload_modules(root, config), python)
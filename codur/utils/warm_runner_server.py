@@ -0,0 +1,104 @@
+"""Fork server behind `codur.utils.warm_runner`.
+
+Runs under the project's interpreter as `python -c <this source> <preload modules...>`
+with the workspace root as cwd, so it must not import codur. It imports the preload
+modules once, then serves JSON-line requests from stdin: for each one it forks a
+child that runs a script (like `python path`) or pytest (like `pytest args`) with
+stdout/stderr redirected to the files named in the request. Replies go to the
+protocol fd, never to fd 1/2, which preloaded modules or children may write to:
+
+    {"ready": true, "loaded": [...], "failed": [...], "files": {path: mtime_ns}}
+    {"pid": 123}            # child started
+    {"returncode": 0}       # child exited (negative: killed by that signal)
+"""
+
+import importlib
+import json
+import os
+import runpy
+import sys
+import traceback
+
+
+def _module_files(names):
+    files = {}
+    for name in names:
+        module = sys.modules.get(name)
+        path = getattr(module, "__file__", None)
+        if path and os.path.isfile(path):
+            files[path] = os.stat(path).st_mtime_ns
+    return files
+
+
+def _run_child(request, protocol_fd):
+    os.close(protocol_fd)
+    os.dup2(os.open(os.devnull, os.O_RDONLY), 0)
+    os.dup2(os.open(request["stdout"], os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600), 1)
+    os.dup2(os.open(request["stderr"], os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600), 2)
+    os.chdir(request["cwd"])
+    os.environ.clear()
+    os.environ.update(request["env"])
+    code = 0
+    try:
+        if request["kind"] == "pytest":
+            import pytest
+            sys.argv = ["pytest", *request["args"]]
+            code = int(pytest.main(request["args"]))
+        else:
+            path = request["args"][0]
+            sys.argv = list(request["args"])
+            sys.path.insert(0, os.path.dirname(os.path.abspath(path)))
+            runpy.run_path(path, run_name="__main__")
+    except SystemExit as exc:
+        if exc.code is None:
+            code = 0
+        elif isinstance(exc.code, int):
+            code = exc.code
+        else:
+            print(exc.code, file=sys.stderr)
+            code = 1
+    except BaseException:
+        traceback.print_exc()
+        code = 1
+    finally:
+        for stream in (sys.stdout, sys.stderr):
+            try:
+                stream.flush()
+            except Exception:
+                pass
+    os._exit(code & 0xFF)
+
+
+def main():
+    protocol = os.fdopen(os.dup(1), "w", buffering=1)
+    devnull = os.open(os.devnull, os.O_WRONLY)
+    os.dup2(devnull, 1)
+    os.dup2(devnull, 2)
+
+    before = set(sys.modules)
+    loaded, failed = [], []
+    for name in sys.argv[1:]:
+        try:
+            importlib.import_module(name)
+            loaded.append(name)
+        except BaseException:
+            failed.append(name)
+    # Like a cold `pytest`/`python path`, children do not get the cwd on sys.path.
+    sys.path[:] = [entry for entry in sys.path if entry not in ("", os.getcwd())]
+    files = _module_files(set(sys.modules) - before)
+    protocol.write(json.dumps({"ready": True, "loaded": loaded, "failed": failed, "files": files}) + "\n")
+
+    for line in sys.stdin:
+        request = json.loads(line)
+        sys.stdout.flush()
+        sys.stderr.flush()
+        pid = os.fork()
+        if pid == 0:
+            _run_child(request, protocol.fileno())
+        protocol.write(json.dumps({"pid": pid}) + "\n")
+        _, status = os.waitpid(pid, 0)
+        protocol.write(json.dumps({"returncode": os.waitstatus_to_exitcode(status)}) + "\n")
+
+
+if __name__ == "__main__":
+    main()
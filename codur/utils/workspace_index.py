@@ -0,0 +1,418 @@
+"""Persistent, incrementally refreshed index of workspace files.
+
+Tree-walking tools (list_files, lint_python_tree, dependency graphs, entry point
+discovery, the TUI file picker) query this index instead of re-walking the
+workspace with os.walk and re-evaluating gitignore for every path on every call.
+
+Refresh is incremental: every indexed directory is stat'ed once, and only
+directories whose mtime changed (an entry was added, removed or renamed) are
+re-listed and re-filtered. Only file names are indexed: a directory's mtime does
+not change when a file in it is edited, so per-file metadata would go stale.
+Tools that mutate files call `notify_path_changed` so their directory is
+rescanned on the next query.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import threading
+import time
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Iterable, Iterator
+
+from codur.utils.ignore_utils import (
+    get_exclude_dirs,
+    is_gitignored,
+    load_gitignore,
+    should_include_hidden,
+    should_respect_gitignore,
+)
+from codur.utils.path_utils import resolve_root
+
+INDEX_VERSION = 2
+INDEX_DIRNAME = ".codur"
+INDEX_FILENAME = "workspace_index.json"
+
+# Directory mtimes this close to the scan time cannot be trusted: an entry created
+# in the same timestamp tick would not bump the mtime again (the "racy git" problem).
+_RACY_WINDOW_NS = 2_000_000_000
+
+LANGUAGE_BY_SUFFIX = {
+    ".py": "python",
+    ".pyi": "python",
+    ".md": "markdown",
+    ".markdown": "markdown",
+    ".json": "json",
+    ".yaml": "yaml",
+    ".yml": "yaml",
+    ".toml": "toml",
+    ".ini": "ini",
+    ".cfg": "ini",
+    ".txt": "text",
+    ".rst": "rst",
+    ".js": "javascript",
+    ".ts": "typescript",
+    ".sh": "shell",
+}
+
+
+def detect_language(path: str | Path) -> str | None:
+    """Return a coarse language label for a path based on its suffix."""
+    return LANGUAGE_BY_SUFFIX.get(Path(path).suffix.lower())
+
+
+@dataclass(frozen=True)
+class IndexedFile:
+    """A file entry served by the workspace index."""
+    path: str  # POSIX path relative to the index root
+    language: str | None
+
+
+@dataclass
+class _DirRecord:
+    mtime_ns: int
+    scanned_ns: int
+    files: list[str] = field(default_factory=list)
+    subdirs: list[str] = field(default_factory=list)
+    stale: bool = False
+
+
+def _join(rel_dir: str, name: str) -> str:
+    return f"{rel_dir}/{name}" if rel_dir else name
+
+
+class WorkspaceIndex:
+    """Index of non-ignored files under a root for a given ignore policy."""
+
+    def __init__(self, root: Path, config: object | None = None, *, persist: bool = False) -> None:
+        self.root = root
+        self.exclude_dirs = get_exclude_dirs(config)
+        self.include_hidden = should_include_hidden(config)
+        self.respect_gitignore = should_respect_gitignore(config)
+        self.persist = persist
+        self.scanned_dirs = 0
+        self.reused_dirs = 0
+        self._dirs: dict[str, _DirRecord] = {}
+        self._gitignore_spec = None
+        self._spec_loaded = False
+        self._policy: str | None = None
+        self._lock = threading.RLock()
+        if persist:
+            self._load()
+
+    # ------------------------------------------------------------------
+    # Queries
+    # ------------------------------------------------------------------
+
+    def iter_files(
+        self,
+        *,
+        start: str | Path | None = None,
+        suffixes: Iterable[str] | None = None,
+    ) -> Iterator[IndexedFile]:
+        """Yield indexed files depth-first, optionally below `start` and filtered by suffix."""
+        suffix_tuple = tuple(suffixes) if suffixes else None
+        with self._lock:
+            self._refresh()
+            entries = list(self._walk_records(self._start_key(start)))
+        for rel_dir, record in entries:
+            for name in record.files:
+                if suffix_tuple and not name.endswith(suffix_tuple):
+                    continue
+                yield IndexedFile(_join(rel_dir, name), detect_language(name))
+
+    def iter_dirs(self, *, start: str | Path | None = None) -> Iterator[str]:
+        """Yield indexed directory paths (relative to the root) depth-first."""
+        start_key = self._start_key(start)
+        with self._lock:
+            self._refresh()
+            keys = [rel_dir for rel_dir, _ in self._walk_records(start_key)]
+        for rel_dir in keys:
+            if rel_dir != start_key:
+                yield rel_dir
+
+    def is_ignored(self, path: str | Path, *, is_dir: bool = False) -> bool:
+        """Return True if a path is excluded by this index's ignore policy."""
+        raw = Path(path)
+        rel = raw.relative_to(self.root) if raw.is_absolute() else raw
+        parts = rel.parts
+        with self._lock:
+            self._ensure_policy()
+            for idx, part in enumerate(parts):
+                part_is_dir = is_dir or idx < len(parts) - 1
+                if self._is_excluded_name(part, is_dir=part_is_dir):
+                    return True
+            if self._gitignore_spec is None:
+                return False
+            return is_gitignored(rel, self.root, self._gitignore_spec, is_dir=is_dir)
+
+    def notify_path_changed(self, path: str | Path) -> None:
+        """Mark the directory containing `path` for rescanning on the next query."""
+        raw = Path(path)
+        try:
+            rel = raw.resolve().relative_to(self.root) if raw.is_absolute() else raw
+        except ValueError:
+            return
+        with self._lock:
+            parent = rel.parent.as_posix()
+            key = "" if parent == "." else parent
+            while True:
+                record = self._dirs.get(key)
+                if record is not None:
+                    record.stale = True
+                    return
+                if not key:
+                    return
+                key = key.rsplit("/", 1)[0] if "/" in key else ""
+
+    # ------------------------------------------------------------------
+    # Refresh
+    # ------------------------------------------------------------------
+
+    def refresh(self) -> None:
+        """Bring the index up to date with the filesystem."""
+        with self._lock:
+            self._refresh()
+
+    def _refresh(self) -> None:
+        policy_changed = self._ensure_policy()
+        changed = policy_changed
+        seen: set[str] = set()
+        stack = [""]
+        while stack:
+            rel_dir = stack.pop()
+            abs_dir = self.root / rel_dir if rel_dir else self.root
+            try:
+                dir_mtime = os.stat(abs_dir).st_mtime_ns
+            except OSError:
+                continue
+            record = self._dirs.get(rel_dir)
+            if (
+                record is None
+                or record.stale
+                or record.mtime_ns != dir_mtime
+                or record.mtime_ns >= record.scanned_ns - _RACY_WINDOW_NS
+            ):
+                record = self._scan_dir(rel_dir, abs_dir, dir_mtime)
+                self._dirs[rel_dir] = record
+                self.scanned_dirs += 1
+                changed = True
+            else:
+                self.reused_dirs += 1
+            seen.add(rel_dir)
+            stack.extend(_join(rel_dir, name) for name in reversed(record.subdirs))
+        for rel_dir in set(self._dirs) - seen:
+            del self._dirs[rel_dir]
+            changed = True
+        if changed and self.persist:
+            self._save()
+
+    def _scan_dir(self, rel_dir: str, abs_dir: Path, dir_mtime: int) -> _DirRecord:
+        record = _DirRecord(mtime_ns=dir_mtime, scanned_ns=time.time_ns())
+        try:
+            entries = list(os.scandir(abs_dir))
+        except OSError:
+            return record
+        for entry in entries:
+            rel_path = Path(rel_dir) / entry.name if rel_dir else Path(entry.name)
+            try:
+                is_dir = entry.is_dir()
+            except OSError:
+                continue
+            if is_dir:
+                if entry.is_symlink() or self._is_excluded_name(entry.name, is_dir=True):
+                    continue
+                if self._gitignore_spec and is_gitignored(rel_path, self.root, self._gitignore_spec, is_dir=True):
+                    continue
+                record.subdirs.append(entry.name)
+                continue
+            if self._is_excluded_name(entry.name, is_dir=False):
+                continue
+            if self._gitignore_spec and is_gitignored(rel_path, self.root, self._gitignore_spec, is_dir=False):
+                continue
+            record.files.append(entry.name)
+        record.files.sort()
+        record.subdirs.sort()
+        return record
+
+    def _is_excluded_name(self, name: str, *, is_dir: bool) -> bool:
+        if is_dir and (name in self.exclude_dirs or name == INDEX_DIRNAME):
+            return True
+        return not self.include_hidden and name.startswith(".")
+
+    def _ensure_policy(self) -> bool:
+        """Reload gitignore rules; drop the index if the ignore policy changed."""
+        gitignore_path = self.root / ".gitignore"
+        gitignore_digest = ""
+        if self.respect_gitignore:
+            try:
+                gitignore_digest = hashlib.sha1(gitignore_path.read_bytes()).hexdigest()
+            except OSError:
+                gitignore_digest = ""
+        policy = json.dumps(
+            [sorted(self.exclude_dirs), self.include_hidden, self.respect_gitignore, gitignore_digest]
+        )
+        if policy == self._policy and self._spec_loaded:
+            return False
+        self._gitignore_spec = load_gitignore(self.root) if gitignore_digest else None
+        self._spec_loaded = True
+        if policy == self._policy:
+            return False
+        self._dirs.clear()
+        self._policy = policy
+        return True
+
+    def _walk_records(self, start_key: str) -> Iterator[tuple[str, _DirRecord]]:
+        stack = [start_key]
+        while stack:
+            rel_dir = stack.pop()
+            record = self._dirs.get(rel_dir)
+            if record is None:
+                continue
+            yield rel_dir, record
+            stack.extend(_join(rel_dir, name) for name in reversed(record.subdirs))
+
+    def _start_key(self, start: str | Path | None) -> str:
+        if start is None:
+            return ""
+        raw = Path(start)
+        rel = raw.relative_to(self.root) if raw.is_absolute() else raw
+        key = rel.as_posix()
+        return "" if key == "." else key
+
+    # ------------------------------------------------------------------
+    # Persistence
+    # ------------------------------------------------------------------
+
+    @property
+    def index_path(self) -> Path:
+        return self.root / INDEX_DIRNAME / INDEX_FILENAME
+
+    def _load(self) -> None:
+        data = load_index_file(self.index_path, version=INDEX_VERSION, root=self.root)
+        if data is None:
+            return
+        self._policy = data.get("policy")
+        dirs: dict[str, _DirRecord] = {}
+        for rel_dir, raw in (data.get("dirs") or {}).items():
+            try:
+                mtime_ns, scanned_ns, files, subdirs = raw
+                dirs[rel_dir] = _DirRecord(
+                    mtime_ns=int(mtime_ns),
+                    scanned_ns=int(scanned_ns),
+                    files=sorted(str(name) for name in files),
+                    subdirs=list(subdirs),
+                )
+            except (TypeError, ValueError):
+                return
+        self._dirs = dirs
+
+    def _save(self) -> None:
+        payload = {
+            "version": INDEX_VERSION,
+            "root": str(self.root),
+            "policy": self._policy,
+            "dirs": {
+                rel_dir: [record.mtime_ns, record.scanned_ns, record.files, record.subdirs]
+                for rel_dir, record in self._dirs.items()
+            },
+        }
+        save_index_file(self.index_path, payload)
+
+
+def load_index_file(path: Path, *, version: int, root: Path) -> dict | None:
+    """Load a persisted index payload, or None if missing, corrupt or from another version/root."""
+    try:
+        data = json.loads(path.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return None
+    if not isinstance(data, dict) or data.get("version") != version:
+        return None
+    if data.get("root") != str(root):
+        return None
+    return data
+
+
+def save_index_file(path: Path, payload: dict) -> None:
+    """Atomically write an index payload; persistence failures are ignored."""
+    tmp_path = path.with_suffix(f".{os.getpid()}.{threading.get_ident()}.tmp")
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path.write_text(json.dumps(payload, separators=(",", ":")), encoding="utf-8")
+        os.replace(tmp_path, path)
+    except OSError:
+        try:
+            tmp_path.unlink()
+        except OSError:
+            pass
+
+
+_INDEXES: dict[tuple[str, bool, bool, tuple[str, ...]], WorkspaceIndex] = {}
+_INDEXES_LOCK = threading.Lock()
+
+
+def should_persist_index(root: Path, config: object | None) -> bool:
+    """Only the workspace root index is persisted, and only when enabled in config."""
+    tools = getattr(config, "tools", None) if config is not None else None
+    if tools is not None and not bool(getattr(tools, "persist_workspace_index", True)):
+        return False
+    return root == resolve_root(None)
+
+
+def get_workspace_index(root: str | Path | None, config: object | None = None) -> WorkspaceIndex:
+    """Return the shared index for a root and ignore policy, creating it on first use."""
+    root_path = resolve_root(root)
+    key = (
+        str(root_path),
+        should_include_hidden(config),
+        should_respect_gitignore(config),
+        tuple(sorted(get_exclude_dirs(config))),
+    )
+    with _INDEXES_LOCK:
+        index = _INDEXES.get(key)
+        if index is None:
+            index = WorkspaceIndex(root_path, config, persist=should_persist_index(root_path, config))
+            _INDEXES[key] = index
+        return index
+
+
+def iter_workspace_files(
+    root: str | Path | None,
+    config: object | None = None,
+    *,
+    suffixes: Iterable[str] | None = None,
+) -> Iterator[Path]:
+    """Yield absolute paths of non-ignored files under root, served from the index."""
+    index = get_workspace_index(root, config)
+    for entry in index.iter_files(suffixes=suffixes):
+        yield index.root / entry.path
+
+
+def notify_path_changed(path: str | Path) -> None:
+    """Tell every index containing `path` that its directory changed."""
+    target = Path(path)
+    if not target.is_absolute():
+        target = resolve_root(None) / target
+    target = target.resolve()
+    with _INDEXES_LOCK:
+        indexes = list(_INDEXES.values())
+    for index in indexes:
+        if index.root == target or index.root in target.parents:
+            index.notify_path_changed(target)
+
+
+def drop_workspace_index(root: str | Path) -> None:
+    """Drop the in-memory indexes of one root, e.g. a temporary copy being deleted."""
+    root_key = str(Path(root).resolve())
+    with _INDEXES_LOCK:
+        for key in [key for key in _INDEXES if key[0] == root_key]:
+            del _INDEXES[key]
+
+
+def clear_workspace_indexes() -> None:
+    """Drop all in-memory indexes (persisted files are left in place)."""
+    with _INDEXES_LOCK:
+        _INDEXES.clear()
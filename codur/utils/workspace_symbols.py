@@ -0,0 +1,288 @@
+"""Workspace-wide definitions/references index for Python sources.
+
+Sits between text search (grep/ripgrep) and rope: answers "where is X defined"
+and "where is X used" from an inverted index built from the AST of every Python
+file in the workspace. Files are re-indexed only when their mtime or size
+changes, and the index for the workspace root is persisted under `.codur/`.
+
+References are name-based (identifiers, attribute names and imported names),
+so they over-approximate rope's scope-aware usages.
+"""
+
+from __future__ import annotations
+
+import ast
+import os
+import threading
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Iterable, TypedDict
+
+from codur.utils.ast_cache import parse_source
+from codur.utils.path_utils import resolve_root
+from codur.utils.symbol_index import SymbolTable
+from codur.utils.workspace_index import (
+    INDEX_DIRNAME,
+    get_workspace_index,
+    load_index_file,
+    save_index_file,
+    should_persist_index,
+)
+
+SYMBOL_INDEX_VERSION = 1
+SYMBOL_INDEX_FILENAME = "symbol_index.json"
+PYTHON_SUFFIXES = (".py", ".pyi")
+
+
+class SymbolDefinition(TypedDict):
+    """A definition site returned by the workspace symbol index."""
+    path: str
+    module: str
+    qualname: str
+    kind: str
+    start_line: int
+    end_line: int
+
+
+class SymbolReference(TypedDict):
+    """A reference site returned by the workspace symbol index."""
+    path: str
+    line: int
+
+
+@dataclass
+class _FileRecord:
+    mtime_ns: int
+    size: int
+    definitions: list[tuple[str, str, int, int]]  # (qualname, kind, start_line, end_line)
+    references: dict[str, list[int]]  # bare name -> sorted line numbers
+
+
+def module_name_for_path(rel_path: str) -> str:
+    """Convert a root-relative POSIX path into a dotted module name."""
+    stem = rel_path.rsplit(".", 1)[0]
+    parts = [part for part in stem.split("/") if part]
+    if parts and parts[-1] == "__init__":
+        parts.pop()
+    return ".".join(parts)
+
+
+def _extract_references(tree: ast.AST) -> dict[str, list[int]]:
+    refs: dict[str, set[int]] = {}
+
+    def _add(name: str, line: int) -> None:
+        refs.setdefault(name, set()).add(line)
+
+    for node in ast.walk(tree):
+        if isinstance(node, ast.Name):
+            _add(node.id, node.lineno)
+        elif isinstance(node, ast.Attribute):
+            _add(node.attr, node.end_lineno or node.lineno)
+        elif isinstance(node, ast.ImportFrom):
+            for alias in node.names:
+                if alias.name != "*":
+                    _add(alias.name, node.lineno)
+        elif isinstance(node, ast.Import):
+            for alias in node.names:
+                _add(alias.name.rsplit(".", 1)[-1], node.lineno)
+    return {name: sorted(lines) for name, lines in refs.items()}
+
+
+def _index_file(path: Path, mtime_ns: int, size: int) -> _FileRecord:
+    try:
+        with open(path, "r", encoding="utf-8", errors="replace") as handle:
+            source = handle.read()
+        tree = parse_source(source, filename=str(path))
+    except (OSError, SyntaxError, ValueError):
+        return _FileRecord(mtime_ns, size, [], {})
+    table = SymbolTable.from_source(source)
+    definitions = [(s.qualname, s.kind, s.start_line, s.end_line) for s in table.symbols]
+    return _FileRecord(mtime_ns, size, definitions, _extract_references(tree))
+
+
+class WorkspaceSymbolIndex:
+    """Inverted index of Python definitions and references under a root."""
+
+    def __init__(self, root: Path, config: object | None = None, *, persist: bool = False) -> None:
+        self.root = root
+        self.config = config
+        self.persist = persist
+        self.indexed_files = 0
+        self._files: dict[str, _FileRecord] = {}
+        self._definitions: dict[str, dict[str, list[tuple[str, str, int, int]]]] = {}
+        self._references: dict[str, dict[str, list[int]]] = {}
+        self._lock = threading.RLock()
+        if persist:
+            self._load()
+
+    @property
+    def index_path(self) -> Path:
+        return self.root / INDEX_DIRNAME / SYMBOL_INDEX_FILENAME
+
+    def refresh(self) -> None:
+        """Re-index Python files whose mtime or size changed; drop deleted files."""
+        with self._lock:
+            self._refresh()
+
+    def find_definitions(
+        self,
+        name: str,
+        kind: str | None = None,
+        max_results: int | None = None,
+    ) -> list[SymbolDefinition]:
+        """Find definitions by bare name, qualified name or dotted module path."""
+        bare = name.rsplit(".", 1)[-1]
+        results: list[SymbolDefinition] = []
+        with self._lock:
+            self._refresh()
+            postings = self._definitions.get(bare, {})
+            for rel_path in sorted(postings):
+                module = module_name_for_path(rel_path)
+                for qualname, def_kind, start, end in postings[rel_path]:
+                    if kind is not None and def_kind != kind:
+                        continue
+                    if name != bare:
+                        full = f"{module}.{qualname}" if module else qualname
+                        if name not in (qualname, full) and not full.endswith(f".{name}"):
+                            continue
+                    results.append({
+                        "path": rel_path,
+                        "module": module,
+                        "qualname": qualname,
+                        "kind": def_kind,
+                        "start_line": start,
+                        "end_line": end,
+                    })
+                    if max_results and len(results) >= max_results:
+                        return results
+        return results
+
+    def find_references(self, name: str, max_results: int | None = None) -> list[SymbolReference]:
+        """Find lines that mention the bare name of `name` as an identifier."""
+        bare = name.rsplit(".", 1)[-1]
+        results: list[SymbolReference] = []
+        with self._lock:
+            self._refresh()
+            postings = self._references.get(bare, {})
+            for rel_path in sorted(postings):
+                for line in postings[rel_path]:
+                    results.append({"path": rel_path, "line": line})
+                    if max_results and len(results) >= max_results:
+                        return results
+        return results
+
+    def files_defining(self, names: Iterable[str]) -> list[str]:
+        """Return root-relative files that define any of the given names."""
+        paths: set[str] = set()
+        for name in names:
+            paths.update(item["path"] for item in self.find_definitions(name))
+        return sorted(paths)
+
+    def _refresh(self) -> None:
+        workspace = get_workspace_index(self.root, self.config)
+        seen: set[str] = set()
+        changed = False
+        for entry in workspace.iter_files(suffixes=PYTHON_SUFFIXES):
+            rel_path = entry.path
+            seen.add(rel_path)
+            try:
+                stat = os.stat(self.root / rel_path)
+            except OSError:
+                continue
+            record = self._files.get(rel_path)
+            if record is not None and record.mtime_ns == stat.st_mtime_ns and record.size == stat.st_size:
+                continue
+            self._replace_record(rel_path, _index_file(self.root / rel_path, stat.st_mtime_ns, stat.st_size))
+            self.indexed_files += 1
+            changed = True
+        for rel_path in set(self._files) - seen:
+            self._replace_record(rel_path, None)
+            changed = True
+        if changed and self.persist:
+            self._save()
+
+    def _replace_record(self, rel_path: str, record: _FileRecord | None) -> None:
+        previous = self._files.pop(rel_path, None)
+        if previous is not None:
+            for qualname, *_ in previous.definitions:
+                bare = qualname.rsplit(".", 1)[-1]
+                self._definitions.get(bare, {}).pop(rel_path, None)
+            for name in previous.references:
+                self._references.get(name, {}).pop(rel_path, None)
+        if record is None:
+            return
+        self._files[rel_path] = record
+        for definition in record.definitions:
+            bare = definition[0].rsplit(".", 1)[-1]
+            self._definitions.setdefault(bare, {}).setdefault(rel_path, []).append(definition)
+        for name, lines in record.references.items():
+            self._references.setdefault(name, {})[rel_path] = lines
+
+    def _load(self) -> None:
+        data = load_index_file(self.index_path, version=SYMBOL_INDEX_VERSION, root=self.root)
+        if data is None:
+            return
+        try:
+            for rel_path, (mtime_ns, size, definitions, references) in (data.get("files") or {}).items():
+                self._replace_record(rel_path, _FileRecord(
+                    int(mtime_ns),
+                    int(size),
+                    [(str(q), str(k), int(s), int(e)) for q, k, s, e in definitions],
+                    {str(name): [int(line) for line in lines] for name, lines in references.items()},
+                ))
+        except (TypeError, ValueError, AttributeError):
+            self._files.clear()
+            self._definitions.clear()
+            self._references.clear()
+
+    def _save(self) -> None:
+        save_index_file(self.index_path, {
+            "version": SYMBOL_INDEX_VERSION,
+            "root": str(self.root),
+            "files": {
+                rel_path: [record.mtime_ns, record.size, record.definitions, record.references]
+                for rel_path, record in self._files.items()
+            },
+        })
+
+
+_SYMBOL_INDEXES: dict[str, WorkspaceSymbolIndex] = {}
+_SYMBOL_INDEXES_LOCK = threading.Lock()
+
+
+def get_workspace_symbols(root: str | Path | None, config: object | None = None) -> WorkspaceSymbolIndex:
+    """Return the shared symbol index for a root, creating it on first use."""
+    root_path = resolve_root(root)
+    with _SYMBOL_INDEXES_LOCK:
+        index = _SYMBOL_INDEXES.get(str(root_path))
+        if index is None:
+            index = WorkspaceSymbolIndex(
+                root_path,
+                config,
+                persist=should_persist_index(root_path, config),
+            )
+            _SYMBOL_INDEXES[str(root_path)] = index
+        else:
+            index.config = config
+        return index
+
+
+def has_workspace_symbols(root: str | Path | None, config: object | None = None) -> bool:
+    """True when the symbol index for root is in memory or will load from disk (no full build)."""
+    root_path = resolve_root(root)
+    with _SYMBOL_INDEXES_LOCK:
+        if str(root_path) in _SYMBOL_INDEXES:
+            return True
+    return should_persist_index(root_path, config) and (root_path / INDEX_DIRNAME / SYMBOL_INDEX_FILENAME).is_file()
+
+
+def drop_workspace_symbols(root: str | Path) -> None:
+    """Drop the in-memory symbol index of one root, e.g. a temporary copy being deleted."""
+    with _SYMBOL_INDEXES_LOCK:
+        _SYMBOL_INDEXES.pop(str(Path(root).resolve()), None)
+
+
+def clear_workspace_symbols() -> None:
+    """Drop all in-memory symbol indexes (persisted files are left in place)."""
+    with _SYMBOL_INDEXES_LOCK:
+        _SYMBOL_INDEXES.clear()
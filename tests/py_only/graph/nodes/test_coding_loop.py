@@ -0,0 +1,120 @@
+"""Tests for the coding agent's turn loop and its budgets."""
+
+from __future__ import annotations
+
+import json
+
+import pytest
+from langchain_core.messages import AIMessage, HumanMessage, ToolMessage
+
+from codur.config import CodurConfig, LLMSettings
+from codur.graph import coding_agent
+from codur.graph.state_operations import get_messages
+from codur.graph.tool_executor import ToolExecutionResult
+from codur.graph.tool_loop import (
+    STOP_REPEATED_CALLS,
+    STOP_TOKEN_BUDGET,
+    STOP_TURN_BUDGET,
+    ToolLoop,
+    ToolLoopBudget,
+)
+from codur.utils.llm_telemetry import LLMCallRecord, LLMTelemetry
+
+
+def _turn(*calls: tuple[str, dict]) -> ToolExecutionResult:
+    results = [{"tool": tool, "args": args, "output": "ok"} for tool, args in calls]
+    messages = [
+        ToolMessage(content=json.dumps(result), tool_call_id=str(idx), name=result["tool"])
+        for idx, result in enumerate(results)
+    ]
+    return ToolExecutionResult(results=results, errors=[], summary="", messages=messages)
+
+
+@pytest.fixture
+def scripted_turns(monkeypatch):
+    """Replace the LLM + tool execution with scripted turns; records the history each turn saw."""
+    script: list[ToolExecutionResult] = []
+    seen_history: list[int] = []
+
+    def _invoke(config, new_messages, tool_schemas, profile_name=None, temperature=None, invoked_by="", state=None):
+        seen_history.append(len(get_messages(state)))
+        execution_result = script.pop(0)
+        new_messages.append(AIMessage(content="{}"))
+        new_messages.extend(execution_result.messages)
+        return new_messages, [], execution_result
+
+    monkeypatch.setattr(coding_agent, "create_and_invoke_with_tool_support", _invoke)
+    return script, seen_history
+
+
+def _state(max_turns: int = 5) -> dict:
+    config = CodurConfig(llm=LLMSettings(default_profile="test"))
+    config.runtime.coding_max_turns = max_turns
+    return {"config": config, "messages": [HumanMessage(content="fix app.py")], "iterations": 0, "llm_calls": 0}
+
+
+def test_loop_runs_until_done_and_returns_all_turns(scripted_turns):
+    script, seen_history = scripted_turns
+    script.extend([
+        _turn(("read_file", {"path": "app.py"})),
+        _turn(("write_file", {"path": "app.py", "content": "x = 1\n"})),
+        _turn(("done", {"reasoning": "fixed"})),
+    ])
+    state = _state()
+
+    result = coding_agent.coding_node(state, state["config"], summary="User: fix app.py")
+
+    assert result["selected_agent"] == "codur-verification"
+    assert result["agent_outcomes"][0]["result"] == "fixed"
+    # Two system prompt messages, then an AI + tool message per turn.
+    assert len(result["messages"]) == 2 + 3 * 2
+    assert seen_history == [1, 5, 7]
+    assert state["iterations"] == 3
+
+
+def test_loop_continues_past_old_depth_limit_when_configured(scripted_turns):
+    script, _ = scripted_turns
+    script.extend(_turn(("run_python_file", {"path": f"s{idx}.py"})) for idx in range(8))
+    state = _state(max_turns=7)
+
+    result = coding_agent.coding_node(state, state["config"], summary="")
+
+    assert state["iterations"] == 7
+    assert result["agent_outcomes"][0]["result"] == f"tool calls executed ({STOP_TURN_BUDGET})"
+
+
+def test_repeated_calls_stop_the_loop_unless_a_file_changed_in_between(scripted_turns):
+    script, _ = scripted_turns
+    script.extend([
+        _turn(("run_pytest", {})),
+        _turn(("write_file", {"path": "app.py", "content": "x = 2\n"})),
+        _turn(("run_pytest", {})),
+        _turn(("run_pytest", {})),
+        _turn(("done", {"reasoning": "unreachable"})),
+    ])
+    state = _state()
+
+    result = coding_agent.coding_node(state, state["config"], summary="")
+
+    assert state["iterations"] == 4
+    assert result["agent_outcomes"][0]["result"] == f"tool calls executed ({STOP_REPEATED_CALLS})"
+
+
+def test_token_budget_counts_only_the_loops_own_calls():
+    telemetry = LLMTelemetry()
+
+    def record(invoked_by: str, tokens: int) -> None:
+        telemetry.add(LLMCallRecord(
+            invoked_by=invoked_by, model="m", profile="p", started_at=0.0, latency_s=0.1, ttft_s=None,
+            prompt_tokens=tokens, completion_tokens=0, tokens_estimated=False, cost_usd=None,
+        ))
+
+    record("coding.primary", 5000)
+    loop = ToolLoop(ToolLoopBudget(max_turns=10, max_tokens=1000), telemetry, invoked_by_prefix="coding.")
+    record("summarizer", 5000)
+    record("coding.primary", 600)
+    assert loop.finish_turn(_turn(("read_file", {"path": "a.py"})))
+    record("coding.primary", 600)
+    assert not loop.finish_turn(_turn(("read_file", {"path": "b.py"})))
+    assert loop.stop_reason == STOP_TOKEN_BUDGET
+    assert loop.tokens_used == 1200
@@ -0,0 +1,254 @@
+"""Tests for tool call scheduling in execute_tool_calls."""
+
+from __future__ import annotations
+
+import threading
+import time
+from pathlib import Path
+
+import pytest
+from langchain_core.messages import HumanMessage
+
+from codur.config import CodurConfig, LLMSettings
+from codur.graph import tool_executor
+from codur.graph.state import AgentStateData
+from codur.graph.tool_executor import _is_concurrent_safe, execute_tool_calls
+from codur.graph.tool_result_cache import tool_result_scope
+from codur.utils.concurrency import OperationCancelled, cancel_scope, current_cancel_token, raise_if_cancelled
+
+
+def _state(config: CodurConfig) -> AgentStateData:
+    return AgentStateData({"config": config, "messages": [HumanMessage(content="test")]})
+
+
+def _config(max_concurrent: int = 3) -> CodurConfig:
+    config = CodurConfig(llm=LLMSettings(default_profile="test"))
+    config.runtime.async_.max_concurrent_agents = max_concurrent
+    return config
+
+
+def test_concurrent_safe_classification():
+    assert _is_concurrent_safe("read_file")
+    assert _is_concurrent_safe("python_ast_dependencies")
+    assert not _is_concurrent_safe("write_file")
+    assert not _is_concurrent_safe("run_pytest")
+    assert not _is_concurrent_safe("agent_call")
+    assert not _is_concurrent_safe("not_a_tool")
+
+
+def test_mutations_stay_ordered_between_reads(tmp_path: Path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    config = _config()
+    calls = [
+        {"tool": "write_file", "args": {"path": "a.txt", "content": "one"}},
+        {"tool": "read_file", "args": {"path": "a.txt"}},
+        {"tool": "line_count", "args": {"path": "a.txt"}},
+        {"tool": "write_file", "args": {"path": "a.txt", "content": "two"}},
+        {"tool": "read_file", "args": {"path": "a.txt"}},
+    ]
+
+    result = execute_tool_calls(calls, _state(config), config, augment=False)
+
+    assert result.errors == []
+    assert [item["tool"] for item in result.results] == [
+        "write_file", "read_file", "line_count", "write_file", "read_file",
+    ]
+    assert result.results[1]["output"] == "one"
+    assert result.results[4]["output"] == "two"
+
+
+def test_read_only_calls_overlap_and_keep_order(tmp_path: Path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    config = _config(max_concurrent=4)
+    active = 0
+    peak = 0
+    lock = threading.Lock()
+
+    def _slow(value):
+        def _run(args):
+            nonlocal active, peak
+            with lock:
+                active += 1
+                peak = max(peak, active)
+            time.sleep(0.05)
+            with lock:
+                active -= 1
+            return value
+        return _run
+
+    fake_map = {name: _slow(name) for name in ("read_file", "list_dirs", "git_status", "line_count")}
+    monkeypatch.setattr(tool_executor, "_build_tool_map", lambda *args, **kwargs: fake_map)
+
+    args = {"read_file": {"path": "a.txt"}, "line_count": {"path": "a.txt"}}
+    calls = [{"tool": name, "args": args.get(name, {})} for name in fake_map] + [{"tool": "missing", "args": {}}]
+    result = execute_tool_calls(calls, _state(config), config, augment=False)
+
+    assert peak > 1
+    assert [item["output"] for item in result.results] == list(fake_map)
+    assert result.errors == ["Unknown tool: missing"]
+
+
+def test_single_worker_runs_sequentially(tmp_path: Path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    config = _config(max_concurrent=1)
+    active = 0
+    peak = 0
+    order: list[int] = []
+
+    def _record(args):
+        nonlocal active, peak
+        active += 1
+        peak = max(peak, active)
+        time.sleep(0.01)
+        order.append(args["path"])
+        active -= 1
+        return "ok"
+
+    monkeypatch.setattr(tool_executor, "_build_tool_map", lambda *args, **kwargs: {"read_file": _record})
+    calls = [{"tool": "read_file", "args": {"path": f"{n}.txt"}} for n in range(3)]
+    result = execute_tool_calls(calls, _state(config), config, augment=False)
+
+    assert len(result.results) == 3
+    assert peak == 1
+    assert order == ["0.txt", "1.txt", "2.txt"]
+
+
+def test_hung_tool_times_out_and_is_cancelled(tmp_path: Path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    config = _config()
+    config.runtime.async_.tool_timeout_s = 0.2
+    config.runtime.async_.cancel_grace_s = 1
+    stopped = threading.Event()
+
+    def _hang(args):
+        while True:
+            time.sleep(0.01)
+            if current_cancel_token().cancelled:
+                stopped.set()
+                raise_if_cancelled()
+
+    fake_map = {"run_pytest": _hang, "read_file": lambda args: "contents"}
+    monkeypatch.setattr(tool_executor, "_build_tool_map", lambda *args, **kwargs: fake_map)
+    calls = [{"tool": "run_pytest", "args": {}}, {"tool": "read_file", "args": {"path": "a.txt"}}]
+
+    started = time.monotonic()
+    result = execute_tool_calls(calls, _state(config), config, augment=False)
+
+    assert time.monotonic() - started < 1
+    assert stopped.is_set()
+    assert result.errors == ["run_pytest timed out after 0.2s"]
+    assert [item["output"] for item in result.results] == ["contents"]
+
+
+def test_call_waiting_for_a_slot_held_by_an_abandoned_call_times_out(tmp_path: Path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    config = _config(max_concurrent=1)
+    config.runtime.async_.tool_timeout_s = 0.2
+    config.runtime.async_.cancel_grace_s = 0.1
+    release = threading.Event()
+
+    def _ignore_cancel(args):
+        release.wait(5)
+        return "late"
+
+    fake_map = {"run_pytest": _ignore_cancel, "read_file": lambda args: "contents"}
+    monkeypatch.setattr(tool_executor, "_build_tool_map", lambda *args, **kwargs: fake_map)
+    try:
+        execute_tool_calls([{"tool": "run_pytest", "args": {}}], _state(config), config, augment=False)
+
+        started = time.monotonic()
+        result = execute_tool_calls(
+            [{"tool": "read_file", "args": {"path": "a.txt"}}], _state(config), config, augment=False
+        )
+    finally:
+        release.set()
+
+    assert time.monotonic() - started < 1
+    assert result.errors == ["read_file timed out after 0.2s waiting for a free slot"]
+
+
+def test_timed_out_mutation_invalidates_reads_when_it_finishes(tmp_path: Path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    config = _config()
+    config.runtime.async_.tool_timeout_s = 0.2
+    config.runtime.async_.cancel_grace_s = 0.1
+    (tmp_path / "a.txt").write_text("old")
+    release = threading.Event()
+
+    def _slow_write(args):
+        release.wait(5)
+        (tmp_path / args["path"]).write_text(args["content"])
+        return "ok"
+
+    fake_map = {"write_file": _slow_write, "read_file": lambda args: (tmp_path / args["path"]).read_text()}
+    monkeypatch.setattr(tool_executor, "_build_tool_map", lambda *args, **kwargs: fake_map)
+    read = [{"tool": "read_file", "args": {"path": "a.txt"}}]
+
+    with tool_result_scope(tmp_path) as cache:
+        result = execute_tool_calls(
+            [{"tool": "write_file", "args": {"path": "a.txt", "content": "new"}}, *read],
+            _state(config), config, augment=False,
+        )
+        assert result.errors == [
+            "write_file timed out after 0.2s (still running after 0.1s grace period, abandoned)"
+        ]
+        assert [item["output"] for item in result.results] == ["old"]
+        assert len(cache) == 1
+
+        # The abandoned write finishes late; its thread invalidates the read cached meanwhile.
+        release.set()
+        deadline = time.monotonic() + 5
+        while len(cache) and time.monotonic() < deadline:
+            time.sleep(0.01)
+
+        again = execute_tool_calls(read, _state(config), config, augment=False)
+
+    assert [item["output"] for item in again.results] == ["new"]
+    assert again.results[0].get("cached") is None
+
+
+def test_cancelled_run_stops_scheduling(tmp_path: Path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    config = _config()
+    monkeypatch.setattr(tool_executor, "_build_tool_map", lambda *args, **kwargs: {"read_file": lambda args: "x"})
+
+    with cancel_scope() as token:
+        token.cancel("run exceeded 5 seconds")
+        with pytest.raises(OperationCancelled, match="run exceeded 5 seconds"):
+            execute_tool_calls([{"tool": "read_file", "args": {}}], _state(config), config, augment=False)
+
+
+def test_run_scoped_result_cache_invalidated_by_mutation(tmp_path: Path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    config = _config()
+    (tmp_path / "a.txt").write_text("one")
+    (tmp_path / "b.txt").write_text("bee")
+    read_both = [
+        {"tool": "read_file", "args": {"path": "a.txt"}},
+        {"tool": "read_file", "args": {"path": "b.txt"}},
+    ]
+
+    with tool_result_scope(tmp_path) as cache:
+        first = execute_tool_calls(read_both, _state(config), config, augment=False)
+        second = execute_tool_calls(read_both, _state(config), config, augment=False)
+        assert [item["output"] for item in second.results] == ["one", "bee"]
+        assert [item.get("cached") for item in first.results] == [None, None]
+        assert [item.get("cached") for item in second.results] == [True, True]
+        assert "read_file: a.txt -> 3 chars (cached)" in second.summary
+
+        execute_tool_calls(
+            [{"tool": "write_file", "args": {"path": "a.txt", "content": "two"}}],
+            _state(config), config, augment=False,
+        )
+        third = execute_tool_calls(read_both, _state(config), config, augment=False)
+        assert [item["output"] for item in third.results] == ["two", "bee"]
+        assert [item.get("cached") for item in third.results] == [None, True]
+
+        # Edits made outside Codur are caught by the file stamp check.
+        (tmp_path / "b.txt").write_text("bzz!")
+        fourth = execute_tool_calls(read_both[1:], _state(config), config, augment=False)
+        assert fourth.results[0]["output"] == "bzz!"
+        assert cache.hits == 3
+
+    uncached = execute_tool_calls(read_both, _state(config), config, augment=False)
+    assert [item.get("cached") for item in uncached.results] == [None, None]
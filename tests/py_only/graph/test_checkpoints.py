@@ -0,0 +1,84 @@
+"""Tests for git-object checkpoints of agent edits."""
+
+from __future__ import annotations
+
+from pathlib import Path
+
+import pygit2
+import pytest
+from langchain_core.messages import HumanMessage
+
+from codur.config import CodurConfig, LLMSettings
+from codur.graph.checkpoints import CheckpointStore, checkpoint_scope, restore_last_green
+from codur.graph.state import AgentStateData
+from codur.graph.tool_executor import execute_tool_calls
+from codur.tools.git import checkpoint_restore
+from codur.utils.path_utils import workspace_root_scope
+
+GOOD = "print('ok')\n"
+BROKEN = "raise SystemExit(1)\n"
+
+
+def _config() -> CodurConfig:
+    return CodurConfig(llm=LLMSettings(default_profile="test"))
+
+
+def _run(config: CodurConfig, *calls: tuple[str, dict]) -> list[dict]:
+    state = AgentStateData({"config": config, "messages": [HumanMessage(content="fix app.py")]})
+    tool_calls = [{"tool": tool, "args": args} for tool, args in calls]
+    return execute_tool_calls(tool_calls, state, config, augment=False).results
+
+
+def test_failed_edits_roll_back_to_last_green_without_touching_git_state(tmp_path: Path, monkeypatch):
+    repo = pygit2.init_repository(str(tmp_path))
+    (tmp_path / "app.py").write_text(BROKEN)
+    monkeypatch.chdir(tmp_path)
+    config = _config()
+    refs_before = list(repo.references)
+
+    with checkpoint_scope(CheckpointStore(tmp_path)) as store:
+        _run(config, ("write_file", {"path": "app.py", "content": GOOD}), ("run_python_file", {"path": "app.py"}))
+        _run(config, ("write_file", {"path": "app.py", "content": BROKEN}), ("write_file", {"path": "new.py", "content": "x"}))
+
+        assert [checkpoint.green for checkpoint in store.checkpoints] == [False, True, False]
+        checkpoint, changed = restore_last_green(config)
+
+    assert checkpoint.id == 1
+    assert sorted(changed) == ["app.py", "new.py"]
+    assert (tmp_path / "app.py").read_text() == GOOD
+    assert not (tmp_path / "new.py").exists()
+    assert list(repo.references) == refs_before
+    assert len(repo.index) == 0
+
+
+def test_checkpoint_tools_restore_the_baseline_outside_a_git_repository(tmp_path: Path, monkeypatch):
+    (tmp_path / "app.py").write_text(BROKEN)
+    monkeypatch.chdir(tmp_path)
+    config = _config()
+
+    with checkpoint_scope(CheckpointStore(tmp_path)):
+        _run(config, ("write_file", {"path": "app.py", "content": GOOD}))
+        listed = _run(config, ("checkpoint_list", {}))[0]["output"]
+        restored = _run(config, ("checkpoint_restore", {"checkpoint_id": 0}))[0]["output"]
+
+    assert [(item["id"], item["paths"]) for item in listed] == [(0, []), (1, ["app.py"])]
+    assert restored["changed_files"] == ["app.py"]
+    assert (tmp_path / "app.py").read_text() == BROKEN
+    assert not (tmp_path / ".git").exists()
+
+
+def test_checkpoint_tools_refuse_a_different_workspace_root(tmp_path: Path, monkeypatch):
+    root, candidate = tmp_path / "root", tmp_path / "candidate"
+    root.mkdir()
+    candidate.mkdir()
+    (root / "app.py").write_text(BROKEN)
+    monkeypatch.chdir(root)
+    config = _config()
+
+    with checkpoint_scope(CheckpointStore(root)):
+        _run(config, ("write_file", {"path": "app.py", "content": GOOD}))
+        with workspace_root_scope(candidate):
+            with pytest.raises(ValueError, match="not the current workspace"):
+                checkpoint_restore(0)
+
+    assert (root / "app.py").read_text() == GOOD
@@ -0,0 +1,138 @@
+"""Tests for speculative parallel fix candidates."""
+
+from __future__ import annotations
+
+import json
+import time
+from pathlib import Path
+
+import pytest
+from langchain_core.messages import HumanMessage, ToolMessage
+
+from codur.config import CodurConfig, LLMSettings
+from codur.graph import fix_candidates
+from codur.graph.checkpoints import CheckpointStore, checkpoint_scope
+from codur.graph.fix_candidates import AGENT_FIX_CANDIDATES, fix_candidates_node
+from codur.graph.tool_executor import execute_tool_calls
+from codur.utils.concurrency import raise_if_cancelled
+from codur.utils import workspace_index, workspace_symbols
+from codur.utils.path_utils import current_workspace_root
+from codur.utils.workspace_index import get_workspace_index
+from codur.utils.workspace_symbols import get_workspace_symbols
+
+FIXED = "def add(a, b):\n    return a + b\n"
+
+
+@pytest.fixture
+def workspace(tmp_path: Path, monkeypatch) -> Path:
+    root = tmp_path / "project"
+    root.mkdir()
+    (root / "app.py").write_text("def add(a, b):\n    return a - b\n")
+    (root / "notes.txt").write_text("keep me")
+    monkeypatch.chdir(root)
+    return root
+
+
+@pytest.fixture
+def candidate_workspaces(monkeypatch) -> list[Path]:
+    """Fake coding/verification: only the temperature 0.5 candidate writes the right fix, quickly."""
+    seen: list[Path] = []
+
+    def _coding_node(state, config, summary):
+        seen.append(current_workspace_root())
+        # Build the per-root caches a real coding agent would.
+        get_workspace_index(None, config)
+        get_workspace_symbols(None, config)
+        temperature = config.llm.generation_temperature
+        if temperature != 0.5:
+            # Slow, wrong candidates; the winner cancels them.
+            for _ in range(100):
+                raise_if_cancelled()
+                time.sleep(0.01)
+        content = FIXED if temperature == 0.5 else f"# wrong {temperature}\n"
+        result = execute_tool_calls(
+            [{"tool": "write_file", "args": {"path": "app.py", "content": content}}],
+            state, config, augment=False,
+        )
+        state["messages"] = list(state["messages"]) + result.messages
+        return {"agent_outcomes": [{"agent": "coding", "status": "success", "messages": []}], "messages": result.messages}
+
+    def _verification_agent_node(state, config, summary):
+        passed = (current_workspace_root() / "app.py").read_text() == FIXED
+        output = {"passed": passed, "reasoning": "checked app.py", "suggestions": "use a + b"}
+        message = ToolMessage(
+            content=json.dumps({"tool": "build_verification_response", "args": {}, "output": output}),
+            tool_call_id="verify",
+            name="build_verification_response",
+        )
+        outcome = {
+            "agent": "agent:codur-verification",
+            "status": "success" if passed else "failed",
+            "result": "checked app.py",
+            "next_step_suggestion": "use a + b",
+            "messages": [message],
+        }
+        return {"agent_outcomes": [outcome], "messages": [message]}
+
+    monkeypatch.setattr(fix_candidates, "coding_node", _coding_node)
+    monkeypatch.setattr(fix_candidates, "verification_agent_node", _verification_agent_node)
+    return seen
+
+
+def _state(temperatures: list[float]) -> dict:
+    config = CodurConfig(llm=LLMSettings(default_profile="test"))
+    config.runtime.fix_candidates.count = len(temperatures)
+    config.runtime.fix_candidates.temperatures = temperatures
+    return {"config": config, "messages": [HumanMessage(content="fix add in app.py")], "iterations": 0, "llm_calls": 0}
+
+
+def _wait_until_removed(paths: list[Path]) -> None:
+    deadline = time.monotonic() + 5
+    while any(path.exists() for path in paths) and time.monotonic() < deadline:
+        time.sleep(0.02)
+
+
+def test_first_passing_candidate_is_promoted_and_the_rest_discarded(workspace, candidate_workspaces):
+    state = _state([0.1, 0.5, 0.9])
+
+    result = fix_candidates_node(state, state["config"], summary="")
+
+    assert (workspace / "app.py").read_text() == FIXED
+    assert (workspace / "notes.txt").read_text() == "keep me"
+    assert result["agent_outcomes"][-1]["status"] == "success"
+    assert isinstance(result["messages"][-1], ToolMessage)
+    assert len(set(candidate_workspaces)) == 3 and workspace not in candidate_workspaces
+    _wait_until_removed(candidate_workspaces)
+    assert not any(path.exists() for path in candidate_workspaces)
+
+
+def test_nothing_is_promoted_when_no_candidate_passes(workspace, candidate_workspaces):
+    original = (workspace / "app.py").read_text()
+    state = _state([0.1, 0.9])
+
+    result = fix_candidates_node(state, state["config"], summary="")
+
+    assert (workspace / "app.py").read_text() == original
+    outcome = result["agent_outcomes"][0]
+    assert outcome["agent"] == AGENT_FIX_CANDIDATES
+    assert outcome["status"] == "failed"
+    assert "use a + b" in outcome["next_step_suggestion"]
+    _wait_until_removed(candidate_workspaces)
+    assert not any(path.exists() for path in candidate_workspaces)
+
+
+def test_promotion_is_checkpointed_and_candidate_caches_are_dropped(workspace, candidate_workspaces):
+    original = (workspace / "app.py").read_text()
+    state = _state([0.5, 0.9])
+
+    with checkpoint_scope(CheckpointStore(workspace)) as store:
+        fix_candidates_node(state, state["config"], summary="")
+        assert store.edited_paths() == ["app.py"]
+        assert store.checkpoints[-1].paths == ("app.py",)
+        store.restore(0)
+
+    assert (workspace / "app.py").read_text() == original
+    _wait_until_removed(candidate_workspaces)
+    roots = {str(path.resolve()) for path in candidate_workspaces}
+    assert not roots & {key[0] for key in workspace_index._INDEXES}
+    assert not roots & set(workspace_symbols._SYMBOL_INDEXES)
@@ -0,0 +1,127 @@
+"""Tests for the rolling conversation summary used by agent nodes."""
+
+from __future__ import annotations
+
+import json
+import time
+
+import pytest
+from langchain_core.language_models.fake_chat_models import GenericFakeChatModel
+from langchain_core.messages import AIMessage, HumanMessage, ToolMessage
+
+from codur.config import CodurConfig, LLMSettings
+from codur.graph import message_summary
+from codur.graph.message_summary import prepend_summary, rolling_summary_scope
+from codur.utils.llm_calls import LLMCallLimitExceeded
+from codur.utils.prompt_cache import build_system_messages
+
+
+@pytest.fixture
+def summarizer_calls(monkeypatch):
+    calls = []
+
+    def _create_llm_profile(config, profile, json_mode=False, temperature=None):
+        calls.append(profile)
+        return GenericFakeChatModel(messages=iter([AIMessage(content=f"summary {len(calls)}")]))
+
+    monkeypatch.setattr(message_summary, "create_llm_profile", _create_llm_profile)
+    return calls
+
+
+@prepend_summary
+def _node(state, summary: str):
+    return {"messages": build_system_messages("PROMPT", summary), "llm_calls": state.get("llm_calls", 0)}
+
+
+def _config(threshold: int) -> CodurConfig:
+    config = CodurConfig(llm=LLMSettings(default_profile="test"))
+    config.runtime.summary_threshold_tokens = threshold
+    return config
+
+
+def _tool_message(size: int) -> ToolMessage:
+    content = json.dumps({"tool": "read_file", "args": {"path": "a.py"}, "output": "x" * size})
+    return ToolMessage(content=content, tool_call_id="1", name="read_file")
+
+
+def _enter(state: dict) -> dict:
+    result = _node(state)
+    state["messages"] = state["messages"] + result["messages"]
+    state.update({key: result[key] for key in ("rolling_summary", "rolling_summary_upto", "llm_calls")})
+    return result
+
+
+def test_small_material_is_passed_verbatim_without_llm_calls(summarizer_calls):
+    state = {"messages": [HumanMessage(content="fix app.py")], "config": _config(1000), "llm_calls": 0}
+
+    result = _enter(state)
+
+    assert summarizer_calls == []
+    assert "User: fix app.py" in result["agent_summaries"][0]
+    assert result["rolling_summary_upto"] == 0
+    # The node's own prompt messages are never summarized.
+    state["messages"] = state["messages"] + [AIMessage(content="{}")]
+    context = _node(state)["agent_summaries"][0]
+    assert "PROMPT" not in context and "Assistant: {}" in context
+
+
+def test_large_material_is_folded_in_the_background_and_adopted_on_next_entry(summarizer_calls):
+    state = {"messages": [HumanMessage(content="fix app.py"), _tool_message(2000)], "config": _config(200), "llm_calls": 0}
+
+    with rolling_summary_scope():
+        first = _enter(state)
+        assert "Recent messages:" in first["agent_summaries"][0]
+        assert first["rolling_summary_upto"] == 0
+        # Counted when submitted, not when adopted.
+        assert first["llm_calls"] == 1
+
+        state["messages"] = state["messages"] + [AIMessage(content="{}")]
+        second = _enter(state)
+
+    assert summarizer_calls == ["test"]
+    assert second["rolling_summary"] == "summary 1"
+    assert second["rolling_summary_upto"] == 2
+    assert second["llm_calls"] == 1
+    context = second["agent_summaries"][0]
+    assert "summary 1" in context and "Assistant: {}" in context and "xxxx" not in context
+
+
+def test_background_fold_respects_the_llm_call_limit(summarizer_calls):
+    state = {
+        "messages": [HumanMessage(content="fix app.py"), _tool_message(2000)],
+        "config": _config(200),
+        "llm_calls": 1,
+        "max_llm_calls": 1,
+    }
+
+    with rolling_summary_scope(), pytest.raises(LLMCallLimitExceeded):
+        _enter(state)
+
+    assert summarizer_calls == []
+
+
+def test_closing_the_scope_waits_for_a_running_fold(monkeypatch):
+    finished = []
+
+    def _slow_fold(config, summary, messages, state=None):
+        time.sleep(0.2)
+        finished.append(True)
+        return "summary"
+
+    monkeypatch.setattr(message_summary, "fold_summary", _slow_fold)
+    state = {"messages": [HumanMessage(content="fix app.py"), _tool_message(2000)], "config": _config(200), "llm_calls": 0}
+
+    with rolling_summary_scope():
+        _enter(state)
+
+    assert finished == [True]
+
+
+def test_material_is_folded_inline_without_a_run_scope(summarizer_calls):
+    state = {"messages": [HumanMessage(content="fix app.py"), _tool_message(2000)], "config": _config(200), "llm_calls": 0}
+
+    result = _enter(state)
+
+    assert summarizer_calls == ["test"]
+    assert result["rolling_summary_upto"] == 2
+    assert result["agent_summaries"][0] == "Summary of the conversation so far:\nsummary 1"
@@ -0,0 +1,81 @@
+"""Tests for the async graph runtime."""
+
+import asyncio
+import time
+from typing import TypedDict
+
+import pytest
+from langchain_core.language_models.fake_chat_models import GenericFakeChatModel
+from langchain_core.messages import AIMessage, HumanMessage
+from langgraph.graph import END, StateGraph
+
+from codur.config import CodurConfig, LLMSettings
+from codur.graph.runtime import ainvoke_graph, run_graph
+
+
+class _State(TypedDict, total=False):
+    config: object
+    plan: str
+    final_response: str
+
+
+def _build_graph(answer: str, delay_s: float = 0.0):
+    planner = GenericFakeChatModel(messages=iter([AIMessage(content='{"action": "explain"}')]))
+    explainer = GenericFakeChatModel(messages=iter([AIMessage(content=answer)]))
+
+    def llm_plan(state):
+        return {"plan": planner.invoke([HumanMessage(content="plan")]).content}
+
+    def explaining(state):
+        time.sleep(delay_s)
+        return {"final_response": explainer.invoke([HumanMessage(content="explain")]).content}
+
+    workflow = StateGraph(_State)
+    workflow.add_node("llm_plan", llm_plan)
+    workflow.add_node("explaining", explaining)
+    workflow.set_entry_point("llm_plan")
+    workflow.add_edge("llm_plan", "explaining")
+    workflow.add_edge("explaining", END)
+    return workflow.compile()
+
+
+def test_run_graph_streams_tokens_from_prose_nodes_only():
+    tokens = []
+    updates = []
+
+    result = run_graph(
+        _build_graph("It reads the config first"),
+        {},
+        on_token=lambda node, text: tokens.append((node, text)),
+        on_update=updates.append,
+    )
+
+    assert result["final_response"] == "It reads the config first"
+    assert {node for node, _ in tokens} == {"explaining"}
+    assert len(tokens) > 1
+    assert "".join(text for _, text in tokens) == "It reads the config first"
+    assert [list(update) for update in updates] == [["llm_plan"], ["explaining"]]
+
+
+def test_ainvoke_graph_enforces_timeout():
+    with pytest.raises(TimeoutError, match="exceeded 1 seconds"):
+        asyncio.run(ainvoke_graph(_build_graph("slow", delay_s=1.5), {}, timeout_s=1))
+
+
+def test_event_buffer_and_stream_events_settings():
+    config = CodurConfig(llm=LLMSettings(default_profile="test"))
+    config.runtime.async_.event_buffer_size = 1
+    updates = []
+
+    async def slow_consumer(event):
+        await asyncio.sleep(0.01)
+        updates.append(event)
+
+    run_graph(_build_graph("answer"), {"config": config}, on_update=slow_consumer)
+    assert [list(update) for update in updates] == [["llm_plan"], ["explaining"]]
+
+    config.runtime.async_.stream_events = False
+    updates.clear()
+    result = run_graph(_build_graph("answer"), {"config": config}, on_update=updates.append)
+    assert updates == []
+    assert result["final_response"] == "answer"
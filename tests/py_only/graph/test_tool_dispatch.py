@@ -0,0 +1,76 @@
+"""Tests for the precompiled tool dispatcher and its argument validators."""
+
+from __future__ import annotations
+
+from pathlib import Path
+
+import pytest
+from langchain_core.messages import HumanMessage
+
+from codur.config import CodurConfig, LLMSettings
+from codur.graph.state import AgentStateData
+from codur.graph.tool_dispatch import (
+    ToolArgumentError,
+    ToolCallContext,
+    compile_arg_validator,
+    get_tool_dispatcher,
+)
+from codur.graph.tool_executor import execute_tool_calls
+from codur.tools.schema_generator import function_to_json_schema
+from codur.tools.filesystem import read_file
+
+
+def _config() -> CodurConfig:
+    return CodurConfig(llm=LLMSettings(default_profile="test"))
+
+
+def _state(config: CodurConfig) -> AgentStateData:
+    return AgentStateData({"config": config, "messages": [HumanMessage(content="test")]})
+
+
+def test_dispatcher_is_built_once_and_bound_per_call(tmp_path: Path):
+    (tmp_path / "one").mkdir()
+    (tmp_path / "two").mkdir()
+    (tmp_path / "one" / "f.txt").write_text("first")
+    (tmp_path / "two" / "f.txt").write_text("second")
+    config = _config()
+    dispatcher = get_tool_dispatcher()
+
+    assert get_tool_dispatcher() is dispatcher
+    outputs = [
+        dispatcher.bind(ToolCallContext(tmp_path / name, False, _state(config), config))["read_file"]({"path": "f.txt"})
+        for name in ("one", "two")
+    ]
+    assert outputs == ["first", "second"]
+
+
+def test_validator_rejects_unknown_missing_and_mistyped_args():
+    validator = compile_arg_validator(function_to_json_schema(read_file))
+
+    args = {"path": "a.txt", "max_bytes": "100"}
+    validator.validate(args)
+    assert args == {"path": "a.txt", "max_bytes": 100}
+
+    with pytest.raises(ToolArgumentError, match="unknown argument 'line' \\(expected: path, max_bytes\\)"):
+        validator.validate({"path": "a.txt", "line": 3})
+    with pytest.raises(ToolArgumentError, match="missing required argument 'path'"):
+        validator.validate({})
+    with pytest.raises(ToolArgumentError, match="argument 'max_bytes' must be integer, got list"):
+        validator.validate({"path": "a.txt", "max_bytes": [1]})
+
+
+def test_invalid_args_are_rejected_before_the_tool_runs(tmp_path: Path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    (tmp_path / "a.txt").write_text("original")
+    config = _config()
+    calls = [
+        {"tool": "write_file", "args": {"path": "a.txt", "content": "x", "mode": "append"}},
+        {"tool": "read_file", "args": {"path": "a.txt"}},
+    ]
+
+    result = execute_tool_calls(calls, _state(config), config, augment=False)
+
+    assert result.errors == [
+        "Invalid arguments for write_file: unknown argument 'mode' (expected: path, content, create_dirs)",
+    ]
+    assert [item["output"] for item in result.results] == ["original"]
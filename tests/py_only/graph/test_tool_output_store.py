@@ -0,0 +1,58 @@
+"""Tests for keeping large tool outputs out of the message history."""
+
+from __future__ import annotations
+
+import json
+from pathlib import Path
+
+from langchain_core.messages import HumanMessage
+
+from codur.config import CodurConfig, LLMSettings
+from codur.graph.state import AgentStateData
+from codur.graph.state_operations import parse_tool_message
+from codur.graph.tool_executor import execute_tool_calls
+from codur.graph.tool_output_store import tool_output_scope
+
+
+def _config(threshold: int = 1000) -> CodurConfig:
+    config = CodurConfig(llm=LLMSettings(default_profile="test"))
+    config.tools.output_blob_threshold_chars = threshold
+    return config
+
+
+def _state(config: CodurConfig) -> AgentStateData:
+    return AgentStateData({"config": config, "messages": [HumanMessage(content="test")]})
+
+
+def test_large_outputs_are_stored_and_paged(tmp_path: Path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    body = "".join(f"line {idx}\n" for idx in range(1000))
+    (tmp_path / "big.txt").write_text(body)
+    (tmp_path / "small.txt").write_text("tiny")
+    config = _config()
+
+    with tool_output_scope() as store:
+        result = execute_tool_calls(
+            [{"tool": "read_file", "args": {"path": "big.txt"}}, {"tool": "read_file", "args": {"path": "small.txt"}}],
+            _state(config), config, augment=False,
+        )
+        big_message, small_message = result.messages
+        stub = json.loads(big_message.content)["output"]
+        assert len(big_message.content) < 2000
+        assert stub["total_chars"] == len(body) and body.startswith(stub["head"])
+        assert json.loads(small_message.content)["output"] == "tiny"
+        assert result.results[0]["output"] == body
+        assert parse_tool_message(big_message).output == body
+
+        offset = len(stub["head"])
+        page = execute_tool_calls(
+            [{"tool": "read_tool_output", "args": {"handle": stub["blob_handle"], "offset": offset, "limit": 50}}],
+            _state(config), config, augment=False,
+        ).results[0]["output"]
+        assert page["content"] == body[offset:offset + 50]
+        assert page["next_offset"] == offset + 50
+        assert len(store) == 1
+
+    # Outside a run scope (or with the store disabled) outputs stay inline.
+    inline = execute_tool_calls([{"tool": "read_file", "args": {"path": "big.txt"}}], _state(config), config, augment=False)
+    assert json.loads(inline.messages[0].content)["output"] == body
@@ -0,0 +1,73 @@
+"""Tests for task-aware tool schema selection."""
+
+from __future__ import annotations
+
+import json
+
+from langchain_core.messages import HumanMessage, ToolMessage
+
+from codur.config import CodurConfig, LLMSettings
+from codur.constants import TaskType
+from codur.graph.planning.types import ClassificationResult
+from codur.graph.tool_selection import select_tool_schemas
+from codur.tools import request_tools
+from codur.tools.schema_generator import get_function_schemas
+
+
+def _config(top_k: int = 30) -> CodurConfig:
+    config = CodurConfig(llm=LLMSettings(default_profile="test"))
+    config.tools.selection_top_k = top_k
+    return config
+
+
+def _classification(task_type: TaskType, files: list[str]) -> ClassificationResult:
+    return ClassificationResult(
+        task_type=task_type,
+        confidence=0.9,
+        detected_files=files,
+        detected_action=None,
+        reasoning="test",
+    )
+
+
+def _tool_message(tool: str, args: dict, output) -> ToolMessage:
+    content = json.dumps({"tool": tool, "args": args, "output": output})
+    return ToolMessage(content=content, tool_call_id=tool, tool_name=tool)
+
+
+def test_selection_ranks_by_task_and_file_type_and_keeps_meta_tools():
+    schemas = get_function_schemas()
+    state = {
+        "messages": [HumanMessage(content="fix the bug in app.py")],
+        "classification": _classification(TaskType.CODE_FIX, ["app.py"]),
+    }
+
+    selection = select_tool_schemas(schemas, state, _config())
+    names = set(selection.names)
+
+    assert {"done", "clarify", "request_tools"} <= names
+    assert {"read_file", "replace_function", "run_pytest", "python_ast_outline"} <= names
+    assert not names & {"duckduckgo_search", "markdown_outline", "git_commit", "system_cpu_stats"}
+    assert len(names) < len(schemas)
+    assert selection.saved_tokens > 0
+    assert selection.full_tokens == select_tool_schemas(schemas, state, _config(top_k=0)).bound_tokens
+
+
+def test_used_and_requested_tools_stay_bound():
+    schemas = get_function_schemas()
+    granted = request_tools(["markdown_outline", "no_such_tool"])
+    assert granted["granted"] == ["markdown_outline"]
+    assert granted["unknown"] == ["no_such_tool"]
+    state = {
+        "messages": [
+            HumanMessage(content="fix the bug in app.py"),
+            _tool_message("system_cpu_stats", {}, {"percent": 3}),
+            _tool_message("request_tools", {"tools": ["markdown_outline"]}, granted),
+        ],
+        "classification": _classification(TaskType.CODE_FIX, ["app.py"]),
+    }
+
+    names = select_tool_schemas(schemas, state, _config()).names
+
+    assert "system_cpu_stats" in names
+    assert "markdown_outline" in names
@@ -0,0 +1,88 @@
+"""Tests for test impact analysis (run_pytest(affected_only=True))."""
+
+from __future__ import annotations
+
+from pathlib import Path
+
+import pytest
+
+from codur.graph.checkpoints import CheckpointStore, checkpoint_scope
+from codur.tools.affected_tests import clear_test_result_cache
+from codur.tools.validation import run_pytest
+
+
+@pytest.fixture
+def project(tmp_path: Path) -> Path:
+    clear_test_result_cache()
+    (tmp_path / "conftest.py").write_text("")
+    (tmp_path / "app").mkdir()
+    (tmp_path / "app" / "__init__.py").write_text("")
+    (tmp_path / "app" / "calc.py").write_text("def add(a, b):\n    return a + b\n")
+    (tmp_path / "app" / "api.py").write_text("from app.calc import add\n\ndef total(items):\n    return sum(items)\n")
+    (tmp_path / "app" / "other.py").write_text("VALUE = 1\n")
+    (tmp_path / "tests").mkdir()
+    (tmp_path / "tests" / "test_api.py").write_text(
+        "from app.api import add\n\ndef test_add():\n    assert add(1, 2) == 3\n"
+    )
+    (tmp_path / "tests" / "test_other.py").write_text(
+        "from app.other import VALUE\n\ndef test_value():\n    assert VALUE == 1\n"
+    )
+    yield tmp_path
+    clear_test_result_cache()
+
+
+def test_runs_only_tests_importing_the_edited_module_transitively(project: Path):
+    with checkpoint_scope(CheckpointStore(project)) as store:
+        store.track(["app/calc.py"])
+        result = run_pytest(affected_only=True, root=project, extra_args=["-p", "no:cacheprovider"])
+
+    assert result["modified"] == ["app/calc.py"]
+    assert result["selected"] == ["tests/test_api.py"]
+    assert result["ran"] == ["tests/test_api.py"]
+    assert result["success"] is True
+
+
+def test_results_are_reused_until_the_dependency_closure_changes(project: Path):
+    args = {"affected_only": True, "paths": ["app/calc.py"], "root": project, "extra_args": ["-p", "no:cacheprovider"]}
+    run_pytest(**args)
+
+    again = run_pytest(**args)
+    assert again["ran"] == []
+    assert again["cached"] == {"tests/test_api.py": True}
+    assert "command" not in again
+
+    (project / "app" / "calc.py").write_text("def add(a, b):\n    return a - b\n")
+    broken = run_pytest(**args)
+    assert broken["ran"] == ["tests/test_api.py"]
+    assert broken["failed"] == ["tests/test_api.py"]
+    assert broken["success"] is False
+
+
+def test_modified_conftest_selects_every_test_below_it(project: Path):
+    result = run_pytest(affected_only=True, paths=["conftest.py"], root=project, extra_args=["-p", "no:cacheprovider"])
+
+    assert result["selected"] == ["tests/test_api.py", "tests/test_other.py"]
+    assert result["success"] is True
+
+
+def test_nothing_selected_without_edits(project: Path):
+    result = run_pytest(affected_only=True, root=project)
+
+    assert result["selected"] == []
+    assert result["success"] is False
+
+
+def test_nothing_is_cached_when_the_report_omits_failures(project: Path):
+    (project / "tests" / "test_api.py").write_text(
+        "import pytest\n\n@pytest.mark.parametrize('n', range(25))\ndef test_add(n):\n    assert False\n"
+    )
+    (project / "tests" / "test_other.py").write_text("def test_value():\n    assert False\n")
+    args = {"affected_only": True, "paths": ["conftest.py"], "root": project, "extra_args": ["-p", "no:cacheprovider"]}
+
+    first = run_pytest(**args)
+    again = run_pytest(**args)
+
+    assert first["omitted_failures"] > 0
+    assert first["failed"] == ["tests/test_api.py", "tests/test_other.py"]
+    assert again["cached"] == {}
+    assert again["ran"] == ["tests/test_api.py", "tests/test_other.py"]
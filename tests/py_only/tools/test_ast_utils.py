@@ -309,3 +309,13 @@ class TestFindMethodLines:
         start, end = result
         assert start == 2
         assert end >= 6
+
+    def test_find_async_method(self):
+        """Test that async methods are located like sync ones."""
+        code = """class Client:
+    async def fetch(self):
+        await self.send()
+        return 1
+"""
+        assert find_method_lines(code, "Client", "fetch") == (2, 4)
+        assert find_function_lines(code, "fetch") == (2, 4)
@@ -4,6 +4,7 @@ import pytest
 from pathlib import Path
 from tempfile import TemporaryDirectory
 from codur.tools.python_ast import (
+    find_symbol,
     python_ast_dependencies,
     python_ast_dependencies_multifile,
     python_ast_graph,
@@ -215,6 +216,38 @@ class Bar:
             assert truncated["count"] == 1
 
 
+class TestFindSymbol:
+    """Test symbol lookups backed by the symbol index."""
+
+    def test_find_symbol_reports_metadata(self, tmp_path):
+        source = tmp_path / "service.py"
+        source.write_text(
+            "import functools\n"
+            "\n"
+            "class Service:\n"
+            "    @functools.cache\n"
+            "    async def load(self):\n"
+            "        return 1\n"
+            "\n"
+            "def load():\n"
+            "    return 2\n"
+        )
+
+        result = find_symbol(str(source), "Service.load", root=tmp_path)
+        assert result["count"] == 1
+        [symbol] = result["symbols"]
+        assert symbol["kind"] == "method"
+        assert (symbol["start_line"], symbol["end_line"]) == (5, 6)
+        assert symbol["decorator_start_line"] == 4
+        assert symbol["decorators"] == ["functools.cache"]
+        assert symbol["is_async"] is True
+
+        by_name = find_symbol(str(source), "load", root=tmp_path)
+        assert [item["qualname"] for item in by_name["symbols"]] == ["load", "Service.load"]
+        functions = find_symbol(str(source), "load", kind="function", root=tmp_path)
+        assert [item["qualname"] for item in functions["symbols"]] == ["load"]
+
+
 class TestPythonAstPathResolution:
     """Test path resolution and validation in Python AST tools."""
 
@@ -10,6 +10,7 @@ from codur.tools.rope_tools import (
     rope_move_module,
     rope_extract_method,
 )
+from codur.utils.rope_pool import RopeProjectPool, get_rope_pool, notify_rope_changed
 
 
 def test_rope_find_usages_across_files():
@@ -202,3 +203,41 @@ def test_rope_find_usages_relative_path():
 
         result = rope_find_usages(path="a.py", line=1, column=4, root=root)
         assert result["count"] > 0
+
+
+def test_rope_project_pool_reuses_project_and_sees_notified_writes():
+    pool = get_rope_pool()
+    with TemporaryDirectory() as tmpdir:
+        root = Path(tmpdir).resolve()
+        (root / "a.py").write_text("def foo():\n    return 1\n\nfoo()\n")
+        (root / "b.py").write_text("from a import foo\n")
+
+        first = rope_find_usages(path="a.py", line=1, column=4, root=root)
+        reused = pool.reused
+        (root / "b.py").write_text("from a import foo\n\nfoo()\nfoo()\n")
+        notify_rope_changed(root / "b.py")
+        second = rope_find_usages(path="a.py", line=1, column=4, root=root)
+
+        assert pool.reused == reused + 1
+        assert second["count"] == first["count"] + 2
+    assert pool.evict_idle(idle_timeout_s=900) >= 1
+
+
+def test_rope_project_pool_validates_only_notified_paths_between_close_uses():
+    pool = RopeProjectPool()
+    with TemporaryDirectory() as tmpdir:
+        root = Path(tmpdir).resolve()
+        (root / "a.py").write_text("def foo():\n    return 1\n")
+        with pool.acquire(root):
+            pass
+        (root / "b.py").write_text("from a import foo\n")
+        pool.notify_changed(root / "b.py")
+
+        with pool.acquire(root) as project:
+            assert project.get_file("b.py").exists()
+        assert pool.full_validations == 0
+
+        with pool.acquire(root, full_validate_after_s=0):
+            pass
+        assert pool.full_validations == 1
+    pool.close_all()
@@ -2,10 +2,21 @@
 
 from __future__ import annotations
 
+import json
+from types import SimpleNamespace
+
 import pytest
 
 from codur.constants import TaskType
-from codur.tools.schema_generator import get_function_schemas
+from codur.tools import schema_generator
+from codur.tools.filesystem import read_file
+from codur.tools.schema_generator import (
+    clear_tool_schemas,
+    get_function_schemas,
+    get_tool_schema,
+    load_tool_schemas,
+    tools_source_hash,
+)
 from codur.tools.tool_annotations import ToolSideEffect
 
 
@@ -121,3 +132,40 @@ class TestGetFunctionSchemasFiltering:
             # Check that internal params are not in properties
             for param in properties:
                 assert param not in internal_params
+
+
+class TestSchemaMemoization:
+    """Tests for memoized and persisted schemas."""
+
+    def test_slices_are_computed_once(self):
+        first = get_function_schemas(
+            task_types=[TaskType.CODE_VALIDATION, TaskType.FILE_OPERATION],
+            exclude_side_effects=ToolSideEffect.FILE_MUTATION,
+        )
+        second = get_function_schemas(
+            task_types=[TaskType.FILE_OPERATION, TaskType.CODE_VALIDATION],
+            exclude_side_effects=[ToolSideEffect.FILE_MUTATION],
+        )
+        assert first == second
+        assert all(a is b for a, b in zip(first, second))
+        assert get_tool_schema(read_file) is next(s for s in get_function_schemas() if s["name"] == "read_file")
+
+    def test_persisted_schemas_follow_source_hash(self, tmp_path, monkeypatch):
+        cache_path = tmp_path / "schemas.json"
+        config = SimpleNamespace(tools=SimpleNamespace(schema_cache_path=str(cache_path)))
+        expected = get_function_schemas()
+        try:
+            clear_tool_schemas()
+            assert load_tool_schemas(config) is False
+            assert json.loads(cache_path.read_text())["source_hash"] == tools_source_hash()
+
+            clear_tool_schemas()
+            assert load_tool_schemas(config) is True
+            assert get_function_schemas() == expected
+
+            monkeypatch.setattr(schema_generator, "tools_source_hash", lambda: "changed")
+            clear_tool_schemas()
+            assert load_tool_schemas(config) is False
+            assert json.loads(cache_path.read_text())["source_hash"] == "changed"
+        finally:
+            clear_tool_schemas()
@@ -0,0 +1,102 @@
+"""Tests for workspace symbol search tools."""
+
+import os
+from pathlib import Path
+
+import pytest
+from langchain_core.messages import HumanMessage
+
+from codur.config import CodurConfig, LLMSettings
+from codur.graph.planning.strategies.discovery import find_files_for_mentioned_symbols
+from codur.tools.symbol_search import find_symbol_definitions, find_symbol_references
+from codur.utils.workspace_index import clear_workspace_indexes
+from codur.utils.workspace_symbols import clear_workspace_symbols, get_workspace_symbols
+
+
+@pytest.fixture(autouse=True)
+def _fresh_indexes():
+    clear_workspace_indexes()
+    clear_workspace_symbols()
+    yield
+    clear_workspace_indexes()
+    clear_workspace_symbols()
+
+
+@pytest.fixture
+def workspace(tmp_path: Path) -> Path:
+    (tmp_path / "pkg").mkdir()
+    (tmp_path / "pkg" / "__init__.py").write_text("")
+    (tmp_path / "pkg" / "service.py").write_text(
+        "class Service:\n"
+        "    def load(self):\n"
+        "        return helper()\n"
+        "\n"
+        "def helper():\n"
+        "    return 1\n"
+    )
+    (tmp_path / "main.py").write_text(
+        "from pkg.service import Service, helper\n"
+        "\n"
+        "def run():\n"
+        "    return Service().load() + helper()\n"
+    )
+    return tmp_path
+
+
+def test_find_definitions_by_bare_and_qualified_name(workspace: Path) -> None:
+    result = find_symbol_definitions("load", root=workspace)
+    assert result["definitions"] == [{
+        "path": "pkg/service.py",
+        "module": "pkg.service",
+        "qualname": "Service.load",
+        "kind": "method",
+        "start_line": 2,
+        "end_line": 3,
+    }]
+    assert find_symbol_definitions("pkg.service.Service", root=workspace)["count"] == 1
+    assert find_symbol_definitions("Other.load", root=workspace)["count"] == 0
+    assert find_symbol_definitions("helper", kind="class", root=workspace)["count"] == 0
+
+
+def test_find_references_includes_imports_and_calls(workspace: Path) -> None:
+    result = find_symbol_references("helper", root=workspace)
+    assert [(item["path"], item["line"]) for item in result["references"]] == [
+        ("main.py", 1), ("main.py", 4), ("pkg/service.py", 3),
+    ]
+    assert result["files"] == 2
+
+    truncated = find_symbol_references("helper", root=workspace, max_results=1)
+    assert truncated["truncated"] is True
+    assert truncated["count"] == 1
+
+
+def test_index_updates_changed_and_deleted_files(workspace: Path) -> None:
+    index = get_workspace_symbols(workspace)
+    assert index.files_defining(["helper"]) == ["pkg/service.py"]
+    indexed = index.indexed_files
+
+    index.refresh()
+    assert index.indexed_files == indexed
+
+    target = workspace / "main.py"
+    target.write_text("def helper():\n    return 2\n")
+    stat = target.stat()
+    os.utime(target, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+    assert index.files_defining(["helper"]) == ["main.py", "pkg/service.py"]
+    assert index.indexed_files == indexed + 1
+
+    (workspace / "pkg" / "service.py").unlink()
+    assert index.files_defining(["helper"]) == ["main.py"]
+
+
+def test_discovery_reads_files_defining_mentioned_symbols(workspace: Path, monkeypatch) -> None:
+    monkeypatch.chdir(workspace)
+    config = CodurConfig(llm=LLMSettings(default_profile="test"))
+    config.tools.persist_workspace_index = False
+    messages = [HumanMessage(content="Why does `Service` return the wrong value?")]
+    # No index built yet: planning does not build one.
+    assert find_files_for_mentioned_symbols(messages, config) == []
+
+    get_workspace_symbols(None, config)
+    assert find_files_for_mentioned_symbols(messages, config) == ["pkg/service.py"]
+    assert find_files_for_mentioned_symbols([HumanMessage(content="fix the service")]) == []
@@ -196,3 +196,33 @@ class TestRunPytest:
 
         with pytest.raises(ValueError, match="Path escapes workspace root"):
             run_pytest(root=root, cwd=str(outside))
+
+    def test_run_pytest_returns_compact_failures_and_logs_full_output(self, tmp_path: Path):
+        """Failures come from the junit report; the raw output goes to a log file."""
+        (tmp_path / "conftest.py").write_text("", encoding="utf-8")
+        (tmp_path / "calc.py").write_text(
+            "import json\n\ndef parse(text):\n    return json.loads(text)\n", encoding="utf-8"
+        )
+        (tmp_path / "test_calc.py").write_text(
+            "from calc import parse\n\n"
+            "def test_ok():\n    assert parse('1') == 1\n\n"
+            "class TestParse:\n    def test_bad(self):\n        parse('{bad')\n",
+            encoding="utf-8",
+        )
+
+        result = run_pytest(root=tmp_path, extra_args=["-p", "no:cacheprovider"])
+
+        assert result["success"] is False
+        assert result["summary"]["tests"] == 2
+        assert result["summary"]["passed"] == 1
+        assert result["summary"]["failed"] == 1
+        assert "stdout" not in result
+        [failure] = result["failures"]
+        assert failure["test_id"] == "test_calc.py::TestParse::test_bad"
+        assert failure["exception_type"] == "JSONDecodeError"
+        assert "Expecting property name" in failure["message"]
+        assert "calc.py:4" in failure["traceback"]
+        assert "json/__init__.py" not in failure["traceback"]
+        log = (tmp_path / result["log_path"]).read_text(encoding="utf-8")
+        assert "json/__init__.py" in log
+        assert "1 failed, 1 passed" in log
@@ -0,0 +1,53 @@
+import ast
+
+import pytest
+
+from codur.utils.ast_cache import ASTParseCache
+
+
+def test_same_content_is_parsed_once() -> None:
+    cache = ASTParseCache()
+    first = cache.parse("x = 1\n", filename="a.py")
+    second = cache.parse("x = 1\n", filename="b.py")
+
+    assert first is second
+    assert isinstance(first, ast.Module)
+    stats = cache.stats()
+    assert (stats["hits"], stats["misses"], stats["entries"]) == (1, 1, 1)
+
+
+def test_syntax_errors_are_cached_with_caller_filename() -> None:
+    cache = ASTParseCache()
+    with pytest.raises(SyntaxError) as first:
+        cache.parse("def broken(:\n", filename="one.py")
+    with pytest.raises(SyntaxError) as second:
+        cache.parse("def broken(:\n", filename="two.py")
+
+    assert first.value.filename == "one.py"
+    assert second.value.filename == "two.py"
+    assert second.value.lineno == first.value.lineno
+    assert cache.stats()["hits"] == 1
+
+
+def test_indentation_errors_keep_their_type() -> None:
+    cache = ASTParseCache()
+    for _ in range(2):
+        with pytest.raises(IndentationError, match="unexpected indent"):
+            cache.parse("    x = 1\n")
+
+
+def test_lru_eviction_by_entries_and_bytes() -> None:
+    cache = ASTParseCache(max_entries=2, max_bytes=1_000)
+    cache.parse("a = 1\n")
+    cache.parse("b = 2\n")
+    cache.parse("a = 1\n")  # refresh "a" so "b" is least recently used
+    cache.parse("c = 3\n")
+
+    assert cache.stats()["evictions"] == 1
+    cache.parse("a = 1\n")
+    assert cache.stats()["hits"] == 2
+
+    big = "x = 1\n" * 200
+    cache.parse(big)
+    assert cache.stats()["bytes"] <= 1_000
+    assert cache.stats()["entries"] == 2
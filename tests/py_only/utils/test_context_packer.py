@@ -0,0 +1,76 @@
+"""Tests for the token-budgeted context packer."""
+
+from __future__ import annotations
+
+import json
+
+from langchain_core.messages import AIMessage, SystemMessage, ToolMessage
+
+from codur.config import CodurConfig, LLMProfile, LLMSettings
+from codur.utils.context_packer import DEFAULT_CONTEXT_BUDGET_TOKENS, get_context_budget, pack_context
+
+
+def _call(tool: str, args: dict, output, call_id: str) -> list:
+    return [
+        AIMessage(content=json.dumps({"tool_calls": [{"tool": tool, "args": args}]})),
+        ToolMessage(
+            content=json.dumps({"tool": tool, "args": args, "output": output}),
+            tool_call_id=call_id,
+            name=tool,
+        ),
+    ]
+
+
+def _outputs(messages) -> list:
+    return [json.loads(message.content)["output"] for message in messages if isinstance(message, ToolMessage)]
+
+
+def test_superseded_and_stale_reads_become_stubs():
+    body = "print('hello')\n" * 40
+    messages = [
+        SystemMessage(content="old prompt"),
+        *_call("read_file", {"path": "old.py"}, body, "0"),
+        SystemMessage(content="prompt"),
+        *_call("read_file", {"path": "app.py"}, body, "1"),
+        *_call("read_files", {"paths": ["app.py", "lib.py"]}, {"app.py": body, "lib.py": body}, "2"),
+        *_call("write_file", {"path": "lib.py", "content": "x = 1\n"}, "ok", "3"),
+        *_call("run_pytest", {}, "F" * 300, "4"),
+        *_call("run_pytest", {}, "." * 300, "5"),
+    ]
+
+    packed = pack_context(messages)
+
+    assert packed.messages[0].content == "prompt"
+    assert _outputs(packed.messages) == [
+        "[superseded: app.py is read again later]",
+        {"app.py": body, "lib.py": "[stale: lib.py was modified later by write_file]"},
+        "ok",
+        "[superseded: run_pytest is called again later with the same arguments]",
+        "." * 300,
+    ]
+    assert packed.stubbed == 3
+    assert [message.tool_call_id for message in packed.messages if isinstance(message, ToolMessage)] == [
+        "1", "2", "3", "4", "5",
+    ]
+
+
+def test_budget_drops_oldest_exchanges_then_truncates_but_keeps_pairs():
+    messages = [SystemMessage(content="prompt")]
+    for idx in range(4):
+        messages += _call("run_python_file", {"path": f"s{idx}.py"}, "y" * 4000, str(idx))
+
+    packed = pack_context(messages, budget_tokens=600)
+
+    assert packed.dropped == 6
+    assert [type(message) for message in packed.messages] == [SystemMessage, AIMessage, ToolMessage]
+    assert packed.messages[-1].tool_call_id == "3"
+    assert packed.truncated == 1
+    assert packed.tokens <= 600 < packed.original_tokens
+
+
+def test_budget_comes_from_the_profile():
+    config = CodurConfig(llm=LLMSettings(default_profile="small"))
+    config.llm.profiles["small"] = LLMProfile(provider="ollama", model="tiny", context_budget_tokens=8000)
+
+    assert get_context_budget(config, "small") == 8000
+    assert get_context_budget(config, "missing") == DEFAULT_CONTEXT_BUDGET_TOKENS
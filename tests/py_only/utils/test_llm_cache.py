@@ -0,0 +1,69 @@
+from pathlib import Path
+
+from langchain_core.language_models.fake_chat_models import GenericFakeChatModel
+from langchain_core.messages import AIMessage, HumanMessage
+
+from codur.config import CodurConfig, LLMSettings
+from codur.utils.llm_cache import clear_llm_caches, get_llm_cache, get_llm_cache_stats
+from codur.utils.llm_calls import invoke_llm
+
+
+class _FakeModel(GenericFakeChatModel):
+    model_name: str = "fake-model"
+    temperature: float = 0.1
+
+
+def _config(tmp_path: Path, **cache) -> CodurConfig:
+    config = CodurConfig(llm=LLMSettings(default_profile="test"))
+    config.llm.cache.enabled = True
+    config.llm.cache.path = str(tmp_path / "llm_cache.sqlite")
+    for name, value in cache.items():
+        setattr(config.llm.cache, name, value)
+    return config
+
+
+def _model(*answers: str, temperature: float = 0.1) -> _FakeModel:
+    return _FakeModel(messages=iter([AIMessage(content=answer) for answer in answers]), temperature=temperature)
+
+
+def test_identical_prompts_are_served_from_cache(tmp_path: Path) -> None:
+    clear_llm_caches()
+    config = _config(tmp_path)
+    prompt = [HumanMessage(content="plan this")]
+
+    first = invoke_llm(_model("first"), prompt, invoked_by="planning.llm_plan", config=config)
+    second = invoke_llm(_model("second"), prompt, invoked_by="planning.llm_plan", config=config)
+    other = invoke_llm(_model("third"), [HumanMessage(content="something else")], invoked_by="planning.llm_plan", config=config)
+
+    assert (first.content, second.content, other.content) == ("first", "first", "third")
+    stats = get_llm_cache_stats(config)
+    assert (stats["hits"], stats["misses"], stats["writes"]) == (1, 2, 2)
+    assert round(stats["hit_rate"], 2) == 0.33
+
+    # A new process reads the same file.
+    clear_llm_caches()
+    again = invoke_llm(_model("fresh"), prompt, invoked_by="planning.llm_plan", config=config)
+    assert again.content == "first"
+    clear_llm_caches()
+
+
+def test_high_temperature_bypasses_and_ttl_and_size_evict(tmp_path: Path) -> None:
+    clear_llm_caches()
+    config = _config(tmp_path, max_entries=1)
+    prompt = [HumanMessage(content="explain")]
+
+    invoke_llm(_model("a", temperature=0.7), prompt, invoked_by="explaining.primary", config=config)
+    assert get_llm_cache_stats(config)["bypassed"] == 1
+
+    cache = get_llm_cache(config)
+    key_one = cache.key_for(_model(), prompt)
+    key_two = cache.key_for(_model(), [HumanMessage(content="other")])
+    cache.put(key_one, AIMessage(content="one"))
+    cache.put(key_two, AIMessage(content="two"))
+    assert cache.get(key_one) is None
+    assert cache.get(key_two).content == "two"
+
+    cache.ttl_s = -1
+    assert cache.get(key_two) is None
+    assert get_llm_cache(CodurConfig(llm=LLMSettings(default_profile="test"))) is None
+    clear_llm_caches()
@@ -0,0 +1,67 @@
+"""Tests for memoized LLM client construction."""
+
+from langchain_core.language_models.fake_chat_models import GenericFakeChatModel
+
+from codur.config import CodurConfig, LLMProfile, LLMProviderSettings, LLMSettings
+from codur.llm import clear_llm_clients, create_llm_profile, create_llm_with_tools
+from codur.providers.base import BaseLLMProvider, ProviderRegistry
+
+
+class _CountingProvider(BaseLLMProvider):
+    created = 0
+
+    @staticmethod
+    def create(config, model, temperature, api_key=None, json_mode=False):
+        _CountingProvider.created += 1
+        return GenericFakeChatModel(messages=iter([]))
+
+    @staticmethod
+    def get_api_key_env_name(config):
+        return ""
+
+    @staticmethod
+    def provider_name():
+        return "counting"
+
+    @staticmethod
+    def supports_native_tools():
+        return True
+
+    @staticmethod
+    def bind_tools_to_llm(llm, tool_schemas):
+        return llm.bind(tools=tool_schemas)
+
+
+def _config() -> CodurConfig:
+    return CodurConfig(llm=LLMSettings(
+        default_profile="fake",
+        profiles={"fake": LLMProfile(provider="counting", model="fake-1")},
+    ))
+
+
+def test_clients_are_reused_per_profile_temperature_mode_and_tools(monkeypatch):
+    monkeypatch.setitem(ProviderRegistry._providers, "counting", _CountingProvider)
+    monkeypatch.setattr(_CountingProvider, "created", 0)
+    clear_llm_clients()
+    config = _config()
+    schemas = [{"name": "read_file", "parameters": {"type": "object", "properties": {}}}]
+
+    first = create_llm_profile(config, "fake", temperature=0.2)
+    assert create_llm_profile(config, "fake", temperature=0.2) is first
+    assert create_llm_profile(config, "fake", temperature=0.7) is not first
+    assert create_llm_profile(config, "fake", json_mode=True, temperature=0.2) is not first
+    bound = create_llm_with_tools(config, "fake", schemas, temperature=0.2)
+    assert create_llm_with_tools(config, "fake", [dict(schemas[0])], temperature=0.2) is bound
+    assert _CountingProvider.created == 4
+
+    # Changing provider settings or the profile produces a fresh client.
+    config.providers["counting"] = LLMProviderSettings(base_url="http://other")
+    assert create_llm_profile(config, "fake", temperature=0.2) is not first
+    config.llm.profiles["fake"].model = "fake-2"
+    create_llm_profile(config, "fake", temperature=0.2)
+    assert _CountingProvider.created == 6
+
+    clear_llm_clients()
+    create_llm_profile(config, "fake", temperature=0.2)
+    assert _CountingProvider.created == 7
+    clear_llm_clients()
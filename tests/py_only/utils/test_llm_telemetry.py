@@ -0,0 +1,73 @@
+import json
+from pathlib import Path
+
+import pytest
+from langchain_core.language_models.fake_chat_models import GenericFakeChatModel
+from langchain_core.messages import AIMessage, HumanMessage
+
+from codur.config import CodurConfig, LLMProfile, LLMSettings
+from codur.utils.llm_calls import invoke_llm
+from codur.utils.llm_telemetry import LLMTelemetry, format_telemetry_summary, llm_telemetry_scope
+
+
+class _FakeModel(GenericFakeChatModel):
+    model_name: str = "fake-model"
+    streaming: bool = False
+
+
+class _FailingModel(_FakeModel):
+    def invoke(self, input, config=None, **kwargs):
+        raise RuntimeError("rate limited")
+
+
+def _config() -> CodurConfig:
+    config = CodurConfig(llm=LLMSettings(default_profile="fake"))
+    config.llm.profiles["fake"] = LLMProfile(
+        provider="fake", model="fake-model", input_cost_per_mtok=1.0, output_cost_per_mtok=4.0,
+    )
+    return config
+
+
+def test_calls_are_recorded_with_usage_cost_and_first_token(tmp_path: Path) -> None:
+    config = _config()
+    jsonl = tmp_path / "telemetry.jsonl"
+    reply = AIMessage(
+        content="hello there",
+        usage_metadata={"input_tokens": 1000, "output_tokens": 500, "total_tokens": 1500},
+    )
+
+    with llm_telemetry_scope(LLMTelemetry(jsonl)) as telemetry:
+        invoke_llm(_FakeModel(messages=iter([reply])), [HumanMessage(content="hi")], "coding.primary", config=config)
+        invoke_llm(
+            _FakeModel(messages=iter([AIMessage(content="streamed answer")]), streaming=True),
+            [HumanMessage(content="x" * 400)],
+            "planning.llm_plan",
+            config=config,
+        )
+
+    first, second = telemetry.records
+    assert (first.prompt_tokens, first.completion_tokens, first.tokens_estimated) == (1000, 500, False)
+    assert first.profile == "fake"
+    assert first.cost_usd == pytest.approx(0.003)
+    assert second.tokens_estimated and second.prompt_tokens >= 100
+    assert second.ttft_s is not None and second.ttft_s <= second.latency_s
+    assert [json.loads(line)["invoked_by"] for line in jsonl.read_text().splitlines()] == [
+        "coding.primary", "planning.llm_plan",
+    ]
+
+
+def test_failed_calls_count_as_attempts_and_are_summarized() -> None:
+    config = _config()
+    prompt = [HumanMessage(content="hi")]
+
+    with llm_telemetry_scope() as telemetry:
+        with pytest.raises(RuntimeError):
+            invoke_llm(_FailingModel(messages=iter([])), prompt, "coding.primary", config=config)
+        invoke_llm(_FakeModel(messages=iter([AIMessage(content="ok")])), prompt, "coding.primary", config=config)
+
+    assert [(record.attempt, record.error) for record in telemetry.records] == [
+        (1, "RuntimeError: rate limited"), (2, None),
+    ]
+    summary = telemetry.summary()["coding.primary"]
+    assert (summary["calls"], summary["errors"]) == (2, 1)
+    assert format_telemetry_summary(telemetry.summary())[0].startswith("coding.primary: 2 calls")
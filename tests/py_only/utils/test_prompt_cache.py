@@ -0,0 +1,70 @@
+from langchain_core.language_models.fake_chat_models import GenericFakeChatModel
+from langchain_core.messages import AIMessage, HumanMessage, SystemMessage, ToolMessage
+
+from codur.config import CodurConfig, LLMProfile, LLMSettings
+from codur.utils.llm_calls import invoke_llm
+from codur.utils.llm_telemetry import llm_telemetry_scope
+from codur.utils.message_pipeline import message_shortening_pipeline
+from codur.utils.prompt_cache import add_cache_breakpoints, build_system_messages
+
+
+class _RecordingModel(GenericFakeChatModel):
+    model_name: str = "claude-test"
+    seen: list = []
+
+    def invoke(self, input, config=None, **kwargs):
+        self.seen.append(list(input))
+        return super().invoke(input, config=config, **kwargs)
+
+
+def _config(provider: str) -> CodurConfig:
+    config = CodurConfig(llm=LLMSettings(default_profile="main"))
+    config.llm.profiles["main"] = LLMProfile(provider=provider, model="claude-test")
+    config.model_agent_instructions = []
+    return config
+
+
+def test_stable_prompt_stays_byte_identical_and_survives_shortening():
+    first = build_system_messages("SYSTEM PROMPT", "summary one")
+    second = build_system_messages("SYSTEM PROMPT", "summary two\n\nNext Step Suggestion: run tests")
+    assert first[0] == second[0]
+    assert first[1].content != second[1].content
+
+    history = [SystemMessage(content="old"), HumanMessage(content="task"), *second, AIMessage(content="{}")]
+    assert message_shortening_pipeline(history) == [*second, history[-1]]
+
+
+def test_anthropic_calls_get_breakpoints_and_report_cache_reads():
+    usage = {
+        "input_tokens": 2000,
+        "output_tokens": 10,
+        "total_tokens": 2010,
+        "input_token_details": {"cache_read": 1500},
+    }
+    model = _RecordingModel(messages=iter([AIMessage(content="ok", usage_metadata=usage)]), seen=[])
+    prompt = [
+        *build_system_messages("SYSTEM PROMPT", "summary"),
+        AIMessage(content="{}"),
+        ToolMessage(content="tool output", tool_call_id="1", name="read_file"),
+    ]
+
+    with llm_telemetry_scope() as telemetry:
+        invoke_llm(model, prompt, "coding.primary", config=_config("anthropic"))
+
+    sent = model.seen[0]
+    assert sent[0].content == [{"type": "text", "text": "SYSTEM PROMPT", "cache_control": {"type": "ephemeral"}}]
+    assert sent[1].content == "summary"
+    assert sent[-1].content[-1]["cache_control"] == {"type": "ephemeral"}
+    summary = telemetry.summary()["coding.primary"]
+    assert summary["prompt_cache_read_tokens"] == 1500
+    assert summary["prompt_cache_hit_rate"] == 0.75
+
+
+def test_other_providers_get_plain_messages():
+    model = _RecordingModel(messages=iter([AIMessage(content="ok")]), seen=[])
+    prompt = build_system_messages("SYSTEM PROMPT", "summary")
+
+    invoke_llm(model, prompt, "coding.primary", config=_config("groq"))
+
+    assert [message.content for message in model.seen[0]] == ["SYSTEM PROMPT", "summary"]
+    assert add_cache_breakpoints([]) == []
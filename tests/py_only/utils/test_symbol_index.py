@@ -0,0 +1,90 @@
+import pytest
+
+from codur.utils.symbol_index import (
+    SymbolTable,
+    clear_symbol_tables,
+    get_symbol_table,
+    record_span_replacement,
+)
+
+SOURCE = '''import functools
+
+
+class Service:
+    def start(self):
+        return 1
+
+    @functools.cache
+    def helper(self):
+        def inner():
+            return 2
+        return inner()
+
+
+async def main():
+    return Service().start()
+'''
+
+
+def _spans(table: SymbolTable) -> list[tuple]:
+    return [
+        (s.qualname, s.kind, s.start_line, s.end_line, s.decorator_start_line, s.col_offset, s.decorators, s.is_async)
+        for s in table.symbols
+    ]
+
+
+def test_symbol_table_metadata() -> None:
+    table = SymbolTable.from_source(SOURCE)
+
+    assert [s.qualname for s in table.symbols] == [
+        "Service", "main", "Service.start", "Service.helper", "Service.helper.inner",
+    ]
+    helper = table.find_method("Service", "helper")
+    assert helper is not None
+    assert (helper.start_line, helper.end_line, helper.decorator_start_line) == (9, 12, 8)
+    assert helper.decorators == ("functools.cache",)
+    assert table.find_function("inner").kind == "function"
+    assert table.find_function("main").is_async
+
+
+def test_span_replacement_matches_full_rebuild() -> None:
+    clear_symbol_tables()
+    table = get_symbol_table(SOURCE)
+    helper = table.find_method("Service", "helper")
+    new_code = (
+        "    async def helper(self):\n"
+        "        class Local:\n"
+        "            pass\n"
+        "        return Local\n"
+        "\n"
+        "    def extra(self):\n"
+        "        return 3\n"
+    )
+
+    new_source = record_span_replacement(SOURCE, helper.start_line, helper.end_line, new_code)
+    patched = table.with_replaced_span(helper.start_line, helper.end_line, new_code)
+
+    assert patched is not None
+    assert get_symbol_table(new_source) is not table
+    assert _spans(get_symbol_table(new_source)) == _spans(patched)
+    assert _spans(patched) == _spans(SymbolTable.from_source(new_source))
+
+
+@pytest.mark.parametrize("trailer", ["\n", "\n    # trailing comment\n", "\n\n"])
+def test_span_replacement_with_trailing_non_code_lines(trailer: str) -> None:
+    source = "class A:\n    def m(self):\n        return 1\nx = 1\ny = 2\n"
+    table = SymbolTable.from_source(source)
+    new_code = "    def m(self):\n        return 2\n" + trailer
+
+    patched = table.with_replaced_span(2, 3, new_code)
+    new_source = record_span_replacement(source, 2, 3, new_code)
+
+    assert patched is not None
+    assert _spans(patched) == _spans(SymbolTable.from_source(new_source))
+
+
+def test_span_replacement_falls_back_for_reindented_code() -> None:
+    table = SymbolTable.from_source(SOURCE)
+    start = table.find_method("Service", "start")
+
+    assert table.with_replaced_span(start.start_line, start.end_line, "def start(self):\n    return 5\n") is None
@@ -0,0 +1,82 @@
+"""Tests for the warm pre-forked Python runner."""
+
+from __future__ import annotations
+
+import os
+from pathlib import Path
+
+import pytest
+
+from codur.config import CodurConfig, LLMSettings
+from codur.tools.validation import run_pytest, run_python_file
+from codur.utils import warm_runner
+
+pytestmark = pytest.mark.skipif(not hasattr(os, "fork"), reason="the warm runner needs os.fork")
+
+
+@pytest.fixture
+def pool(monkeypatch):
+    pool = warm_runner.WarmRunnerPool()
+    monkeypatch.setattr(warm_runner, "_POOL", pool)
+    yield pool
+    pool.close_all()
+
+
+@pytest.fixture
+def project(tmp_path: Path) -> Path:
+    (tmp_path / "app").mkdir()
+    (tmp_path / "app" / "__init__.py").write_text("VALUE = 1\n")
+    (tmp_path / "main.py").write_text(
+        "import sys\nimport app\nprint('value', app.VALUE)\nsys.exit(3)\n"
+    )
+    (tmp_path / "tests").mkdir()
+    (tmp_path / "tests" / "test_slow.py").write_text(
+        "import time\n\ndef test_slow():\n    time.sleep(30)\n"
+    )
+    (tmp_path / "tests" / "test_fast.py").write_text("def test_fast():\n    assert True\n")
+    return tmp_path
+
+
+def _config() -> CodurConfig:
+    config = CodurConfig(llm=LLMSettings(default_profile="test"))
+    config.tools.warm_runner.enabled = True
+    return config
+
+
+def test_scripts_reuse_the_server_until_a_preloaded_module_changes(project: Path, pool):
+    config = _config()
+    state = {"config": config}
+
+    first = run_python_file("main.py", root=str(project), state=state)
+    second = run_python_file("main.py", root=str(project), state=state)
+    assert first == second == {"return_code": 3, "std_out": "value 1", "std_err": None}
+    assert (pool.started, pool.reused) == (1, 1)
+
+    (project / "app" / "__init__.py").write_text("VALUE = 2\n")
+    # Guarantee a new mtime even on filesystems with coarse timestamps.
+    os.utime(project / "app" / "__init__.py", ns=(0, 1))
+    changed = run_python_file("main.py", root=str(project), state=state)
+    assert changed["std_out"] == "value 2"
+    assert (pool.started, pool.invalidated) == (2, 1)
+
+
+def test_pytest_runs_warm_and_timeouts_kill_only_the_child(project: Path, pool):
+    config = _config()
+    args = {"root": project, "extra_args": ["-p", "no:cacheprovider"], "state": {"config": config}}
+
+    timed_out = run_pytest(paths=["tests/test_slow.py"], timeout=1, **args)
+    passed = run_pytest(paths=["tests/test_fast.py"], **args)
+
+    assert "timed out" in timed_out["error"]
+    assert passed["success"] is True
+    assert passed["summary"]["passed"] == 1
+    assert (pool.started, pool.reused, pool.cold_fallbacks) == (1, 1, 0)
+
+
+def test_disabled_runner_runs_cold(project: Path, pool):
+    config = CodurConfig(llm=LLMSettings(default_profile="test"))
+
+    result = run_python_file("main.py", root=str(project), state={"config": config})
+
+    assert result["return_code"] == 3
+    assert pool.started == 0
@@ -0,0 +1,111 @@
+import json
+import os
+from pathlib import Path
+
+import pytest
+
+from codur.utils.workspace_index import (
+    WorkspaceIndex,
+    clear_workspace_indexes,
+    get_workspace_index,
+    iter_workspace_files,
+    notify_path_changed,
+)
+
+
+@pytest.fixture(autouse=True)
+def _fresh_indexes():
+    clear_workspace_indexes()
+    yield
+    clear_workspace_indexes()
+
+
+def _age_dirs(root: Path) -> None:
+    """Push directory mtimes out of the racy window so they can be reused."""
+    past = 1_000_000_000
+    for dirpath, _, _ in os.walk(root):
+        os.utime(dirpath, (past, past))
+
+
+def _make_tree(root: Path) -> None:
+    (root / "pkg").mkdir()
+    (root / "pkg" / "mod.py").write_text("x = 1\n")
+    (root / "pkg" / "notes.md").write_text("# notes\n")
+    (root / "build").mkdir()
+    (root / "build" / "gen.py").write_text("y = 2\n")
+    (root / ".hidden").mkdir()
+    (root / ".hidden" / "secret.py").write_text("z = 3\n")
+    (root / "__pycache__").mkdir()
+    (root / "__pycache__" / "mod.pyc").write_text("")
+    (root / ".gitignore").write_text("build/\n")
+    (root / "main.py").write_text("print('hi')\n")
+
+
+def test_index_honors_ignore_rules(tmp_path: Path) -> None:
+    _make_tree(tmp_path)
+    index = WorkspaceIndex(tmp_path)
+
+    assert [entry.path for entry in index.iter_files()] == ["main.py", "pkg/mod.py", "pkg/notes.md"]
+    assert list(index.iter_dirs()) == ["pkg"]
+    assert [entry.language for entry in index.iter_files(suffixes=(".py",))] == ["python", "python"]
+    assert index.is_ignored("build/gen.py")
+    assert index.is_ignored(".hidden/secret.py")
+    assert not index.is_ignored("pkg/mod.py")
+
+
+def test_refresh_only_rescans_changed_dirs(tmp_path: Path) -> None:
+    _make_tree(tmp_path)
+    index = WorkspaceIndex(tmp_path)
+    _age_dirs(tmp_path)
+    index.refresh()
+    index.scanned_dirs = 0
+
+    index.refresh()
+    assert index.scanned_dirs == 0
+
+    (tmp_path / "pkg" / "new.py").write_text("")
+    assert "pkg/new.py" in [entry.path for entry in index.iter_files()]
+    assert index.scanned_dirs == 1
+
+    (tmp_path / "pkg" / "new.py").unlink()
+    assert "pkg/new.py" not in [entry.path for entry in index.iter_files()]
+
+
+def test_notify_path_changed_rescans_its_directory(tmp_path: Path) -> None:
+    (tmp_path / "a.py").write_text("a = 1\n")
+    index = get_workspace_index(tmp_path)
+    _age_dirs(tmp_path)
+    index.refresh()
+
+    (tmp_path / "a.py").rename(tmp_path / "b.py")
+    # Hide the change from the directory mtime check.
+    os.utime(tmp_path, (1_000_000_000, 1_000_000_000))
+    notify_path_changed(tmp_path / "b.py")
+
+    assert [entry.path for entry in index.iter_files()] == ["b.py"]
+
+
+def test_gitignore_change_rebuilds_index(tmp_path: Path) -> None:
+    _make_tree(tmp_path)
+    index = WorkspaceIndex(tmp_path)
+    assert "pkg/notes.md" in [entry.path for entry in index.iter_files()]
+
+    (tmp_path / ".gitignore").write_text("build/\n*.md\n")
+    assert "pkg/notes.md" not in [entry.path for entry in index.iter_files()]
+
+
+def test_workspace_root_index_is_persisted(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.chdir(tmp_path)
+    _make_tree(tmp_path)
+
+    files = [path.relative_to(tmp_path).as_posix() for path in iter_workspace_files(None)]
+    assert files == ["main.py", "pkg/mod.py", "pkg/notes.md"]
+
+    data = json.loads((tmp_path / ".codur" / "workspace_index.json").read_text())
+    assert set(data["dirs"]) == {"", "pkg"}
+
+    _age_dirs(tmp_path)
+    clear_workspace_indexes()
+    reloaded = WorkspaceIndex(tmp_path.resolve(), persist=True)
+    assert [entry.path for entry in reloaded.iter_files()] == files
+    assert ".codur/workspace_index.json" not in [entry.path for entry in reloaded.iter_files()]